@@ -79,6 +79,10 @@ class AppConfig(BaseAppConfig):
 
             settings = get_settings_proxy()
 
+            # Permission version and authentication cache signals
+            from .extensions import auth_cache  # noqa: F401
+            from .security import permission_cache  # noqa: F401
+
             if settings.get("schema_registry.enable_registry", False):
                 # Import signals to register them
                 from . import signals  # This will be created later
@@ -109,6 +113,10 @@ class AppConfig(BaseAppConfig):
 
             settings = get_settings_proxy()
 
+            # Permission version and authentication cache signals
+            from .extensions import auth_cache  # noqa: F401
+            from .security import permission_cache  # noqa: F401
+
             if settings.get("schema_registry.enable_registry", False):
                 from .core.registry import schema_registry
 
@@ -0,0 +1,338 @@
+"""
+Request-scoped DataLoaders for generated relationship resolvers.
+
+Generated object types resolve ManyToMany fields, reverse relations and their
+``*_count`` companions once per parent instance. This module batches those
+lookups per request: sibling instances returned by a list resolver (or by a
+previous loader) are registered as a batch, and the first relation access on
+any of them loads the relation for the whole batch with one ``IN (...)`` query
+per chunk of ``dataloader_batch_size`` keys.
+
+The registry is stored on ``info.context`` so its lifetime matches the request
+and nothing leaks between users. Behaviour is controlled by the
+``enable_dataloader`` and ``dataloader_batch_size`` performance settings.
+"""
+
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
+
+from django.db import models
+from django.db.models import Count, F
+from django.db.models.fields.related import ManyToManyField
+from django.db.models.fields.reverse_related import (
+    ManyToManyRel,
+    ManyToOneRel,
+    OneToOneRel,
+)
+
+from .performance import PerformanceSettings
+
+logger = logging.getLogger(__name__)
+
+DATALOADER_CONTEXT_ATTR = "_rail_dataloader_registry"
+
+# Annotation used to remember which parent a batched row belongs to.
+PARENT_KEY_ALIAS = "_rail_parent_key"
+COUNT_ALIAS = "_rail_related_count"
+
+LOADER_KINDS = ("list", "count", "one")
+
+
+class RelationSpec:
+    """
+    Describes how to fetch a relation for many parents at once.
+
+    Attributes:
+        related_model: Model returned by the relation
+        lookup: Query path from ``related_model`` back to the parent model
+        parent_key_attname: Attribute on the parent holding the joined value
+    """
+
+    def __init__(
+        self,
+        related_model: Type[models.Model],
+        lookup: str,
+        parent_key_attname: str,
+    ):
+        self.related_model = related_model
+        self.lookup = lookup
+        self.parent_key_attname = parent_key_attname
+
+
+def describe_relation(
+    model: Type[models.Model], accessor: str
+) -> Optional[RelationSpec]:
+    """
+    Build a RelationSpec for a forward ManyToMany field or a reverse accessor.
+
+    Returns None for relations that cannot be batched (hidden reverse names,
+    generic relations, unknown accessors); callers then keep the per-instance
+    resolution path.
+    """
+    try:
+        field = model._meta.get_field(accessor)
+    except Exception:
+        field = None
+
+    if isinstance(field, ManyToManyField) and not field.auto_created:
+        lookup = field.related_query_name()
+        if not lookup or lookup.endswith("+"):
+            return None
+        return RelationSpec(field.related_model, lookup, model._meta.pk.attname)
+
+    for rel in getattr(model._meta, "related_objects", []):
+        if rel.get_accessor_name() != accessor:
+            continue
+        if isinstance(rel, ManyToManyRel):
+            return RelationSpec(
+                rel.related_model, rel.field.name, model._meta.pk.attname
+            )
+        if isinstance(rel, (ManyToOneRel, OneToOneRel)):
+            target_field = getattr(rel.field, "target_field", None)
+            if target_field is None:
+                return None
+            return RelationSpec(
+                rel.related_model, rel.field.name, target_field.attname
+            )
+        return None
+
+    return None
+
+
+class RelationLoader:
+    """
+    Batches one relation (list, count or reverse one-to-one) for a request.
+
+    Results are cached by parent key so every parent is fetched at most once
+    per request, whatever the nesting level it appears at.
+    """
+
+    def __init__(
+        self,
+        registry: "DataLoaderRegistry",
+        kind: str,
+        model: Type[models.Model],
+        accessor: str,
+        spec: RelationSpec,
+    ):
+        if kind not in LOADER_KINDS:
+            raise ValueError(f"Unsupported loader kind: {kind}")
+        self.registry = registry
+        self.kind = kind
+        self.model = model
+        self.accessor = accessor
+        self.spec = spec
+        self._cache: Dict[Any, Any] = {}
+        # Sibling batches whose prefetched children were already registered
+        self._prefetched_batches: Dict[int, List[models.Model]] = {}
+
+    def _empty(self) -> Any:
+        if self.kind == "list":
+            return []
+        if self.kind == "count":
+            return 0
+        return None
+
+    def _from_instance_cache(self, instance: models.Model) -> Tuple[bool, Any]:
+        """Reuse prefetch_related/select_related results already on the instance."""
+        prefetched = getattr(instance, "_prefetched_objects_cache", None) or {}
+        if self.accessor in prefetched:
+            items = list(prefetched[self.accessor])
+            if self.kind == "count":
+                return True, len(items)
+            if self.kind == "list":
+                return True, items
+        if self.kind == "one":
+            cached = getattr(instance, "_state", None)
+            fields_cache = getattr(cached, "fields_cache", None) or {}
+            if self.accessor in fields_cache:
+                return True, fields_cache[self.accessor]
+        return False, None
+
+    def load(self, instance: models.Model) -> Any:
+        """Return the relation value for ``instance``, batching its siblings."""
+        found, value = self._from_instance_cache(instance)
+        if found:
+            if self.kind == "list":
+                self._register_prefetched_children(instance)
+            return value
+
+        key = getattr(instance, self.spec.parent_key_attname, None)
+        if key is None:
+            return self._empty()
+
+        if key not in self._cache:
+            pending: List[Any] = [key]
+            seen = {key}
+            for sibling in self.registry.siblings_of(instance):
+                if not isinstance(sibling, self.model):
+                    continue
+                sibling_key = getattr(sibling, self.spec.parent_key_attname, None)
+                if (
+                    sibling_key is None
+                    or sibling_key in seen
+                    or sibling_key in self._cache
+                ):
+                    continue
+                seen.add(sibling_key)
+                pending.append(sibling_key)
+            self._fetch(pending)
+
+        return self._cache.get(key, self._empty())
+
+    def _register_prefetched_children(self, instance: models.Model) -> None:
+        """Register prefetched children of a whole sibling batch as one batch."""
+        siblings = self.registry.siblings_of(instance)
+        marker = id(siblings)
+        if marker in self._prefetched_batches:
+            return
+        self._prefetched_batches[marker] = siblings
+
+        children: List[models.Model] = []
+        for sibling in siblings:
+            prefetched = getattr(sibling, "_prefetched_objects_cache", None) or {}
+            if self.accessor in prefetched:
+                children.extend(prefetched[self.accessor])
+        self.registry.register_batch(children)
+
+    def _base_queryset(self) -> models.QuerySet:
+        return self.spec.related_model._default_manager.all()
+
+    def _fetch(self, keys: List[Any]) -> None:
+        lookup = self.spec.lookup
+        batch_size = self.registry.batch_size
+
+        for start in range(0, len(keys), batch_size):
+            chunk = keys[start : start + batch_size]
+            for key in chunk:
+                self._cache[key] = self._empty()
+
+            queryset = self._base_queryset().filter(**{f"{lookup}__in": chunk})
+
+            if self.kind == "count":
+                rows = (
+                    queryset.order_by()
+                    .values(lookup)
+                    .annotate(**{COUNT_ALIAS: Count("pk")})
+                )
+                for row in rows:
+                    self._cache[row[lookup]] = row[COUNT_ALIAS]
+                continue
+
+            fetched: List[models.Model] = []
+            for obj in queryset.annotate(**{PARENT_KEY_ALIAS: F(lookup)}):
+                parent_key = getattr(obj, PARENT_KEY_ALIAS)
+                if self.kind == "one":
+                    self._cache[parent_key] = obj
+                else:
+                    self._cache[parent_key].append(obj)
+                fetched.append(obj)
+
+            # Children of this batch form the sibling batch for the next level.
+            self.registry.register_batch(fetched)
+
+
+class DataLoaderRegistry:
+    """
+    Per-request registry of sibling batches and relation loaders.
+
+    Instances are tracked by identity: the registry keeps a reference to every
+    batch it stores, so identities cannot be recycled while it is alive.
+    """
+
+    def __init__(self, batch_size: int = 100, enabled: bool = True):
+        self.batch_size = max(1, int(batch_size or 1))
+        self.enabled = enabled
+        self._batches: Dict[int, List[models.Model]] = {}
+        self._loaders: Dict[
+            Tuple[str, Type[models.Model], str], Optional[RelationLoader]
+        ] = {}
+
+    def register_batch(self, instances: Iterable[Any]) -> None:
+        """Record instances resolved together so their relations load together."""
+        batch = [obj for obj in instances if isinstance(obj, models.Model)]
+        if not batch:
+            return
+        for obj in batch:
+            self._batches[id(obj)] = batch
+
+    def siblings_of(self, instance: models.Model) -> List[models.Model]:
+        """Return the batch ``instance`` was resolved in (itself when unknown)."""
+        return self._batches.get(id(instance)) or [instance]
+
+    def get_loader(
+        self, kind: str, model: Type[models.Model], accessor: str
+    ) -> Optional[RelationLoader]:
+        """Return (and memoize) the loader for a relation, or None if unsupported."""
+        key = (kind, model, accessor)
+        if key not in self._loaders:
+            spec = describe_relation(model, accessor)
+            self._loaders[key] = (
+                RelationLoader(self, kind, model, accessor, spec) if spec else None
+            )
+        return self._loaders[key]
+
+
+def _is_query_operation(info: Any) -> bool:
+    operation = getattr(info, "operation", None)
+    if operation is None:
+        return True
+    op_type = getattr(operation, "operation", None)
+    return getattr(op_type, "value", op_type) in (None, "query")
+
+
+def get_dataloader_registry(info: Any) -> Optional[DataLoaderRegistry]:
+    """
+    Return the DataLoader registry attached to the request context.
+
+    Returns None when the context cannot carry state, when dataloaders are
+    disabled, or for mutations (writes in the same document would otherwise
+    be hidden behind cached reads).
+    """
+    context = getattr(info, "context", None)
+    if context is None or not _is_query_operation(info):
+        return None
+
+    if isinstance(context, dict):
+        registry = context.get(DATALOADER_CONTEXT_ATTR)
+    else:
+        registry = getattr(context, DATALOADER_CONTEXT_ATTR, None)
+
+    if registry is None:
+        schema_name = (
+            context.get("schema_name")
+            if isinstance(context, dict)
+            else getattr(context, "schema_name", None)
+        )
+        settings = PerformanceSettings.from_schema(schema_name)
+        registry = DataLoaderRegistry(
+            batch_size=settings.dataloader_batch_size,
+            enabled=settings.enable_dataloader,
+        )
+        try:
+            if isinstance(context, dict):
+                context[DATALOADER_CONTEXT_ATTR] = registry
+            else:
+                setattr(context, DATALOADER_CONTEXT_ATTR, registry)
+        except Exception as exc:
+            logger.debug(f"Could not attach DataLoader registry to context: {exc}")
+            return None
+
+    return registry if registry.enabled else None
+
+
+def get_relation_loader(
+    info: Any, kind: str, model: Type[models.Model], accessor: str
+) -> Optional[RelationLoader]:
+    """Shortcut returning the request loader for a relation, if batching applies."""
+    registry = get_dataloader_registry(info)
+    if registry is None:
+        return None
+    return registry.get_loader(kind, model, accessor)
+
+
+def register_dataloader_batch(info: Any, instances: Iterable[Any]) -> None:
+    """Register resolved list items as siblings for subsequent relation loads."""
+    registry = get_dataloader_registry(info)
+    if registry is not None:
+        registry.register_batch(instances)
@@ -0,0 +1,174 @@
+"""
+Parsed and validated document cache for Rail Django GraphQL.
+
+Parsing and validating a query usually costs more than executing a small
+one. ``DocumentCache`` keeps an LRU, per schema and schema version, mapping
+the SHA-256 of the query text to its parsed ``DocumentNode`` and validation
+errors, so hot documents skip both steps. When ``SchemaBuilder`` reports a
+new schema version, the entries of the previous versions are dropped.
+
+Validation results only depend on the schema and the document; rules bound
+to request variables (query cost) must run outside of the cached validation.
+"""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Optional, Sequence, Tuple
+
+from graphql import DocumentNode, GraphQLError, GraphQLSchema, parse, validate
+
+from .performance import PerformanceSettings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CachedDocument:
+    """Parsed document and the result of its validation."""
+
+    query_hash: str
+    document: DocumentNode
+    errors: Tuple[GraphQLError, ...] = ()
+
+    @property
+    def is_valid(self) -> bool:
+        return not self.errors
+
+
+class DocumentCache:
+    """LRU of parsed and validated documents, invalidated by schema version."""
+
+    def __init__(self, max_size: Optional[int] = None):
+        if max_size is None:
+            max_size = PerformanceSettings.from_schema().document_cache_size
+        self.max_size = max_size
+        self._entries: "OrderedDict[Hashable, CachedDocument]" = OrderedDict()
+        self._versions: Dict[Hashable, Hashable] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def hash_query(query: str) -> str:
+        """Return the SHA-256 hex digest of a query text."""
+        return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def get_document(
+        self,
+        schema_name: Hashable,
+        schema_version: Hashable,
+        schema: GraphQLSchema,
+        query: str,
+        rules: Optional[Sequence[Any]] = None,
+        max_errors: Optional[int] = None,
+        query_hash: Optional[str] = None,
+    ) -> CachedDocument:
+        """
+        Return the parsed and validated document for a query.
+
+        Args:
+            schema_name: Name of the schema
+            schema_version: Version reported by the schema builder
+            schema: GraphQL schema used for validation
+            query: Query text
+            rules: Validation rules (graphql-core specified rules when None)
+            max_errors: Maximum number of validation errors
+            query_hash: SHA-256 of the query text when already known
+
+        Returns:
+            CachedDocument holding the document and its validation errors
+
+        Raises:
+            GraphQLError: If the query cannot be parsed (never cached)
+        """
+        query_hash = query_hash or self.hash_query(query)
+        rules = tuple(rules) if rules is not None else None
+        key = (schema_name, schema_version, rules, query_hash)
+
+        with self._lock:
+            self._check_version(schema_name, schema_version)
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+
+        document = parse(query)
+        errors = validate(schema, document, rules, max_errors)
+        entry = CachedDocument(query_hash, document, tuple(errors))
+
+        with self._lock:
+            self.misses += 1
+            if self.max_size > 0 and self._versions.get(schema_name) == schema_version:
+                self._entries[key] = entry
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+        return entry
+
+    def invalidate(self, schema_name: Optional[Hashable] = None) -> None:
+        """Drop the entries of one schema, or of every schema when None."""
+        with self._lock:
+            self._drop(schema_name)
+            if schema_name is None:
+                self._versions.clear()
+            else:
+                self._versions.pop(schema_name, None)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+            self.hits = self.misses = self.invalidations = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the cache statistics."""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hit_ratio, 4),
+                "invalidations": self.invalidations,
+            }
+
+    def _check_version(self, schema_name: Hashable, schema_version: Hashable) -> None:
+        current = self._versions.get(schema_name)
+        if current == schema_version:
+            return
+        if schema_name in self._versions:
+            self._drop(schema_name)
+            self.invalidations += 1
+            logger.debug(
+                f"Document cache invalidated for schema '{schema_name}' "
+                f"(version {current} -> {schema_version})"
+            )
+        self._versions[schema_name] = schema_version
+
+    def _drop(self, schema_name: Optional[Hashable]) -> None:
+        if schema_name is None:
+            self._entries.clear()
+            return
+        for key in [key for key in self._entries if key[0] == schema_name]:
+            del self._entries[key]
+
+
+_document_cache: Optional[DocumentCache] = None
+
+
+def get_document_cache() -> DocumentCache:
+    """Get the process-wide document cache."""
+    global _document_cache
+    if _document_cache is None:
+        _document_cache = DocumentCache()
+    return _document_cache
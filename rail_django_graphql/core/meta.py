@@ -16,7 +16,7 @@ from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Type
 from django.apps import apps
 from django.core.exceptions import FieldDoesNotExist
 from django.db import models
-from django.db.models import Q
+from django.db.models import F, Q
 from graphql import GraphQLError
 
 logger = logging.getLogger(__name__)
@@ -34,6 +34,7 @@ def _load_security_components() -> Dict[str, Any]:
             RoleDefinition,
             RoleType,
             field_permission_manager,
+            get_permission_cache,
             role_manager,
         )
 
@@ -44,6 +45,7 @@ def _load_security_components() -> Dict[str, Any]:
             "RoleDefinition": RoleDefinition,
             "RoleType": RoleType,
             "field_permission_manager": field_permission_manager,
+            "get_permission_cache": get_permission_cache,
             "role_manager": role_manager,
         }
     return _SECURITY_COMPONENTS
@@ -121,6 +123,30 @@ class OrderingConfig:
     allow_related: bool = True
 
 
+@dataclass
+class PaginationConfig:
+    """
+    Pagination configuration for paginated queries.
+
+    Attributes:
+        mode: ``"offset"`` (page/per_page with an exact count) or ``"keyset"``
+              (opaque ``after`` cursors, no COUNT unless ``totalCount`` or
+              ``pageCount`` is selected).
+        count_strategy: How ``totalCount`` is computed: ``"exact"`` (always
+              counted), ``"selected"`` (counted only when selected),
+              ``"estimate"`` (PostgreSQL planner estimate above
+              ``estimate_threshold`` rows) or ``"cached"`` (exact count cached
+              for ``count_cache_ttl`` seconds per filter set).
+        estimate_threshold: Estimated row count above which estimates are used.
+        count_cache_ttl: Lifetime of cached counts, in seconds.
+    """
+
+    mode: str = "offset"
+    count_strategy: str = "exact"
+    estimate_threshold: int = 100000
+    count_cache_ttl: int = 30
+
+
 @dataclass
 class ResolverConfig:
     """
@@ -138,6 +164,39 @@ class ResolverConfig:
     fields: Dict[str, Union[str, Callable]] = field(default_factory=dict)
 
 
+@dataclass
+class PropertyConfig:
+    """
+    Declarative configuration for a computed field (``@property`` or ``desc``).
+
+    Attributes:
+        requires: Concrete fields read by the property. They are kept when
+                  queries prune columns with only(), so the property does not
+                  lazy-load them one row at a time.
+        expression: Django query expression computing the same value
+                  (``F``, ``Case``, ``Concat``...) or a callable returning one.
+                  Filters and order_by on the property then run in SQL.
+    """
+
+    requires: List[str] = field(default_factory=list)
+    expression: Optional[Any] = None
+
+
+@dataclass
+class CostConfig:
+    """
+    Query cost declared for a model type.
+
+    Attributes:
+        type_cost: Cost of fetching one object of the type; multiplied by the
+                   list size when the object is fetched in a list.
+        fields: Mapping of field names to their cost (other fields cost 1).
+    """
+
+    type_cost: int = 1
+    fields: Dict[str, int] = field(default_factory=dict)
+
+
 @dataclass
 class RoleConfig:
     """Declarative role configuration scoped to a GraphQL model."""
@@ -219,16 +278,29 @@ class GraphQLMeta:
                     allowed=["name", "created_at"],
                     default=["-created_at"],
                 )
+                pagination = GraphQLMeta.Pagination(mode="keyset")
                 resolvers = GraphQLMeta.Resolvers(
                     queries={"list": "resolve_custom_list"}
                 )
+                property_scan_limit = 50000
+                label_expression = "name"
+                cost = GraphQLMeta.Cost(type_cost=2, fields={"history": 10})
+                properties = {
+                    "full_name": GraphQLMeta.Property(
+                        requires=["first_name", "last_name"],
+                        expression=Concat("first_name", Value(" "), "last_name"),
+                    ),
+                }
     """
 
     FilterField = FilterFieldConfig
     Filtering = FilteringConfig
     Fields = FieldExposureConfig
     Ordering = OrderingConfig
+    Pagination = PaginationConfig
     Resolvers = ResolverConfig
+    Property = PropertyConfig
+    Cost = CostConfig
     Role = RoleConfig
     FieldGuard = FieldGuardConfig
     OperationGuard = OperationGuardConfig
@@ -249,7 +321,18 @@ class GraphQLMeta:
         self.filtering: FilteringConfig = self._build_filtering_config()
         self.field_config: FieldExposureConfig = self._build_field_config()
         self.ordering_config: OrderingConfig = self._build_ordering_config()
+        self.pagination_config: PaginationConfig = self._build_pagination_config()
         self.resolvers: ResolverConfig = self._build_resolver_config()
+        self.property_config: Dict[str, PropertyConfig] = self._build_property_config()
+        self.cost_config: CostConfig = self._build_cost_config()
+        # Per-model cap on rows evaluated in Python for property filters/ordering
+        self.property_scan_limit: Optional[int] = getattr(
+            self._meta_config, "property_scan_limit", None
+        )
+        # Display label of rows, used for grouping buckets of relations to this model
+        self.label_expression: Optional[Any] = getattr(
+            self._meta_config, "label_expression", None
+        )
         self.access_config: AccessControlConfig = self._build_access_control_config()
 
         # Backwards-compatible attribute aliases
@@ -465,6 +548,42 @@ class GraphQLMeta:
 
         return config
 
+    def _build_pagination_config(self) -> PaginationConfig:
+        """Construct pagination configuration."""
+
+        if not self._meta_config:
+            return PaginationConfig()
+
+        raw = getattr(self._meta_config, "pagination", None)
+        if raw is None:
+            return PaginationConfig()
+        if isinstance(raw, PaginationConfig):
+            config = raw
+        elif isinstance(raw, dict):
+            config = PaginationConfig(
+                mode=raw.get("mode", "offset"),
+                count_strategy=raw.get("count_strategy", "exact"),
+                estimate_threshold=raw.get("estimate_threshold", 100000),
+                count_cache_ttl=raw.get("count_cache_ttl", 30),
+            )
+        elif isinstance(raw, str):
+            # Treat strings as a mode shortcut
+            config = PaginationConfig(mode=raw)
+        else:
+            raise ValueError(f"Unsupported pagination configuration: {raw}")
+
+        config.mode = (config.mode or "offset").strip().lower()
+        if config.mode not in ("offset", "keyset"):
+            raise ValueError(
+                f"Unsupported pagination mode for {self.model_label}: {config.mode}"
+            )
+        config.count_strategy = (config.count_strategy or "exact").strip().lower()
+        if config.count_strategy not in ("exact", "selected", "estimate", "cached"):
+            raise ValueError(
+                f"Unsupported count strategy for {self.model_label}: {config.count_strategy}"
+            )
+        return config
+
     def _build_resolver_config(self) -> ResolverConfig:
         """Construct resolver configuration."""
 
@@ -491,6 +610,57 @@ class GraphQLMeta:
 
         return ResolverConfig()
 
+    def _build_property_config(self) -> Dict[str, PropertyConfig]:
+        """Construct computed field configuration."""
+
+        if not self._meta_config:
+            return {}
+
+        raw = getattr(self._meta_config, "properties", None) or {}
+        if not isinstance(raw, dict):
+            raise ValueError(f"Unsupported properties configuration: {raw}")
+
+        return {
+            name: self._coerce_property_config(name, value)
+            for name, value in raw.items()
+        }
+
+    def _coerce_property_config(self, name: str, value: Any) -> PropertyConfig:
+        if isinstance(value, PropertyConfig):
+            return value
+        if isinstance(value, dict):
+            return PropertyConfig(
+                requires=list(value.get("requires", [])),
+                expression=value.get("expression"),
+            )
+        if isinstance(value, str):
+            return PropertyConfig(requires=[value])
+        if isinstance(value, (list, tuple, set)):
+            # Treat sequences as a requires shortcut
+            return PropertyConfig(requires=list(value))
+        raise ValueError(f"Unsupported property configuration for '{name}': {value}")
+
+    def _build_cost_config(self) -> CostConfig:
+        """Construct query cost configuration."""
+
+        if not self._meta_config:
+            return CostConfig()
+
+        raw = getattr(self._meta_config, "cost", None)
+        if raw is None:
+            return CostConfig()
+        if isinstance(raw, CostConfig):
+            return raw
+        if isinstance(raw, dict):
+            return CostConfig(
+                type_cost=int(raw.get("type_cost", 1)),
+                fields={name: int(cost) for name, cost in raw.get("fields", {}).items()},
+            )
+        if isinstance(raw, int):
+            # Treat integers as a type_cost shortcut
+            return CostConfig(type_cost=raw)
+        raise ValueError(f"Unsupported cost configuration: {raw}")
+
     def _build_access_control_config(self) -> AccessControlConfig:
         """Construct access control configuration."""
 
@@ -801,10 +971,15 @@ class GraphQLMeta:
         info: Any,
         *,
         instance: Optional[models.Model] = None,
+        instances: Optional[Sequence[models.Model]] = None,
     ) -> None:
         """
         Enforce the configured access guard for a given operation.
 
+        ``instances`` checks several instances at once (bulk mutations): user
+        roles and permissions are resolved once and only the guard condition
+        is evaluated per instance.
+
         Raises:
             GraphQLError when the current user is not allowed to perform the operation.
         """
@@ -830,30 +1005,45 @@ class GraphQLMeta:
 
         criteria_results: List[bool] = []
 
+        permission_cache = security["get_permission_cache"](context, user)
+
         if guard.roles:
             try:
-                user_roles = set(role_mgr.get_user_roles(user))
+                user_roles = set(role_mgr.get_user_roles(user, permission_cache))
             except Exception:
                 user_roles = set()
             criteria_results.append(bool(user_roles & set(guard.roles)))
 
         if guard.permissions:
             if user:
+                has_perm = (
+                    permission_cache.has_perm if permission_cache else user.has_perm
+                )
                 criteria_results.append(
-                    any(user.has_perm(perm) for perm in guard.permissions)
+                    any(has_perm(perm) for perm in guard.permissions)
                 )
             else:
                 criteria_results.append(False)
 
-        if guard.condition:
-            condition_callable = self._resolve_condition_callable(guard.condition)
+        condition_callable = (
+            self._resolve_condition_callable(guard.condition)
+            if guard.condition
+            else None
+        )
+        targets = [instance] if instances is None else list(instances) or [None]
+        if condition_callable is None:
+            # The outcome does not depend on the instance: evaluate it once
+            targets = targets[:1]
+
+        for target in targets:
+            results = list(criteria_results)
             if condition_callable:
                 try:
                     allowed = condition_callable(
                         user=user,
                         operation=operation,
                         info=info,
-                        instance=instance,
+                        instance=target,
                         model=self.model_class,
                     )
                 except Exception as exc:  # pragma: no cover - defensive logging
@@ -864,22 +1054,22 @@ class GraphQLMeta:
                         exc,
                     )
                     allowed = False
-                criteria_results.append(bool(allowed))
+                results.append(bool(allowed))
 
-        if not criteria_results:
-            # No specific roles/permissions/conditions configured -> auth check already performed.
-            return
+            if not results:
+                # No specific roles/permissions/conditions configured -> auth check already performed.
+                return
 
-        if guard.match.lower() == "all":
-            allowed = all(criteria_results)
-        else:
-            allowed = any(criteria_results)
+            if guard.match.lower() == "all":
+                allowed = all(results)
+            else:
+                allowed = any(results)
 
-        if not allowed:
-            raise GraphQLError(
-                guard.deny_message
-                or f"Operation '{operation}' is not permitted on {self.model_class.__name__}"
-            )
+            if not allowed:
+                raise GraphQLError(
+                    guard.deny_message
+                    or f"Operation '{operation}' is not permitted on {self.model_class.__name__}"
+                )
 
     def describe_operation_guard(
         self,
@@ -914,9 +1104,11 @@ class GraphQLMeta:
         criteria_results: List[bool] = []
         failure_reasons: List[str] = []
 
+        permission_cache = security["get_permission_cache"](user=user)
+
         if guard.roles:
             try:
-                user_roles = set(role_mgr.get_user_roles(user))
+                user_roles = set(role_mgr.get_user_roles(user, permission_cache))
             except Exception:
                 user_roles = set()
             role_allowed = bool(user_roles & set(guard.roles))
@@ -925,7 +1117,8 @@ class GraphQLMeta:
                 failure_reasons.append("Rôle requis manquant")
 
         if guard.permissions:
-            permission_allowed = any(user.has_perm(perm) for perm in guard.permissions)
+            has_perm = permission_cache.has_perm if permission_cache else user.has_perm
+            permission_allowed = any(has_perm(perm) for perm in guard.permissions)
             criteria_results.append(permission_allowed)
             if not permission_allowed:
                 failure_reasons.append("Permission manquante")
@@ -1169,6 +1362,89 @@ class GraphQLMeta:
             for name, cfg in self.filtering.fields.items()
         }
 
+    def get_property_requirements(self, property_name: str) -> Optional[List[str]]:
+        """
+        Get the concrete fields a computed field declares it reads.
+
+        Returns:
+            List of field names, or None when the property is not declared.
+        """
+
+        config = self.property_config.get(property_name)
+        if config is None:
+            return None
+        return list(config.requires)
+
+    def get_property_expression(self, property_name: str) -> Optional[Any]:
+        """
+        Get the query expression declared for a property.
+
+        Returns:
+            Django expression, or None when the property has no SQL equivalent.
+        """
+
+        config = self.property_config.get(property_name)
+        if config is None or config.expression is None:
+            return None
+        expression = config.expression
+        if callable(expression):
+            expression = expression()
+        return expression
+
+    def get_label_expression(self) -> Optional[Any]:
+        """
+        Get the expression computing the display label of a row.
+
+        ``label_expression`` may be a field path (``"name"``), a query
+        expression or a callable returning one.
+
+        Returns:
+            Django expression, or None when rows are labelled with ``str()``.
+        """
+
+        expression = self.label_expression
+        if expression is None:
+            return None
+        if callable(expression):
+            expression = expression()
+        if isinstance(expression, str):
+            expression = F(expression)
+        return expression
+
+    def apply_property_expressions(
+        self, queryset: models.QuerySet, names: Iterable[str]
+    ) -> models.QuerySet:
+        """
+        Alias the declared expressions of the properties referenced by ``names``.
+
+        ``names`` are filter keys or order_by specs (``full_name__icontains``,
+        ``-full_name``). The alias reuses the property name so lookups and
+        ordering on it run in SQL; properties without expression are skipped.
+        """
+
+        aliases: Dict[str, Any] = {}
+        for name in names:
+            property_name = str(name).lstrip("-").split("__")[0]
+            if property_name in aliases or property_name in queryset.query.annotations:
+                continue
+            expression = self.get_property_expression(property_name)
+            if expression is not None:
+                aliases[property_name] = expression
+        return queryset.alias(**aliases) if aliases else queryset
+
+    def has_guard_conditions(self) -> bool:
+        """Check if any operation or field guard uses a condition callable."""
+
+        if any(guard.condition for guard in self._operation_guards.values()):
+            return True
+        return any(guard.condition for guard in self.access_config.fields)
+
+    def operation_guard_uses_instance(self, operation: str) -> bool:
+        """Check if the guard of ``operation`` needs the instance (condition callable)."""
+
+        guard = self._operation_guards.get(operation) or self._operation_guards.get("*")
+        return bool(guard and guard.condition and not guard.allow_anonymous)
+
     def get_ordering_fields(self) -> List[str]:
         """
         Get the ordering fields configuration.
@@ -3,12 +3,33 @@ GraphQL middleware for Rail Django GraphQL.
 
 This module implements middleware functionality defined in LIBRARY_DEFAULTS
 including authentication, logging, performance monitoring, and error handling.
+
+Each middleware declares a scope:
+
+- ``OPERATION``: runs once per document, on its first root field; the outcome
+  is memoized on the context and replayed for the other root fields
+- ``ROOT``: runs for every root field
+- ``FIELD``: runs for every non-trivial field
+
+``compile_middleware_stack`` turns a stack into a single middleware that only
+calls the middlewares relevant to the field being resolved. Nested fields
+returning a scalar through a default resolver bypass the chain entirely.
 """
 
 import logging
 import time
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional, Union
+from enum import Enum
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from graphene.types.resolver import attr_resolver, dict_or_attr_resolver, dict_resolver
+from graphql import (
+    GraphQLEnumType,
+    GraphQLScalarType,
+    get_named_type,
+    value_from_ast_untyped,
+)
 
 from django.contrib.auth.models import AnonymousUser
 from django.utils import timezone
@@ -62,13 +83,27 @@ class MiddlewareSettings:
         return cls(**filtered_settings)
 
 
+class MiddlewareScope(Enum):
+    """Granularity at which a middleware runs."""
+
+    OPERATION = "operation"
+    ROOT = "root"
+    FIELD = "field"
+
+
 class BaseMiddleware:
     """Base class for GraphQL middleware."""
 
+    scope = MiddlewareScope.FIELD
+
     def __init__(self, schema_name: Optional[str] = None):
         self.schema_name = schema_name
         self.settings = MiddlewareSettings.from_schema(schema_name)
 
+    def is_enabled(self) -> bool:
+        """Whether the middleware is kept when the stack is compiled."""
+        return True
+
     def resolve(self, next_resolver: Callable, root: Any, info: Any, **kwargs) -> Any:
         """
         Middleware resolve method.
@@ -88,10 +123,15 @@ class BaseMiddleware:
 class AuthenticationMiddleware(BaseMiddleware):
     """Middleware for handling authentication."""
 
+    scope = MiddlewareScope.OPERATION
+
     def __init__(self, schema_name: Optional[str] = None):
         super().__init__(schema_name)
         self.auth_manager = get_auth_manager(schema_name)
 
+    def is_enabled(self) -> bool:
+        return self.settings.enable_authentication_middleware
+
     def resolve(self, next_resolver: Callable, root: Any, info: Any, **kwargs) -> Any:
         """Authenticate user and add to context."""
         if not self.settings.enable_authentication_middleware:
@@ -108,6 +148,11 @@ class AuthenticationMiddleware(BaseMiddleware):
 class LoggingMiddleware(BaseMiddleware):
     """Middleware for logging GraphQL operations."""
 
+    scope = MiddlewareScope.ROOT
+
+    def is_enabled(self) -> bool:
+        return self.settings.enable_logging_middleware
+
     def resolve(self, next_resolver: Callable, root: Any, info: Any, **kwargs) -> Any:
         """Log GraphQL operations."""
         if not self.settings.enable_logging_middleware:
@@ -161,6 +206,11 @@ class LoggingMiddleware(BaseMiddleware):
 class PerformanceMiddleware(BaseMiddleware):
     """Middleware for performance monitoring."""
 
+    scope = MiddlewareScope.ROOT
+
+    def is_enabled(self) -> bool:
+        return self.settings.enable_performance_middleware
+
     def resolve(self, next_resolver: Callable, root: Any, info: Any, **kwargs) -> Any:
         """Monitor performance of GraphQL operations."""
         if not self.settings.enable_performance_middleware:
@@ -194,23 +244,28 @@ class PerformanceMiddleware(BaseMiddleware):
 class RateLimitingMiddleware(BaseMiddleware):
     """Middleware for rate limiting."""
 
+    scope = MiddlewareScope.OPERATION
+
     def __init__(self, schema_name: Optional[str] = None):
         super().__init__(schema_name)
         self.rate_limiter = get_rate_limiter(schema_name)
 
+    def is_enabled(self) -> bool:
+        return self.settings.enable_rate_limiting_middleware
+
     def resolve(self, next_resolver: Callable, root: Any, info: Any, **kwargs) -> Any:
-        """Apply rate limiting to GraphQL operations."""
+        """Apply rate limiting once per GraphQL operation."""
         if not self.settings.enable_rate_limiting_middleware:
             return next_resolver(root, info, **kwargs)
 
-        # Check rate limits
-        identifier = self.rate_limiter.get_client_identifier(info.context)
+        # Only the first root field of an operation is counted
+        from ..extensions.rate_limiting import is_new_operation
 
-        if not self.rate_limiter.check_rate_limit(identifier, "minute"):
-            raise PermissionError("Rate limit exceeded (per minute)")
-
-        if not self.rate_limiter.check_rate_limit(identifier, "hour"):
-            raise PermissionError("Rate limit exceeded (per hour)")
+        if is_new_operation(info, "core"):
+            identifier = self.rate_limiter.get_client_identifier(info.context)
+            result = self.rate_limiter.check(identifier)
+            if not result.allowed:
+                raise PermissionError(f"Rate limit exceeded (per {result.rule.name})")
 
         return next_resolver(root, info, **kwargs)
 
@@ -221,18 +276,24 @@ class RateLimitingMiddleware(BaseMiddleware):
 class ValidationMiddleware(BaseMiddleware):
     """Middleware for input validation."""
 
+    scope = MiddlewareScope.OPERATION
+
     def __init__(self, schema_name: Optional[str] = None):
         super().__init__(schema_name)
         self.input_validator = get_input_validator(schema_name)
 
+    def is_enabled(self) -> bool:
+        return self.settings.enable_validation_middleware
+
     def resolve(self, next_resolver: Callable, root: Any, info: Any, **kwargs) -> Any:
-        """Validate GraphQL inputs."""
+        """Validate every input of the GraphQL document."""
         if not self.settings.enable_validation_middleware:
             return next_resolver(root, info, **kwargs)
 
-        # Validate input arguments
-        if kwargs:
-            validation_errors = self.input_validator.validate_input(kwargs)
+        # Variables and literal arguments of the whole document, checked once
+        inputs = _collect_operation_inputs(info)
+        if inputs:
+            validation_errors = self.input_validator.validate_input(inputs)
             if validation_errors:
                 raise ValueError(f"Input validation failed: {'; '.join(validation_errors)}")
 
@@ -242,6 +303,9 @@ class ValidationMiddleware(BaseMiddleware):
 class ErrorHandlingMiddleware(BaseMiddleware):
     """Middleware for error handling."""
 
+    def is_enabled(self) -> bool:
+        return self.settings.enable_error_handling_middleware
+
     def resolve(self, next_resolver: Callable, root: Any, info: Any, **kwargs) -> Any:
         """Handle and format GraphQL errors."""
         if not self.settings.enable_error_handling_middleware:
@@ -277,10 +341,15 @@ class ErrorHandlingMiddleware(BaseMiddleware):
 class QueryComplexityMiddleware(BaseMiddleware):
     """Middleware for query complexity analysis."""
 
+    scope = MiddlewareScope.OPERATION
+
     def __init__(self, schema_name: Optional[str] = None):
         super().__init__(schema_name)
         self.complexity_analyzer = get_complexity_analyzer(schema_name)
 
+    def is_enabled(self) -> bool:
+        return self.settings.enable_query_complexity_middleware
+
     def resolve(self, next_resolver: Callable, root: Any, info: Any, **kwargs) -> Any:
         """Analyze and limit query complexity."""
         if not self.settings.enable_query_complexity_middleware:
@@ -291,9 +360,12 @@ class QueryComplexityMiddleware(BaseMiddleware):
         if operation_type != "query":
             return next_resolver(root, info, **kwargs)
 
-        # Analyze query complexity
-        query_string = str(info.operation)
-        validation_errors = self.complexity_analyzer.validate_query_limits(query_string)
+        # Cost computed during validation (or once per operation)
+        from .query_cost import get_query_cost, validate_query_cost
+
+        validation_errors = validate_query_cost(
+            get_query_cost(info), self.complexity_analyzer.settings
+        )
 
         if validation_errors:
             raise ValueError(f"Query complexity validation failed: {'; '.join(validation_errors)}")
@@ -304,6 +376,11 @@ class QueryComplexityMiddleware(BaseMiddleware):
 class CORSMiddleware(BaseMiddleware):
     """Middleware for CORS handling."""
 
+    scope = MiddlewareScope.OPERATION
+
+    def is_enabled(self) -> bool:
+        return self.settings.enable_cors_middleware
+
     def resolve(self, next_resolver: Callable, root: Any, info: Any, **kwargs) -> Any:
         """Handle CORS for GraphQL requests."""
         if not self.settings.enable_cors_middleware:
@@ -321,7 +398,6 @@ DEFAULT_MIDDLEWARE = [
     RateLimitingMiddleware,
     ValidationMiddleware,
     QueryComplexityMiddleware,
-    CachingMiddleware,
     PerformanceMiddleware,
     LoggingMiddleware,
     ErrorHandlingMiddleware,
@@ -348,30 +424,186 @@ def get_middleware_stack(schema_name: Optional[str] = None) -> List[BaseMiddlewa
     return middleware_stack
 
 
-def create_middleware_resolver(middleware_stack: List[BaseMiddleware]) -> Callable:
+def _collect_operation_inputs(info: Any) -> Dict[str, Any]:
+    """Collect the variables and literal arguments of the current operation."""
+    variables = dict(info.variable_values or {})
+    inputs: Dict[str, Any] = {"variables": variables} if variables else {}
+    fragments = getattr(info, "fragments", None) or {}
+    visited = set()
+    stack = [info.operation.selection_set]
+    while stack:
+        selection_set = stack.pop()
+        for selection in getattr(selection_set, "selections", None) or ():
+            if selection.kind == "fragment_spread":
+                name = selection.name.value
+                if name not in visited and name in fragments:
+                    visited.add(name)
+                    stack.append(fragments[name].selection_set)
+                continue
+            if selection.kind == "field":
+                for argument in selection.arguments or ():
+                    if argument.value.kind != "variable":
+                        key = f"{selection.name.value}.{argument.name.value}"
+                        inputs[key] = value_from_ast_untyped(argument.value, variables)
+            if selection.selection_set is not None:
+                stack.append(selection.selection_set)
+    return inputs
+
+
+_DEFAULT_RESOLVERS = (attr_resolver, dict_resolver, dict_or_attr_resolver)
+OPERATION_RESULTS_ATTRIBUTE = "_rail_operation_middleware"
+
+
+def _skip_resolver(root: Any, info: Any, **kwargs) -> None:
+    """Terminal resolver of operation-scope middlewares."""
+    return None
+
+
+class CompiledMiddleware:
     """
-    Create a resolver that applies middleware stack.
+    Single middleware running a stack according to each middleware's scope.
+
+    Args:
+        middleware_stack: Middleware instances, in execution order
+        use_scopes: When False every middleware runs on every field
+            (the behaviour of the uncompiled stack)
+    """
+
+    def __init__(self, middleware_stack: List[BaseMiddleware], use_scopes: bool = True):
+        enabled = [m for m in middleware_stack if m.is_enabled()]
+        if not use_scopes:
+            self.operation: Tuple[BaseMiddleware, ...] = ()
+            self.root = self.field = tuple(enabled)
+        else:
+            self.operation = tuple(
+                m for m in enabled if m.scope is MiddlewareScope.OPERATION
+            )
+            self.root = tuple(m for m in enabled if m.scope is not MiddlewareScope.OPERATION)
+            self.field = tuple(m for m in enabled if m.scope is MiddlewareScope.FIELD)
+        self.use_scopes = use_scopes
+        self._handlers: Dict[Tuple[str, Any], Callable] = {}
+        self._trivial_fields: Dict[Tuple[str, str], bool] = {}
+
+    def resolve(self, next_resolver: Callable, root: Any, info: Any, **kwargs) -> Any:
+        """Apply the middlewares relevant to the field being resolved."""
+        if info.path.prev is not None:
+            if not self.field or (self.use_scopes and self._is_trivial(info)):
+                return next_resolver(root, info, **kwargs)
+            return self._get_handler("field", self.field, next_resolver)(
+                root, info, **kwargs
+            )
+
+        if self.operation:
+            self._run_operation_middlewares(root, info, kwargs)
+        if not self.root:
+            return next_resolver(root, info, **kwargs)
+        return self._get_handler("root", self.root, next_resolver)(root, info, **kwargs)
+
+    def _run_operation_middlewares(self, root: Any, info: Any, kwargs: Dict) -> None:
+        """Run operation-scope middlewares once per document."""
+        context = info.context
+        results = getattr(context, OPERATION_RESULTS_ATTRIBUTE, None)
+        if results is None:
+            results = {}
+            try:
+                setattr(context, OPERATION_RESULTS_ATTRIBUTE, results)
+            except (AttributeError, TypeError):
+                results = None
+
+        key = id(info.operation)
+        if results is not None and key in results:
+            error = results[key]
+        else:
+            error = None
+            try:
+                self._get_handler("operation", self.operation, _skip_resolver)(
+                    root, info, **kwargs
+                )
+            except Exception as e:
+                error = e
+            if results is not None:
+                results[key] = error
+        if error is not None:
+            raise error
+
+    def _get_handler(
+        self, scope: str, middlewares: Tuple[BaseMiddleware, ...], next_resolver: Callable
+    ) -> Callable:
+        """Return the chain of `middlewares` ending with `next_resolver`."""
+        key = (scope, next_resolver)
+        try:
+            handler = self._handlers.get(key)
+        except TypeError:
+            return self._build_handler(middlewares, next_resolver)
+        if handler is None:
+            if len(self._handlers) > 4096:
+                self._handlers.clear()
+            handler = self._handlers[key] = self._build_handler(middlewares, next_resolver)
+        return handler
+
+    @staticmethod
+    def _build_handler(
+        middlewares: Tuple[BaseMiddleware, ...], next_resolver: Callable
+    ) -> Callable:
+        handler = next_resolver
+        for middleware in reversed(middlewares):
+            handler = partial(middleware.resolve, handler)
+        return handler
+
+    def _is_trivial(self, info: Any) -> bool:
+        """Whether a field returns a scalar through a default resolver."""
+        key = (info.parent_type.name, info.field_name)
+        trivial = self._trivial_fields.get(key)
+        if trivial is None:
+            field_def = info.parent_type.fields.get(info.field_name)
+            resolver = getattr(field_def, "resolve", None)
+            default_resolver = resolver is None or (
+                isinstance(resolver, partial) and resolver.func in _DEFAULT_RESOLVERS
+            )
+            trivial = default_resolver and isinstance(
+                get_named_type(info.return_type), (GraphQLScalarType, GraphQLEnumType)
+            )
+            self._trivial_fields[key] = trivial
+        return trivial
+
+
+def compile_middleware_stack(
+    middleware_stack: List[BaseMiddleware], use_scopes: bool = True
+) -> CompiledMiddleware:
+    """
+    Compile a middleware stack into a single scoped middleware.
 
     Args:
         middleware_stack: List of middleware instances
+        use_scopes: Honour middleware scopes (False runs everything per field)
 
     Returns:
-        Middleware resolver function
+        CompiledMiddleware usable in a GraphQL middleware list
     """
-    def middleware_resolver(next_resolver: Callable, root: Any, info: Any, **kwargs) -> Any:
-        """Apply middleware stack to resolver."""
+    return CompiledMiddleware(middleware_stack, use_scopes=use_scopes)
 
-        def apply_middleware(index: int) -> Any:
-            if index >= len(middleware_stack):
-                return next_resolver(root, info, **kwargs)
 
-            middleware = middleware_stack[index]
+def get_compiled_middleware(schema_name: Optional[str] = None) -> CompiledMiddleware:
+    """
+    Get the compiled middleware of a schema.
 
-            def next_middleware_resolver(r, i, **kw):
-                return apply_middleware(index + 1)
+    Args:
+        schema_name: Schema name (optional)
 
-            return middleware.resolve(next_middleware_resolver, root, info, **kwargs)
+    Returns:
+        CompiledMiddleware built from the default stack
+    """
+    return compile_middleware_stack(get_middleware_stack(schema_name))
 
-        return apply_middleware(0)
 
-    return middleware_resolver
+def create_middleware_resolver(middleware_stack: List[BaseMiddleware]) -> Callable:
+    """
+    Create a resolver that applies middleware stack.
+
+    Args:
+        middleware_stack: List of middleware instances
+
+    Returns:
+        Middleware resolver function
+    """
+    return compile_middleware_stack(middleware_stack).resolve
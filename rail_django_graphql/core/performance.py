@@ -8,7 +8,7 @@ fully removed from this project.
 
 import logging
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Type, Union
+from typing import Any, Dict, List, Optional, Sequence, Type, Union
 
 from django.conf import settings as django_settings
 from django.db import models
@@ -34,6 +34,12 @@ class PerformanceSettings:
     max_query_complexity: int = 1000
     enable_query_cost_analysis: bool = False
     query_timeout: int = 30  # seconds
+    # List multiplier when no limit/per_page argument is given, and its cap
+    default_list_size: int = 10
+    max_list_size: int = 1000
+    query_cost_cache_size: int = 512
+    # Parsed and validated documents kept per process (0 disables the cache)
+    document_cache_size: int = 1000
 
     @classmethod
     def from_schema(cls, schema_name: Optional[str] = None) -> "PerformanceSettings":
@@ -133,18 +139,94 @@ class QueryOptimizer:
 
         return prefetch_fields
 
-    def _get_only_fields(self, model: Type[models.Model], info: Any = None) -> List[str]:
+    def apply_only_fields(
+        self,
+        queryset: models.QuerySet,
+        info: Any = None,
+        extra_fields: Sequence[str] = (),
+    ) -> models.QuerySet:
+        """
+        Restrict a QuerySet to the columns the GraphQL selection reads.
+
+        Call this once select_related() has been applied so joined models are
+        pruned too. ``extra_fields`` lists additional local fields to keep
+        (ordering specs, property names).
+
+        Args:
+            queryset: The Django QuerySet to prune
+            info: GraphQL resolve info of the field returning the rows
+            extra_fields: Additional field names to keep loaded
+
+        Returns:
+            QuerySet restricted with only(), or the original QuerySet
+        """
+        if (
+            info is None
+            or not self.settings.enable_query_optimization
+            or not self.settings.enable_only_fields
+        ):
+            return queryset
+
+        only_fields = self._get_only_fields(
+            queryset.model, info, queryset=queryset, extra_fields=extra_fields
+        )
+        if only_fields:
+            queryset = queryset.only(*only_fields)
+        return queryset
+
+    def _get_only_fields(
+        self,
+        model: Type[models.Model],
+        info: Any = None,
+        queryset: Optional[models.QuerySet] = None,
+        extra_fields: Sequence[str] = (),
+    ) -> List[str]:
         """Get fields that should be included in only()."""
-        # For now, return empty list - could be enhanced with GraphQL field analysis
-        return []
+        if info is None:
+            return []
+
+        joined: Any = {}
+        if queryset is not None:
+            query = queryset.query
+            if query.deferred_loading[0] or not query.deferred_loading[1]:
+                # Explicit only()/defer() calls win over the selection plan
+                return []
+            joined = query.select_related
+            if joined is True:
+                # select_related() without paths joins unknown relations
+                return []
+
+        from ..extensions.optimization import get_optimizer
+
+        analyzer = get_optimizer().analyzer
+        try:
+            tree = analyzer._unwrap_connection(model, analyzer.build_selection_tree(info))
+            only_fields = analyzer.plan_only_fields(
+                model,
+                tree,
+                joined=joined or {},
+                extra_fields=[spec.lstrip("-") for spec in extra_fields if spec],
+            )
+        except Exception as e:
+            logger.warning(f"Failed to plan only() fields for {model.__name__}: {e}")
+            return []
+
+        return only_fields or []
 
     def _get_defer_fields(self, model: Type[models.Model], info: Any = None) -> List[str]:
-        """Get fields that should be deferred."""
-        defer_fields = []
+        """Get large fields that the GraphQL selection does not read."""
+        if info is None:
+            return []
 
-        # Defer large text fields by default
-        for field in model._meta.get_fields():
-            if isinstance(field, models.TextField):
+        only_fields = set(self._get_only_fields(model, info))
+        if not only_fields:
+            return []
+
+        defer_fields = []
+        for field in model._meta.concrete_fields:
+            if field.name in only_fields:
+                continue
+            if isinstance(field, (models.TextField, models.JSONField, models.BinaryField)):
                 defer_fields.append(field.name)
 
         return defer_fields
@@ -160,53 +242,27 @@ class QueryComplexityAnalyzer:
         self.schema_name = schema_name
         self.settings = PerformanceSettings.from_schema(schema_name)
 
-    def analyze_query_depth(self, query: str) -> int:
-        """Analyze the depth of a GraphQL query."""
-        # Simple depth analysis - could be enhanced with proper AST parsing
-        depth = 0
-        current_depth = 0
+    def analyze_query_cost(self, query: str) -> Any:
+        """Analyze a GraphQL query with the shared query cost analyzer."""
+        from graphql import parse
 
-        for char in query:
-            if char == '{':
-                current_depth += 1
-                depth = max(depth, current_depth)
-            elif char == '}':
-                current_depth -= 1
+        from .query_cost import get_query_cost_analyzer
 
-        return depth
+        return get_query_cost_analyzer().analyze(None, parse(query))
+
+    def analyze_query_depth(self, query: str) -> int:
+        """Analyze the depth of a GraphQL query."""
+        return self.analyze_query_cost(query).depth
 
     def analyze_query_complexity(self, query: str) -> int:
         """Analyze the complexity of a GraphQL query."""
-        # Simple complexity analysis - count fields and nested structures
-        complexity = 0
-
-        # Count field selections (simplified)
-        lines = query.split('\n')
-        for line in lines:
-            stripped = line.strip()
-            if stripped and not stripped.startswith('#') and '{' not in stripped and '}' not in stripped:
-                complexity += 1
-
-        return complexity
+        return self.analyze_query_cost(query).complexity
 
     def validate_query_limits(self, query: str) -> List[str]:
         """Validate query against performance limits."""
-        errors = []
-
-        # Check query depth
-        depth = self.analyze_query_depth(query)
-        if depth > self.settings.max_query_depth:
-            errors.append(
-                f"Query depth {depth} exceeds maximum allowed depth {self.settings.max_query_depth}")
-
-        # Check query complexity
-        if self.settings.enable_query_cost_analysis:
-            complexity = self.analyze_query_complexity(query)
-            if complexity > self.settings.max_query_complexity:
-                errors.append(
-                    f"Query complexity {complexity} exceeds maximum allowed complexity {self.settings.max_query_complexity}")
-
-        return errors
+        from .query_cost import validate_query_cost
+
+        return validate_query_cost(self.analyze_query_cost(query), self.settings)
 
 
 # Global instances
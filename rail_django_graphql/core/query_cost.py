@@ -0,0 +1,528 @@
+"""
+Query cost analysis for Rail Django GraphQL.
+
+A single schema-aware analyzer computes the cost, depth and field count of a
+GraphQL document:
+
+- every field costs 1, unless the model's ``GraphQLMeta.Cost`` declares
+  another cost for it; objects cost ``type_cost``
+- list fields multiply the cost of their selection by the list size, taken
+  from a ``limit`` / ``per_page`` / ``first`` / ``last`` argument (on the
+  field or on the paginated wrapper above it), else ``default_list_size``;
+  a variable missing from the request takes its declared default value
+- fragments are expanded where they are spread
+
+Results are cached in an LRU keyed by the schema name and version (the
+schema object itself when they are unknown), the normalized document hash
+and the values of the variables that drive list sizes. ``QueryCostValidationRule``
+runs the analysis during validation; the view exposes the result as
+``context.query_cost`` for rate limiting and metrics.
+"""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set, Tuple, Type
+
+from graphene.utils.str_converters import to_camel_case
+from graphql import (
+    DocumentNode,
+    FragmentDefinitionNode,
+    GraphQLError,
+    GraphQLList,
+    GraphQLNonNull,
+    GraphQLSchema,
+    OperationDefinitionNode,
+    ValidationRule,
+    get_named_type,
+    print_ast,
+    value_from_ast_untyped,
+)
+
+from .performance import PerformanceSettings
+
+logger = logging.getLogger(__name__)
+
+SIZE_ARGUMENTS = ("limit", "per_page", "perPage", "first", "last", "page_size", "pageSize")
+CONTEXT_ATTRIBUTE = "query_cost"
+# Cache key of a variable absent from the request (its default value applies)
+_UNSET = "<unset>"
+
+
+@dataclass(frozen=True)
+class QueryCost:
+    """Cost analysis of a GraphQL document."""
+
+    complexity: int
+    depth: int
+    field_count: int
+    operation_count: int = 1
+    has_introspection: bool = False
+    has_mutations: bool = False
+
+
+class _Analysis:
+    """Mutable state of one analysis pass."""
+
+    def __init__(self, schema, fragments, variables):
+        self.schema = schema
+        self.fragments = fragments
+        self.variables = variables
+        self.depth = 0
+        self.field_count = 0
+        self.has_introspection = False
+        self.size_variables: Set[str] = set()
+
+
+class QueryCostAnalyzer:
+    """Compute and cache the cost of GraphQL documents."""
+
+    def __init__(self, settings: Optional[PerformanceSettings] = None):
+        self.settings = settings or PerformanceSettings.from_schema()
+        self._entries: "OrderedDict[Hashable, Tuple[Tuple[str, ...], Dict]]" = OrderedDict()
+        self._field_costs: Dict[Any, Tuple[int, Dict[str, int]]] = {}
+        self._versions: Dict[Hashable, Hashable] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def analyze(
+        self,
+        schema: Optional[GraphQLSchema],
+        document: DocumentNode,
+        operation_name: Optional[str] = None,
+        variables: Optional[Dict[str, Any]] = None,
+        document_hash: Optional[str] = None,
+        schema_name: Optional[Hashable] = None,
+        schema_version: Optional[Hashable] = None,
+    ) -> QueryCost:
+        """
+        Return the cost of a document, from the cache when possible.
+
+        Args:
+            schema: GraphQL schema (None analyzes without type information)
+            document: Parsed document
+            operation_name: Operation to analyze (all operations when None)
+            variables: Variable values
+            document_hash: Known hash of the document (computed when None)
+            schema_name: Name of the schema (entries are keyed by the schema
+                object when None)
+            schema_version: Version reported by the schema builder; a new
+                version drops the entries of the schema
+
+        Returns:
+            QueryCost of the operation (the most expensive one when several)
+        """
+        variables = variables or {}
+        if document_hash is None:
+            document_hash = hashlib.sha256(print_ast(document).encode("utf-8")).hexdigest()
+        if schema_name is not None:
+            scope: Hashable = (schema_name, schema_version)
+        else:
+            scope = schema
+        key = (scope, document_hash, operation_name)
+        with self._lock:
+            if schema_name is not None:
+                self._check_version(schema_name, schema_version)
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                size_variables, costs = entry
+                values = self._variables_key(size_variables, variables)
+                cost = costs.get(values)
+                if cost is not None:
+                    self.hits += 1
+                    return cost
+
+        cost, size_variables = self._compute(schema, document, operation_name, variables)
+        values = self._variables_key(size_variables, variables)
+        with self._lock:
+            self.misses += 1
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = (size_variables, {})
+            costs = entry[1]
+            if len(costs) >= 64:
+                costs.clear()
+            costs[values] = cost
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.settings.query_cost_cache_size:
+                self._entries.popitem(last=False)
+        return cost
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        with self._lock:
+            self._entries.clear()
+            self._field_costs.clear()
+            self._versions.clear()
+            self.hits = self.misses = 0
+
+    def _check_version(self, schema_name: Hashable, schema_version: Hashable) -> None:
+        current = self._versions.get(schema_name)
+        if current == schema_version:
+            return
+        if schema_name in self._versions:
+            for key in [key for key in self._entries if key[0] == (schema_name, current)]:
+                del self._entries[key]
+            # Types of the previous schema are no longer reachable
+            self._field_costs.clear()
+        self._versions[schema_name] = schema_version
+
+    @staticmethod
+    def _variables_key(names: Tuple[str, ...], variables: Dict[str, Any]) -> Tuple:
+        # An absent variable uses its default, an explicit null does not
+        return tuple(
+            repr(variables[name]) if name in variables else _UNSET for name in names
+        )
+
+    @staticmethod
+    def _operation_variables(
+        operation: OperationDefinitionNode, variables: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Request variables completed with the operation's default values."""
+        values = {}
+        for definition in operation.variable_definitions or ():
+            name = definition.variable.name.value
+            if name not in variables and definition.default_value is not None:
+                values[name] = value_from_ast_untyped(definition.default_value)
+        if not values:
+            return variables
+        values.update(variables)
+        return values
+
+    def _compute(
+        self,
+        schema: Optional[GraphQLSchema],
+        document: DocumentNode,
+        operation_name: Optional[str],
+        variables: Dict[str, Any],
+    ) -> Tuple[QueryCost, Tuple[str, ...]]:
+        fragments = {
+            definition.name.value: definition
+            for definition in document.definitions
+            if isinstance(definition, FragmentDefinitionNode)
+        }
+        operations = [
+            definition
+            for definition in document.definitions
+            if isinstance(definition, OperationDefinitionNode)
+        ]
+        selected = [
+            operation
+            for operation in operations
+            if operation_name is None
+            or (operation.name is not None and operation.name.value == operation_name)
+        ]
+
+        best = None
+        size_variables: Set[str] = set()
+        for operation in selected:
+            analysis = _Analysis(
+                schema, fragments, self._operation_variables(operation, variables)
+            )
+            root_type = (
+                schema.get_root_type(operation.operation) if schema is not None else None
+            )
+            complexity = self._selection_cost(
+                analysis, operation.selection_set, root_type, 1, None, ()
+            )
+            size_variables |= analysis.size_variables
+            cost = QueryCost(
+                complexity=complexity,
+                depth=analysis.depth,
+                field_count=analysis.field_count,
+                operation_count=len(operations),
+                has_introspection=analysis.has_introspection,
+                has_mutations=operation.operation.value == "mutation",
+            )
+            if best is None or cost.complexity > best.complexity:
+                best = cost
+        if best is None:
+            best = QueryCost(0, 0, 0, operation_count=len(operations))
+        return best, tuple(sorted(size_variables))
+
+    def _selection_cost(
+        self,
+        analysis: _Analysis,
+        selection_set: Any,
+        parent_type: Any,
+        depth: int,
+        pending_size: Optional[int],
+        fragment_path: Tuple[str, ...],
+    ) -> int:
+        """Cost of a selection set; `pending_size` sizes the next list below."""
+        total = 0
+        for selection in selection_set.selections:
+            kind = selection.kind
+            if kind == "fragment_spread":
+                name = selection.name.value
+                fragment = analysis.fragments.get(name)
+                if fragment is None or name in fragment_path:
+                    continue
+                total += self._selection_cost(
+                    analysis,
+                    fragment.selection_set,
+                    self._condition_type(analysis, fragment, parent_type),
+                    depth,
+                    pending_size,
+                    fragment_path + (name,),
+                )
+            elif kind == "inline_fragment":
+                total += self._selection_cost(
+                    analysis,
+                    selection.selection_set,
+                    self._condition_type(analysis, selection, parent_type),
+                    depth,
+                    pending_size,
+                    fragment_path,
+                )
+            elif kind == "field":
+                total += self._field_cost(
+                    analysis, selection, parent_type, depth, pending_size, fragment_path
+                )
+        return total
+
+    def _field_cost(
+        self,
+        analysis: _Analysis,
+        node: Any,
+        parent_type: Any,
+        depth: int,
+        pending_size: Optional[int],
+        fragment_path: Tuple[str, ...],
+    ) -> int:
+        name = node.name.value
+        if name == "__typename":
+            return 0
+        if name in ("__schema", "__type"):
+            analysis.has_introspection = True
+
+        analysis.field_count += 1
+        analysis.depth = max(analysis.depth, depth)
+
+        field_def = None
+        fields = getattr(parent_type, "fields", None)
+        if fields is not None:
+            field_def = fields.get(name)
+        field_type = getattr(field_def, "type", None)
+        _, declared_costs = self._get_type_costs(parent_type)
+        declared = declared_costs.get(name)
+
+        if node.selection_set is None:
+            return declared if declared is not None else 1
+
+        child_type = get_named_type(field_type) if field_type is not None else None
+        type_cost, _ = self._get_type_costs(child_type)
+        own_cost = declared if declared is not None else type_cost
+        size = self._size_argument(analysis, node)
+
+        if self._is_list(field_type, node, size):
+            multiplier = size or pending_size or self.settings.default_list_size
+            multiplier = max(min(multiplier, self.settings.max_list_size), 0)
+            children = self._selection_cost(
+                analysis, node.selection_set, child_type, depth + 1, None, fragment_path
+            )
+            return multiplier * (own_cost + children)
+
+        children = self._selection_cost(
+            analysis,
+            node.selection_set,
+            child_type,
+            depth + 1,
+            size or pending_size,
+            fragment_path,
+        )
+        return own_cost + children
+
+    @staticmethod
+    def _is_list(field_type: Any, node: Any, size: Optional[int]) -> bool:
+        if field_type is None:
+            # Without type information, a sized selection is treated as a list
+            return size is not None
+        while isinstance(field_type, GraphQLNonNull):
+            field_type = field_type.of_type
+        return isinstance(field_type, GraphQLList)
+
+    @staticmethod
+    def _condition_type(analysis: _Analysis, node: Any, parent_type: Any) -> Any:
+        condition = getattr(node, "type_condition", None)
+        if condition is None or analysis.schema is None:
+            return parent_type
+        return analysis.schema.get_type(condition.name.value) or parent_type
+
+    @staticmethod
+    def _size_argument(analysis: _Analysis, node: Any) -> Optional[int]:
+        for argument in node.arguments or ():
+            if argument.name.value not in SIZE_ARGUMENTS:
+                continue
+            value = argument.value
+            if value.kind == "variable":
+                name = value.name.value
+                analysis.size_variables.add(name)
+                raw = analysis.variables.get(name)
+            else:
+                raw = getattr(value, "value", None)
+            try:
+                return int(raw) if raw is not None else None
+            except (TypeError, ValueError):
+                return None
+        return None
+
+    def _get_type_costs(self, graphql_type: Any) -> Tuple[int, Dict[str, int]]:
+        """Declared `(type_cost, field costs)` of the model behind a type."""
+        if graphql_type is None:
+            return 1, {}
+        costs = self._field_costs.get(graphql_type)
+        if costs is None:
+            costs = (1, {})
+            graphene_type = getattr(graphql_type, "graphene_type", None)
+            model = getattr(getattr(graphene_type, "_meta", None), "model", None)
+            if model is not None:
+                try:
+                    from .meta import get_model_graphql_meta
+
+                    config = get_model_graphql_meta(model).cost_config
+                    fields = {}
+                    for field_name, cost in config.fields.items():
+                        fields[field_name] = cost
+                        fields[to_camel_case(field_name)] = cost
+                    costs = (config.type_cost, fields)
+                except Exception as e:
+                    logger.debug(f"No cost configuration for {model}: {e}")
+            self._field_costs[graphql_type] = costs
+        return costs
+
+
+_query_cost_analyzer: Optional[QueryCostAnalyzer] = None
+
+
+def get_query_cost_analyzer() -> QueryCostAnalyzer:
+    """Get the process-wide query cost analyzer."""
+    global _query_cost_analyzer
+    if _query_cost_analyzer is None:
+        _query_cost_analyzer = QueryCostAnalyzer()
+    return _query_cost_analyzer
+
+
+def build_operation_document(info: Any) -> DocumentNode:
+    """Rebuild the document of the operation being executed."""
+    fragments = list((getattr(info, "fragments", None) or {}).values())
+    return DocumentNode(definitions=(info.operation, *fragments))
+
+
+def get_query_cost(info: Any) -> QueryCost:
+    """
+    Return the cost of the operation being executed.
+
+    The cost computed during validation (``context.query_cost``) is reused;
+    otherwise it is computed once and stored on the context.
+
+    Args:
+        info: GraphQL resolve info
+
+    Returns:
+        QueryCost of the operation
+    """
+    context = info.context
+    cost = getattr(context, CONTEXT_ATTRIBUTE, None)
+    if isinstance(cost, QueryCost):
+        return cost
+    cost = get_query_cost_analyzer().analyze(
+        info.schema, build_operation_document(info), None, info.variable_values
+    )
+    try:
+        setattr(context, CONTEXT_ATTRIBUTE, cost)
+    except (AttributeError, TypeError):
+        pass
+    return cost
+
+
+class QueryCostValidationRule(ValidationRule):
+    """
+    Validation rule computing the document cost.
+
+    Documents deeper than ``max_query_depth`` are rejected; documents over
+    ``max_query_complexity`` only when ``enable_query_cost_analysis`` is set.
+    """
+
+    variables: Optional[Dict[str, Any]] = None
+    operation_name: Optional[str] = None
+    on_cost: Optional[Callable[[QueryCost], None]] = None
+
+    def enter_document(self, node: DocumentNode, *_args):
+        analyzer = get_query_cost_analyzer()
+        try:
+            cost = analyzer.analyze(
+                self.context.schema, node, self.operation_name, self.variables
+            )
+        except Exception as e:
+            logger.warning(f"Query cost analysis failed: {e}")
+            return self.SKIP
+
+        if self.on_cost is not None:
+            self.on_cost(cost)
+
+        for message in validate_query_cost(cost, analyzer.settings):
+            self.report_error(GraphQLError(message, node))
+        return self.SKIP
+
+
+def validate_query_cost(
+    cost: QueryCost, settings: Optional[PerformanceSettings] = None
+) -> List[str]:
+    """
+    Check a query cost against the performance limits.
+
+    Args:
+        cost: Analyzed cost
+        settings: Performance settings (default: shared analyzer settings)
+
+    Returns:
+        List of limit violations
+    """
+    settings = settings or get_query_cost_analyzer().settings
+    errors = []
+    # Depth is always limited; complexity only with enable_query_cost_analysis
+    if cost.depth > settings.max_query_depth:
+        errors.append(
+            f"Query depth {cost.depth} exceeds maximum allowed depth {settings.max_query_depth}"
+        )
+    if (
+        settings.enable_query_cost_analysis
+        and cost.complexity > settings.max_query_complexity
+    ):
+        errors.append(
+            f"Query complexity {cost.complexity} exceeds maximum allowed complexity "
+            f"{settings.max_query_complexity}"
+        )
+    return errors
+
+
+def create_query_cost_rule(
+    variables: Optional[Dict[str, Any]] = None,
+    operation_name: Optional[str] = None,
+    on_cost: Optional[Callable[[QueryCost], None]] = None,
+) -> Type[QueryCostValidationRule]:
+    """
+    Bind the request variables and a result callback to the validation rule.
+
+    Args:
+        variables: Variable values of the request
+        operation_name: Operation to execute
+        on_cost: Called with the computed QueryCost
+
+    Returns:
+        ValidationRule class usable with ``graphql.validate``
+    """
+    return type(
+        "BoundQueryCostValidationRule",
+        (QueryCostValidationRule,),
+        {
+            "variables": variables,
+            "operation_name": operation_name,
+            "on_cost": staticmethod(on_cost) if on_cost is not None else None,
+        },
+    )
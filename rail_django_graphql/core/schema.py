@@ -244,6 +244,11 @@ class SchemaBuilder:
             )
             return False
 
+        # Internal storage models (e.g. persisted queries) are never exposed
+        if getattr(model, "exclude_from_schema", False):
+            logger.debug(f"Excluding internal model {full_model_name}")
+            return False
+
         # Ignore Django Simple History generated models (Historical*).
         # These models are used for audit/history tracking and should not be exposed in the API.
         try:
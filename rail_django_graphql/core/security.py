@@ -212,6 +212,32 @@ class RateLimiter:
         self.schema_name = schema_name
         self.settings = SecuritySettings.from_schema(schema_name)
 
+    def get_rules(self) -> List[Any]:
+        """Return the per-minute and per-hour rules of the shared rate limit engine."""
+        from ..extensions.rate_limiting import RateLimitRule
+
+        return [
+            RateLimitRule("minute", self.settings.rate_limit_requests_per_minute, 60),
+            RateLimitRule("hour", self.settings.rate_limit_requests_per_hour, 3600),
+        ]
+
+    def check(self, identifier: str, cost: int = 1) -> Any:
+        """
+        Count one operation against every rule.
+
+        Args:
+            identifier: Unique identifier (IP, user ID, etc.)
+            cost: Operation cost
+
+        Returns:
+            RateLimitResult of the shared engine
+        """
+        from ..extensions.rate_limiting import RateLimitResult, get_rate_limit_engine
+
+        if not self.settings.enable_rate_limiting:
+            return RateLimitResult(True)
+        return get_rate_limit_engine().check(identifier, self.get_rules(), cost)
+
     def check_rate_limit(self, identifier: str, window: str = "minute") -> bool:
         """
         Check if request is within rate limits.
@@ -223,36 +249,26 @@ class RateLimiter:
         Returns:
             True if within limits, False if rate limited
         """
-        # Rate limiting disabled: always allow
-        return True
+        from ..extensions.rate_limiting import get_rate_limit_engine
+
+        if not self.settings.enable_rate_limiting:
+            return True
+        rules = [rule for rule in self.get_rules() if rule.name == window]
+        return get_rate_limit_engine().check(identifier, rules).allowed
 
     def get_client_identifier(self, request: Any) -> str:
         """Get unique identifier for rate limiting."""
-        # Try to get user ID first
-        if hasattr(request, 'user') and request.user.is_authenticated:
-            return f"user:{request.user.id}"
-
-        # Fall back to IP address
-        x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-        if x_forwarded_for:
-            ip = x_forwarded_for.split(',')[0].strip()
-        else:
-            ip = request.META.get('REMOTE_ADDR', 'unknown')
+        from ..extensions.rate_limiting import get_client_identifier
 
-        return f"ip:{ip}"
+        return get_client_identifier(request)
 
     def rate_limit(self, func):
         """Decorator to apply rate limiting to GraphQL resolvers."""
         @wraps(func)
         def wrapper(root, info, **kwargs):
-            identifier = self.get_client_identifier(info.context)
-
-            # Check both minute and hour limits
-            if not self.check_rate_limit(identifier, "minute"):
-                raise PermissionError("Rate limit exceeded (per minute)")
-
-            if not self.check_rate_limit(identifier, "hour"):
-                raise PermissionError("Rate limit exceeded (per hour)")
+            result = self.check(self.get_client_identifier(info.context))
+            if not result.allowed:
+                raise PermissionError(f"Rate limit exceeded (per {result.rule.name})")
 
             return func(root, info, **kwargs)
 
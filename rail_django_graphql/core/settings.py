@@ -207,6 +207,15 @@ class QueryGeneratorSettings:
     # Maximum number of buckets returned by grouping queries
     max_grouping_buckets: int = 200
 
+    # Maximum rows evaluated in Python for property filters/ordering (0 = no cap)
+    max_property_scan_rows: int = 10000
+
+    # Rows fetched per database round-trip when evaluating properties in Python
+    property_scan_chunk_size: int = 2000
+
+    # Compiled complex filter shapes kept in the LRU cache (0 = no caching)
+    filter_compiler_cache_size: int = 512
+
     # Additional fields to use for lookups (e.g., slug, uuid)
     additional_lookup_fields: Dict[str, List[str]] = field(default_factory=dict)
 
@@ -54,6 +54,9 @@ LIBRARY_DEFAULTS: Dict[str, Any] = {
         "use_relay": False,
         "default_page_size": 20,
         "max_page_size": 100,
+        "max_property_scan_rows": 10000,
+        "property_scan_chunk_size": 2000,
+        "filter_compiler_cache_size": 512,
         "additional_lookup_fields": {},
     },
     "mutation_settings": {
@@ -84,6 +87,18 @@ LIBRARY_DEFAULTS: Dict[str, Any] = {
         "max_query_complexity": 1000,
         "enable_query_cost_analysis": False,
         "query_timeout": 30,
+        "default_list_size": 10,
+        "max_list_size": 1000,
+        "query_cost_cache_size": 512,
+        "document_cache_size": 1000,
+    },
+    "persisted_query_settings": {
+        "enabled": True,
+        "store": "memory",
+        "cache_alias": "default",
+        "cache_timeout": 86400,
+        "max_size": 1000,
+        "allow_list_only": False,
     },
     "security_settings": {
         "enable_authentication": True,
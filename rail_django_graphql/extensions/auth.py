@@ -15,6 +15,7 @@ from django.apps import apps
 from django.conf import settings
 from django.contrib.auth import authenticate, get_user_model, login, logout
 from django.contrib.auth.password_validation import validate_password
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 from graphene_django import DjangoObjectType
@@ -22,8 +23,10 @@ from graphene_django import DjangoObjectType
 if TYPE_CHECKING:
     from django.contrib.auth.models import AbstractUser
 
+from ..security.permission_cache import get_permission_cache, get_permission_version
 from ..security.rbac import role_manager
 from ..extensions.permissions import (
+    DjangoPermissionChecker,
     OperationType,
     PermissionInfo,
     permission_manager,
@@ -47,37 +50,96 @@ def _get_effective_permissions(user: "AbstractUser") -> List[str]:
         return []
 
 
-def _build_model_permission_snapshot(user: "AbstractUser") -> List[PermissionInfo]:
-    """Return model-level CRUD permissions for a user."""
-    if not user or not getattr(user, "is_authenticated", False):
-        return []
+MODEL_PERMISSION_CACHE_TIMEOUT = 300
+
+_MODEL_PERMISSION_OPERATIONS = (
+    ("can_create", OperationType.CREATE),
+    ("can_read", OperationType.READ),
+    ("can_update", OperationType.UPDATE),
+    ("can_delete", OperationType.DELETE),
+    ("can_list", OperationType.LIST),
+)
+
+
+def _model_permission_cache_key(user: "AbstractUser") -> str:
+    """Build the per-user cache key of the model permission matrix."""
+    flags = "".join(
+        "1" if getattr(user, flag, False) else "0"
+        for flag in ("is_active", "is_staff", "is_superuser")
+    )
+    return (
+        f"rail_django_graphql:model_permissions:{user.pk}:{flags}:"
+        f"{get_permission_version()}"
+    )
 
-    permissions: List[PermissionInfo] = []
+
+def _compute_model_permission_rows(user: "AbstractUser") -> List[Dict[str, Any]]:
+    """
+    Compute the CRUD matrix of every model in one pass.
+
+    Django permission checkers are answered from the user's effective
+    permission set (Django permissions and role definitions); other checkers
+    such as GraphQLMeta guards are evaluated directly.
+    """
+    effective_permissions = role_manager.get_effective_permissions(user)
+    grants_all = user.is_active and user.is_superuser
+
+    def is_allowed(model_label: str, operation: OperationType) -> bool:
+        for checker in permission_manager.get_operation_checkers(
+            model_label, operation
+        ):
+            if isinstance(checker, DjangoPermissionChecker):
+                allowed = grants_all or (
+                    user.is_active
+                    and checker.get_permission_name() in effective_permissions
+                )
+            else:
+                allowed = checker.check_permission(user).allowed
+            if not allowed:
+                return False
+        return True
+
+    rows = []
     for model in apps.get_models():
         model_label = model._meta.label_lower
-        permissions.append(
-            PermissionInfo(
-                model_name=model_label,
-                verbose_name=str(model._meta.verbose_name),
-                can_create=permission_manager.check_operation_permission(
-                    user, model_label, OperationType.CREATE
-                ).allowed,
-                can_read=permission_manager.check_operation_permission(
-                    user, model_label, OperationType.READ
-                ).allowed,
-                can_update=permission_manager.check_operation_permission(
-                    user, model_label, OperationType.UPDATE
-                ).allowed,
-                can_delete=permission_manager.check_operation_permission(
-                    user, model_label, OperationType.DELETE
-                ).allowed,
-                can_list=permission_manager.check_operation_permission(
-                    user, model_label, OperationType.LIST
-                ).allowed,
-            )
-        )
+        row = {
+            "model_name": model_label,
+            "verbose_name": str(model._meta.verbose_name),
+        }
+        for attribute, operation in _MODEL_PERMISSION_OPERATIONS:
+            row[attribute] = is_allowed(model_label, operation)
+        rows.append(row)
+    return rows
+
+
+def _build_model_permission_snapshot(
+    user: "AbstractUser", app_labels: Optional[List[str]] = None
+) -> List[PermissionInfo]:
+    """
+    Return model-level CRUD permissions for a user.
 
-    return permissions
+    The matrix is cached per user under the global permission version, which
+    is bumped when group memberships or role definitions change.
+
+    Args:
+        user: Authenticated user
+        app_labels: Restrict the result to these Django apps
+    """
+    if not user or not getattr(user, "is_authenticated", False):
+        return []
+
+    cache_key = _model_permission_cache_key(user)
+    rows = cache.get(cache_key)
+    if rows is None:
+        rows = _compute_model_permission_rows(user)
+        cache.set(cache_key, rows, MODEL_PERMISSION_CACHE_TIMEOUT)
+
+    wanted_apps = set(app_labels) if app_labels else None
+    return [
+        PermissionInfo(**row)
+        for row in rows
+        if wanted_apps is None or row["model_name"].split(".", 1)[0] in wanted_apps
+    ]
 
 
 # Lazy cache for UserSettingsType
@@ -147,6 +209,10 @@ def get_authenticated_user_type():
         )
         model_permissions = graphene.List(
             PermissionInfo,
+            app_labels=graphene.List(
+                graphene.String,
+                description="Limiter la matrice à ces applications Django",
+            ),
             description="Permissions CRUD détaillées par modèle",
         )
         desc = graphene.String(description="Description de l'utilisateur")
@@ -177,8 +243,10 @@ def get_authenticated_user_type():
         def resolve_permissions(self, info):
             return _get_effective_permissions(self)
 
-        def resolve_model_permissions(self, info):
-            return _build_model_permission_snapshot(self)
+        def resolve_model_permissions(self, info, app_labels=None):
+            # Share role lookups with the rest of the request
+            get_permission_cache(getattr(info, "context", None), self)
+            return _build_model_permission_snapshot(self, app_labels)
 
         def resolve_settings(self, info):
             # Only resolve settings if the model and GraphQL type exist
@@ -783,7 +851,10 @@ class AuthMutations(graphene.ObjectType):
 
 def get_user_from_token(token: str) -> Optional["AbstractUser"]:
     """
-    Récupère un utilisateur à partir d'un token JWT.
+    Récupère un utilisateur actif à partir d'un token JWT.
+
+    Les claims vérifiés et les utilisateurs sont mis en cache (voir
+    ``auth_cache``).
 
     Args:
         token: Token JWT
@@ -791,15 +862,9 @@ def get_user_from_token(token: str) -> Optional["AbstractUser"]:
     Returns:
         Instance User ou None si le token est invalide
     """
-    payload = JWTManager.verify_token(token)
-    if not payload:
-        return None
+    from .auth_cache import authenticate_token
 
-    try:
-        User = get_user_model()
-        return User.objects.get(id=payload["user_id"])
-    except User.DoesNotExist:
-        return None
+    return authenticate_token(token)
 
 
 def authenticate_request(info) -> Optional["AbstractUser"]:
@@ -0,0 +1,205 @@
+"""
+Shared JWT authentication caches.
+
+Every authenticated request used to decode its JWT and load the user row
+again. This module keeps two small per-process caches shared by the GraphQL
+view, the PDF template view and ``get_user_from_token``:
+
+- an LRU of verified tokens mapped to their claims, each entry expiring with
+  the token itself (``exp``) and at most after ``JWT_CLAIMS_CACHE_TTL``;
+- a short-TTL cache of active users (``JWT_USER_CACHE_TTL`` seconds), loaded
+  with their groups and Django permissions so the permission checks that
+  follow make no extra queries. Entries are dropped on ``post_save`` /
+  ``post_delete`` of the user model and on group or permission changes.
+
+Each request receives its own copy of the cached user, so per-request
+attributes never leak between requests.
+"""
+
+import copy
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Optional, Tuple
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+if TYPE_CHECKING:
+    from django.contrib.auth.models import AbstractUser
+
+logger = logging.getLogger(__name__)
+
+
+class ExpiringLRUCache:
+    """Thread-safe LRU mapping whose entries carry their own expiry time."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, now: float) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, expires_at: float) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_claims_cache = ExpiringLRUCache(getattr(settings, "JWT_CLAIMS_CACHE_SIZE", 1024))
+_user_cache = ExpiringLRUCache(getattr(settings, "JWT_USER_CACHE_SIZE", 1024))
+
+
+def _token_key(token: str) -> str:
+    """Cache key of a token (digest of the full token, never the token itself)."""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def get_token_claims(token: str) -> Optional[Dict[str, Any]]:
+    """
+    Return the verified claims of a JWT, decoding it only on a cache miss.
+
+    Invalid and expired tokens are never cached.
+    """
+    from .auth import JWTManager
+
+    key = _token_key(token)
+    now = time.time()
+    claims = _claims_cache.get(key, now)
+    if claims is not None:
+        return claims
+
+    claims = JWTManager.verify_token(token)
+    if not claims:
+        return None
+
+    expires_at = now + getattr(settings, "JWT_CLAIMS_CACHE_TTL", 300)
+    exp = claims.get("exp")
+    if isinstance(exp, (int, float)):
+        expires_at = min(expires_at, float(exp))
+    _claims_cache.set(key, claims, expires_at)
+    return claims
+
+
+def _load_user(user_id: Any) -> Optional["AbstractUser"]:
+    """Load an active user with groups and warmed permission caches."""
+    User = get_user_model()
+    user = (
+        User.objects.filter(pk=user_id, is_active=True)
+        .prefetch_related("groups")
+        .first()
+    )
+    if user is not None:
+        # Fills the ModelBackend permission caches carried by the instance
+        user.get_all_permissions()
+    return user
+
+
+def get_active_user(user_id: Any) -> Optional["AbstractUser"]:
+    """
+    Return an active user by primary key from the short-TTL cache.
+
+    The returned instance is a copy private to the caller.
+    """
+    if user_id in (None, ""):
+        return None
+
+    ttl = getattr(settings, "JWT_USER_CACHE_TTL", 30)
+    key = str(user_id)
+    now = time.monotonic()
+    user = _user_cache.get(key, now) if ttl > 0 else None
+    if user is None:
+        try:
+            user = _load_user(user_id)
+        except (TypeError, ValueError):
+            return None
+        if user is None:
+            return None
+        if ttl > 0:
+            _user_cache.set(key, user, now + ttl)
+    return copy.copy(user)
+
+
+def authenticate_token(token: str) -> Optional["AbstractUser"]:
+    """
+    Return the active user identified by a JWT, or None.
+
+    Both the ``user_id`` claim and the standard ``sub`` claim are accepted.
+    """
+    if not token:
+        return None
+    claims = get_token_claims(token)
+    if not claims:
+        return None
+    return get_active_user(claims.get("user_id") or claims.get("sub"))
+
+
+def clear_auth_caches() -> None:
+    """Drop every cached token and user."""
+    _claims_cache.clear()
+    _user_cache.clear()
+
+
+def _is_user_model(sender: Any) -> bool:
+    meta = getattr(sender, "_meta", None)
+    return meta is not None and meta.label_lower == settings.AUTH_USER_MODEL.lower()
+
+
+@receiver(post_save)
+def invalidate_user_cache_on_save(sender, instance, **kwargs):
+    """Drop a cached user when its row changes."""
+    if _is_user_model(sender):
+        _user_cache.pop(str(instance.pk))
+
+
+@receiver(post_delete)
+def invalidate_user_cache_on_delete(sender, instance, **kwargs):
+    """Drop a cached user when it is deleted; group deletions clear all users."""
+    if _is_user_model(sender):
+        _user_cache.pop(str(instance.pk))
+    elif getattr(sender, "_meta", None) is not None and sender._meta.label_lower in (
+        "auth.group",
+        "auth.permission",
+    ):
+        _user_cache.clear()
+
+
+@receiver(m2m_changed)
+def invalidate_user_cache_on_m2m_change(sender, action, **kwargs):
+    """Clear cached users when group memberships or permissions change."""
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    from ..security.permission_cache import is_permission_relation
+
+    if is_permission_relation(sender):
+        _user_cache.clear()
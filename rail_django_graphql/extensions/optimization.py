@@ -14,7 +14,7 @@ import time
 from collections import defaultdict
 from dataclasses import dataclass, field
 from functools import wraps
-from typing import Any, Callable, Dict, List, Optional, Set, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Type, Union
 
 import graphene
 from django.core.exceptions import FieldDoesNotExist
@@ -22,17 +22,32 @@ from django.db import connection, models
 from django.db.models import Prefetch, QuerySet
 from django.db.models.fields.related import ForeignKey, ManyToManyField, OneToOneField
 from django.db.models.fields.reverse_related import (
-    ManyToManyRel,
-    ManyToOneRel,
+    ForeignObjectRel,
     OneToOneRel,
 )
-from graphql import GraphQLResolveInfo
+from graphene.utils.str_converters import to_snake_case
+from graphql import (
+    FieldNode,
+    FragmentSpreadNode,
+    GraphQLResolveInfo,
+    InlineFragmentNode,
+    SelectionSetNode,
+)
 from graphql.execution.collect_fields import collect_fields
 
 # Caching removed from project: no cache imports
 
 logger = logging.getLogger(__name__)
 
+# Nested mapping of requested GraphQL field names to their sub-selections.
+SelectionTree = Dict[str, "SelectionTree"]
+
+# Wrapper fields returned by paginated queries around the model items.
+CONNECTION_ITEM_FIELDS = ("items",)
+
+# Generated fields that never read model columns besides the primary key.
+COLUMN_FREE_FIELDS = ("pk", "polymorphic_type")
+
 
 @dataclass
 class QueryOptimizationConfig:
@@ -67,8 +82,9 @@ class QueryAnalysisResult:
     """Result of query analysis for optimization."""
 
     requested_fields: Set[str] = field(default_factory=set)
+    selection_tree: SelectionTree = field(default_factory=dict)
     select_related_fields: List[str] = field(default_factory=list)
-    prefetch_related_fields: List[str] = field(default_factory=list)
+    prefetch_related_fields: List[Union[str, Prefetch]] = field(default_factory=list)
     complexity_score: int = 0
     depth: int = 0
     estimated_queries: int = 1
@@ -107,17 +123,20 @@ class QueryAnalyzer:
         """
         result = QueryAnalysisResult()
 
-        # Extract requested fields from GraphQL query
-        result.requested_fields = self._extract_requested_fields(info)
-
-        # Analyze relationships for optimization
-        result.select_related_fields = self._get_select_related_fields(
-            model, result.requested_fields
+        # Build the full selection tree (fragments expanded) for the model level
+        result.selection_tree = self._unwrap_connection(
+            model, self.build_selection_tree(info)
         )
-        result.prefetch_related_fields = self._get_prefetch_related_fields(
-            model, result.requested_fields
+        result.requested_fields = self._extract_requested_fields(
+            model, result.selection_tree
         )
 
+        # Plan nested select_related / Prefetch chains from the selection tree
+        (
+            result.select_related_fields,
+            result.prefetch_related_fields,
+        ) = self.plan_relations(model, result.selection_tree)
+
         # Calculate complexity and depth
         result.complexity_score = self._calculate_complexity(info)
         result.depth = self._calculate_depth(info)
@@ -129,103 +148,340 @@ class QueryAnalyzer:
 
         return result
 
-    def _extract_requested_fields(self, info: GraphQLResolveInfo) -> Set[str]:
-        """Extract requested fields from GraphQL query."""
-        try:
-            # Extract field names directly from the selection set
-            # This is more reliable than using collect_fields which has version compatibility issues
-            requested_fields = set()
-
-            if info.field_nodes and info.field_nodes[0].selection_set:
-                for selection in info.field_nodes[0].selection_set.selections:
-                    # Handle field selections
-                    if hasattr(selection, "name") and hasattr(selection.name, "value"):
-                        requested_fields.add(selection.name.value)
-                    # Handle inline fragments and fragment spreads
-                    elif (
-                        hasattr(selection, "selection_set") and selection.selection_set
-                    ):
-                        for sub_selection in selection.selection_set.selections:
-                            if hasattr(sub_selection, "name") and hasattr(
-                                sub_selection.name, "value"
-                            ):
-                                requested_fields.add(sub_selection.name.value)
+    def build_selection_tree(self, info: GraphQLResolveInfo) -> SelectionTree:
+        """
+        Build the nested selection tree of the field being resolved.
 
-            return requested_fields
+        Named fragments and inline fragments are expanded at every level and
+        selections of the same field are merged. Keys are the raw GraphQL
+        field names (not aliases); introspection fields are skipped.
+        """
+        tree: SelectionTree = {}
+        try:
+            fragments = getattr(info, "fragments", None) or {}
+            for field_node in info.field_nodes or []:
+                if field_node.selection_set:
+                    self._merge_selection_set(
+                        field_node.selection_set, tree, fragments, frozenset()
+                    )
         except Exception as e:
-            logger.warning(f"Failed to extract requested fields: {e}")
-            return set()
+            logger.warning(f"Failed to build selection tree: {e}")
+        return tree
 
-    def _get_select_related_fields(
-        self, model: Type[models.Model], requested_fields: Set[str]
-    ) -> List[str]:
-        """Determine which fields should use select_related."""
-        select_related = []
+    def _merge_selection_set(
+        self,
+        selection_set: SelectionSetNode,
+        tree: SelectionTree,
+        fragments: Dict[str, Any],
+        visited_fragments: frozenset,
+    ) -> None:
+        """Merge a selection set into ``tree``, expanding fragments recursively."""
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                name = selection.name.value
+                if name.startswith("__"):
+                    continue
+                subtree = tree.setdefault(name, {})
+                if selection.selection_set:
+                    self._merge_selection_set(
+                        selection.selection_set, subtree, fragments, visited_fragments
+                    )
+            elif isinstance(selection, InlineFragmentNode):
+                if selection.selection_set:
+                    self._merge_selection_set(
+                        selection.selection_set, tree, fragments, visited_fragments
+                    )
+            elif isinstance(selection, FragmentSpreadNode):
+                fragment_name = selection.name.value
+                fragment = fragments.get(fragment_name)
+                if fragment is None or fragment_name in visited_fragments:
+                    continue
+                self._merge_selection_set(
+                    fragment.selection_set,
+                    tree,
+                    fragments,
+                    visited_fragments | {fragment_name},
+                )
 
-        for field_name in requested_fields:
+    def _unwrap_connection(
+        self, model: Type[models.Model], tree: SelectionTree
+    ) -> SelectionTree:
+        """Descend into ``items`` for paginated results wrapping the model rows."""
+        for wrapper in CONNECTION_ITEM_FIELDS:
+            if wrapper in tree and self.resolve_model_field(model, wrapper) is None:
+                return tree[wrapper]
+        return tree
+
+    def resolve_model_field(
+        self, model: Type[models.Model], graphql_name: str
+    ) -> Optional[tuple]:
+        """
+        Map a GraphQL field name to ``(django_name, field)`` on ``model``.
+
+        Accepts Django names as well as their camelCase form (``createdBy``),
+        and reverse relations by accessor name (``book_set``). Returns None
+        for names that are not model fields (properties, computed fields...).
+        """
+        candidates = [graphql_name]
+        snake_name = to_snake_case(graphql_name)
+        if snake_name != graphql_name:
+            candidates.append(snake_name)
+
+        for candidate in candidates:
             try:
-                field = model._meta.get_field(field_name)
-                if isinstance(field, (ForeignKey, OneToOneField)):
-                    select_related.append(field_name)
+                model_field = model._meta.get_field(candidate)
             except FieldDoesNotExist:
-                # Field might be a reverse relationship or method
+                model_field = None
+            if model_field is not None:
+                if not isinstance(model_field, ForeignObjectRel):
+                    return candidate, model_field
+                if model_field.get_accessor_name() == candidate:
+                    return candidate, model_field
+
+            for rel in getattr(model._meta, "related_objects", []):
+                if rel.get_accessor_name() == candidate:
+                    return candidate, rel
+
+        return None
+
+    def _extract_requested_fields(
+        self, model: Type[models.Model], selection_tree: SelectionTree
+    ) -> Set[str]:
+        """Return the Django names of the model fields requested at this level."""
+        requested_fields = set()
+        for name in selection_tree:
+            resolved = self.resolve_model_field(model, name)
+            requested_fields.add(resolved[0] if resolved else name)
+        return requested_fields
+
+    def plan_relations(
+        self,
+        model: Type[models.Model],
+        selection_tree: SelectionTree,
+        prefix: str = "",
+        depth: int = 0,
+    ) -> tuple:
+        """
+        Plan ``select_related`` paths and ``Prefetch`` objects for a selection.
+
+        Forward FK/OneToOne and reverse OneToOne relations are joined with
+        ``select_related("a__b")`` and their own selections are planned along
+        the same path. Many-valued relations become ``Prefetch`` objects whose
+        querysets carry the nested plan for the related model.
+
+        Returns:
+            Tuple of (select_related paths, prefetch lookups)
+        """
+        select_related: List[str] = []
+        prefetches: List[Union[str, Prefetch]] = []
+        if depth >= self.config.max_prefetch_depth:
+            return select_related, prefetches
+
+        for name, subtree in selection_tree.items():
+            resolved = self.resolve_model_field(model, name)
+            if resolved is None:
+                continue
+            django_name, model_field = resolved
+            related_model = getattr(model_field, "related_model", None)
+            if not getattr(model_field, "is_relation", False) or not isinstance(
+                related_model, type
+            ):
                 continue
 
-        return select_related
+            path = f"{prefix}{django_name}"
+            if model_field.many_to_one or model_field.one_to_one:
+                if not self.config.enable_select_related:
+                    continue
+                select_related.append(path)
+                nested_select, nested_prefetch = self.plan_relations(
+                    related_model, subtree, f"{path}__", depth + 1
+                )
+                select_related.extend(nested_select)
+                prefetches.extend(nested_prefetch)
+            elif model_field.many_to_many or model_field.one_to_many:
+                if not self.config.enable_prefetch_related:
+                    continue
+                nested_select, nested_prefetch = self.plan_relations(
+                    related_model, subtree, "", depth + 1
+                )
+                queryset = related_model._default_manager.all()
+                if nested_select:
+                    queryset = queryset.select_related(*nested_select)
+                if nested_prefetch:
+                    queryset = queryset.prefetch_related(*nested_prefetch)
+                prefetches.append(Prefetch(path, queryset=queryset))
 
-    def _get_prefetch_related_fields(
-        self, model: Type[models.Model], requested_fields: Set[str]
-    ) -> List[str]:
-        """Determine which fields should use prefetch_related."""
-        prefetch_related = []
+        return select_related, prefetches
 
-        for field_name in requested_fields:
+    def plan_only_fields(
+        self,
+        model: Type[models.Model],
+        selection_tree: SelectionTree,
+        joined: Optional[Dict[str, Any]] = None,
+        prefix: str = "",
+        extra_fields: Sequence[str] = (),
+    ) -> Optional[List[str]]:
+        """
+        Plan the ``only()`` column list for a selection.
+
+        The primary key, foreign key columns, ``extra_fields`` (ordering) and
+        fields referenced by GraphQLMeta field guards are always kept.
+        Relations in ``joined`` (the ``select_related`` mapping of the
+        queryset) are pruned along the same path. Properties and ``desc``
+        must declare the columns they read in ``GraphQLMeta.properties``;
+        an undeclared computed field, or a guard condition callable, keeps
+        every column of its model.
+
+        Returns:
+            List of ``only()`` paths, or None when nothing can be pruned
+        """
+        level = self._collect_columns(model, selection_tree, extra_fields)
+        if level is None:
+            if not prefix:
+                return None
+            return self._all_columns(model, joined, prefix)
+
+        columns, relation_trees = level
+        paths = [f"{prefix}{name}" for name in sorted(columns)]
+        for name, nested_joined in (joined or {}).items():
             try:
-                field = model._meta.get_field(field_name)
-                if isinstance(field, ManyToManyField):
-                    prefetch_related.append(field_name)
+                model_field = model._meta.get_field(name)
             except FieldDoesNotExist:
-                # Check for reverse relationships
-                # For modern Django versions, use related_objects
-                if hasattr(model._meta, "related_objects"):
-                    for rel in model._meta.related_objects:
-                        if rel.get_accessor_name() == field_name:
-                            if isinstance(rel, (ManyToOneRel, ManyToManyRel)):
-                                prefetch_related.append(field_name)
-                            break
-                # Fallback for Django versions that use get_fields() with related fields
-                elif hasattr(model._meta, "get_fields"):
-                    try:
-                        for field in model._meta.get_fields():
-                            if hasattr(field, "related_model") and hasattr(
-                                field, "get_accessor_name"
-                            ):
-                                if field.get_accessor_name() == field_name:
-                                    if (
-                                        hasattr(field, "many_to_many")
-                                        and field.many_to_many
-                                    ):
-                                        prefetch_related.append(field_name)
-                                    elif (
-                                        hasattr(field, "one_to_many")
-                                        and field.one_to_many
-                                    ):
-                                        prefetch_related.append(field_name)
-                                    break
-                    except AttributeError:
-                        pass
-                else:
-                    # Final fallback for very old Django versions
-                    try:
-                        for rel in model._meta.get_all_related_objects():
-                            if rel.get_accessor_name() == field_name:
-                                if isinstance(rel, (ManyToOneRel, ManyToManyRel)):
-                                    prefetch_related.append(field_name)
-                                break
-                    except AttributeError:
-                        pass
+                return None if not prefix else self._all_columns(model, joined, prefix)
+            if not isinstance(model_field, ForeignObjectRel) and name not in columns:
+                paths.append(f"{prefix}{name}")
+            paths.extend(
+                self.plan_only_fields(
+                    model_field.related_model,
+                    relation_trees.get(name, {}),
+                    nested_joined,
+                    f"{prefix}{name}__",
+                )
+            )
+        return paths
 
-        return prefetch_related
+    def _all_columns(
+        self,
+        model: Type[models.Model],
+        joined: Optional[Dict[str, Any]],
+        prefix: str,
+    ) -> List[str]:
+        """Return every column of a joined model and of the models joined below it."""
+        paths = [f"{prefix}{f.name}" for f in model._meta.concrete_fields]
+        for name, nested_joined in (joined or {}).items():
+            try:
+                related_model = model._meta.get_field(name).related_model
+            except FieldDoesNotExist:
+                continue
+            paths.extend(self._all_columns(related_model, nested_joined, f"{prefix}{name}__"))
+        return paths
+
+    def _collect_columns(
+        self,
+        model: Type[models.Model],
+        selection_tree: SelectionTree,
+        extra_fields: Sequence[str] = (),
+    ) -> Optional[tuple]:
+        """
+        Collect the local columns a model level needs.
+
+        Returns:
+            Tuple of (column names, selection subtree per relation name), or
+            None when the level must load every column.
+        """
+        from ..core.meta import get_model_graphql_meta
+
+        try:
+            graphql_meta = get_model_graphql_meta(model)
+        except Exception as e:
+            logger.debug(f"Could not load GraphQLMeta for {model.__name__}: {e}")
+            graphql_meta = None
+        if graphql_meta is not None and graphql_meta.has_guard_conditions():
+            return None
+
+        columns = {model._meta.pk.name}
+        relation_trees: Dict[str, SelectionTree] = {}
+        requested = [(name, subtree, True) for name, subtree in selection_tree.items()]
+        requested.extend((name, {}, False) for name in extra_fields if "__" not in name)
+
+        for name, subtree, selected in requested:
+            resolved = self.resolve_model_field(model, name)
+            if resolved is None:
+                companion = self._resolve_companion_field(model, name)
+                if companion is not None:
+                    resolved, subtree = companion, {}
+            if resolved is not None:
+                django_name, model_field = resolved
+                columns.update(self._columns_for_field(model, model_field))
+                if model_field.is_relation and subtree:
+                    relation_trees[django_name] = subtree
+                continue
+
+            if name in COLUMN_FREE_FIELDS:
+                continue
+            if not selected and (
+                not isinstance(getattr(model, name, None), property)
+                or (
+                    graphql_meta is not None
+                    and graphql_meta.get_property_expression(name) is not None
+                )
+            ):
+                # Extra names that are not Python-evaluated properties run in SQL
+                continue
+            requirements = (
+                graphql_meta.get_property_requirements(to_snake_case(name))
+                if graphql_meta is not None
+                else None
+            )
+            if requirements is None:
+                return None
+            columns.update(path.split("__")[0] for path in requirements)
+
+        if graphql_meta is not None:
+            for guard in graphql_meta.access_config.fields:
+                resolved = self.resolve_model_field(model, guard.field or "")
+                if resolved is not None:
+                    columns.update(self._columns_for_field(model, resolved[1]))
+
+        return columns, relation_trees
+
+    def _resolve_companion_field(
+        self, model: Type[models.Model], graphql_name: str
+    ) -> Optional[tuple]:
+        """Resolve generated ``<field>_desc`` and ``<relation>_count`` fields."""
+        snake_name = to_snake_case(graphql_name)
+        for suffix in ("_desc", "_count"):
+            if not snake_name.endswith(suffix):
+                continue
+            resolved = self.resolve_model_field(model, snake_name[: -len(suffix)])
+            if resolved is None:
+                continue
+            is_relation = getattr(resolved[1], "is_relation", False)
+            if is_relation == (suffix == "_count"):
+                return resolved
+        return None
+
+    def _columns_for_field(self, model: Type[models.Model], model_field: Any) -> Set[str]:
+        """Return the local columns read when resolving ``model_field``."""
+        if getattr(model_field, "concrete", False):
+            return {model_field.name}
+        if isinstance(model_field, ForeignObjectRel):
+            # Reverse relations are looked up by the referenced local column
+            try:
+                target_field = model_field.field.target_field
+            except Exception:
+                return set()
+            if getattr(target_field, "model", None) is not None and issubclass(
+                model, target_field.model
+            ):
+                return {target_field.name}
+            return set()
+        ct_field = getattr(model_field, "ct_field", None)
+        fk_field = getattr(model_field, "fk_field", None)
+        if ct_field and fk_field:
+            # GenericForeignKey
+            return {ct_field, fk_field}
+        return set()
 
     def _calculate_complexity(self, info: GraphQLResolveInfo) -> int:
         """Calculate query complexity score."""
@@ -346,42 +602,16 @@ class QueryOptimizer:
             queryset = queryset.select_related(*analysis.select_related_fields)
             logger.debug(f"Applied select_related: {analysis.select_related_fields}")
 
-        # Apply prefetch_related optimization
+        # Apply prefetch_related optimization (Prefetch objects carry nested plans)
         if self.config.enable_prefetch_related and analysis.prefetch_related_fields:
-            prefetch_objects = self._build_prefetch_objects(
-                model, analysis.prefetch_related_fields
-            )
-            queryset = queryset.prefetch_related(*prefetch_objects)
+            queryset = queryset.prefetch_related(*analysis.prefetch_related_fields)
             logger.debug(
-                f"Applied prefetch_related: {analysis.prefetch_related_fields}"
+                "Applied prefetch_related: "
+                f"{[getattr(p, 'prefetch_to', p) for p in analysis.prefetch_related_fields]}"
             )
 
         return queryset
 
-    def _build_prefetch_objects(
-        self, model: Type[models.Model], fields: List[str]
-    ) -> List[Union[str, Prefetch]]:
-        """Build Prefetch objects for complex prefetch_related optimization."""
-        prefetch_objects = []
-
-        for field_name in fields:
-            try:
-                field = model._meta.get_field(field_name)
-                if isinstance(field, ManyToManyField):
-                    # Simple prefetch for many-to-many
-                    prefetch_objects.append(field_name)
-                else:
-                    # Create Prefetch object for more control
-                    related_model = field.related_model
-                    prefetch_objects.append(
-                        Prefetch(field_name, queryset=related_model.objects.all())
-                    )
-            except FieldDoesNotExist:
-                # Handle reverse relationships
-                prefetch_objects.append(field_name)
-
-        return prefetch_objects
-
 
 ## CacheManager removed: caching functionality is not supported in this project.
 
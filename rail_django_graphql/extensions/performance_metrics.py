@@ -22,7 +22,7 @@ from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 from graphene import Boolean, Field, Float, Int
 from graphene import List as GrapheneList
 from graphene import ObjectType, String
-from graphql import Visitor, parse, validate, visit
+from graphql import parse
 from graphql.language.ast import FieldNode, FragmentDefinitionNode, OperationDefinitionNode
 
 logger = logging.getLogger(__name__)
@@ -92,17 +92,11 @@ class SlowQueryAlert:
 
 
 class QueryComplexityAnalyzer:
-    """Analyseur de complexité des requêtes GraphQL."""
+    """Analyseur de complexité des requêtes GraphQL (analyseur de coût partagé)."""
 
     def __init__(self, max_depth: int = 10, complexity_weights: Dict[str, int] = None):
         self.max_depth = max_depth
-        self.complexity_weights = complexity_weights or {
-            'field': 1,
-            'list_field': 2,
-            'connection': 3,
-            'nested_object': 2,
-            'fragment': 1
-        }
+        self.complexity_weights = complexity_weights or {}
 
     def analyze_query(self, query_text: str) -> Tuple[int, int]:
         """
@@ -112,65 +106,16 @@ class QueryComplexityAnalyzer:
             Tuple[int, int]: (depth, complexity)
         """
         try:
-            document = parse(query_text)
-            analyzer = ComplexityVisitor(self.complexity_weights)
-            visit(document, analyzer)
+            from ..core.query_cost import get_query_cost_analyzer
 
-            return analyzer.max_depth, analyzer.total_complexity
+            cost = get_query_cost_analyzer().analyze(None, parse(query_text))
+            return cost.depth, cost.complexity
 
         except Exception as e:
             logger.warning(f"Failed to analyze query complexity: {e}")
             return 0, 0
 
 
-class ComplexityVisitor(Visitor):
-    """Visiteur pour calculer la complexité des requêtes GraphQL."""
-
-    def __init__(self, complexity_weights: Dict[str, int]):
-        # Initialize parent Visitor class to set up enter_leave_map
-        super().__init__()
-
-        self.complexity_weights = complexity_weights
-        self.current_depth = 0
-        self.max_depth = 0
-        self.total_complexity = 0
-        self.field_stack = []
-
-    def enter_field(self, node: FieldNode, *_):
-        """Entrée dans un champ."""
-        self.current_depth += 1
-        self.max_depth = max(self.max_depth, self.current_depth)
-        self.field_stack.append(node.name.value)
-
-        # Calculer la complexité du champ
-        field_complexity = self.complexity_weights.get('field', 1)
-
-        # Augmenter la complexité pour les listes et connexions
-        if self._is_list_field(node):
-            field_complexity = self.complexity_weights.get('list_field', 2)
-        elif self._is_connection_field(node):
-            field_complexity = self.complexity_weights.get('connection', 3)
-
-        # Multiplier par la profondeur pour pénaliser les requêtes profondes
-        self.total_complexity += field_complexity * self.current_depth
-
-    def leave_field(self, node: FieldNode, *_):
-        """Sortie d'un champ."""
-        self.current_depth -= 1
-        if self.field_stack:
-            self.field_stack.pop()
-
-    def _is_list_field(self, node: FieldNode) -> bool:
-        """Vérifie si le champ est une liste."""
-        field_name = node.name.value
-        return field_name.startswith('all') or field_name.endswith('s')
-
-    def _is_connection_field(self, node: FieldNode) -> bool:
-        """Vérifie si le champ est une connexion Relay."""
-        return any(arg.name.value in ['first', 'last', 'after', 'before']
-                   for arg in (node.arguments or []))
-
-
 class PerformanceMetricsCollector:
     """Collecteur de métriques de performance avancées."""
 
@@ -205,8 +150,14 @@ class PerformanceMetricsCollector:
                                cache_hits: int = 0,
                                cache_misses: int = 0,
                                memory_usage_mb: float = 0.0,
-                               error_message: Optional[str] = None) -> None:
-        """Enregistre l'exécution d'une requête."""
+                               error_message: Optional[str] = None,
+                               query_cost: Any = None) -> None:
+        """
+        Enregistre l'exécution d'une requête.
+
+        ``query_cost`` (coût calculé lors de la validation) évite de
+        réanalyser le texte de la requête.
+        """
 
         with self._lock:
             # Générer un hash pour identifier la requête
@@ -214,7 +165,10 @@ class PerformanceMetricsCollector:
             query_name = self._extract_query_name(query_text)
 
             # Analyser la complexité
-            depth, complexity = self.complexity_analyzer.analyze_query(query_text)
+            if query_cost is not None:
+                depth, complexity = query_cost.depth, query_cost.complexity
+            else:
+                depth, complexity = self.complexity_analyzer.analyze_query(query_text)
 
             # Déterminer si c'est une requête lente ou complexe
             is_slow = execution_time > self.slow_query_threshold
@@ -93,6 +93,14 @@ class DjangoPermissionChecker(BasePermissionChecker):
         self.permission_codename = permission_codename
         self.model_class = model_class
 
+    def get_permission_name(self) -> str:
+        """Retourne le nom complet de la permission (``app_label.codename``)."""
+        if self.model_class:
+            app_label = self.model_class._meta.app_label
+            model_name = self.model_class._meta.model_name
+            return f"{app_label}.{self.permission_codename}_{model_name}"
+        return self.permission_codename
+
     def check_permission(
         self, user: "AbstractUser", obj: Any = None, **kwargs
     ) -> PermissionResult:
@@ -103,14 +111,7 @@ class DjangoPermissionChecker(BasePermissionChecker):
         if user.is_superuser:
             return PermissionResult(True, "Superutilisateur")
 
-        # Construction du nom complet de la permission
-        if self.model_class:
-            app_label = self.model_class._meta.app_label
-            model_name = self.model_class._meta.model_name
-            full_permission = f"{app_label}.{self.permission_codename}_{model_name}"
-        else:
-            full_permission = self.permission_codename
-
+        full_permission = self.get_permission_name()
         if user.has_perm(full_permission):
             return PermissionResult(True, f"Permission {full_permission} accordée")
 
@@ -291,6 +292,23 @@ class PermissionManager:
 
         return PermissionResult(True, "Toutes les vérifications d'objet réussies")
 
+    def get_operation_checkers(
+        self, model_name: str, operation: OperationType
+    ) -> List[BasePermissionChecker]:
+        """
+        Retourne les vérificateurs enregistrés pour une opération.
+
+        Args:
+            model_name: Nom du modèle
+            operation: Type d'opération
+
+        Returns:
+            Liste des vérificateurs (vide si aucune restriction)
+        """
+        return self._operation_permissions.get(model_name, {}).get(
+            operation.value, []
+        )
+
     def check_operation_permission(
         self,
         user: "AbstractUser",
@@ -310,9 +328,7 @@ class PermissionManager:
         Returns:
             PermissionResult
         """
-        checkers = self._operation_permissions.get(model_name, {}).get(
-            operation.value, []
-        )
+        checkers = self.get_operation_checkers(model_name, operation)
 
         if not checkers:
             return PermissionResult(True, "Aucune restriction d'opération")
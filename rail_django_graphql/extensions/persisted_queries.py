@@ -0,0 +1,424 @@
+"""
+Persisted queries for Rail Django GraphQL.
+
+Clients may send the SHA-256 hash of a query instead of its text, using the
+automatic persisted query (APQ) protocol::
+
+    {"extensions": {"persistedQuery": {"version": 1, "sha256Hash": "<hash>"}}}
+
+An unknown hash is answered with ``PersistedQueryNotFound``; the client then
+sends the query text along with the hash, and the query is stored once it
+has been validated. Queries are kept in a pluggable store:
+
+- ``memory``: per-process LRU (default)
+- ``cache``: a Django cache backend, shared between processes
+- ``database``: the ``PersistedQuery`` table, read through a memory LRU
+
+In allow-list mode (``allow_list_only``) only operations registered with the
+``register_persisted_queries`` management command can be executed, whether
+sent by hash or as text, and clients cannot register new ones.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Iterable, NamedTuple, Optional
+
+from django.db import models
+from graphql import GraphQLError
+
+logger = logging.getLogger(__name__)
+
+APQ_VERSION = 1
+
+NOT_FOUND = "PERSISTED_QUERY_NOT_FOUND"
+NOT_SUPPORTED = "PERSISTED_QUERY_NOT_SUPPORTED"
+NOT_ALLOWED = "PERSISTED_QUERY_NOT_ALLOWED"
+HASH_MISMATCH = "PERSISTED_QUERY_HASH_MISMATCH"
+INVALID_REQUEST = "PERSISTED_QUERY_INVALID"
+
+
+class PersistedQuery(models.Model):
+    """Stores persisted GraphQL queries by the SHA-256 hash of their text."""
+
+    # Internal storage table: never exposed by the generated schema
+    exclude_from_schema = True
+
+    sha256_hash = models.CharField(
+        max_length=64, unique=True, verbose_name="Empreinte SHA-256"
+    )
+    query = models.TextField(verbose_name="Requete")
+    operation_name = models.CharField(
+        max_length=255, blank=True, verbose_name="Operation"
+    )
+    registered = models.BooleanField(
+        default=False,
+        verbose_name="Enregistree",
+        help_text="Operation enregistree par register_persisted_queries (liste autorisee).",
+    )
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="Creation")
+
+    class Meta:
+        app_label = "rail_django_graphql"
+        verbose_name = "Requete persistee"
+        verbose_name_plural = "Requetes persistees"
+        ordering = ["-created_at"]
+
+    def __str__(self) -> str:
+        return self.operation_name or self.sha256_hash
+
+
+@dataclass(frozen=True)
+class PersistedQueryEntry:
+    """Query text stored under a hash."""
+
+    query: str
+    operation_name: str = ""
+    registered: bool = False
+
+
+@dataclass
+class PersistedQuerySettings:
+    """Settings for persisted queries."""
+
+    enabled: bool = True
+    # memory | cache | database
+    store: str = "memory"
+    cache_alias: str = "default"
+    # Lifetime of queries registered by clients in the cache store (None: no expiry)
+    cache_timeout: Optional[int] = 86400
+    # Size of the memory LRU (also the read-through LRU of the database store)
+    max_size: int = 1000
+    allow_list_only: bool = False
+
+    @classmethod
+    def from_schema(cls, schema_name: Optional[str] = None) -> "PersistedQuerySettings":
+        """Create PersistedQuerySettings from schema configuration."""
+        from ..conf import get_settings_proxy
+        from ..defaults import LIBRARY_DEFAULTS
+
+        configured = get_settings_proxy(schema_name).get("persisted_query_settings") or {}
+        merged = {**LIBRARY_DEFAULTS.get("persisted_query_settings", {}), **configured}
+        valid_fields = set(cls.__dataclass_fields__.keys())
+        return cls(**{k: v for k, v in merged.items() if k in valid_fields})
+
+
+class PersistedQueryError(GraphQLError):
+    """Persisted query protocol error, carrying an APQ error code."""
+
+    def __init__(self, message: str, code: str):
+        super().__init__(message, extensions={"code": code})
+        self.code = code
+
+
+class PersistedQueryStore:
+    """Storage interface for persisted queries."""
+
+    def get(self, query_hash: str) -> Optional[PersistedQueryEntry]:
+        raise NotImplementedError
+
+    def set(self, query_hash: str, entry: PersistedQueryEntry) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class MemoryPersistedQueryStore(PersistedQueryStore):
+    """Per-process LRU store."""
+
+    def __init__(self, max_size: int = 1000):
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, PersistedQueryEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, query_hash: str) -> Optional[PersistedQueryEntry]:
+        with self._lock:
+            entry = self._entries.get(query_hash)
+            if entry is not None:
+                self._entries.move_to_end(query_hash)
+            return entry
+
+    def set(self, query_hash: str, entry: PersistedQueryEntry) -> None:
+        with self._lock:
+            self._entries[query_hash] = entry
+            self._entries.move_to_end(query_hash)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def discard(self, query_hash: str) -> None:
+        with self._lock:
+            self._entries.pop(query_hash, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class CachePersistedQueryStore(PersistedQueryStore):
+    """Store backed by a Django cache; registered operations never expire."""
+
+    key_prefix = "rail_apq"
+
+    def __init__(self, alias: str = "default", timeout: Optional[int] = 86400):
+        self.alias = alias
+        self.timeout = timeout
+
+    @property
+    def cache(self):
+        from django.core.cache import caches
+
+        return caches[self.alias]
+
+    def get(self, query_hash: str) -> Optional[PersistedQueryEntry]:
+        value = self.cache.get(f"{self.key_prefix}:{query_hash}")
+        if not isinstance(value, (list, tuple)) or len(value) != 3:
+            return None
+        return PersistedQueryEntry(*value)
+
+    def set(self, query_hash: str, entry: PersistedQueryEntry) -> None:
+        self.cache.set(
+            f"{self.key_prefix}:{query_hash}",
+            (entry.query, entry.operation_name, entry.registered),
+            None if entry.registered else self.timeout,
+        )
+
+
+class DatabasePersistedQueryStore(PersistedQueryStore):
+    """Store backed by the PersistedQuery table, read through a memory LRU."""
+
+    def __init__(self, max_size: int = 1000):
+        self._memory = MemoryPersistedQueryStore(max_size)
+
+    def get(self, query_hash: str) -> Optional[PersistedQueryEntry]:
+        entry = self._memory.get(query_hash)
+        if entry is not None:
+            return entry
+        row = (
+            PersistedQuery.objects.filter(sha256_hash=query_hash)
+            .values_list("query", "operation_name", "registered")
+            .first()
+        )
+        if row is None:
+            return None
+        entry = PersistedQueryEntry(*row)
+        self._memory.set(query_hash, entry)
+        return entry
+
+    def set(self, query_hash: str, entry: PersistedQueryEntry) -> None:
+        if entry.registered:
+            PersistedQuery.objects.update_or_create(
+                sha256_hash=query_hash,
+                defaults={
+                    "query": entry.query,
+                    "operation_name": entry.operation_name,
+                    "registered": True,
+                },
+            )
+        else:
+            # Never downgrade an operation registered by the management command
+            PersistedQuery.objects.get_or_create(
+                sha256_hash=query_hash,
+                defaults={"query": entry.query, "operation_name": entry.operation_name},
+            )
+        self._memory.discard(query_hash)
+
+    def clear(self) -> None:
+        PersistedQuery.objects.all().delete()
+        self._memory.clear()
+
+
+_stores: Dict[Hashable, PersistedQueryStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_persisted_query_store(
+    settings: Optional[PersistedQuerySettings] = None,
+) -> PersistedQueryStore:
+    """
+    Get the process-wide store for the given settings.
+
+    Args:
+        settings: Persisted query settings (default schema settings when None)
+
+    Returns:
+        PersistedQueryStore instance, shared by every request
+    """
+    settings = settings or PersistedQuerySettings.from_schema()
+    key = (settings.store, settings.cache_alias, settings.cache_timeout, settings.max_size)
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            if settings.store == "database":
+                store = DatabasePersistedQueryStore(settings.max_size)
+            elif settings.store == "cache":
+                store = CachePersistedQueryStore(
+                    settings.cache_alias, settings.cache_timeout
+                )
+            else:
+                if settings.store != "memory":
+                    logger.warning(
+                        f"Unknown persisted query store '{settings.store}', using memory"
+                    )
+                store = MemoryPersistedQueryStore(settings.max_size)
+            _stores[key] = store
+        return store
+
+
+def hash_query(query: str) -> str:
+    """Return the SHA-256 hex digest of a query text, as computed by APQ clients."""
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+def get_request_extensions(request: Any, data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Return the ``extensions`` of a GraphQL request (body or GET parameter).
+
+    Raises:
+        PersistedQueryError: If the extensions are not a JSON object
+    """
+    extensions = request.GET.get("extensions") or (data or {}).get("extensions")
+    if not extensions:
+        return {}
+    if isinstance(extensions, str):
+        try:
+            extensions = json.loads(extensions)
+        except ValueError:
+            raise PersistedQueryError("Extensions are invalid JSON.", INVALID_REQUEST)
+    if not isinstance(extensions, dict):
+        raise PersistedQueryError("Extensions must be an object.", INVALID_REQUEST)
+    return extensions
+
+
+class PersistedQueryLookup(NamedTuple):
+    """Query to execute, its hash and whether it must be stored once valid."""
+
+    query: Optional[str]
+    query_hash: Optional[str] = None
+    should_store: bool = False
+
+
+def resolve_persisted_query(
+    query: Optional[str],
+    extensions: Dict[str, Any],
+    settings: PersistedQuerySettings,
+    store: Optional[PersistedQueryStore] = None,
+) -> PersistedQueryLookup:
+    """
+    Resolve the query text of a request according to the APQ protocol.
+
+    Args:
+        query: Query text sent by the client (None for hash-only requests)
+        extensions: Request extensions
+        settings: Persisted query settings
+        store: Store to use (the shared store for the settings when None)
+
+    Returns:
+        PersistedQueryLookup of the query to execute
+
+    Raises:
+        PersistedQueryError: Unknown, mismatching or disallowed query
+    """
+    persisted = extensions.get("persistedQuery")
+    if not persisted:
+        if not (settings.allow_list_only and query):
+            return PersistedQueryLookup(query)
+        query_hash = hash_query(query)
+        _check_allowed(query_hash, settings, store)
+        return PersistedQueryLookup(query, query_hash)
+
+    if not settings.enabled:
+        raise PersistedQueryError("PersistedQueryNotSupported", NOT_SUPPORTED)
+    if not isinstance(persisted, dict) or persisted.get("version", APQ_VERSION) != APQ_VERSION:
+        raise PersistedQueryError("Unsupported persisted query version", INVALID_REQUEST)
+    query_hash = persisted.get("sha256Hash")
+    if not isinstance(query_hash, str) or not query_hash:
+        raise PersistedQueryError("Missing persisted query sha256Hash", INVALID_REQUEST)
+    query_hash = query_hash.lower()
+
+    store = store or get_persisted_query_store(settings)
+    if not query:
+        entry = store.get(query_hash)
+        if entry is None or (settings.allow_list_only and not entry.registered):
+            raise PersistedQueryError("PersistedQueryNotFound", NOT_FOUND)
+        return PersistedQueryLookup(entry.query, query_hash)
+
+    if hash_query(query) != query_hash:
+        raise PersistedQueryError("provided sha does not match query", HASH_MISMATCH)
+    if settings.allow_list_only:
+        _check_allowed(query_hash, settings, store)
+        return PersistedQueryLookup(query, query_hash)
+    return PersistedQueryLookup(query, query_hash, store.get(query_hash) is None)
+
+
+def _check_allowed(
+    query_hash: str,
+    settings: PersistedQuerySettings,
+    store: Optional[PersistedQueryStore],
+) -> None:
+    entry = (store or get_persisted_query_store(settings)).get(query_hash)
+    if entry is None or not entry.registered:
+        raise PersistedQueryError(
+            "Operation is not in the persisted query allow-list", NOT_ALLOWED
+        )
+
+
+def store_persisted_query(
+    lookup: PersistedQueryLookup,
+    settings: PersistedQuerySettings,
+    operation_name: Optional[str] = None,
+) -> None:
+    """Store a validated query sent with its hash by an APQ client."""
+    if not lookup.should_store or lookup.query is None:
+        return
+    try:
+        get_persisted_query_store(settings).set(
+            lookup.query_hash,
+            PersistedQueryEntry(lookup.query, operation_name or ""),
+        )
+    except Exception as e:
+        # Storage failures only cost the client another round trip
+        logger.warning(f"Failed to store persisted query {lookup.query_hash}: {e}")
+
+
+def register_operations(
+    operations: Iterable[PersistedQueryEntry], store: PersistedQueryStore
+) -> int:
+    """
+    Register build operations in a store (allow-list).
+
+    Args:
+        operations: Operations to register
+        store: Target store
+
+    Returns:
+        Number of registered operations
+    """
+    count = 0
+    for operation in operations:
+        registered = PersistedQueryEntry(operation.query, operation.operation_name, True)
+        store.set(hash_query(operation.query), registered)
+        count += 1
+    return count
+
+
+__all__ = [
+    "PersistedQuery",
+    "PersistedQueryEntry",
+    "PersistedQuerySettings",
+    "PersistedQueryError",
+    "PersistedQueryStore",
+    "MemoryPersistedQueryStore",
+    "CachePersistedQueryStore",
+    "DatabasePersistedQueryStore",
+    "PersistedQueryLookup",
+    "get_persisted_query_store",
+    "get_request_extensions",
+    "hash_query",
+    "resolve_persisted_query",
+    "store_persisted_query",
+    "register_operations",
+]
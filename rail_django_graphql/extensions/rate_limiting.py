@@ -1,21 +1,34 @@
 """
-Purpose: Provide a lightweight GraphQL rate limiting middleware for the project
-Args: N/A (module defines middleware callable used by Graphene)
-Returns: N/A (exports `rate_limit_middleware` for Graphene middleware chain)
+Purpose: Provide the GraphQL rate limiting engine shared by the project
+Args: N/A (module defines the engine, its backends and the Graphene middleware)
+Returns: N/A (exports `RateLimitEngine`, backends and `rate_limit_middleware`)
 Raises: GraphQLError when rate limit exceeded; otherwise no explicit exceptions
 Example:
     >>> # In schema setup
     >>> # schema = graphene.Schema(query=Query, mutation=Mutation,
     >>> #                            middleware=[rate_limit_middleware])
+
+Limits are checked once per operation (on its first root field), never per
+resolved field. Counters are fixed windows: each window gets its own key
+which is incremented atomically and expires with the window. Backends:
+
+- ``django_cache`` (default): ``cache.add`` + ``cache.incr`` on the Django cache
+- ``memory``: per-process counters, for single-process deployments
+- ``redis``: any client exposing ``incrby`` and ``expire`` (``redis_url``)
+
+A rule can count requests or the operation cost (``context.query_cost``).
 """
 
 from __future__ import annotations
 
-import hashlib
 import logging
-from typing import Any, Dict, Optional
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional, Tuple
 
-from django.core.cache import cache
+from django.core.cache import caches
 from graphql import GraphQLError
 import graphene
 
@@ -23,32 +36,326 @@ from rail_django_graphql.conf import get_settings_proxy
 
 logger = logging.getLogger(__name__)
 
+OPERATIONS_ATTRIBUTE = "_rail_rate_limited_operations"
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    """
+    Purpose: Describe one limit enforced by the engine
+    Args:
+        name (str): rule name, part of the counter key
+        limit (int): maximum requests (or cost units) per window
+        window_seconds (int): window length in seconds
+        use_cost (bool): count the operation cost instead of requests
+    """
+
+    name: str
+    limit: int
+    window_seconds: int
+    use_cost: bool = False
+
+
+@dataclass(frozen=True)
+class RateLimitResult:
+    """
+    Purpose: Outcome of a rate limit check
+    Args:
+        allowed (bool): whether the operation may proceed
+        rule (Optional[RateLimitRule]): the exceeded rule, if any
+        count (int): counter value of the exceeded rule
+        retry_after (int): seconds until the exceeded window resets
+    """
+
+    allowed: bool
+    rule: Optional[RateLimitRule] = None
+    count: int = 0
+    retry_after: int = 0
+
+
+class RateLimitBackend:
+    """
+    Purpose: Storage of rate limit counters
+    Args: None
+    Returns: N/A (base class)
+    Raises: NotImplementedError from `increment`
+    """
+
+    def increment(self, key: str, amount: int, ttl: int) -> int:
+        """
+        Purpose: Atomically add `amount` to a counter created with a TTL
+        Args:
+            key (str): counter key
+            amount (int): value to add
+            ttl (int): lifetime of a newly created counter, in seconds
+        Returns:
+            int: counter value after the increment
+        """
+        raise NotImplementedError
+
+
+class LocalMemoryBackend(RateLimitBackend):
+    """
+    Purpose: Per-process counters guarded by a lock
+    Args:
+        max_entries (int): size above which expired counters are purged
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._counters: Dict[str, Tuple[int, float]] = {}
+        self._lock = threading.Lock()
+
+    def increment(self, key: str, amount: int, ttl: int) -> int:
+        now = time.monotonic()
+        with self._lock:
+            value, expires_at = self._counters.get(key, (0, 0.0))
+            if expires_at <= now:
+                value, expires_at = 0, now + ttl
+            value += amount
+            self._counters[key] = (value, expires_at)
+            if len(self._counters) > self.max_entries:
+                self._purge(now)
+            return value
+
+    def _purge(self, now: float) -> None:
+        for key in [k for k, (_, exp) in self._counters.items() if exp <= now]:
+            del self._counters[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counters.clear()
+
+
+class DjangoCacheBackend(RateLimitBackend):
+    """
+    Purpose: Counters stored in a Django cache, shared between processes
+    Args:
+        alias (str): name of the cache in settings.CACHES
+    """
+
+    def __init__(self, alias: str = "default"):
+        self.alias = alias
+
+    def increment(self, key: str, amount: int, ttl: int) -> int:
+        cache = caches[self.alias]
+        if cache.add(key, amount, timeout=ttl):
+            return amount
+        try:
+            return cache.incr(key, amount)
+        except ValueError:
+            # The counter expired between add() and incr()
+            if cache.add(key, amount, timeout=ttl):
+                return amount
+            return cache.incr(key, amount)
+
+
+class RedisBackend(RateLimitBackend):
+    """
+    Purpose: Counters stored in a Redis-compatible server (Redis >= 7.0)
+    Args:
+        client: object exposing `pipeline(transaction=True)` whose pipelines
+            queue `incrby(key, amount)` and `expire(key, seconds, nx=True)`
+    """
+
+    def __init__(self, client: Any):
+        self.client = client
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisBackend":
+        """
+        Purpose: Build the backend from a redis:// URL
+        Args:
+            url (str): server URL
+        Returns:
+            RedisBackend: backend bound to a new client
+        Raises:
+            ImportError: when the `redis` package is not installed
+        """
+        import redis
+
+        return cls(redis.Redis.from_url(url))
+
+    def increment(self, key: str, amount: int, ttl: int) -> int:
+        # MULTI/EXEC: the counter never exists without its expiration
+        pipeline = self.client.pipeline(transaction=True)
+        pipeline.incrby(key, amount)
+        pipeline.expire(key, ttl, nx=True)
+        value, _ = pipeline.execute()
+        return int(value)
 
-def _build_key(scope: str, field_name: str, user_id: Optional[int], ip_addr: Optional[str]) -> str:
+
+class RateLimitEngine:
+    """
+    Purpose: Check fixed-window rate limit rules against a backend
+    Args:
+        backend (Optional[RateLimitBackend]): counter storage (Django cache by default)
+        key_prefix (str): prefix of every counter key
+    Example:
+        >>> engine = RateLimitEngine(LocalMemoryBackend())
+        >>> engine.check("user:1", [RateLimitRule("minute", 60, 60)]).allowed
+        True
+    """
+
+    def __init__(
+        self, backend: Optional[RateLimitBackend] = None, key_prefix: str = "gql_rl"
+    ):
+        self.backend = backend or DjangoCacheBackend()
+        self.key_prefix = key_prefix
+
+    def check(
+        self, identifier: str, rules: Iterable[RateLimitRule], cost: int = 1
+    ) -> RateLimitResult:
+        """
+        Purpose: Count one operation against each rule
+        Args:
+            identifier (str): client identifier (user or IP)
+            rules (Iterable[RateLimitRule]): rules to enforce, in order
+            cost (int): operation cost, counted by `use_cost` rules
+        Returns:
+            RateLimitResult: the first exceeded rule, or an allowed result
+        """
+        now = time.time()
+        for rule in rules:
+            if rule.limit <= 0 or rule.window_seconds <= 0:
+                continue
+            window = rule.window_seconds
+            bucket = int(now // window)
+            key = f"{self.key_prefix}:{rule.name}:{identifier}:{window}:{bucket}"
+            amount = max(int(cost), 1) if rule.use_cost else 1
+            count = self.backend.increment(key, amount, window)
+            if count > rule.limit:
+                retry_after = max(int(math.ceil((bucket + 1) * window - now)), 1)
+                return RateLimitResult(False, rule, count, retry_after)
+        return RateLimitResult(True)
+
+
+_engines: Dict[Tuple[str, str], RateLimitEngine] = {}
+_engines_lock = threading.Lock()
+
+
+def get_rate_limit_engine(
+    backend: str = "django_cache", location: str = ""
+) -> RateLimitEngine:
     """
-    Purpose: Build a stable cache key for rate limiting
-    Args: 
-        scope (str): either "per_user" or "per_ip"
-        field_name (str): GraphQL field being resolved
-        user_id (Optional[int]): authenticated user id if available
-        ip_addr (Optional[str]): client IP address or None
+    Purpose: Return the process-wide engine for a backend configuration
+    Args:
+        backend (str): "django_cache", "memory" or "redis"
+        location (str): cache alias (django_cache) or server URL (redis)
     Returns:
-        str: hashed cache key prefixed with 'gql_rl:'
-    Raises:
-        None
+        RateLimitEngine: shared engine, created on first use
     Example:
-        >>> _build_key("per_user", "createOrder", 42, None)
-        'gql_rl:...'
+        >>> get_rate_limit_engine("memory") is get_rate_limit_engine("memory")
+        True
+    """
+    config = (backend or "django_cache", location or "")
+    engine = _engines.get(config)
+    if engine is not None:
+        return engine
+    with _engines_lock:
+        engine = _engines.get(config)
+        if engine is None:
+            engine = RateLimitEngine(_create_backend(*config))
+            _engines[config] = engine
+    return engine
+
+
+def _create_backend(backend: str, location: str) -> RateLimitBackend:
+    if backend == "memory":
+        return LocalMemoryBackend()
+    if backend == "redis":
+        try:
+            return RedisBackend.from_url(location or "redis://localhost:6379/0")
+        except ImportError:
+            logger.warning("redis is not installed, falling back to the Django cache")
+            return DjangoCacheBackend()
+    return DjangoCacheBackend(location or "default")
+
+
+def get_client_identifier(request: Any, scope: str = "per_user") -> str:
+    """
+    Purpose: Identify the client counted by a rate limit
+    Args:
+        request: Django request or GraphQL context
+        scope (str): "per_user" (IP for anonymous users) or "per_ip"
+    Returns:
+        str: "user:<id>" or "ip:<address>"
     """
-    base = f"{scope}:{field_name}:{user_id or 'anon'}:{ip_addr or 'noip'}"
-    return "gql_rl:" + hashlib.sha256(base.encode("utf-8")).hexdigest()
+    user = getattr(request, "user", None)
+    if scope != "per_ip" and user is not None and getattr(user, "is_authenticated", False):
+        return f"user:{user.pk}"
+    meta = getattr(request, "META", None) or {}
+    ip_addr = meta.get("HTTP_X_FORWARDED_FOR", "").split(",")[0].strip() or meta.get(
+        "REMOTE_ADDR"
+    )
+    return f"ip:{ip_addr or 'unknown'}"
+
+
+def is_new_operation(info: Any, namespace: str) -> bool:
+    """
+    Purpose: Tell whether a resolver call starts an operation for `namespace`
+    Args:
+        info: GraphQL ResolveInfo
+        namespace (str): caller name, so each limiter counts the operation once
+    Returns:
+        bool: True on the first root field of each operation, False otherwise
+    """
+    path = getattr(info, "path", None)
+    if path is None or path.prev is not None:
+        return False
+    context = info.context
+    seen = getattr(context, OPERATIONS_ATTRIBUTE, None)
+    if seen is None:
+        seen = set()
+        try:
+            setattr(context, OPERATIONS_ATTRIBUTE, seen)
+        except (AttributeError, TypeError):
+            return True
+    marker = (namespace, id(info.operation))
+    if marker in seen:
+        return False
+    seen.add(marker)
+    return True
+
+
+def get_operation_cost(info: Any) -> int:
+    """
+    Purpose: Return the cost of the current operation
+    Args:
+        info: GraphQL ResolveInfo
+    Returns:
+        int: query complexity computed by the shared query cost analyzer
+    """
+    from rail_django_graphql.core.query_cost import get_query_cost
+
+    return max(int(get_query_cost(info).complexity), 1)
+
+
+def rate_limit_error(result: RateLimitResult, message: str) -> GraphQLError:
+    """
+    Purpose: Build the GraphQL error reported for an exceeded limit
+    Args:
+        result (RateLimitResult): failed check
+        message (str): error message
+    Returns:
+        GraphQLError: error carrying the rule and `retry_after` in extensions
+    """
+    return GraphQLError(
+        message,
+        extensions={
+            "code": "RATE_LIMITED",
+            "rule": result.rule.name if result.rule else None,
+            "retry_after": result.retry_after,
+        },
+    )
 
 
 def _get_rate_limit_settings() -> Dict[str, Any]:
     """
     Purpose: Retrieve rate limiting settings from hierarchical settings proxy
     Args: None
-    Returns: Dict[str, Any]: settings dictionary with keys enable, window_seconds, max_requests, scope
+    Returns: Dict[str, Any]: settings dictionary with keys enable, window_seconds,
+        max_requests, max_cost, scope, backend and location
     Raises: None
     Example:
         >>> rl = _get_rate_limit_settings()
@@ -65,54 +372,59 @@ def _get_rate_limit_settings() -> Dict[str, Any]:
         "enable": bool(rl_settings.get("enable", False)),
         "window_seconds": int(rl_settings.get("window_seconds", 60)),
         "max_requests": int(rl_settings.get("max_requests", 100)),
+        "max_cost": int(rl_settings.get("max_cost", 0)),
         "scope": (rl_settings.get("scope") or "per_user"),
+        "backend": (rl_settings.get("backend") or "django_cache"),
+        "location": (rl_settings.get("location") or rl_settings.get("redis_url") or ""),
     }
 
 
+def _get_rules(rl: Dict[str, Any]) -> Tuple[RateLimitRule, ...]:
+    rules = [RateLimitRule("requests", rl["max_requests"], rl["window_seconds"])]
+    if rl["max_cost"] > 0:
+        rules.append(
+            RateLimitRule("cost", rl["max_cost"], rl["window_seconds"], use_cost=True)
+        )
+    return tuple(rules)
+
+
 def rate_limit_middleware(next_fn, root, info, **kwargs):
     """
-    Purpose: Graphene middleware to enforce per-field request rate limits
+    Purpose: Graphene middleware enforcing rate limits once per operation
     Args:
         next_fn: callable, next resolver in chain
         root: Any, resolver root
-        info: GraphQL ResolveInfo, contains context and field_name
+        info: GraphQL ResolveInfo, contains context and path
         kwargs: Dict, resolver arguments
     Returns:
         Any: resolver result when allowed, otherwise raises GraphQLError
     Raises:
-        GraphQLError: when the request exceeds configured rate limits
+        GraphQLError: when the operation exceeds configured rate limits
     Example:
         >>> # Register in schema setup
         >>> # schema = graphene.Schema(query=Query, mutation=Mutation,
         >>> #                            middleware=[rate_limit_middleware])
     """
+    # Nested fields belong to an operation that was already counted
+    if info.path.prev is not None:
+        return next_fn(root, info, **kwargs)
     try:
         rl = _get_rate_limit_settings()
-        if not rl.get("enable", False):
-            return next_fn(root, info, **kwargs)
-
-        user = getattr(info.context, "user", None)
-        user_id: Optional[int] = getattr(user, "id", None) if (user and getattr(user, "is_authenticated", False)) else None
-        ip_addr: Optional[str] = (
-            info.context.META.get("HTTP_X_FORWARDED_FOR", "").split(",")[0].strip()
-            or info.context.META.get("REMOTE_ADDR")
-        )
-        scope = rl.get("scope", "per_user")
-        key = _build_key(scope=scope, field_name=getattr(info, "field_name", "unknown"), user_id=user_id, ip_addr=ip_addr)
-        count = cache.get(key, 0)
-
-        if count >= rl.get("max_requests", 100):
-            raise GraphQLError("Rate limit exceeded. Please retry later.")
-
-        # Increment with TTL window
-        cache.set(key, int(count) + 1, timeout=rl.get("window_seconds", 60))
-        return next_fn(root, info, **kwargs)
+        if rl["enable"] and is_new_operation(info, "rate_limiting"):
+            rules = _get_rules(rl)
+            cost = get_operation_cost(info) if rl["max_cost"] > 0 else 1
+            engine = get_rate_limit_engine(rl["backend"], rl["location"])
+            result = engine.check(
+                get_client_identifier(info.context, rl["scope"]), rules, cost
+            )
+            if not result.allowed:
+                raise rate_limit_error(result, "Rate limit exceeded. Please retry later.")
     except GraphQLError:
         raise
     except Exception as exc:
         # Fail-open to avoid breaking requests due to middleware issues
         logger.warning(f"Rate limit middleware error: {exc}")
-        return next_fn(root, info, **kwargs)
+    return next_fn(root, info, **kwargs)
 
 
 class GraphQLSecurityMiddleware:
@@ -157,7 +469,9 @@ class RateLimitInfo(graphene.ObjectType):
     enable = graphene.Boolean(description="Whether rate limiting is enabled")
     window_seconds = graphene.Int(description="Time window in seconds for counting requests")
     max_requests = graphene.Int(description="Max requests allowed within the time window")
+    max_cost = graphene.Int(description="Max operation cost allowed within the time window (0 = no cost limit)")
     scope = graphene.String(description="Rate limit scope (per_user or per_ip)")
+    backend = graphene.String(description="Counter backend (django_cache, memory or redis)")
 
 
 class SecurityQuery(graphene.ObjectType):
@@ -194,12 +508,26 @@ class SecurityQuery(graphene.ObjectType):
             enable=bool(config.get("enable", False)),
             window_seconds=int(config.get("window_seconds", 60)),
             max_requests=int(config.get("max_requests", 100)),
+            max_cost=int(config.get("max_cost", 0)),
             scope=str(config.get("scope", "per_user")),
+            backend=str(config.get("backend", "django_cache")),
         )
 
 
 __all__ = [
+    "DjangoCacheBackend",
     "GraphQLSecurityMiddleware",
+    "LocalMemoryBackend",
+    "RateLimitBackend",
+    "RateLimitEngine",
+    "RateLimitResult",
+    "RateLimitRule",
+    "RedisBackend",
     "SecurityQuery",
+    "get_client_identifier",
+    "get_operation_cost",
+    "get_rate_limit_engine",
+    "is_new_operation",
+    "rate_limit_error",
     "rate_limit_middleware",
-]
\ No newline at end of file
+]
@@ -0,0 +1,741 @@
+"""
+Set-based bulk operations for GraphQL bulk mutations.
+
+Rows are validated in memory first (field validation, plus one batched
+query per relation or unique field instead of one query per row). Errors are
+collected per row index and nothing is written while any row is invalid.
+Valid rows are then written with ``bulk_create``/``bulk_update`` in batches
+of ``bulk_batch_size``, and many-to-many values with a second batched pass on
+the through tables. Deletes run in primary-key chunks of the same size.
+
+``bulk_create`` and ``bulk_update`` neither call ``save()`` nor send
+``pre_save``/``post_save`` or ``m2m_changed`` signals; ``auto_now`` fields
+are still refreshed on update.
+"""
+
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Type
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db import connections, models, router
+from django.db.models import Q
+
+RowErrors = Dict[int, ValidationError]
+
+
+def chunked(values: Sequence[Any], size: int) -> Iterable[Sequence[Any]]:
+    """Yield successive slices of ``values`` holding at most ``size`` items."""
+    size = max(1, size)
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
+
+
+class BulkOperationHandler:
+    """
+    Validates and writes many rows of a model with a bounded number of queries.
+
+    Attributes:
+        batch_size: Rows per INSERT statement and per batched lookup query
+    """
+
+    def __init__(self, batch_size: int = 100):
+        self.batch_size = max(1, batch_size or 100)
+
+    def bulk_create(
+        self,
+        model: Type[models.Model],
+        rows: Sequence[Dict[str, Any]],
+        ignore_conflicts: bool = False,
+        update_conflicts: bool = False,
+        update_fields: Optional[List[str]] = None,
+        unique_fields: Optional[List[str]] = None,
+    ) -> Tuple[List[models.Model], RowErrors]:
+        """
+        Validate then insert ``rows`` with ``bulk_create``.
+
+        Rows hold concrete field values, foreign key ids and many-to-many id
+        lists. Nested payloads are not supported and are reported as errors.
+        Unique fields are only checked up front when no conflict mode is used.
+
+        Returns:
+            Tuple of (created instances, errors by row index). No row is
+            written when errors is not empty.
+
+        Raises:
+            ValueError: If the conflict options are inconsistent
+        """
+        if ignore_conflicts and update_conflicts:
+            raise ValueError("ignore_conflicts and update_conflicts are exclusive")
+        if update_conflicts and not update_fields:
+            raise ValueError("update_conflicts requires update_fields")
+
+        errors: Dict[int, Dict[str, List[ValidationError]]] = defaultdict(
+            lambda: defaultdict(list)
+        )
+        instances: List[Optional[models.Model]] = []
+        m2m_values: List[Dict[str, List[Any]]] = []
+
+        for index, row in enumerate(rows):
+            values, m2m, row_errors = self._split_row(model, row)
+            for name, message in row_errors.items():
+                errors[index][name].append(ValidationError(message))
+            m2m_values.append(m2m)
+            try:
+                instance = model(**values)
+            except (TypeError, ValueError) as exc:
+                errors[index]["__all__"].append(ValidationError(str(exc)))
+                instances.append(None)
+                continue
+            instances.append(instance)
+            self._clean_instance(model, instance, errors[index])
+
+        self._check_foreign_keys(model, instances, errors)
+        self._check_many_to_many(model, m2m_values, errors)
+        if not (ignore_conflicts or update_conflicts):
+            self._check_unique_fields(model, instances, errors)
+
+        row_errors = self._row_errors(errors)
+        if row_errors:
+            return [], row_errors
+
+        created = self._insert(
+            model,
+            instances,
+            ignore_conflicts=ignore_conflicts,
+            update_conflicts=update_conflicts,
+            update_fields=update_fields,
+            unique_fields=unique_fields,
+        )
+        self._insert_many_to_many(model, created, m2m_values)
+        return created, {}
+
+    def bulk_update(
+        self,
+        model: Type[models.Model],
+        updates: Sequence[Tuple[Any, Dict[str, Any]]],
+        queryset: Optional[models.QuerySet] = None,
+        check_access: Optional[Callable[[List[models.Model]], None]] = None,
+    ) -> Tuple[List[models.Model], RowErrors]:
+        """
+        Load, validate then write ``updates`` with ``bulk_update``.
+
+        Targets are loaded with a single locked ``in_bulk`` (call this inside a
+        transaction) and every row is written with the union of the fields
+        touched by any row. Many-to-many values replace the current relations.
+
+        Args:
+            model: Model to update
+            updates: Sequence of (primary key, changed values)
+            queryset: Queryset the targets are loaded from
+            check_access: Called once with the loaded targets, before any change
+
+        Returns:
+            Tuple of (updated instances in input order, errors by row index).
+            No row is written when errors is not empty.
+        """
+        errors: Dict[int, Dict[str, List[ValidationError]]] = defaultdict(
+            lambda: defaultdict(list)
+        )
+        if queryset is None:
+            queryset = model._default_manager.all()
+        pks, targets = self._load_update_targets(model, updates, queryset, errors)
+        if check_access is not None:
+            check_access(list(targets.values()))
+
+        instances: List[Optional[models.Model]] = []
+        m2m_values: List[Dict[str, List[Any]]] = []
+        changed: List[Set[str]] = []
+        seen: Set[Any] = set()
+        for index, ((_, row), pk) in enumerate(zip(updates, pks)):
+            instance = self._claim_update_target(model, targets, pk, seen, errors[index])
+            m2m, fields = (
+                self._apply_update_row(model, instance, row, errors[index])
+                if instance is not None
+                else ({}, set())
+            )
+            instances.append(instance)
+            m2m_values.append(m2m)
+            changed.append(fields)
+
+        self._check_foreign_keys(model, instances, errors, changed=changed)
+        self._check_many_to_many(model, m2m_values, errors)
+        self._check_unique_fields(model, instances, errors, changed=changed)
+
+        row_errors = self._row_errors(errors)
+        if row_errors:
+            return [], row_errors
+
+        self._write_updates(model, instances, set().union(*changed), m2m_values)
+        return instances, {}
+
+    def _load_update_targets(
+        self,
+        model: Type[models.Model],
+        updates: Sequence[Tuple[Any, Dict[str, Any]]],
+        queryset: models.QuerySet,
+        errors: Dict[int, Dict[str, List[ValidationError]]],
+    ) -> Tuple[List[Any], Dict[Any, models.Model]]:
+        """Coerce the primary keys of ``updates`` and lock their rows in one query."""
+        pk_field = model._meta.pk
+        pks: List[Any] = []
+        for index, (pk, _) in enumerate(updates):
+            try:
+                pk = pk_field.to_python(pk)
+            except ValidationError as exc:
+                errors[index]["id"].extend(exc.error_list)
+                pk = None
+            pks.append(pk)
+
+        targets = queryset.select_for_update().in_bulk(
+            [pk for pk in pks if pk is not None]
+        )
+        return pks, targets
+
+    @staticmethod
+    def _claim_update_target(
+        model: Type[models.Model],
+        targets: Dict[Any, models.Model],
+        pk: Any,
+        seen: Set[Any],
+        row_errors: Dict[str, List[ValidationError]],
+    ) -> Optional[models.Model]:
+        """Return the loaded target of ``pk``, unless missing or already updated."""
+        instance = targets.get(pk)
+        if instance is None:
+            if pk is not None:
+                row_errors["id"].append(
+                    ValidationError(
+                        f"{model._meta.verbose_name} matching id {pk!r} "
+                        "does not exist."
+                    )
+                )
+            return None
+        if pk in seen:
+            row_errors["id"].append(
+                ValidationError(f"id {pk!r} is updated more than once.")
+            )
+            return None
+        seen.add(pk)
+        return instance
+
+    def _apply_update_row(
+        self,
+        model: Type[models.Model],
+        instance: models.Model,
+        row: Dict[str, Any],
+        row_errors: Dict[str, List[ValidationError]],
+    ) -> Tuple[Dict[str, List[Any]], Set[str]]:
+        """
+        Assign the changed values of ``row`` to ``instance`` and validate it.
+
+        Returns:
+            Tuple of (many-to-many values, names of the changed fields)
+        """
+        pk_field = model._meta.pk
+        values, m2m, split_errors = self._split_row(model, row)
+        for name, message in split_errors.items():
+            row_errors[name].append(ValidationError(message))
+        if pk_field.attname in values or pk_field.name in values:
+            row_errors[pk_field.name].append(
+                ValidationError("The primary key cannot be changed.")
+            )
+        changed: Set[str] = set()
+        for name, value in values.items():
+            setattr(instance, name, value)
+            changed.add(model._meta.get_field(name).name)
+        self._clean_instance(model, instance, row_errors)
+        return m2m, changed
+
+    def _write_updates(
+        self,
+        model: Type[models.Model],
+        instances: List[models.Model],
+        touched: Set[str],
+        m2m_values: List[Dict[str, List[Any]]],
+    ) -> None:
+        """Write the touched fields with ``bulk_update``, then many-to-many values."""
+        for field in model._meta.concrete_fields:
+            if getattr(field, "auto_now", False):
+                # bulk_update does not call pre_save()
+                for instance in instances:
+                    field.pre_save(instance, add=False)
+                touched.add(field.name)
+        if touched:
+            model._default_manager.bulk_update(
+                instances, fields=sorted(touched), batch_size=self.batch_size
+            )
+        self._replace_many_to_many(model, instances, m2m_values)
+
+    def bulk_delete(
+        self,
+        model: Type[models.Model],
+        ids: Sequence[Any],
+        load_instances: bool = True,
+        queryset: Optional[models.QuerySet] = None,
+        check_access: Optional[Callable[[List[models.Model]], None]] = None,
+    ) -> Tuple[List[models.Model], Dict[str, int], List[Any]]:
+        """
+        Check then delete the rows of ``ids`` in primary-key chunks.
+
+        Targets are resolved chunk by chunk: only primary keys are read unless
+        ``load_instances`` is set (to return the deleted objects or evaluate
+        an instance guard), in which case ``check_access`` is called once per
+        chunk. Rows are then deleted chunk by chunk through the ORM collector
+        (cascades included); call this inside a transaction.
+
+        Returns:
+            Tuple of (loaded instances, deleted row counts by model label,
+            missing ids). Nothing is deleted when ids are missing.
+        """
+        if queryset is None:
+            queryset = model._default_manager.all()
+        pk_field = model._meta.pk
+
+        requested: Dict[Any, Any] = {}
+        missing: List[Any] = []
+        for raw_id in ids:
+            try:
+                requested.setdefault(pk_field.to_python(raw_id), raw_id)
+            except ValidationError:
+                missing.append(raw_id)
+
+        pks = list(requested)
+        instances, found = self._resolve_delete_targets(
+            queryset, pks, load_instances, check_access
+        )
+        missing.extend(raw_id for pk, raw_id in requested.items() if pk not in found)
+        if missing:
+            return [], {}, missing
+        return instances, self._delete_chunks(queryset, pks), []
+
+    def _resolve_delete_targets(
+        self,
+        queryset: models.QuerySet,
+        pks: List[Any],
+        load_instances: bool,
+        check_access: Optional[Callable[[List[models.Model]], None]],
+    ) -> Tuple[List[models.Model], Set[Any]]:
+        """
+        Find the rows of ``pks`` chunk by chunk.
+
+        Returns:
+            Tuple of (loaded instances, primary keys found)
+        """
+        instances: List[models.Model] = []
+        found: Set[Any] = set()
+        for batch in chunked(pks, self.batch_size):
+            chunk_queryset = queryset.filter(pk__in=batch)
+            if not load_instances:
+                found.update(chunk_queryset.values_list("pk", flat=True))
+                continue
+            chunk = list(chunk_queryset)
+            if check_access is not None:
+                check_access(chunk)
+            instances.extend(chunk)
+            found.update(instance.pk for instance in chunk)
+        return instances, found
+
+    def _delete_chunks(self, queryset: models.QuerySet, pks: List[Any]) -> Dict[str, int]:
+        """Delete the rows of ``pks`` chunk by chunk; returns counts by model label."""
+        counts: Dict[str, int] = defaultdict(int)
+        for batch in chunked(pks, self.batch_size):
+            _, per_model = queryset.filter(pk__in=batch).delete()
+            for label, count in per_model.items():
+                counts[label] += count
+        return dict(counts)
+
+    def _row_errors(
+        self, errors: Dict[int, Dict[str, List[ValidationError]]]
+    ) -> RowErrors:
+        """Build one ValidationError per invalid row index."""
+        return {
+            index: ValidationError(dict(field_errors))
+            for index, field_errors in sorted(errors.items())
+            if field_errors
+        }
+
+    def _split_row(
+        self, model: Type[models.Model], row: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], Dict[str, List[Any]], Dict[str, str]]:
+        """Split an input row into model kwargs, M2M id lists and errors."""
+        values: Dict[str, Any] = {}
+        m2m: Dict[str, List[Any]] = {}
+        errors: Dict[str, str] = {}
+        for name, value in row.items():
+            try:
+                field = model._meta.get_field(name)
+            except FieldDoesNotExist:
+                field = None
+
+            if field is not None and field.many_to_many and not field.auto_created:
+                m2m[name] = list(dict.fromkeys(value or []))
+            elif field is not None and field.concrete and field.is_relation:
+                values[field.attname] = value
+            elif field is not None and field.concrete:
+                values[field.name] = value
+            elif value not in (None, [], {}):
+                errors[name] = (
+                    f"'{name}' is not supported by bulk mutations; "
+                    "write related objects separately"
+                )
+        return values, m2m, errors
+
+    def _clean_instance(
+        self,
+        model: Type[models.Model],
+        instance: models.Model,
+        errors: Dict[str, List[ValidationError]],
+    ) -> None:
+        """
+        Validate an instance without per-row queries.
+
+        Foreign keys are checked in batch by :meth:`_check_foreign_keys`;
+        only their null/blank constraint is checked here.
+        """
+        relation_fields = [
+            field
+            for field in model._meta.concrete_fields
+            if field.many_to_one or field.one_to_one
+        ]
+        try:
+            instance.full_clean(
+                exclude=[field.name for field in relation_fields],
+                validate_unique=False,
+                validate_constraints=False,
+            )
+        except ValidationError as exc:
+            for name, messages in exc.message_dict.items():
+                errors[name].extend(ValidationError(message) for message in messages)
+
+        for field in relation_fields:
+            if field.primary_key and field.one_to_one:
+                continue
+            if getattr(instance, field.attname) is None and not field.blank:
+                errors[field.name].append(
+                    ValidationError(field.error_messages["blank"], code="blank")
+                )
+
+    def _check_foreign_keys(
+        self,
+        model: Type[models.Model],
+        instances: List[Optional[models.Model]],
+        errors: Dict[int, Dict[str, List[ValidationError]]],
+        changed: Optional[List[Set[str]]] = None,
+    ) -> None:
+        """
+        Check the existence of every referenced row with one query per batch.
+
+        When ``changed`` is given, only the fields changed on each row are checked.
+        """
+        for field in model._meta.concrete_fields:
+            if not (field.many_to_one or field.one_to_one):
+                continue
+            values_by_index = [
+                (index, [getattr(instance, field.attname)])
+                for index, instance in enumerate(instances)
+                if instance is not None
+                and (changed is None or field.name in changed[index])
+                and getattr(instance, field.attname) is not None
+            ]
+            references, coerced = self._collect_references(
+                field, values_by_index, errors
+            )
+            for index, values in coerced.items():
+                if values:
+                    setattr(instances[index], field.attname, values[0])
+
+            existing = self._existing_values(
+                field.remote_field.model._base_manager.complex_filter(
+                    field.get_limit_choices_to()
+                ),
+                field.target_field.attname,
+                list(references),
+            )
+            for value, indexes in references.items():
+                if value in existing:
+                    continue
+                error = ValidationError(
+                    field.error_messages["invalid"],
+                    code="invalid",
+                    params={
+                        "model": field.remote_field.model._meta.verbose_name,
+                        "pk": value,
+                        "field": field.remote_field.field_name,
+                        "value": value,
+                    },
+                )
+                for index in indexes:
+                    errors[index][field.name].append(error)
+
+    def _check_many_to_many(
+        self,
+        model: Type[models.Model],
+        m2m_values: List[Dict[str, List[Any]]],
+        errors: Dict[int, Dict[str, List[ValidationError]]],
+    ) -> None:
+        """Check the related ids of many-to-many values with batched queries."""
+        for field in model._meta.many_to_many:
+            values_by_index = []
+            for index, m2m in enumerate(m2m_values):
+                if not m2m.get(field.name):
+                    continue
+                if not field.remote_field.through._meta.auto_created:
+                    errors[index][field.name].append(
+                        ValidationError(
+                            f"'{field.name}' uses a custom through model and "
+                            "cannot be assigned by bulk creation"
+                        )
+                    )
+                    continue
+                values_by_index.append((index, m2m[field.name]))
+            references, coerced = self._collect_references(
+                field, values_by_index, errors
+            )
+            for index, values in coerced.items():
+                m2m_values[index][field.name] = values
+
+            existing = self._existing_values(
+                field.related_model._base_manager.all(),
+                field.target_field.attname,
+                list(references),
+            )
+            for value, indexes in references.items():
+                if value not in existing:
+                    for index in set(indexes):
+                        errors[index][field.name].append(
+                            ValidationError(
+                                f"{field.related_model._meta.verbose_name} "
+                                f"{value!r} does not exist."
+                            )
+                        )
+
+    @staticmethod
+    def _collect_references(
+        field: models.Field,
+        values_by_index: Iterable[Tuple[int, List[Any]]],
+        errors: Dict[int, Dict[str, List[ValidationError]]],
+    ) -> Tuple[Dict[Any, List[int]], Dict[int, List[Any]]]:
+        """
+        Coerce the values referenced by ``field`` on each row.
+
+        Invalid values are reported on their row and skipped.
+
+        Returns:
+            Tuple of (row indexes by coerced value, coerced values by row index)
+        """
+        target = field.target_field
+        references: Dict[Any, List[int]] = defaultdict(list)
+        coerced: Dict[int, List[Any]] = {}
+        for index, values in values_by_index:
+            coerced[index] = []
+            for value in values:
+                try:
+                    value = target.to_python(value)
+                except ValidationError as exc:
+                    errors[index][field.name].extend(exc.error_list)
+                    continue
+                coerced[index].append(value)
+                references[value].append(index)
+        return references, coerced
+
+    def _check_unique_fields(
+        self,
+        model: Type[models.Model],
+        instances: List[Optional[models.Model]],
+        errors: Dict[int, Dict[str, List[ValidationError]]],
+        changed: Optional[List[Set[str]]] = None,
+    ) -> None:
+        """
+        Check single-field uniqueness within the rows and against the table.
+
+        A value stored on the row being updated is not a conflict. When
+        ``changed`` is given, only the fields changed on each row are checked
+        (unchanged values are already in the table).
+        """
+        for field in model._meta.concrete_fields:
+            if not field.unique or (field.primary_key and field.has_default()):
+                continue
+            positions: Dict[Any, List[int]] = defaultdict(list)
+            for index, instance in enumerate(instances):
+                if changed is not None and field.name not in changed[index]:
+                    continue
+                value = getattr(instance, field.attname, None) if instance else None
+                if value is None:
+                    continue
+                positions[value].append(index)
+
+            owners = self._existing_owners(
+                model._base_manager.all(), field.attname, list(positions)
+            )
+            for value, indexes in positions.items():
+                for position, index in enumerate(indexes):
+                    stored_by_other = owners.get(value, set()) - {instances[index].pk}
+                    if position or stored_by_other:
+                        errors[index][field.name].append(
+                            instances[index].unique_error_message(
+                                model, (field.name,)
+                            )
+                        )
+
+    def _existing_values(
+        self, queryset: models.QuerySet, attname: str, values: List[Any]
+    ) -> Set[Any]:
+        """Return which of ``values`` exist in ``queryset`` (batched IN queries)."""
+        existing: Set[Any] = set()
+        for batch in chunked(values, self.batch_size):
+            existing.update(
+                queryset.filter(**{f"{attname}__in": batch}).values_list(
+                    attname, flat=True
+                )
+            )
+        return existing
+
+    def _existing_owners(
+        self, queryset: models.QuerySet, attname: str, values: List[Any]
+    ) -> Dict[Any, Set[Any]]:
+        """Map each of ``values`` found in ``queryset`` to the pks storing it."""
+        owners: Dict[Any, Set[Any]] = defaultdict(set)
+        for batch in chunked(values, self.batch_size):
+            rows = queryset.filter(**{f"{attname}__in": batch}).values_list(
+                attname, "pk"
+            )
+            for value, pk in rows:
+                owners[value].add(pk)
+        return owners
+
+    def _insert(
+        self,
+        model: Type[models.Model],
+        instances: List[models.Model],
+        **conflict_options: Any,
+    ) -> List[models.Model]:
+        """
+        Insert instances in batches.
+
+        Multi-table inheritance saves row by row. On backends that cannot
+        return rows from a bulk insert (MySQL, MariaDB < 10.5), rows without
+        a primary key are saved row by row too, or read back by a unique key
+        when a conflict mode is used. Ignored conflicts never set primary keys.
+
+        Raises:
+            ValueError: If the primary keys of upserted rows cannot be read back
+        """
+        if model._meta.parents:
+            # bulk_create does not support multi-table inheritance
+            for instance in instances:
+                instance.save(force_insert=True)
+            return instances
+        options = {key: value for key, value in conflict_options.items() if value}
+        connection = connections[router.db_for_write(model)]
+        if connection.features.can_return_rows_from_bulk_insert or all(
+            instance.pk is not None for instance in instances
+        ):
+            return model._default_manager.bulk_create(
+                instances, batch_size=self.batch_size, **options
+            )
+
+        if not options:
+            for instance in instances:
+                instance.save(force_insert=True)
+            return instances
+        if options.get("ignore_conflicts"):
+            return model._default_manager.bulk_create(
+                instances, batch_size=self.batch_size, **options
+            )
+
+        lookup_fields = self._lookup_fields(model, options.get("unique_fields"))
+        if not lookup_fields:
+            raise ValueError(
+                f"The {connection.vendor} backend does not return primary keys from "
+                f"bulk inserts and {model._meta.label} has no unique field to read "
+                "them back: pass unique_fields with update_conflicts"
+            )
+        created = model._default_manager.bulk_create(
+            instances, batch_size=self.batch_size, **options
+        )
+        self._read_back_primary_keys(model, created, lookup_fields)
+        return created
+
+    @staticmethod
+    def _lookup_fields(
+        model: Type[models.Model], unique_fields: Optional[List[str]]
+    ) -> List[str]:
+        """Attnames of the unique key identifying inserted rows."""
+        if unique_fields:
+            return [model._meta.get_field(name).attname for name in unique_fields]
+        for field in model._meta.concrete_fields:
+            if field.unique and not field.primary_key:
+                return [field.attname]
+        return []
+
+    def _read_back_primary_keys(
+        self,
+        model: Type[models.Model],
+        instances: List[models.Model],
+        lookup_fields: List[str],
+    ) -> None:
+        """Set the primary keys of inserted rows from their unique key values."""
+        pk_name = model._meta.pk.attname
+        for chunk in chunked(instances, self.batch_size):
+            by_key = {
+                tuple(getattr(instance, name) for name in lookup_fields): instance
+                for instance in chunk
+            }
+            condition = Q()
+            for key in by_key:
+                condition |= Q(**dict(zip(lookup_fields, key)))
+            for row in model._default_manager.filter(condition).values(
+                pk_name, *lookup_fields
+            ):
+                instance = by_key.get(tuple(row[name] for name in lookup_fields))
+                if instance is not None:
+                    instance.pk = row[pk_name]
+
+    def _insert_many_to_many(
+        self,
+        model: Type[models.Model],
+        instances: List[models.Model],
+        m2m_values: List[Dict[str, List[Any]]],
+    ) -> None:
+        """Insert the through rows of every many-to-many field in batches."""
+        for field in model._meta.many_to_many:
+            through = field.remote_field.through
+            source = through._meta.get_field(field.m2m_field_name()).attname
+            target = through._meta.get_field(field.m2m_reverse_field_name()).attname
+            links = []
+            for instance, m2m in zip(instances, m2m_values):
+                related_ids = m2m.get(field.name)
+                if not related_ids:
+                    continue
+                if instance.pk is None:
+                    raise ValueError(
+                        f"Cannot assign '{field.name}' to rows whose primary key "
+                        "was not returned (ignored conflicts)"
+                    )
+                links.extend(
+                    through(**{source: instance.pk, target: related_id})
+                    for related_id in related_ids
+                )
+            if links:
+                through._default_manager.bulk_create(
+                    links, batch_size=self.batch_size, ignore_conflicts=True
+                )
+
+    def _replace_many_to_many(
+        self,
+        model: Type[models.Model],
+        instances: List[models.Model],
+        m2m_values: List[Dict[str, List[Any]]],
+    ) -> None:
+        """Replace the relations of the given many-to-many values in batches."""
+        for field in model._meta.many_to_many:
+            through = field.remote_field.through
+            source = through._meta.get_field(field.m2m_field_name()).attname
+            pks = [
+                instance.pk
+                for instance, m2m in zip(instances, m2m_values)
+                if field.name in m2m
+            ]
+            for batch in chunked(pks, self.batch_size):
+                through._base_manager.filter(**{f"{source}__in": batch}).delete()
+        self._insert_many_to_many(model, instances, m2m_values)
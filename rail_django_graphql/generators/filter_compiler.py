@@ -0,0 +1,293 @@
+"""
+Compiled filter trees for complex (AND/OR/NOT) filters.
+
+Dashboards send the same filter shapes over and over with different literal
+values. ``FilterCompiler`` normalizes a filter tree into a canonical shape
+key, resolves and validates every lookup path of that shape once (field
+traversal, lookup and transform names, value coercer) and keeps the result in
+an LRU cache. Binding a compiled filter to a new input only reads the values
+and builds the ``Q`` objects; the input is never mutated.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, List, Mapping, Optional, Tuple, Type
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db import models
+from django.db.models import Q
+
+from ..core.meta import get_model_graphql_meta
+
+LOGICAL_KEYS = ("AND", "OR", "NOT")
+
+# Lookups whose value is compared as-is (pattern matching on text)
+PATTERN_LOOKUPS = {
+    "contains",
+    "icontains",
+    "startswith",
+    "istartswith",
+    "endswith",
+    "iendswith",
+    "regex",
+    "iregex",
+}
+
+
+def filter_shape(filter_input: Optional[Mapping[str, Any]]) -> Hashable:
+    """
+    Return the canonical shape of a filter tree.
+
+    The shape keeps the set (not the order) of the lookups carrying a value
+    and the structure of the AND/OR/NOT branches, but none of the values.
+    """
+    if not filter_input:
+        return ()
+    leaves = tuple(
+        sorted(
+            key
+            for key, value in filter_input.items()
+            if key not in LOGICAL_KEYS and value is not None
+        )
+    )
+    and_shape = tuple(filter_shape(item) for item in filter_input.get("AND") or [])
+    or_shape = tuple(filter_shape(item) for item in filter_input.get("OR") or [])
+    not_input = filter_input.get("NOT")
+    not_shape = filter_shape(not_input) if not_input else None
+    return (leaves, and_shape, or_shape, not_shape)
+
+
+class CompiledLookup:
+    """
+    Resolved filter lookup (``path__to__field__lookup``).
+
+    Attributes:
+        key: Filter key as sent by the client
+        coerce: Converts a client value to the Python type of the field
+    """
+
+    __slots__ = ("key", "coerce")
+
+    def __init__(self, key: str, coerce: Optional[Callable[[Any], Any]] = None):
+        self.key = key
+        self.coerce = coerce
+
+    def bind(self, value: Any) -> Tuple[str, Any]:
+        if self.coerce is not None:
+            try:
+                value = self.coerce(value)
+            except (TypeError, ValueError, ValidationError):
+                # Let the ORM report the invalid value with its usual error
+                pass
+        return self.key, value
+
+
+class CompiledFilter:
+    """
+    Compiled node of a filter tree.
+
+    Attributes:
+        lookups: Field lookups of the node, in canonical order
+        and_nodes: Compiled ``AND`` branches
+        or_nodes: Compiled ``OR`` branches
+        not_node: Compiled ``NOT`` branch
+        keys: Every lookup key used in the tree (for property expressions)
+    """
+
+    __slots__ = ("lookups", "and_nodes", "or_nodes", "not_node", "keys")
+
+    def __init__(
+        self,
+        lookups: List[CompiledLookup],
+        and_nodes: List["CompiledFilter"],
+        or_nodes: List["CompiledFilter"],
+        not_node: Optional["CompiledFilter"],
+    ):
+        self.lookups = lookups
+        self.and_nodes = and_nodes
+        self.or_nodes = or_nodes
+        self.not_node = not_node
+        keys = {lookup.key for lookup in lookups}
+        for node in [*and_nodes, *or_nodes, *([not_node] if not_node else [])]:
+            keys.update(node.keys)
+        self.keys = frozenset(keys)
+
+    def bind(self, filter_input: Mapping[str, Any]) -> Q:
+        """Build the ``Q`` object of ``filter_input`` (which has this shape)."""
+        q_object = Q()
+        for node, item in zip(self.and_nodes, filter_input.get("AND") or []):
+            q_object &= node.bind(item)
+
+        if self.or_nodes:
+            or_q = Q()
+            for node, item in zip(self.or_nodes, filter_input["OR"]):
+                or_q |= node.bind(item)
+            q_object &= or_q
+
+        if self.not_node is not None:
+            q_object &= ~self.not_node.bind(filter_input["NOT"])
+
+        if self.lookups:
+            q_object &= Q(
+                *[lookup.bind(filter_input[lookup.key]) for lookup in self.lookups]
+            )
+        return q_object
+
+
+class FilterCompiler:
+    """
+    Compiles filter trees per model and shape, with an LRU cache.
+
+    Attributes:
+        maxsize: Maximum number of compiled shapes kept (0 disables caching)
+        hits: Number of compilations served from the cache
+        misses: Number of shapes compiled
+    """
+
+    def __init__(self, maxsize: int = 512):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._cache: "OrderedDict[Tuple[str, Hashable], CompiledFilter]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def compile(
+        self, model: Type[models.Model], filter_input: Mapping[str, Any]
+    ) -> CompiledFilter:
+        """
+        Return the compiled filter for the shape of ``filter_input``.
+
+        Raises:
+            ValueError: If a lookup or transform is not supported by its field
+        """
+        cache_key = (model._meta.label_lower, filter_shape(filter_input))
+        with self._lock:
+            compiled = self._cache.get(cache_key)
+            if compiled is not None:
+                self._cache.move_to_end(cache_key)
+                self.hits += 1
+                return compiled
+
+        compiled = self._compile_node(model, filter_input)
+        with self._lock:
+            self.misses += 1
+            if self.maxsize > 0:
+                self._cache[cache_key] = compiled
+                while len(self._cache) > self.maxsize:
+                    self._cache.popitem(last=False)
+        return compiled
+
+    def clear(self) -> None:
+        """Drop every compiled shape."""
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _compile_node(
+        self, model: Type[models.Model], filter_input: Optional[Mapping[str, Any]]
+    ) -> CompiledFilter:
+        filter_input = filter_input or {}
+        not_input = filter_input.get("NOT")
+        return CompiledFilter(
+            lookups=[
+                self._compile_lookup(model, key)
+                for key in sorted(
+                    key
+                    for key, value in filter_input.items()
+                    if key not in LOGICAL_KEYS and value is not None
+                )
+            ],
+            and_nodes=[
+                self._compile_node(model, item) for item in filter_input.get("AND") or []
+            ],
+            or_nodes=[
+                self._compile_node(model, item) for item in filter_input.get("OR") or []
+            ],
+            not_node=self._compile_node(model, not_input) if not_input else None,
+        )
+
+    def _compile_lookup(self, model: Type[models.Model], key: str) -> CompiledLookup:
+        """
+        Resolve ``key`` against ``model`` and pick the coercer of its value.
+
+        Keys that do not start with a model field (property expressions,
+        annotations) are passed to the ORM unchanged.
+        """
+        parts = key.split("__")
+        graphql_meta = get_model_graphql_meta(model)
+        if graphql_meta.get_property_expression(parts[0]) is not None:
+            return CompiledLookup(key)
+
+        field, index = self._resolve_field(model, parts)
+        if field is None:
+            return CompiledLookup(key)
+
+        remaining = parts[index:]
+        lookup_name = remaining[-1] if remaining else "exact"
+        transforms = remaining[:-1]
+        get_transform = getattr(field, "get_transform", lambda name: None)
+        if transforms:
+            if get_transform(transforms[0]) is None:
+                raise ValueError(
+                    f"Unsupported transform '{transforms[0]}' in filter '{key}'"
+                )
+            # Output types of transforms are resolved by the ORM
+            return CompiledLookup(key)
+        if field.get_lookup(lookup_name) is None:
+            if get_transform(lookup_name) is None:
+                raise ValueError(
+                    f"Unsupported lookup '{lookup_name}' in filter '{key}'"
+                )
+            return CompiledLookup(key)
+        return CompiledLookup(key, self._coercer(field, lookup_name))
+
+    def _resolve_field(
+        self, model: Type[models.Model], parts: List[str]
+    ) -> Tuple[Optional[models.Field], int]:
+        """Walk the field path of ``parts``; return the last field and its end index."""
+        opts = model._meta
+        field = None
+        index = 0
+        while index < len(parts):
+            name = opts.pk.name if parts[index] == "pk" else parts[index]
+            try:
+                candidate = opts.get_field(name)
+            except FieldDoesNotExist:
+                break
+            field = candidate
+            index += 1
+            related_model = getattr(field, "related_model", None)
+            if related_model is None or not field.is_relation:
+                break
+            opts = related_model._meta
+        return field, index
+
+    def _coercer(
+        self, field: models.Field, lookup_name: str
+    ) -> Optional[Callable[[Any], Any]]:
+        """Return the value coercer of a lookup, or None to pass values as-is."""
+        if lookup_name == "isnull":
+            return bool
+        if lookup_name in PATTERN_LOOKUPS:
+            return None
+        if field.is_relation:
+            try:
+                target = field.target_field
+            except Exception:
+                return None
+            if target is None or target.is_relation:
+                return None
+            to_python = target.to_python
+        elif field.concrete:
+            to_python = field.to_python
+        else:
+            return None
+
+        if lookup_name == "in":
+            return lambda values: [to_python(value) for value in values]
+        if lookup_name == "range":
+            return lambda values: tuple(to_python(value) for value in values)
+        return to_python
@@ -37,7 +37,10 @@ from django_filters import (
 )
 
 from ..core.meta import GraphQLMeta, get_model_graphql_meta
+from ..conf import get_query_generator_settings
+from .filter_compiler import FilterCompiler
 from .introspector import ModelIntrospector
+from .property_fallback import scan_property_rows
 
 logger = logging.getLogger(__name__)
 
@@ -572,6 +575,7 @@ class AdvancedFilterGenerator:
             schema_name: Optional schema name for context (for future multi-schema support)
         """
         self._filter_cache: Dict[Type[models.Model], Type[FilterSet]] = {}
+        self._filter_compiler: Optional[FilterCompiler] = None
         self.max_nested_depth = min(max_nested_depth, MAX_ALLOWED_NESTED_DEPTH)
         self.enable_nested_filters = enable_nested_filters
         self.schema_name = schema_name or "default"
@@ -1455,16 +1459,36 @@ class AdvancedFilterGenerator:
             """
             Custom filter method for property-based filtering.
 
-            Since properties are computed at runtime, we need to evaluate
-            them for each object and filter accordingly.
+            Properties with a declared expression are filtered in SQL. Others
+            are evaluated on each row, streamed in chunks up to the model's
+            property scan cap.
             """
             if value is None:
                 return queryset
 
-            # Get all objects and evaluate the property
+            # Declared expressions let the database evaluate the property
+            graphql_meta = get_model_graphql_meta(queryset.model)
+            if graphql_meta.get_property_expression(property_name) is not None:
+                queryset = graphql_meta.apply_property_expressions(
+                    queryset, [property_name]
+                )
+                lookup = (
+                    property_name
+                    if lookup_expr == "exact"
+                    else f"{property_name}__{lookup_expr}"
+                )
+                return queryset.filter(**{lookup: value})
+
+            # Evaluate the property on a bounded stream of rows
             filtered_ids = []
+            rows = scan_property_rows(
+                queryset,
+                [property_name],
+                schema_name=self.schema_name,
+                columns_only=True,
+            )
 
-            for obj in queryset:
+            for obj in rows:
                 try:
                     # Get the property value
                     property_value = getattr(obj, property_name)
@@ -2555,6 +2579,9 @@ class AdvancedFilterGenerator:
         """
         Purpose: Apply a nested AND/OR/NOT filter tree to a queryset using Django Q objects.
 
+        The tree is compiled once per shape (set of lookups and AND/OR/NOT
+        structure) and cached; ``filter_input`` is never mutated.
+
         Args:
             queryset (models.QuerySet): Base queryset to filter.
             filter_input (Dict[str, Any]): Parsed complex filter input (matching the generated
@@ -2565,7 +2592,7 @@ class AdvancedFilterGenerator:
             models.QuerySet: A queryset filtered by the composed logical expression.
 
         Raises:
-            ValueError: If filter_input contains unsupported structures or types.
+            ValueError: If a lookup or transform is not supported by its field.
 
         Example:
             >>> # Given variables['filters'] built like in the generate_complex_filter_input example,
@@ -2575,34 +2602,25 @@ class AdvancedFilterGenerator:
         if not filter_input:
             return queryset
 
-        q_objects = Q()
-
-        # Handle AND operations
-        if "AND" in filter_input:
-            and_filters = filter_input.pop("AND")
-            for and_filter in and_filters:
-                and_q = self._build_q_object(and_filter)
-                q_objects &= and_q
-
-        # Handle OR operations
-        if "OR" in filter_input:
-            or_filters = filter_input.pop("OR")
-            or_q = Q()
-            for or_filter in or_filters:
-                or_q |= self._build_q_object(or_filter)
-            q_objects &= or_q
-
-        # Handle NOT operations
-        if "NOT" in filter_input:
-            not_filter = filter_input.pop("NOT")
-            not_q = self._build_q_object(not_filter)
-            q_objects &= ~not_q
-
-        # Handle regular field filters
-        regular_q = self._build_q_object(filter_input)
-        q_objects &= regular_q
-
-        return queryset.filter(q_objects)
+        # Lookups are resolved once per filter shape; only values are bound here
+        compiled = self.filter_compiler.compile(queryset.model, filter_input)
+
+        # Properties with declared expressions are filtered in SQL
+        queryset = get_model_graphql_meta(queryset.model).apply_property_expressions(
+            queryset, compiled.keys
+        )
+
+        return queryset.filter(compiled.bind(filter_input))
+
+    @property
+    def filter_compiler(self) -> FilterCompiler:
+        """Compiler caching the resolved structure of complex filter shapes."""
+        if self._filter_compiler is None:
+            settings = get_query_generator_settings(self.schema_name)
+            self._filter_compiler = FilterCompiler(
+                maxsize=settings.filter_compiler_cache_size
+            )
+        return self._filter_compiler
 
     def _build_q_object(self, filter_dict: Dict[str, Any]) -> Q:
         """
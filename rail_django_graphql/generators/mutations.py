@@ -6,6 +6,7 @@ GraphQL mutations for Django models, including CRUD operations and custom method
 """
 
 from .types import TypeGenerator
+from .bulk_operations import BulkOperationHandler
 from .nested_operations import NestedOperationHandler
 from .introspector import MethodInfo, ModelIntrospector
 from ..core.settings import MutationGeneratorSettings
@@ -23,6 +24,7 @@ from django.core.exceptions import ValidationError
 from django.db import IntegrityError, models, transaction
 from graphene_django import DjangoObjectType
 from graphene.types.generic import GenericScalar
+from graphene.utils.str_converters import to_snake_case
 
 
 class MutationError(graphene.ObjectType):
@@ -41,6 +43,19 @@ class MutationError(graphene.ObjectType):
     )
 
 
+class DeletionCount(graphene.ObjectType):
+    """
+    Number of rows deleted for one model (cascades included).
+
+    Attributes:
+        model: Model label (``app_label.ModelName``)
+        count: Number of deleted rows
+    """
+
+    model = graphene.String(description="Libellé du modèle (app_label.Modele)")
+    count = graphene.Int(description="Nombre de lignes supprimées")
+
+
 def _normalize_field_path(field: Any, prefix: Optional[str] = None) -> Optional[str]:
     """
     Convert backend field identifiers (including dotted, double-underscore or list
@@ -875,16 +890,41 @@ class MutationGenerator:
     ) -> Type[graphene.Mutation]:
         """
         Generates a mutation for creating multiple model instances in bulk.
+
+        Every row is validated first; errors are reported per row index
+        (``inputs.<index>.<field>``) and nothing is written while a row is
+        invalid. Rows are then inserted with ``bulk_create`` in batches of
+        ``bulk_batch_size`` and many-to-many ids in a second batched pass.
+        ``ignoreConflicts`` / ``updateConflicts`` opt into upserts.
         """
         model_type = self.type_generator.generate_object_type(model)
         input_type = self.type_generator.generate_input_type(
             model, mutation_type="create"
         )
         model_name = model.__name__
+        graphql_meta = get_model_graphql_meta(model)
+        read_only_fields = set(
+            getattr(graphql_meta.field_config, "read_only", []) or []
+        )
+        bulk_handler = BulkOperationHandler(batch_size=self.settings.bulk_batch_size)
 
         class BulkCreateMutation(graphene.Mutation):
             class Arguments:
                 inputs = graphene.List(input_type, required=True)
+                ignore_conflicts = graphene.Boolean(
+                    description="Ignorer les lignes en conflit (contrainte d'unicité)"
+                )
+                update_conflicts = graphene.Boolean(
+                    description="Mettre à jour les lignes en conflit (upsert)"
+                )
+                update_fields = graphene.List(
+                    graphene.NonNull(graphene.String),
+                    description="Champs mis à jour en cas de conflit (updateConflicts)",
+                )
+                unique_fields = graphene.List(
+                    graphene.NonNull(graphene.String),
+                    description="Champs identifiant un conflit (updateConflicts)",
+                )
 
             # Standardized return type
             ok = graphene.Boolean()
@@ -894,16 +934,44 @@ class MutationGenerator:
             @classmethod
             @transaction.atomic
             def mutate(
-                cls, root: Any, info: graphene.ResolveInfo, inputs: List[Dict[str, Any]]
+                cls,
+                root: Any,
+                info: graphene.ResolveInfo,
+                inputs: List[Dict[str, Any]],
+                ignore_conflicts: bool = False,
+                update_conflicts: bool = False,
+                update_fields: Optional[List[str]] = None,
+                unique_fields: Optional[List[str]] = None,
             ) -> "BulkCreateMutation":
                 try:
                     graphql_meta.ensure_operation_access("bulk_create", info=info)
-                    instances = []
+                    rows = []
                     for input_data in inputs:
                         # Normalize enum inputs (GraphQL Enum -> underlying Django values)
                         input_data = cls._normalize_enum_inputs(input_data, model)
-                        instance = model.objects.create(**input_data)
-                        instances.append(instance)
+                        rows.append(
+                            {
+                                key: value
+                                for key, value in input_data.items()
+                                if key not in read_only_fields
+                            }
+                        )
+
+                    instances, row_errors = bulk_handler.bulk_create(
+                        model,
+                        rows,
+                        ignore_conflicts=bool(ignore_conflicts),
+                        update_conflicts=bool(update_conflicts),
+                        update_fields=[to_snake_case(name) for name in update_fields or []],
+                        unique_fields=[to_snake_case(name) for name in unique_fields or []],
+                    )
+                    if row_errors:
+                        error_objects = []
+                        for index, error in sorted(row_errors.items()):
+                            error_objects.extend(
+                                build_validation_errors(error, prefix=f"inputs.{index}")
+                            )
+                        return cls(ok=False, objects=[], errors=error_objects)
 
                     return cls(ok=True, objects=instances, errors=[])
 
@@ -1010,12 +1078,21 @@ class MutationGenerator:
     ) -> Type[graphene.Mutation]:
         """
         Generates a mutation for updating multiple model instances in bulk.
+
+        Targets are loaded with one ``in_bulk``, changes are validated in
+        memory with errors reported per row index, and rows are written with
+        ``bulk_update`` on the union of the touched fields.
         """
         model_type = self.type_generator.generate_object_type(model)
         input_type = self.type_generator.generate_input_type(
             model, partial=True, mutation_type="update"
         )
         model_name = model.__name__
+        graphql_meta = get_model_graphql_meta(model)
+        read_only_fields = set(
+            getattr(graphql_meta.field_config, "read_only", []) or []
+        )
+        bulk_handler = BulkOperationHandler(batch_size=self.settings.bulk_batch_size)
 
         class BulkUpdateInput(graphene.InputObjectType):
             id = graphene.ID(required=True)
@@ -1037,21 +1114,37 @@ class MutationGenerator:
             ) -> "BulkUpdateMutation":
                 try:
                     graphql_meta.ensure_operation_access("bulk_update", info=info)
-                    instances = []
+                    updates = []
                     for input_data in inputs:
-                        instance = model.objects.get(pk=input_data["id"])
-                        graphql_meta.ensure_operation_access(
-                            "bulk_update", info=info, instance=instance
-                        )
                         # Normalize enum inputs for update payload
                         update_data = cls._normalize_enum_inputs(
                             input_data["data"], model
                         )
-                        for field, value in update_data.items():
-                            setattr(instance, field, value)
-                        instance.full_clean()
-                        instance.save()
-                        instances.append(instance)
+                        updates.append(
+                            (
+                                input_data["id"],
+                                {
+                                    key: value
+                                    for key, value in update_data.items()
+                                    if key != "id" and key not in read_only_fields
+                                },
+                            )
+                        )
+
+                    instances, row_errors = bulk_handler.bulk_update(
+                        model,
+                        updates,
+                        check_access=lambda targets: graphql_meta.ensure_operation_access(
+                            "bulk_update", info=info, instances=targets
+                        ),
+                    )
+                    if row_errors:
+                        error_objects = []
+                        for index, error in row_errors.items():
+                            error_objects.extend(
+                                build_validation_errors(error, prefix=f"inputs.{index}")
+                            )
+                        return cls(ok=False, objects=[], errors=error_objects)
 
                     return cls(ok=True, objects=instances, errors=[])
 
@@ -1102,6 +1195,50 @@ class MutationGenerator:
                         ],
                     )
 
+            @classmethod
+            def _normalize_enum_inputs(
+                cls, input_data: Dict[str, Any], model: Type[models.Model]
+            ) -> Dict[str, Any]:
+                """
+                Purpose: Normalize GraphQL Enum inputs to their underlying Django field values for bulk update.
+                Args:
+                    input_data: Single input payload from GraphQL bulk mutation list
+                    model: Django model being mutated
+                Returns:
+                    Dict: Input data with enum values normalized
+                Raises:
+                    None
+                Example:
+                    >>> normalized = BulkUpdateMutation._normalize_enum_inputs({'status': SomeEnum.ACTIVE}, Book)
+                    >>> isinstance(normalized['status'], str)
+                    True
+                """
+                normalized: Dict[str, Any] = input_data.copy()
+
+                choice_fields = {
+                    f.name: f
+                    for f in model._meta.get_fields()
+                    if hasattr(f, "choices") and getattr(f, "choices", None)
+                }
+
+                def normalize_value(value: Any) -> Any:
+                    if hasattr(value, "value") and not isinstance(value, (str, bytes)):
+                        try:
+                            return getattr(value, "value")
+                        except Exception:
+                            return value
+                    if isinstance(value, list):
+                        return [normalize_value(v) for v in value]
+                    if isinstance(value, dict):
+                        return {k: normalize_value(v) for k, v in value.items()}
+                    return value
+
+                for field_name in choice_fields.keys():
+                    if field_name in normalized:
+                        normalized[field_name] = normalize_value(normalized[field_name])
+
+                return normalized
+
         return type(
             f"BulkUpdate{model_name}",
             (BulkUpdateMutation,),
@@ -1113,47 +1250,75 @@ class MutationGenerator:
     ) -> Type[graphene.Mutation]:
         """
         Generates a mutation for deleting multiple model instances in bulk.
+
+        Targets are checked and deleted in primary-key chunks of
+        ``bulk_batch_size``. With ``returnObjects: false`` only primary keys
+        are read (unless the guard needs the instances) and the mutation
+        returns the deleted row counts per model instead of the objects.
         """
         model_type = self.type_generator.generate_object_type(model)
         model_name = model.__name__
+        graphql_meta = get_model_graphql_meta(model)
+        bulk_handler = BulkOperationHandler(batch_size=self.settings.bulk_batch_size)
 
         class BulkDeleteMutation(graphene.Mutation):
             class Arguments:
                 ids = graphene.List(graphene.ID, required=True)
+                return_objects = graphene.Boolean(
+                    default_value=True,
+                    description="Retourner les objets supprimés (false: seulement les compteurs)",
+                )
 
             # Standardized return type
             ok = graphene.Boolean()
             objects = graphene.List(model_type)  # Return deleted objects
+            deleted_count = graphene.Int()
+            deleted_counts = graphene.List(DeletionCount)
             errors = graphene.List(MutationError)
 
             @classmethod
             @transaction.atomic
             def mutate(
-                cls, root: Any, info: graphene.ResolveInfo, ids: List[str]
+                cls,
+                root: Any,
+                info: graphene.ResolveInfo,
+                ids: List[str],
+                return_objects: bool = True,
             ) -> "BulkDeleteMutation":
                 try:
                     graphql_meta.ensure_operation_access("bulk_delete", info=info)
-                    instances = model.objects.filter(pk__in=ids)
-                    if len(instances) != len(ids):
-                        found_ids = set(str(instance.pk) for instance in instances)
-                        missing_ids = set(ids) - found_ids
+                    load_instances = bool(
+                        return_objects
+                    ) or graphql_meta.operation_guard_uses_instance("bulk_delete")
+                    deleted_instances, counts, missing_ids = bulk_handler.bulk_delete(
+                        model,
+                        ids,
+                        load_instances=load_instances,
+                        check_access=lambda chunk: graphql_meta.ensure_operation_access(
+                            "bulk_delete", info=info, instances=chunk
+                        ),
+                    )
+                    if missing_ids:
                         return cls(
                             ok=False,
                             objects=[],
                             errors=[
                                 build_mutation_error(
-                                    message=f"Some {model_name} instances not found: {', '.join(missing_ids)}"
+                                    message=f"Some {model_name} instances not found: {', '.join(str(pk) for pk in missing_ids)}"
                                 )
                             ],
                         )
 
-                    deleted_instances = list(instances)  # Store before deletion
-                    for inst in deleted_instances:
-                        graphql_meta.ensure_operation_access(
-                            "bulk_delete", info=info, instance=inst
-                        )
-                    instances.delete()
-                    return cls(ok=True, objects=deleted_instances, errors=[])
+                    return cls(
+                        ok=True,
+                        objects=deleted_instances if return_objects else None,
+                        deleted_count=sum(counts.values()),
+                        deleted_counts=[
+                            DeletionCount(model=label, count=count)
+                            for label, count in sorted(counts.items())
+                        ],
+                        errors=[],
+                    )
 
                 except model.DoesNotExist as exc:
                     return cls(
@@ -7,11 +7,15 @@ validation, transaction management, and cascade handling for related objects.
 
 import logging
 import re
+import threading
 import uuid
-from typing import Any, Dict, List, Optional, Set, Type, Union
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Type, Union
 
 import graphene
-from django.core.exceptions import ValidationError
+from django.core.exceptions import FieldDoesNotExist, ValidationError
 from django.db import IntegrityError, models, transaction
 from django.db.models import Q
 
@@ -23,6 +27,58 @@ from ..core.settings import MutationGeneratorSettings
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class CascadeDeletePlan:
+    """
+    Rows affected by a cascade delete, computed before anything is written.
+
+    Attributes:
+        levels: Rows to delete per model, one mapping per depth (root first)
+        deletions: Every row to delete, per model
+        updates: (value, pks) to assign per (model, foreign key name) for
+                 SET_NULL/SET_DEFAULT rules
+    """
+
+    levels: List[Dict[Type[models.Model], Set[Any]]] = field(default_factory=list)
+    deletions: Dict[Type[models.Model], Set[Any]] = field(
+        default_factory=lambda: defaultdict(set)
+    )
+    updates: Dict[Tuple[Type[models.Model], str], List[Any]] = field(
+        default_factory=lambda: defaultdict(lambda: [None, set()])
+    )
+
+    def add_level(self, level: Dict[Type[models.Model], Set[Any]]) -> None:
+        self.levels.append(level)
+        for model, pks in level.items():
+            self.deletions[model].update(pks)
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        """Number of rows to delete per model label."""
+        return {
+            model._meta.label: len(pks)
+            for model, pks in self.deletions.items()
+            if pks
+        }
+
+    @property
+    def update_counts(self) -> Dict[str, int]:
+        """Number of rows to update per ``model label.field``."""
+        return {
+            f"{model._meta.label}.{field_name}": len(pks - self.deletions[model])
+            for (model, field_name), (_, pks) in self.updates.items()
+        }
+
+    def describe(self) -> List[str]:
+        """Describe the deleted rows, deepest first."""
+        return [
+            f"{model._meta.model_name}(id={pk})"
+            for level in reversed(self.levels)
+            for model, pks in level.items()
+            for pk in sorted(pks, key=str)
+        ]
+
+
 class NestedOperationHandler:
     """
     Handles complex nested operations for GraphQL mutations including
@@ -35,6 +91,9 @@ class NestedOperationHandler:
     - Performance optimization
     - Circular reference detection
     - Transaction management
+    - Batched writes: referenced rows are fetched once per related model and
+      reverse relation children are diffed against one query, then written
+      with bulk_create/bulk_update and one delete
     """
 
     def __init__(self, mutation_settings=None, schema_name: str = "default"):
@@ -62,6 +121,8 @@ class NestedOperationHandler:
         self.query_optimizer = get_query_optimizer(schema_name)
 
         self.circular_reference_tracker = set()
+        # Rows referenced by the payload being processed (per thread)
+        self._local = threading.local()
         self.max_depth = getattr(
             self.mutation_settings, "max_nested_depth", 10
         )  # Prevent infinite recursion
@@ -121,6 +182,16 @@ class NestedOperationHandler:
         Raises:
             ValidationError: If validation fails or circular references detected
         """
+        with self._reference_scope(model, input_data):
+            return self._create_instance(model, input_data, parent_instance)
+
+    def _create_instance(
+        self,
+        model: Type[models.Model],
+        input_data: Dict[str, Any],
+        parent_instance: Optional[models.Model] = None,
+    ) -> models.Model:
+        """Create ``model`` from ``input_data`` (see :meth:`handle_nested_create`)."""
         try:
             # First, process nested_ prefixed fields and extract them
             processed_input = self._process_nested_fields(input_data)
@@ -171,8 +242,8 @@ class NestedOperationHandler:
                     # Nested create
                     if "id" in value:
                         # Update existing object
-                        related_instance = field.related_model.objects.get(
-                            pk=value["id"]
+                        related_instance = self._resolve_reference(
+                            field.related_model, value["id"]
                         )
                         regular_fields[field_name] = self.handle_nested_update(
                             field.related_model, value, related_instance
@@ -193,7 +264,9 @@ class NestedOperationHandler:
                             pass
 
                     try:
-                        related_instance = field.related_model.objects.get(pk=pk_value)
+                        related_instance = self._resolve_reference(
+                            field.related_model, pk_value
+                        )
                         regular_fields[field_name] = related_instance
                     except field.related_model.DoesNotExist:
                         # Explicitly map error to the input field name
@@ -227,30 +300,9 @@ class NestedOperationHandler:
                 # Handle different types of reverse relationship data
                 if isinstance(value, list):
                     # List can contain either IDs (to connect existing objects) or dicts (to create new objects)
-                    for item in value:
-                        if isinstance(item, dict):
-                            # Create new object and set the foreign key to point to our instance
-                            item[related_field.field.name] = instance.pk
-                            self.handle_nested_create(related_field.related_model, item)
-                        elif isinstance(item, (str, int, uuid.UUID)):
-                            # Connect existing object to this instance
-                            pk_value = item
-                            if isinstance(item, str) and item.isdigit():
-                                try:
-                                    pk_value = int(item)
-                                except (TypeError, ValueError):
-                                    pass
-
-                            try:
-                                related_field.related_model.objects.filter(
-                                    pk=pk_value
-                                ).update(**{related_field.field.name: instance})
-                            except Exception as e:
-                                raise ValidationError(
-                                    {
-                                        field_name: f"Failed to connect {related_field.related_model.__name__} with id {item}: {str(e)}"
-                                    }
-                                )
+                    self._sync_reverse_children(
+                        instance, field_name, related_field, value, replace=False
+                    )
 
                 elif isinstance(value, dict):
                     # Handle operations like create, connect, disconnect
@@ -295,8 +347,8 @@ class NestedOperationHandler:
                         if isinstance(item, dict) and use_nested:
                             if "id" in item:
                                 # Reference existing object
-                                related_obj = field.related_model.objects.get(
-                                    pk=item["id"]
+                                related_obj = self._resolve_reference(
+                                    field.related_model, item["id"]
                                 )
                             else:
                                 # Create new object only if nested operations are enabled
@@ -306,7 +358,9 @@ class NestedOperationHandler:
                             related_objects.append(related_obj)
                         elif isinstance(item, (str, int, uuid.UUID)):
                             # Direct ID reference - always allowed
-                            related_obj = field.related_model.objects.get(pk=item)
+                            related_obj = self._resolve_reference(
+                                field.related_model, item
+                            )
                             related_objects.append(related_obj)
                         elif isinstance(item, dict) and not use_nested:
                             # If nested is disabled but dict is provided, raise error
@@ -408,6 +462,16 @@ class NestedOperationHandler:
         Returns:
             Updated model instance
         """
+        with self._reference_scope(model, input_data):
+            return self._update_instance(model, input_data, instance)
+
+    def _update_instance(
+        self,
+        model: Type[models.Model],
+        input_data: Dict[str, Any],
+        instance: models.Model,
+    ) -> models.Model:
+        """Update ``instance`` from ``input_data`` (see :meth:`handle_nested_update`)."""
         try:
             # First, process nested_ prefixed fields and extract them
             processed_input = self._process_nested_fields(input_data)
@@ -460,8 +524,8 @@ class NestedOperationHandler:
                 elif isinstance(value, dict):
                     if "id" in value:
                         # Update existing related object
-                        related_instance = field.related_model.objects.get(
-                            pk=value["id"]
+                        related_instance = self._resolve_reference(
+                            field.related_model, value["id"]
                         )
                         updated_instance = self.handle_nested_update(
                             field.related_model, value, related_instance
@@ -483,7 +547,9 @@ class NestedOperationHandler:
                             pass
 
                     try:
-                        related_instance = field.related_model.objects.get(pk=pk_value)
+                        related_instance = self._resolve_reference(
+                            field.related_model, pk_value
+                        )
                         setattr(instance, field_name, related_instance)
                     except field.related_model.DoesNotExist:
                         raise ValidationError(
@@ -508,213 +574,11 @@ class NestedOperationHandler:
 
                 # Handle different types of reverse relationship data
                 if isinstance(value, list):
-                    # Get all existing related objects for this instance
-                    existing_objects = list(
-                        related_field.related_model.objects.filter(
-                            **{related_field.field.name: instance.pk}
-                        )
+                    # Children absent from the list are deleted
+                    self._sync_reverse_children(
+                        instance, field_name, related_field, value, replace=True
                     )
 
-                    # Track which existing objects are being updated
-                    updated_object_ids = set()
-
-                    # Process each item in the nested field
-                    for item in value:
-                        if isinstance(item, dict):
-                            if "id" in item:
-                                # Update existing object
-                                try:
-                                    existing_obj = (
-                                        related_field.related_model.objects.get(
-                                            pk=item["id"]
-                                        )
-                                    )
-                                    # Ensure the object belongs to this instance
-                                    if (
-                                        getattr(
-                                            existing_obj,
-                                            related_field.field.name + "_id",
-                                        )
-                                        != instance.pk
-                                    ):
-                                        # Set the foreign key to point to our instance
-                                        setattr(
-                                            existing_obj,
-                                            related_field.field.name,
-                                            instance,
-                                        )
-
-                                    # Update the existing object with new data
-                                    for key, val in item.items():
-                                        if key != "id":
-                                            # Handle foreign key fields properly
-                                            try:
-                                                field = existing_obj._meta.get_field(
-                                                    key
-                                                )
-                                                if isinstance(field, models.ForeignKey):
-                                                    if val is None:
-                                                        setattr(existing_obj, key, None)
-                                                    elif isinstance(val, (str, int, uuid.UUID)):
-                                                        # Convert ID to related object instance
-                                                        pk_val = val
-                                                        if isinstance(val, str) and val.isdigit():
-                                                            try:
-                                                                pk_val = int(val)
-                                                            except (TypeError, ValueError):
-                                                                pass
-                                                        
-                                                        related_obj = field.related_model.objects.get(
-                                                            pk=pk_val
-                                                        )
-                                                        setattr(
-                                                            existing_obj,
-                                                            key,
-                                                            related_obj,
-                                                        )
-                                                    elif isinstance(val, dict):
-                                                        # Handle nested object creation/update
-                                                        if "id" in val:
-                                                            related_obj = field.related_model.objects.get(
-                                                                pk=val["id"]
-                                                            )
-                                                            updated_related = self.handle_nested_update(
-                                                                field.related_model,
-                                                                val,
-                                                                related_obj,
-                                                            )
-                                                            setattr(
-                                                                existing_obj,
-                                                                key,
-                                                                updated_related,
-                                                            )
-                                                        else:
-                                                            new_related = self.handle_nested_create(
-                                                                field.related_model, val
-                                                            )
-                                                            setattr(
-                                                                existing_obj,
-                                                                key,
-                                                                new_related,
-                                                            )
-                                                    else:
-                                                        setattr(existing_obj, key, val)
-                                                else:
-                                                    setattr(existing_obj, key, val)
-                                            except:
-                                                # Fallback to direct assignment for non-model fields
-                                                setattr(existing_obj, key, val)
-                                    existing_obj.save()
-                                    updated_object_ids.add(
-                                        int(item["id"])
-                                    )  # Convert to int for consistent comparison
-                                except related_field.related_model.DoesNotExist:
-                                    raise ValidationError(
-                                        f"{related_field.related_model.__name__} with id {item['id']} does not exist"
-                                    )
-                            else:
-                                # Create new object and set the foreign key to point to our instance
-                                item[related_field.field.name] = instance.pk
-
-                                # Handle foreign key fields in the new object data
-                                processed_item = {}
-                                for key, val in item.items():
-                                    try:
-                                        field = (
-                                            related_field.related_model._meta.get_field(
-                                                key
-                                            )
-                                        )
-                                        if isinstance(field, models.ForeignKey):
-                                            if val is None:
-                                                processed_item[key] = None
-                                            elif isinstance(val, (str, int, uuid.UUID)):
-                                                # Convert ID to related object instance
-                                                pk_val = val
-                                                if isinstance(val, str) and val.isdigit():
-                                                    try:
-                                                        pk_val = int(val)
-                                                    except (TypeError, ValueError):
-                                                        pass
-
-                                                related_obj = (
-                                                    field.related_model.objects.get(
-                                                        pk=pk_val
-                                                    )
-                                                )
-                                                processed_item[key] = related_obj
-                                            elif isinstance(val, dict):
-                                                # Handle nested object creation/update
-                                                if "id" in val:
-                                                    related_obj = (
-                                                        field.related_model.objects.get(
-                                                            pk=val["id"]
-                                                        )
-                                                    )
-                                                    updated_related = (
-                                                        self.handle_nested_update(
-                                                            field.related_model,
-                                                            val,
-                                                            related_obj,
-                                                        )
-                                                    )
-                                                    processed_item[key] = (
-                                                        updated_related
-                                                    )
-                                                else:
-                                                    new_related = (
-                                                        self.handle_nested_create(
-                                                            field.related_model, val
-                                                        )
-                                                    )
-                                                    processed_item[key] = new_related
-                                            elif hasattr(val, "pk"):
-                                                # Already a model instance, use directly
-                                                processed_item[key] = val
-                                            else:
-                                                processed_item[key] = val
-                                        else:
-                                            processed_item[key] = val
-                                    except:
-                                        # Fallback to direct assignment for non-model fields
-                                        processed_item[key] = val
-
-                                new_obj = self.handle_nested_create(
-                                    related_field.related_model, processed_item
-                                )
-                                if hasattr(new_obj, "pk"):
-                                    updated_object_ids.add(new_obj.pk)
-                        elif isinstance(item, (str, int, uuid.UUID)):
-                            # Connect existing object to this instance
-                            pk_val = item
-                            if isinstance(item, str) and item.isdigit():
-                                try:
-                                    pk_val = int(item)
-                                except (TypeError, ValueError):
-                                    pass
-
-                            try:
-                                related_field.related_model.objects.filter(
-                                    pk=pk_val
-                                ).update(**{related_field.field.name: instance})
-                                updated_object_ids.add(
-                                    pk_val
-                                )  # Store actual PK value
-                            except Exception as e:
-                                raise ValidationError(
-                                    f"Failed to connect {related_field.related_model.__name__} with id {item}: {str(e)}"
-                                )
-
-                    # Delete old items that are not present in the new nested field data
-                    objects_to_delete = [
-                        obj
-                        for obj in existing_objects
-                        if obj.pk not in updated_object_ids
-                    ]
-
-                    for obj_to_delete in objects_to_delete:
-                        obj_to_delete.delete()
-
             # Handle many-to-many relationships
             for field_name, (field, value) in m2m_fields.items():
                 if value is None:
@@ -732,8 +596,8 @@ class NestedOperationHandler:
                             for item in set_data:
                                 if isinstance(item, dict):
                                     if "id" in item:
-                                        related_obj = field.related_model.objects.get(
-                                            pk=item["id"]
+                                        related_obj = self._resolve_reference(
+                                            field.related_model, item["id"]
                                         )
                                     else:
                                         related_obj = self.handle_nested_create(
@@ -747,8 +611,8 @@ class NestedOperationHandler:
                                             pk_val = int(item)
                                         except (TypeError, ValueError):
                                             pass
-                                    related_obj = field.related_model.objects.get(
-                                        pk=pk_val
+                                    related_obj = self._resolve_reference(
+                                        field.related_model, pk_val
                                     )
                                     related_objects.append(related_obj)
                             m2m_manager.set(related_objects)
@@ -765,8 +629,8 @@ class NestedOperationHandler:
                                             pk_val = int(item)
                                         except (TypeError, ValueError):
                                             pass
-                                    related_obj = field.related_model.objects.get(
-                                        pk=pk_val
+                                    related_obj = self._resolve_reference(
+                                        field.related_model, pk_val
                                     )
                                     m2m_manager.add(related_obj)
 
@@ -792,8 +656,8 @@ class NestedOperationHandler:
                                             pk_val = int(item)
                                         except (TypeError, ValueError):
                                             pass
-                                    related_obj = field.related_model.objects.get(
-                                        pk=pk_val
+                                    related_obj = self._resolve_reference(
+                                        field.related_model, pk_val
                                     )
                                     m2m_manager.remove(related_obj)
 
@@ -803,8 +667,8 @@ class NestedOperationHandler:
                         if isinstance(update_data, list):
                             for item in update_data:
                                 if "id" in item:
-                                    related_instance = field.related_model.objects.get(
-                                        pk=item["id"]
+                                    related_instance = self._resolve_reference(
+                                        field.related_model, item["id"]
                                     )
                                     self.handle_nested_update(
                                         field.related_model, item, related_instance
@@ -819,8 +683,8 @@ class NestedOperationHandler:
                                 # Get existing object by ID - handle both regular and GraphQL IDs
                                 try:
                                     # Try to use the ID as-is first (for integer IDs)
-                                    related_obj = field.related_model.objects.get(
-                                        pk=item["id"]
+                                    related_obj = self._resolve_reference(
+                                        field.related_model, item["id"]
                                     )
                                 except (ValueError, field.related_model.DoesNotExist):
                                     # If that fails, try to decode as GraphQL global ID
@@ -830,13 +694,13 @@ class NestedOperationHandler:
                                         decoded_type, decoded_id = from_global_id(
                                             item["id"]
                                         )
-                                        related_obj = field.related_model.objects.get(
-                                            pk=decoded_id
+                                        related_obj = self._resolve_reference(
+                                            field.related_model, decoded_id
                                         )
                                     except Exception:
                                         # If all else fails, raise the original error
-                                        related_obj = field.related_model.objects.get(
-                                            pk=item["id"]
+                                        related_obj = self._resolve_reference(
+                                            field.related_model, item["id"]
                                         )
 
                                 # If there are other fields besides 'id', update the object
@@ -866,7 +730,9 @@ class NestedOperationHandler:
                             related_objects.append(related_obj)
                         elif isinstance(item, (int, uuid.UUID)):
                             # Get existing object by ID
-                            related_obj = field.related_model.objects.get(pk=item)
+                            related_obj = self._resolve_reference(
+                                field.related_model, item
+                            )
                             related_objects.append(related_obj)
 
                     # Replace all relationships with the new set
@@ -906,6 +772,294 @@ class NestedOperationHandler:
             # Wrap non-validation exceptions with context
             raise ValidationError(f"Failed to update {model.__name__}: {str(e)}")
 
+    @contextmanager
+    def _reference_scope(
+        self, model: Type[models.Model], input_data: Dict[str, Any]
+    ) -> Iterator[None]:
+        """
+        Prefetch the rows referenced by a payload for the outermost nested call.
+
+        Nested calls made while the scope is open reuse the fetched rows.
+        """
+        if getattr(self._local, "references", None) is not None:
+            yield
+            return
+
+        self._local.references = self._prefetch_references(model, input_data)
+        try:
+            yield
+        finally:
+            self._local.references = None
+
+    def _prefetch_references(
+        self, model: Type[models.Model], input_data: Dict[str, Any]
+    ) -> Dict[Type[models.Model], Dict[Any, models.Model]]:
+        """Fetch every row referenced by id in the payload, one query per model."""
+        references: Dict[Type[models.Model], Set[Any]] = defaultdict(set)
+        self._collect_references(model, input_data, references, depth=0)
+
+        fetched: Dict[Type[models.Model], Dict[Any, models.Model]] = {}
+        for related_model, pks in references.items():
+            fetched[related_model] = related_model.objects.in_bulk(list(pks))
+        return fetched
+
+    def _collect_references(
+        self,
+        model: Type[models.Model],
+        data: Any,
+        references: Dict[Type[models.Model], Set[Any]],
+        depth: int,
+    ) -> None:
+        """Collect the primary keys referenced by foreign keys and M2M values."""
+        if not isinstance(data, dict) or depth > self.max_depth:
+            return
+
+        reverse_relations = self._get_reverse_relations(model)
+        for field_name, value in self._process_nested_fields(data).items():
+            if value is None:
+                continue
+
+            if field_name in reverse_relations:
+                related_model = reverse_relations[field_name].related_model
+                items = value if isinstance(value, list) else [value]
+                for item in items:
+                    self._collect_references(related_model, item, references, depth + 1)
+                continue
+
+            try:
+                field = model._meta.get_field(field_name)
+            except FieldDoesNotExist:
+                continue
+            if not field.is_relation or field.related_model is None:
+                continue
+
+            if field.many_to_many:
+                if isinstance(value, dict):
+                    items = [
+                        item
+                        for key in ("set", "connect", "disconnect", "update")
+                        for item in (value.get(key) or [])
+                    ]
+                else:
+                    items = value if isinstance(value, list) else []
+            else:
+                items = [value]
+
+            for item in items:
+                if isinstance(item, dict):
+                    if "id" in item:
+                        self._add_reference(references, field.related_model, item["id"])
+                    self._collect_references(
+                        field.related_model, item, references, depth + 1
+                    )
+                elif isinstance(item, (str, int, uuid.UUID)) and not (
+                    field.many_to_many and isinstance(item, str) and not item.isdigit()
+                ):
+                    self._add_reference(references, field.related_model, item)
+
+    def _add_reference(
+        self,
+        references: Dict[Type[models.Model], Set[Any]],
+        related_model: Type[models.Model],
+        value: Any,
+    ) -> None:
+        try:
+            references[related_model].add(related_model._meta.pk.to_python(value))
+        except (TypeError, ValidationError):
+            # Invalid ids are reported when the reference is resolved
+            pass
+
+    def _resolve_reference(
+        self, related_model: Type[models.Model], value: Any
+    ) -> models.Model:
+        """
+        Return the row ``value`` of ``related_model``, prefetched when possible.
+
+        Raises:
+            related_model.DoesNotExist: If the row does not exist
+        """
+        prefetched = (getattr(self._local, "references", None) or {}).get(
+            related_model
+        )
+        if prefetched:
+            try:
+                pk = related_model._meta.pk.to_python(value)
+            except (TypeError, ValidationError):
+                pk = None
+            if pk in prefetched:
+                return prefetched[pk]
+        return related_model.objects.get(pk=value)
+
+    def _sync_reverse_children(
+        self,
+        instance: models.Model,
+        field_name: str,
+        related_field: Any,
+        items: List[Any],
+        replace: bool,
+    ) -> None:
+        """
+        Write the children of a reverse relation with batched queries.
+
+        Existing children are loaded with one query and diffed against
+        ``items``. Dicts with an ``id`` update a child, other dicts create one
+        and scalar ids attach existing rows. Flat payloads (concrete fields and
+        foreign keys) are written with bulk_update/bulk_create; payloads with
+        nested relations go through the nested handlers. With ``replace``,
+        children missing from ``items`` are deleted with one query.
+        """
+        child_model = related_field.related_model
+        fk_name = related_field.field.name
+        fk_attname = related_field.field.attname
+        pk_field = child_model._meta.pk
+
+        existing: Dict[Any, models.Model] = {}
+        if replace:
+            existing = {
+                obj.pk: obj
+                for obj in child_model.objects.filter(**{fk_name: instance.pk})
+            }
+
+        def coerce_pk(value: Any) -> Any:
+            try:
+                return pk_field.to_python(value)
+            except (TypeError, ValidationError):
+                raise ValidationError(
+                    {field_name: f"Field '{field_name}' invalid ID format: '{value}'."}
+                )
+
+        foreign_ids = [
+            pk
+            for pk in (
+                coerce_pk(item["id"])
+                for item in items
+                if isinstance(item, dict) and "id" in item
+            )
+            if pk not in existing
+        ]
+        foreign = child_model.objects.in_bulk(foreign_ids) if foreign_ids else {}
+
+        kept: Set[Any] = set()
+        to_update: Dict[Any, models.Model] = {}
+        update_fields: Set[str] = set()
+        to_create: List[models.Model] = []
+        connect_ids: List[Any] = []
+
+        for item in items:
+            if isinstance(item, dict):
+                payload = {
+                    key: value
+                    for key, value in self._process_nested_fields(item).items()
+                    if key != "id"
+                }
+                flat = self._is_flat_payload(child_model, payload)
+                if "id" in item:
+                    pk = coerce_pk(item["id"])
+                    child = existing.get(pk) or foreign.get(pk)
+                    if child is None:
+                        raise ValidationError(
+                            f"{child_model.__name__} with id {item['id']} does not exist"
+                        )
+                    kept.add(child.pk)
+                    changed = set()
+                    if getattr(child, fk_attname) != instance.pk:
+                        setattr(child, fk_name, instance)
+                        changed.add(fk_name)
+                    if not flat:
+                        # Saved by the nested handler
+                        self.handle_nested_update(child_model, payload, child)
+                        continue
+                    changed.update(self._assign_flat_payload(child, payload))
+                    if changed:
+                        update_fields.update(changed)
+                        to_update[child.pk] = child
+                elif flat:
+                    child = child_model()
+                    self._assign_flat_payload(child, payload)
+                    setattr(child, fk_name, instance)
+                    to_create.append(child)
+                else:
+                    payload[fk_name] = instance
+                    child = self.handle_nested_create(child_model, payload)
+                    kept.add(child.pk)
+            elif isinstance(item, (str, int, uuid.UUID)):
+                connect_ids.append(coerce_pk(item))
+
+        batch_size = getattr(self.mutation_settings, "bulk_batch_size", 100) or 100
+        if to_update:
+            for field in child_model._meta.concrete_fields:
+                if getattr(field, "auto_now", False):
+                    # bulk_update does not call pre_save()
+                    for child in to_update.values():
+                        field.pre_save(child, add=False)
+                    update_fields.add(field.name)
+            child_model.objects.bulk_update(
+                list(to_update.values()),
+                fields=sorted(update_fields),
+                batch_size=batch_size,
+            )
+
+        if to_create:
+            if child_model._meta.parents:
+                # bulk_create does not support multi-table inheritance
+                for child in to_create:
+                    child.save(force_insert=True)
+            else:
+                child_model.objects.bulk_create(to_create, batch_size=batch_size)
+
+        if connect_ids:
+            try:
+                child_model.objects.filter(pk__in=connect_ids).update(
+                    **{fk_name: instance}
+                )
+            except Exception as e:
+                raise ValidationError(
+                    {
+                        field_name: f"Failed to connect {child_model.__name__} with ids {connect_ids}: {str(e)}"
+                    }
+                )
+            kept.update(connect_ids)
+
+        if replace:
+            stale = [pk for pk in existing if pk not in kept]
+            if stale:
+                child_model.objects.filter(pk__in=stale).delete()
+
+    def _is_flat_payload(
+        self, model: Type[models.Model], payload: Dict[str, Any]
+    ) -> bool:
+        """Check if a payload only holds concrete values and foreign key ids."""
+        for key, value in payload.items():
+            try:
+                field = model._meta.get_field(key)
+            except FieldDoesNotExist:
+                return False
+            if not field.concrete or field.many_to_many:
+                return False
+            if field.is_relation and isinstance(value, (dict, list)):
+                return False
+        return True
+
+    def _assign_flat_payload(
+        self, obj: models.Model, payload: Dict[str, Any]
+    ) -> Set[str]:
+        """Assign a flat payload to ``obj`` and return the assigned field names."""
+        assigned: Set[str] = set()
+        for key, value in payload.items():
+            field = obj._meta.get_field(key)
+            if field.is_relation and value is not None and not hasattr(value, "pk"):
+                try:
+                    value = self._resolve_reference(field.related_model, value)
+                except (field.related_model.DoesNotExist, TypeError, ValueError):
+                    raise ValidationError(
+                        {
+                            key: f"{field.related_model.__name__} with id '{value}' does not exist."
+                        }
+                    )
+            setattr(obj, field.name, value)
+            assigned.add(field.name)
+        return assigned
+
     def _extract_unique_constraint_fields(
         self, model: Type[models.Model], error: Exception
     ) -> List[str]:
@@ -974,78 +1128,163 @@ class NestedOperationHandler:
             return None
         return None
 
-    def handle_cascade_delete(
+    def plan_cascade_delete(
         self, instance: models.Model, cascade_rules: Optional[Dict[str, str]] = None
-    ) -> List[str]:
+    ) -> "CascadeDeletePlan":
         """
-        Handles cascade delete operations with configurable cascade rules.
+        Compute the rows affected by deleting ``instance`` without writing.
+
+        The relation graph is walked level by level: each level costs one
+        query per reverse relation (per batch of primary keys), whatever the
+        number of rows. Many-to-many links are not followed; their through
+        rows are removed with the deleted rows.
 
         Args:
             instance: Model instance to delete
-            cascade_rules: Dictionary mapping field names to cascade actions
-                          ('CASCADE', 'PROTECT', 'SET_NULL', 'SET_DEFAULT')
+            cascade_rules: Dictionary mapping related model names to cascade
+                          actions ('CASCADE', 'PROTECT', 'SET_NULL', 'SET_DEFAULT')
 
         Returns:
-            List of deleted object descriptions
+            CascadeDeletePlan describing the rows to delete and update
+
+        Raises:
+            ValidationError: If a PROTECT rule matches existing related rows, or
+                a rule cannot be applied (unknown action, SET_NULL on a
+                non-nullable foreign key, SET_DEFAULT without a default)
         """
-        deleted_objects = []
+        cascade_rules = cascade_rules or {}
+        batch_size = getattr(self.mutation_settings, "bulk_batch_size", 100) or 100
+        plan = CascadeDeletePlan()
+        frontier = {instance._meta.model: {instance.pk}}
+        plan.add_level(frontier)
+
+        while frontier:
+            next_level: Dict[Type[models.Model], Set[Any]] = defaultdict(set)
+            for model, pks in frontier.items():
+                for rel in model._meta.related_objects:
+                    if rel.many_to_many:
+                        continue
+                    child_model = rel.related_model
+                    fk = rel.field
+                    action = cascade_rules.get(child_model._meta.model_name, "CASCADE")
+                    if (
+                        action not in ("CASCADE", "PROTECT", "SET_NULL", "SET_DEFAULT")
+                        or (action == "SET_NULL" and not fk.null)
+                        or (action == "SET_DEFAULT" and not fk.has_default())
+                    ):
+                        # The ORM would apply its own on_delete instead
+                        raise ValidationError(
+                            f"Cascade rule {action} cannot be applied to "
+                            f"{child_model._meta.model_name}.{fk.name}"
+                        )
+                    child_pks = self._related_pks(model, pks, fk, batch_size)
+                    if not child_pks:
+                        continue
+
+                    if action == "CASCADE":
+                        new_pks = child_pks - plan.deletions[child_model]
+                        if new_pks:
+                            next_level[child_model].update(new_pks)
+                    elif action == "PROTECT":
+                        raise ValidationError(
+                            f"Cannot delete {model._meta.model_name} because it has related {child_model._meta.model_name} objects"
+                        )
+                    elif action == "SET_NULL":
+                        plan.updates[(child_model, fk.name)][1].update(child_pks)
+                        plan.updates[(child_model, fk.name)][0] = None
+                    else:
+                        plan.updates[(child_model, fk.name)][1].update(child_pks)
+                        plan.updates[(child_model, fk.name)][0] = fk.get_default()
 
-        try:
-            # Get all related objects
-            related_objects = []
-            for field in instance._meta.get_fields():
-                if hasattr(field, "related_model") and hasattr(
-                    field, "get_accessor_name"
-                ):
-                    accessor_name = field.get_accessor_name()
-                    if hasattr(instance, accessor_name):
-                        related_manager = getattr(instance, accessor_name)
-                        if hasattr(related_manager, "all"):
-                            related_objects.extend(list(related_manager.all()))
-
-            # Apply cascade rules
-            for related_obj in related_objects:
-                field_name = related_obj._meta.model_name
-                cascade_action = (
-                    cascade_rules.get(field_name, "CASCADE")
-                    if cascade_rules
-                    else "CASCADE"
-                )
+            frontier = {model: pks for model, pks in next_level.items() if pks}
+            if frontier:
+                plan.add_level(frontier)
 
-                if cascade_action == "CASCADE":
-                    # Recursively delete related objects
-                    nested_deleted = self.handle_cascade_delete(
-                        related_obj, cascade_rules
-                    )
-                    deleted_objects.extend(nested_deleted)
-                elif cascade_action == "PROTECT":
-                    # Prevent deletion if related objects exist
-                    raise ValidationError(
-                        f"Cannot delete {instance._meta.model_name} because it has related {field_name} objects"
-                    )
-                elif cascade_action == "SET_NULL":
-                    # Set foreign key to NULL (if nullable)
-                    for fk_field in related_obj._meta.get_fields():
-                        if (
-                            isinstance(fk_field, models.ForeignKey)
-                            and fk_field.related_model == instance._meta.model
-                            and fk_field.null
-                        ):
-                            setattr(related_obj, fk_field.name, None)
-                            related_obj.save()
+        return plan
+
+    def handle_cascade_delete(
+        self,
+        instance: models.Model,
+        cascade_rules: Optional[Dict[str, str]] = None,
+        dry_run: bool = False,
+    ) -> Union[List[str], Dict[str, int]]:
+        """
+        Handles cascade delete operations with configurable cascade rules.
 
-            # Delete the main instance
-            instance_description = f"{instance._meta.model_name}(id={instance.pk})"
-            instance.delete()
-            deleted_objects.append(instance_description)
+        The whole cascade is planned first (see :meth:`plan_cascade_delete`).
+        Then SET_NULL/SET_DEFAULT rules run as set-based UPDATEs and rows are
+        deleted level by level, deepest first, in primary-key batches.
+
+        Args:
+            instance: Model instance to delete
+            cascade_rules: Dictionary mapping related model names to cascade actions
+                          ('CASCADE', 'PROTECT', 'SET_NULL', 'SET_DEFAULT')
+            dry_run: Only plan the cascade; nothing is written
 
-            return deleted_objects
+        Returns:
+            List of deleted object descriptions; in dry-run mode, the number of
+            rows to delete per model label
+        """
+        try:
+            plan = self.plan_cascade_delete(instance, cascade_rules)
+            if dry_run:
+                return plan.counts
+
+            batch_size = getattr(self.mutation_settings, "bulk_batch_size", 100) or 100
+            with transaction.atomic():
+                for (model, field_name), (value, pks) in plan.updates.items():
+                    pks = list(pks - plan.deletions[model])
+                    for start in range(0, len(pks), batch_size):
+                        model._base_manager.filter(
+                            pk__in=pks[start : start + batch_size]
+                        ).update(**{field_name: value})
+
+                for level in reversed(plan.levels):
+                    for model, pks in level.items():
+                        pks = list(pks)
+                        for start in range(0, len(pks), batch_size):
+                            model._base_manager.filter(
+                                pk__in=pks[start : start + batch_size]
+                            ).delete()
+
+            return plan.describe()
 
         except Exception as e:
             raise ValidationError(
                 f"Failed to delete {instance._meta.model_name}: {str(e)}"
             )
 
+    def _related_pks(
+        self,
+        model: Type[models.Model],
+        pks: Set[Any],
+        fk: models.ForeignKey,
+        batch_size: int,
+    ) -> Set[Any]:
+        """Return the pks of the rows whose ``fk`` points to one of ``pks``."""
+        values = list(pks)
+        target_attname = fk.target_field.attname
+        if target_attname != model._meta.pk.attname:
+            # Foreign key to a non primary key field (to_field)
+            targets: List[Any] = []
+            for start in range(0, len(values), batch_size):
+                targets.extend(
+                    model._base_manager.filter(
+                        pk__in=values[start : start + batch_size]
+                    ).values_list(target_attname, flat=True)
+                )
+            values = targets
+
+        child_pks: Set[Any] = set()
+        child_manager = fk.model._base_manager
+        for start in range(0, len(values), batch_size):
+            child_pks.update(
+                child_manager.filter(
+                    **{f"{fk.attname}__in": values[start : start + batch_size]}
+                ).values_list("pk", flat=True)
+            )
+        return child_pks
+
     def validate_nested_data(
         self,
         model: Type[models.Model],
@@ -0,0 +1,276 @@
+"""
+Pagination helpers for paginated queries.
+
+Keyset pagination replaces ``OFFSET`` scans by a ``WHERE`` clause built from
+the ordering values of the last row already returned. Cursors are opaque
+base64 strings holding those values together with the ordering they were
+computed for, so a cursor cannot be replayed against a different ordering.
+
+Total counts are computed with the strategy configured on the model's
+``GraphQLMeta.pagination`` (exact, planner estimate or short-lived cache).
+"""
+
+import base64
+import datetime
+import decimal
+import hashlib
+import json
+import logging
+import uuid
+from typing import Any, List, Optional, Sequence, Tuple, Type
+
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet, FieldDoesNotExist
+from django.db import connections, models
+from django.db.models import F, Q
+
+logger = logging.getLogger(__name__)
+
+# Annotation prefix used to read ordering values back from the fetched rows.
+CURSOR_ALIAS_PREFIX = "_rail_cursor_"
+
+
+class _CursorEncoder(json.JSONEncoder):
+    """JSON encoder keeping full precision of ordering values."""
+
+    def default(self, o):
+        if isinstance(o, (datetime.datetime, datetime.date, datetime.time)):
+            return o.isoformat()
+        if isinstance(o, (decimal.Decimal, uuid.UUID)):
+            return str(o)
+        return super().default(o)
+
+
+class KeysetOrdering:
+    """
+    Ordering used by a keyset page.
+
+    Attributes:
+        specs: Effective order_by specs, ending with the primary key tie-breaker
+        paths: Field paths of the specs (without direction prefix)
+        descending: Direction of each spec
+        nullable: Whether each path can hold NULL values
+    """
+
+    def __init__(self, model: Type[models.Model], specs: Sequence[str]):
+        specs = [spec for spec in specs if spec]
+        names = {spec.lstrip("-") for spec in specs}
+        pk_name = model._meta.pk.name
+        if not names & {"pk", pk_name}:
+            specs.append(pk_name)
+
+        self.specs: List[str] = specs
+        self.paths: List[str] = [spec.lstrip("-") for spec in specs]
+        self.descending: List[bool] = [spec.startswith("-") for spec in specs]
+        self.nullable: List[bool] = [
+            _is_nullable_path(model, path) for path in self.paths
+        ]
+
+    @property
+    def aliases(self) -> List[str]:
+        return [f"{CURSOR_ALIAS_PREFIX}{index}" for index in range(len(self.paths))]
+
+    def order_by_expressions(self) -> List[Any]:
+        """Return order_by arguments with an explicit NULLS LAST on nullable paths."""
+        expressions: List[Any] = []
+        for path, desc, nullable in zip(self.paths, self.descending, self.nullable):
+            if nullable:
+                expression = F(path)
+                expressions.append(
+                    expression.desc(nulls_last=True)
+                    if desc
+                    else expression.asc(nulls_last=True)
+                )
+            else:
+                expressions.append(f"-{path}" if desc else path)
+        return expressions
+
+    def annotate(self, queryset: models.QuerySet) -> models.QuerySet:
+        """Annotate rows with their ordering values so cursors can be built."""
+        return queryset.annotate(
+            **{alias: F(path) for alias, path in zip(self.aliases, self.paths)}
+        )
+
+    def after(self, values: Sequence[Any]) -> Q:
+        """
+        Build the predicate selecting rows strictly after ``values``.
+
+        Expands to ``(a > x) OR (a = x AND b > y) OR ...`` where ``>`` follows
+        each spec direction and NULL values sort last.
+        """
+        predicate = Q(pk__in=[])
+        equal_prefix = Q()
+        for path, desc, nullable, value in zip(
+            self.paths, self.descending, self.nullable, values
+        ):
+            if value is not None:
+                greater = Q(**{f"{path}__lt" if desc else f"{path}__gt": value})
+                if nullable:
+                    greater |= Q(**{f"{path}__isnull": True})
+                predicate |= equal_prefix & greater
+                equal_prefix &= Q(**{path: value})
+            else:
+                # Nothing sorts after NULL on this path (NULLS LAST)
+                equal_prefix &= Q(**{f"{path}__isnull": True})
+        return predicate
+
+    def encode_cursor(self, row: models.Model) -> str:
+        """Encode the ordering values of ``row`` into an opaque cursor."""
+        payload = {
+            "o": self.specs,
+            "v": [getattr(row, alias, None) for alias in self.aliases],
+        }
+        raw = json.dumps(payload, cls=_CursorEncoder, separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+    def decode_cursor(self, cursor: str) -> List[Any]:
+        """
+        Decode a cursor produced by :meth:`encode_cursor` for this ordering.
+
+        Raises:
+            ValueError: If the cursor is malformed or was built for another ordering
+        """
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+            specs, values = payload["o"], payload["v"]
+        except Exception as exc:
+            raise ValueError("Invalid pagination cursor") from exc
+        if specs != self.specs or len(values) != len(self.paths):
+            raise ValueError(
+                "Pagination cursor does not match the requested ordering"
+            )
+        return values
+
+
+def paginate_keyset(
+    queryset: models.QuerySet,
+    model: Type[models.Model],
+    order_by: Sequence[str],
+    per_page: int,
+    after: Optional[str] = None,
+    offset: int = 0,
+) -> Tuple[List[models.Model], bool, Optional[str]]:
+    """
+    Fetch one keyset page without counting the queryset.
+
+    ``per_page + 1`` rows are fetched to know whether a next page exists.
+    Without cursor, ``offset`` rows are skipped instead (page based access).
+
+    Returns:
+        Tuple of (items, has_next_page, end_cursor)
+    """
+    ordering = KeysetOrdering(model, order_by)
+    queryset = ordering.annotate(queryset).order_by(*ordering.order_by_expressions())
+    if after:
+        queryset = queryset.filter(ordering.after(ordering.decode_cursor(after)))
+        offset = 0
+
+    rows = list(queryset[offset : offset + per_page + 1])
+    has_next_page = len(rows) > per_page
+    items = rows[:per_page]
+    end_cursor = ordering.encode_cursor(items[-1]) if items else None
+    return items, has_next_page, end_cursor
+
+
+def count_queryset(
+    queryset: models.QuerySet,
+    strategy: str = "exact",
+    estimate_threshold: int = 100000,
+    cache_ttl: int = 30,
+) -> Tuple[int, bool]:
+    """
+    Count a queryset with the given strategy.
+
+    ``"estimate"`` uses the PostgreSQL planner estimate when it is above
+    ``estimate_threshold`` (exact count otherwise or on other databases).
+    ``"cached"`` stores exact counts for ``cache_ttl`` seconds, keyed by a
+    hash of the normalized count query. Other strategies count exactly.
+
+    Returns:
+        Tuple of (count, is_exact)
+    """
+    if strategy == "estimate":
+        estimate = estimate_count(queryset)
+        if estimate is not None and estimate >= estimate_threshold:
+            return estimate, False
+    elif strategy == "cached":
+        key = count_cache_key(queryset)
+        if key is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                return cached, True
+            total = queryset.count()
+            cache.set(key, total, cache_ttl)
+            return total, True
+
+    return queryset.count(), True
+
+
+def count_cache_key(queryset: models.QuerySet) -> Optional[str]:
+    """Return the cache key of a queryset count (model + normalized filters)."""
+    try:
+        sql, params = queryset.order_by().query.sql_with_params()
+    except EmptyResultSet:
+        return None
+    digest = hashlib.sha256(f"{sql}|{params!r}".encode("utf-8")).hexdigest()
+    return f"rail_graphql:count:{queryset.db}:{queryset.model._meta.label_lower}:{digest}"
+
+
+def estimate_count(queryset: models.QuerySet) -> Optional[int]:
+    """
+    Return the PostgreSQL planner row estimate of a queryset.
+
+    Unfiltered querysets read ``pg_class.reltuples``; filtered ones read the
+    top plan node of ``EXPLAIN``. Returns None on other databases or when no
+    estimate is available.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+
+    try:
+        with connection.cursor() as cursor:
+            query = queryset.order_by().query
+            if not query.where and not query.distinct:
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                    [connection.ops.quote_name(queryset.model._meta.db_table)],
+                )
+                row = cursor.fetchone()
+                if row and row[0] is not None and row[0] >= 0:
+                    return int(row[0])
+                return None
+
+            sql, params = query.sql_with_params()
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return int(plan[0]["Plan"]["Plan Rows"])
+    except EmptyResultSet:
+        return 0
+    except Exception as e:
+        logger.debug(f"Count estimate failed for {queryset.model.__name__}: {e}")
+        return None
+
+
+def _is_nullable_path(model: Type[models.Model], path: str) -> bool:
+    """Return True when a lookup path can produce NULL (nullable field or join)."""
+    current_model = model
+    for part in path.split("__"):
+        if part == "pk":
+            return False
+        try:
+            model_field = current_model._meta.get_field(part)
+        except FieldDoesNotExist:
+            # Annotations and property expressions may evaluate to NULL
+            return True
+        if getattr(model_field, "null", False) or not getattr(
+            model_field, "concrete", True
+        ):
+            return True
+        related_model = getattr(model_field, "related_model", None)
+        if related_model is None:
+            return False
+        current_model = related_model
+    return False
@@ -0,0 +1,141 @@
+"""
+Bounded Python-side evaluation of model properties.
+
+Properties without a declared SQL expression are filtered and ordered by
+evaluating them on every row. These helpers stream the rows with
+``iterator(chunk_size=...)``, load only the columns the properties declare
+and stop at a hard row cap with a GraphQL error instead of exhausting worker
+memory.
+"""
+
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Set, Type
+
+from django.db import models
+from graphql import GraphQLError
+
+from ..conf import get_query_generator_settings
+from ..core.meta import get_model_graphql_meta
+
+
+class PropertyScan:
+    """
+    Iterable over a queryset evaluated in Python, enforcing the row cap.
+
+    Attributes:
+        scanned: Number of rows read so far
+    """
+
+    def __init__(
+        self,
+        queryset: models.QuerySet,
+        property_names: Iterable[str],
+        limit: int = 0,
+        chunk_size: int = 2000,
+    ):
+        self.queryset = queryset
+        self.property_names = list(property_names)
+        self.limit = limit
+        self.chunk_size = max(1, chunk_size)
+        self.scanned = 0
+
+    def __iter__(self) -> Iterator[models.Model]:
+        for row in self.queryset.iterator(chunk_size=self.chunk_size):
+            self.scanned += 1
+            if self.limit and self.scanned > self.limit:
+                raise GraphQLError(
+                    f"Filtering or ordering {self.queryset.model.__name__} on "
+                    f"{', '.join(self.property_names)} evaluates more than "
+                    f"{self.limit} rows in Python. Narrow the filters or declare "
+                    "an expression for the property in GraphQLMeta.properties."
+                )
+            yield row
+
+
+class PropertySortKey:
+    """
+    Composite sort key honouring a direction per component.
+
+    Components that cannot be compared with each other are compared through
+    their string representation, so mixed-type values never abort a sort.
+    """
+
+    __slots__ = ("values", "descending")
+
+    def __init__(self, values: Sequence[Any], descending: Sequence[bool]):
+        self.values = values
+        self.descending = descending
+
+    def __eq__(self, other: "PropertySortKey") -> bool:
+        return self.values == other.values
+
+    def __lt__(self, other: "PropertySortKey") -> bool:
+        for value, other_value, desc in zip(
+            self.values, other.values, self.descending
+        ):
+            if value == other_value:
+                continue
+            try:
+                less = value < other_value
+            except TypeError:
+                less = str(value) < str(other_value)
+            return not less if desc else less
+        return False
+
+
+def get_property_scan_limit(
+    model: Type[models.Model], schema_name: Optional[str] = None
+) -> int:
+    """Return the per-model row cap, falling back to ``max_property_scan_rows``."""
+    limit = get_model_graphql_meta(model).property_scan_limit
+    if limit is None:
+        limit = get_query_generator_settings(schema_name).max_property_scan_rows
+    return int(limit or 0)
+
+
+def scan_property_rows(
+    queryset: models.QuerySet,
+    property_names: Iterable[str],
+    schema_name: Optional[str] = None,
+    columns_only: bool = False,
+) -> PropertyScan:
+    """
+    Prepare a bounded streaming scan of ``queryset`` for property evaluation.
+
+    Prefetches are dropped (rows are streamed in chunks). With
+    ``columns_only`` the rows only load the primary key and the columns the
+    properties declare in ``GraphQLMeta.properties``; undeclared properties
+    keep every column.
+    """
+    property_names = list(property_names)
+    model = queryset.model
+    settings = get_query_generator_settings(schema_name)
+
+    queryset = queryset.prefetch_related(None)
+    if columns_only:
+        columns = _declared_columns(model, property_names)
+        if columns is not None:
+            relations = {path.rsplit("__", 1)[0] for path in columns if "__" in path}
+            queryset = queryset.select_related(None)
+            if relations:
+                queryset = queryset.select_related(*relations)
+            queryset = queryset.only(model._meta.pk.name, *columns, *relations)
+
+    return PropertyScan(
+        queryset,
+        property_names,
+        limit=get_property_scan_limit(model, schema_name),
+        chunk_size=settings.property_scan_chunk_size,
+    )
+
+
+def _declared_columns(
+    model: Type[models.Model], property_names: List[str]
+) -> Optional[Set[str]]:
+    graphql_meta = get_model_graphql_meta(model)
+    columns: Set[str] = set()
+    for name in property_names:
+        requirements = graphql_meta.get_property_requirements(name)
+        if requirements is None:
+            return None
+        columns.update(requirements)
+    return columns
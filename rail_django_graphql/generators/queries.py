@@ -5,13 +5,33 @@ This module provides the QueryGenerator class, which is responsible for creating
 GraphQL queries for Django models, including single object, list, and filtered queries.
 """
 
-from typing import Any, Dict, List, Optional, Type, Union
+import datetime
+import decimal
+import heapq
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Type, Union
 
 import graphene
 from django.apps import apps
 from django.db import models
-from django.db.models import Count, ForeignKey, ManyToManyField, OneToOneField, Q
+from django.db.models import (
+    Avg,
+    Count,
+    F,
+    ForeignKey,
+    ManyToManyField,
+    Max,
+    Min,
+    OneToOneField,
+    OuterRef,
+    Q,
+    Subquery,
+    Sum,
+)
+from django.db.models.functions import Trunc
+from graphene.types.generic import GenericScalar
+from graphene.utils.str_converters import to_snake_case
 from graphene_django import DjangoObjectType
+from graphql import GraphQLError
 
 # Resilient import: DjangoFilterConnectionField may not exist in some graphene-django versions
 try:
@@ -20,11 +40,13 @@ except Exception:
     DjangoFilterConnectionField = None  # Fallback when Relay field is unavailable
 
 from ..conf import get_query_generator_settings
+from ..core.dataloaders import register_dataloader_batch
 from ..core.meta import get_model_graphql_meta
 from ..core.performance import get_query_optimizer
 from ..core.security import get_authz_manager
 from ..core.settings import QueryGeneratorSettings
-from ..security.field_permissions import mask_sensitive_fields
+from ..security.field_permissions import apply_mask_plan, get_mask_plan
+from ..security.permission_cache import get_permission_cache
 from ..extensions.optimization import (
     QueryOptimizationConfig,
     get_optimizer,
@@ -33,12 +55,33 @@ from ..extensions.optimization import (
 )
 from .filters import AdvancedFilterGenerator
 from .inheritance import inheritance_handler
+from .pagination import count_queryset, paginate_keyset
+from .property_fallback import PropertyScan, PropertySortKey, scan_property_rows
 from .types import TypeGenerator
 from .introspector import ModelIntrospector
 
 # Default ordering applied when no explicit ordering is provided.
 DEFAULT_ORDERING_FALLBACK = ["-id"]
 
+# values() keys of truncated dimensions, relation labels and metrics in
+# grouping queries (suffixed by the dimension/metric index).
+GROUP_DIMENSION_ALIAS = "_rail_group_dim_"
+GROUP_LABEL_ALIAS = "_rail_group_label_"
+GROUP_METRIC_ALIAS = "_rail_group_metric_"
+
+# Separator of the dimension keys in the key of a multi-dimension bucket.
+GROUPING_KEY_SEPARATOR = "|"
+
+GROUPING_AGGREGATES = {"sum": Sum, "avg": Avg, "min": Min, "max": Max}
+GROUPING_NUMERIC_FIELDS = (
+    models.IntegerField,
+    models.FloatField,
+    models.DecimalField,
+    models.DurationField,
+)
+# Built-in order_by keys of grouping queries, unavailable as metric names
+GROUPING_RESERVED_METRIC_NAMES = ("count", "group")
+
 
 class PaginationInfo(graphene.ObjectType):
     """
@@ -54,6 +97,9 @@ class PaginationInfo(graphene.ObjectType):
     per_page = graphene.Int(description="Number of records per page")
     has_next_page = graphene.Boolean(description="Whether there is a next page")
     has_previous_page = graphene.Boolean(description="Whether there is a previous page")
+    end_cursor = graphene.String(
+        description="Cursor of the last item, to pass as `after` (keyset pagination)"
+    )
 
 
 class PaginatedResult:
@@ -69,6 +115,60 @@ class PaginatedResult:
         self.page_info = page_info
 
 
+class GroupingAggregateEnum(graphene.Enum):
+    """Agrégats disponibles pour les métriques de regroupement."""
+
+    SUM = "sum"
+    AVG = "avg"
+    MIN = "min"
+    MAX = "max"
+    COUNT = "count"
+    COUNT_DISTINCT = "count_distinct"
+
+
+class GroupingTruncEnum(graphene.Enum):
+    """Troncatures de date disponibles pour les dimensions de regroupement."""
+
+    YEAR = "year"
+    QUARTER = "quarter"
+    MONTH = "month"
+    WEEK = "week"
+    DAY = "day"
+    HOUR = "hour"
+
+
+class GroupingDimensionInput(graphene.InputObjectType):
+    """Dimension de regroupement (chemin Django, troncature de date optionnelle)."""
+
+    path = graphene.String(required=True, description="Chemin du champ (__ autorisé)")
+    trunc = GroupingTruncEnum(description="Troncature appliquée à un champ date")
+
+
+class GroupingMetricInput(graphene.InputObjectType):
+    """Métrique agrégée calculée pour chaque groupe."""
+
+    name = graphene.String(required=True, description="Nom de la métrique en sortie")
+    aggregate = GroupingAggregateEnum(required=True, description="Agrégat à calculer")
+    path = graphene.String(
+        description="Chemin du champ agrégé (optionnel pour COUNT)"
+    )
+
+
+class GroupingKeyType(graphene.ObjectType):
+    """Valeur d'une dimension pour un groupe."""
+
+    path = graphene.String(required=True, description="Chemin de la dimension")
+    key = graphene.String(required=True, description="Valeur brute de la dimension")
+    label = graphene.String(required=True, description="Libellé lisible de la valeur")
+
+
+class GroupingMetricValueType(graphene.ObjectType):
+    """Valeur d'une métrique pour un groupe."""
+
+    name = graphene.String(required=True, description="Nom de la métrique")
+    value = GenericScalar(description="Valeur agrégée (nombre ou date ISO)")
+
+
 class GroupingBucketType(graphene.ObjectType):
     """
     Bucket de regroupement retourné par les requêtes de groupement.
@@ -80,6 +180,26 @@ class GroupingBucketType(graphene.ObjectType):
         description="Libellé lisible pour le groupe (nom de relation ou choix)",
     )
     count = graphene.Int(required=True, description="Nombre d'enregistrements")
+    keys = graphene.List(
+        graphene.NonNull(GroupingKeyType),
+        description="Valeurs de chaque dimension du groupe",
+    )
+    metrics = graphene.List(
+        graphene.NonNull(GroupingMetricValueType),
+        description="Métriques agrégées du groupe",
+    )
+    is_total = graphene.Boolean(description="Groupe Total ajouté par rollup")
+
+
+def _grouping_metric_value(value: Any) -> Any:
+    """Convert an aggregate to a JSON friendly value (numbers, ISO dates)."""
+    if isinstance(value, decimal.Decimal):
+        return float(value)
+    if isinstance(value, datetime.timedelta):
+        return value.total_seconds()
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    return value
 
 
 class QueryGenerator:
@@ -126,6 +246,7 @@ class QueryGenerator:
         self._query_registry: Dict[Type[models.Model], Dict[str, Any]] = {}
         self._filter_generator = AdvancedFilterGenerator()
         self._query_fields: Dict[str, graphene.Field] = {}
+        self._choice_labels: Dict[models.Field, Dict[Any, Any]] = {}
 
         # Initialize performance optimization
         self.optimizer = get_optimizer()
@@ -211,7 +332,12 @@ class QueryGenerator:
         info: graphene.ResolveInfo,
         model: Type[models.Model],
     ):
-        """Hide or mask fields based on field-level permissions."""
+        """
+        Hide or mask fields based on field-level permissions.
+
+        The mask plan is compiled once per model and request; only rules
+        that depend on the instance are evaluated per row.
+        """
         context_user = getattr(getattr(info, "context", None), "user", None)
         if (
             not context_user
@@ -220,28 +346,34 @@ class QueryGenerator:
         ):
             return data
 
+        permission_cache = get_permission_cache(info.context, context_user)
+        plan = get_mask_plan(context_user, model, permission_cache)
+        if plan.is_empty:
+            return data
+
         def mask_instance(instance: models.Model):
             if not isinstance(instance, models.Model):
                 return instance
-            field_defs = list(instance._meta.concrete_fields)
-            field_names = [field.name for field in field_defs]
-            snapshot = {name: getattr(instance, name, None) for name in field_names}
-            masked = mask_sensitive_fields(
-                snapshot, context_user, model, instance=instance
-            )
-            for field in field_defs:
-                name = field.name
-                attname = getattr(field, "attname", name)
-                if name in masked:
-                    instance.__dict__[attname] = masked[name]
-                else:
-                    instance.__dict__[attname] = None
-            return instance
+            return apply_mask_plan(plan, instance, context_user, permission_cache)
 
         if isinstance(data, list):
             return [mask_instance(item) for item in data]
         return mask_instance(data)
 
+    def _apply_column_pruning(
+        self,
+        queryset: models.QuerySet,
+        info: graphene.ResolveInfo,
+        model: Type[models.Model],
+        order_by: Optional[List[str]] = None,
+    ) -> models.QuerySet:
+        """Restrict the queryset to the columns the selection and ordering read."""
+        if self._is_historical_model(model):
+            return queryset
+        return self.query_optimizer.apply_only_fields(
+            queryset, info, extra_fields=order_by or ()
+        )
+
     def _apply_count_annotations_for_ordering(
         self,
         queryset: models.QuerySet,
@@ -359,7 +491,7 @@ class QueryGenerator:
     def _split_order_specs(
         self, model: Type[models.Model], order_by: List[str]
     ) -> (List[str], List[str]):
-        """Split order_by specs into DB fields and property-based fields."""
+        """Split order_by specs into DB-orderable specs and Python-side property specs."""
         if not order_by:
             return [], []
         try:
@@ -367,11 +499,13 @@ class QueryGenerator:
             prop_names = set(introspector.properties.keys())
         except Exception:
             prop_names = set()
+        graphql_meta = get_model_graphql_meta(model)
         db_specs: List[str] = []
         prop_specs: List[str] = []
         for spec in order_by:
             name = spec[1:] if spec.startswith("-") else spec
-            if name in prop_names:
+            # Properties with a declared expression are ordered in SQL
+            if name in prop_names and graphql_meta.get_property_expression(name) is None:
                 prop_specs.append(spec)
             else:
                 db_specs.append(spec)
@@ -393,21 +527,40 @@ class QueryGenerator:
             return (0, str(val))
 
     def _apply_property_ordering(
-        self, items: List[Any], prop_specs: List[str]
+        self,
+        items: Iterable[Any],
+        prop_specs: List[str],
+        limit: Optional[int] = None,
     ) -> List[Any]:
-        """Apply stable multi-key sort on a Python list based on property specs."""
+        """
+        Apply a stable multi-key sort based on property specs.
+
+        With ``limit`` only the first ``limit`` rows are kept with a bounded
+        heap, so memory stays O(limit) while ``items`` is streamed.
+        """
         if not prop_specs:
-            return items
-        # Stable sort: apply from last to first
-        for spec in reversed(prop_specs):
-            desc = spec.startswith("-")
-            name = spec[1:] if desc else spec
-            try:
-                items.sort(key=lambda o: self._safe_prop_value(o, name), reverse=desc)
-            except Exception:
-                # If sorting fails, skip this spec
-                continue
-        return items
+            return list(items)
+        names = [spec.lstrip("-") for spec in prop_specs]
+        descending = [spec.startswith("-") for spec in prop_specs]
+
+        def sort_key(obj: Any) -> PropertySortKey:
+            return PropertySortKey(
+                [self._safe_prop_value(obj, name) for name in names], descending
+            )
+
+        if limit is not None:
+            return heapq.nsmallest(max(0, limit), items, key=sort_key)
+        return sorted(items, key=sort_key)
+
+    def _scan_for_property_ordering(
+        self, queryset: models.QuerySet, prop_specs: List[str]
+    ) -> PropertyScan:
+        """Stream rows for Python-side ordering, bounded by the model scan cap."""
+        return scan_property_rows(
+            queryset,
+            [spec.lstrip("-") for spec in prop_specs],
+            schema_name=self.schema_name,
+        )
 
     def generate_single_query(
         self, model: Type[models.Model], manager_name: str = "objects"
@@ -431,7 +584,9 @@ class QueryGenerator:
             """Resolver for single object queries."""
             try:
                 manager = getattr(model, manager_name)
-                instance = manager.get(pk=id)
+                queryset = self.optimizer.optimize_queryset(manager.all(), info, model)
+                queryset = self._apply_column_pruning(queryset, info, model)
+                instance = queryset.get(pk=id)
                 graphql_meta.ensure_operation_access(
                     "retrieve", info=info, instance=instance
                 )
@@ -514,33 +669,46 @@ class QueryGenerator:
                     kwargs.get("order_by"), ordering_config
                 )
                 items: Optional[List[Any]] = None
+                prop_specs: List[str] = []
                 if order_by:
                     queryset, order_by = self._apply_count_annotations_for_ordering(
                         queryset, model, order_by
                     )
                     db_specs, prop_specs = self._split_order_specs(model, order_by)
                     if db_specs:
+                        queryset = graphql_meta.apply_property_expressions(
+                            queryset, db_specs
+                        )
                         queryset = queryset.order_by(*db_specs)
-                    if prop_specs:
-                        items = list(queryset)
-                        items = self._apply_property_ordering(items, prop_specs)
 
+                # Load only the columns the selection reads
+                queryset = self._apply_column_pruning(queryset, info, model, order_by)
                 # Apply pagination
                 offset = kwargs.get("offset")
                 limit = kwargs.get("limit")
+                if prop_specs:
+                    top = (offset or 0) + limit if limit is not None else None
+                    items = self._apply_property_ordering(
+                        self._scan_for_property_ordering(queryset, prop_specs),
+                        prop_specs,
+                        limit=top,
+                    )
                 if items is not None:
                     # In-memory pagination on sorted list
                     if offset is not None and limit is not None:
                         items = items[offset : offset + limit]
                     elif limit is not None:
                         items = items[:limit]
-                    return self._apply_field_masks(items, info, model)
                 else:
                     if offset is not None and limit is not None:
                         queryset = queryset[offset : offset + limit]
                     elif limit is not None:
                         queryset = queryset[:limit]
-                    return self._apply_field_masks(list(queryset), info, model)
+                    items = list(queryset)
+
+                items = self._apply_field_masks(items, info, model)
+                register_dataloader_batch(info, items)
+                return items
 
             # Define arguments for the query
             arguments = {}
@@ -730,36 +898,87 @@ class QueryGenerator:
             order_by = self._normalize_ordering_specs(
                 kwargs.get("order_by"), ordering_config
             )
+            prop_specs: List[str] = []
             if order_by:
                 queryset, order_by = self._apply_count_annotations_for_ordering(
                     queryset, model, order_by
                 )
                 db_specs, prop_specs = self._split_order_specs(model, order_by)
                 if db_specs:
+                    queryset = graphql_meta.apply_property_expressions(
+                        queryset, db_specs
+                    )
                     queryset = queryset.order_by(*db_specs)
-                if prop_specs:
-                    items = list(queryset)
-                    items = self._apply_property_ordering(items, prop_specs)
+
+            # Load only the columns the selection reads
+            queryset = self._apply_column_pruning(queryset, info, model, order_by)
+
+            # Keyset mode cannot seek on Python-side (property) ordering
+            use_keyset = graphql_meta.pagination_config.mode == "keyset"
+            if use_keyset and prop_specs:
+                if kwargs.get("after"):
+                    raise GraphQLError(
+                        "The 'after' cursor cannot be combined with ordering on "
+                        f"computed properties ({', '.join(prop_specs)}); "
+                        "use 'page' instead"
+                    )
+                use_keyset = False
 
             # Calculate pagination values
             page = kwargs.get("page", 1)
             per_page = kwargs.get("per_page", self.settings.default_page_size)
+            if prop_specs:
+                # Keep the rows up to the requested page; count while streaming
+                scan = self._scan_for_property_ordering(queryset, prop_specs)
+                items = self._apply_property_ordering(
+                    scan, prop_specs, limit=max(1, page) * per_page
+                )
+                property_total = scan.scanned
+            if use_keyset:
+                return self._resolve_keyset_page(
+                    queryset, info, model, order_by, page, per_page, kwargs.get("after")
+                )
+
+            pagination_config = graphql_meta.pagination_config
+            exact_count = items is not None or pagination_config.count_strategy == "exact"
+            count_is_exact = True
             if items is not None:
-                total_count = len(items)
+                total_count = property_total
+            elif exact_count or self._selected_page_info_fields(info) & {
+                "total_count",
+                "page_count",
+            }:
+                total_count, count_is_exact = self._count_total(
+                    queryset, pagination_config
+                )
             else:
-                total_count = queryset.count()
-            page_count = (total_count + per_page - 1) // per_page
+                total_count = None
+            page_count = (
+                (total_count + per_page - 1) // per_page
+                if total_count is not None
+                else None
+            )
 
-            # Ensure page is within valid range
-            page = max(1, min(page, page_count))
+            # Ensure page is within valid range (estimates are not trusted)
+            if total_count is not None and count_is_exact:
+                page = max(1, min(page, page_count))
+            else:
+                page = max(1, page)
 
             # Apply pagination
             start = (page - 1) * per_page
             end = start + per_page
             if items is not None:
                 items = items[start:end]
-            else:
+            elif exact_count:
                 items = list(queryset[start:end])
+            else:
+                # One extra row tells whether a next page exists without COUNT
+                rows = list(queryset[start : end + 1])
+                items = rows[:per_page]
+            has_next_page = (
+                page < page_count if exact_count else len(rows) > per_page
+            )
 
             # Create pagination info
             page_info = PaginationInfo(
@@ -767,11 +986,12 @@ class QueryGenerator:
                 page_count=page_count,
                 current_page=page,
                 per_page=per_page,
-                has_next_page=page < page_count,
+                has_next_page=has_next_page,
                 has_previous_page=page > 1,
             )
 
             items = self._apply_field_masks(items, info, model)
+            register_dataloader_batch(info, items)
             # Return a simple object with the required attributes
             return PaginatedResult(items=items, page_info=page_info)
 
@@ -784,6 +1004,11 @@ class QueryGenerator:
             ),
         }
 
+        if graphql_meta.pagination_config.mode == "keyset":
+            arguments["after"] = graphene.String(
+                description="Return records after this cursor (pageInfo.endCursor)"
+            )
+
         # Add complex filtering argument (same as list queries)
         filter_class = self.filter_generator.generate_filter_set(filter_model)
         complex_filter_input = self.filter_generator.generate_complex_filter_input(
@@ -853,6 +1078,74 @@ class QueryGenerator:
             description=f"Retrieve a paginated list of {model_name} instances using {manager_name} manager",
         )
 
+    def _selected_page_info_fields(self, info: graphene.ResolveInfo) -> Set[str]:
+        """Return the snake_case names selected under ``pageInfo``."""
+        tree = self.optimizer.analyzer.build_selection_tree(info)
+        page_info = tree.get("pageInfo") or tree.get("page_info") or {}
+        return {to_snake_case(name) for name in page_info}
+
+    def _count_total(
+        self, queryset: models.QuerySet, pagination_config
+    ) -> Tuple[int, bool]:
+        """Count rows with the model's count strategy; returns (count, is_exact)."""
+        return count_queryset(
+            queryset,
+            pagination_config.count_strategy,
+            estimate_threshold=pagination_config.estimate_threshold,
+            cache_ttl=pagination_config.count_cache_ttl,
+        )
+
+    def _resolve_keyset_page(
+        self,
+        queryset: models.QuerySet,
+        info: graphene.ResolveInfo,
+        model: Type[models.Model],
+        order_by: List[str],
+        page: int,
+        per_page: int,
+        after: Optional[str],
+    ) -> PaginatedResult:
+        """
+        Resolve a paginated query in keyset mode.
+
+        Rows are located with the ``after`` cursor (or the page offset when no
+        cursor is given) and ``per_page + 1`` rows are fetched to compute
+        ``has_next_page``. COUNT only runs when ``totalCount`` or ``pageCount``
+        is selected.
+        """
+        per_page = max(1, per_page or self.settings.default_page_size)
+        page = max(1, page or 1)
+        offset = 0 if after else (page - 1) * per_page
+
+        total_count = page_count = None
+        if self._selected_page_info_fields(info) & {"total_count", "page_count"}:
+            total_count, _ = self._count_total(
+                queryset, get_model_graphql_meta(model).pagination_config
+            )
+            page_count = (total_count + per_page - 1) // per_page
+
+        try:
+            items, has_next_page, end_cursor = paginate_keyset(
+                queryset, model, order_by, per_page, after=after, offset=offset
+            )
+        except ValueError as exc:
+            # Malformed cursor or cursor built for another ordering
+            raise GraphQLError(str(exc)) from exc
+
+        page_info = PaginationInfo(
+            total_count=total_count,
+            page_count=page_count,
+            current_page=None if after else page,
+            per_page=per_page,
+            has_next_page=has_next_page,
+            has_previous_page=bool(after) or page > 1,
+            end_cursor=end_cursor,
+        )
+
+        items = self._apply_field_masks(items, info, model)
+        register_dataloader_batch(info, items)
+        return PaginatedResult(items=items, page_info=page_info)
+
     def add_filtering_support(
         self, query: graphene.Field, model: Type[models.Model]
     ) -> graphene.Field:
@@ -907,13 +1200,213 @@ class QueryGenerator:
                 current_model = current_model
         return final_field
 
+    def _get_choice_labels(self, field: models.Field) -> Dict[Any, Any]:
+        """Return the value -> label mapping of a field's choices, computed once."""
+        labels = self._choice_labels.get(field)
+        if labels is None:
+            labels = dict(field.flatchoices)
+            self._choice_labels[field] = labels
+        return labels
+
+    def _parse_grouping_dimensions(
+        self, model: Type[models.Model], kwargs: Dict[str, Any]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Collect the grouping dimensions from ``group_by`` and ``dimensions``.
+
+        Returns:
+            List of dimensions (path, field, trunc, values key), or None when a
+            path cannot be grouped on.
+        """
+        raw_dimensions: List[Dict[str, Any]] = []
+        if kwargs.get("group_by"):
+            raw_dimensions.append({"path": kwargs["group_by"]})
+        raw_dimensions.extend(kwargs.get("dimensions") or [])
+
+        dimensions: List[Dict[str, Any]] = []
+        for index, raw in enumerate(raw_dimensions):
+            path = raw.get("path")
+            field = self._resolve_group_by_field(model, path) if path else None
+            if field is None:
+                return None
+            trunc = getattr(raw.get("trunc"), "value", raw.get("trunc"))
+            if trunc:
+                if not isinstance(field, models.DateField) or (
+                    trunc == "hour" and not isinstance(field, models.DateTimeField)
+                ):
+                    raise GraphQLError(
+                        f"Cannot truncate '{path}' to {trunc}: not a date field"
+                    )
+                key = f"{GROUP_DIMENSION_ALIAS}{index}"
+            else:
+                key = path
+            dimensions.append(
+                {
+                    "path": path,
+                    "field": field,
+                    "trunc": trunc,
+                    "key": key,
+                    "label_alias": f"{GROUP_LABEL_ALIAS}{index}",
+                }
+            )
+        return dimensions
+
+    def _parse_grouping_metrics(
+        self, model: Type[models.Model], raw_metrics: Optional[List[Dict[str, Any]]]
+    ) -> List[Tuple[str, str, Any]]:
+        """
+        Build the aggregate expressions requested by ``metrics``.
+
+        Returns:
+            List of (name, values key, aggregate expression)
+
+        Raises:
+            GraphQLError: If a metric has an invalid or reserved name, an invalid
+                path or aggregate
+        """
+        metrics: List[Tuple[str, str, Any]] = []
+        names: Set[str] = set()
+        for index, raw in enumerate(raw_metrics or []):
+            name = raw.get("name")
+            aggregate = getattr(raw.get("aggregate"), "value", raw.get("aggregate"))
+            path = raw.get("path")
+            if not name or name in names:
+                raise GraphQLError(f"Metric names must be unique: '{name}'")
+            if name in GROUPING_RESERVED_METRIC_NAMES:
+                raise GraphQLError(
+                    f"Metric name '{name}' is reserved for ordering by "
+                    f"{' and '.join(GROUPING_RESERVED_METRIC_NAMES)}"
+                )
+            names.add(name)
+
+            field = self._resolve_group_by_field(model, path) if path else None
+            if path and field is None:
+                raise GraphQLError(f"Invalid metric path '{path}'")
+            if aggregate in ("sum", "avg") and not isinstance(
+                field, GROUPING_NUMERIC_FIELDS
+            ):
+                raise GraphQLError(
+                    f"Metric '{name}' requires a numeric path for {aggregate}"
+                )
+            if aggregate in ("min", "max") and (
+                field is None or field.is_relation
+            ):
+                raise GraphQLError(
+                    f"Metric '{name}' requires a value path for {aggregate}"
+                )
+
+            if aggregate == "count_distinct":
+                expression = Count(path or "pk", distinct=True)
+            elif aggregate == "count":
+                expression = Count(path or "pk")
+            else:
+                expression = GROUPING_AGGREGATES[aggregate](path)
+            metrics.append((name, f"{GROUP_METRIC_ALIAS}{index}", expression))
+        return metrics
+
+    def _build_grouping_queryset(
+        self,
+        queryset: models.QuerySet,
+        dimensions: List[Dict[str, Any]],
+        metrics: List[Tuple[str, str, Any]],
+    ) -> models.QuerySet:
+        """
+        Group ``queryset`` by the dimensions with a count and the metrics.
+
+        Everything is computed by a single ``values().annotate()`` query. When
+        the related model of a relation dimension declares
+        ``GraphQLMeta.label_expression``, the labels are computed in the same
+        query: a field path through a join, other expressions through a
+        correlated subquery.
+        """
+        value_paths: List[str] = []
+        value_expressions: Dict[str, Any] = {}
+        label_subqueries: Dict[str, Any] = {}
+        for dimension in dimensions:
+            path, field = dimension["path"], dimension["field"]
+            if dimension["trunc"]:
+                value_expressions[dimension["key"]] = Trunc(path, dimension["trunc"])
+                continue
+            value_paths.append(path)
+
+            if not isinstance(field, (ForeignKey, OneToOneField)):
+                continue
+            related_model = field.remote_field.model
+            label_expression = get_model_graphql_meta(
+                related_model
+            ).get_label_expression()
+            if label_expression is None:
+                continue
+            if isinstance(label_expression, F):
+                value_expressions[dimension["label_alias"]] = F(
+                    f"{path}__{label_expression.name}"
+                )
+            else:
+                labels = (
+                    related_model._default_manager.filter(
+                        **{field.remote_field.field_name: OuterRef(path)}
+                    )
+                    .annotate(**{GROUP_LABEL_ALIAS: label_expression})
+                    .values(GROUP_LABEL_ALIAS)[:1]
+                )
+                label_subqueries[dimension["label_alias"]] = Subquery(labels)
+
+        queryset = queryset.values(*value_paths, **value_expressions).annotate(
+            total=Count("pk"), **{key: expression for _, key, expression in metrics}
+        )
+        if label_subqueries:
+            queryset = queryset.annotate(**label_subqueries)
+        return queryset
+
+    def _grouping_labels(
+        self, dimension: Dict[str, Any], entries: List[Dict[str, Any]], using: str
+    ) -> Tuple[Optional[Dict[Any, Any]], Dict[Any, Any]]:
+        """Return the choice labels and relation labels of a dimension's buckets."""
+        field, key = dimension["field"], dimension["key"]
+        if dimension["trunc"]:
+            return None, {}
+        choice_labels = (
+            self._get_choice_labels(field) if getattr(field, "choices", None) else None
+        )
+        if not isinstance(field, (ForeignKey, OneToOneField)):
+            return choice_labels, {}
+        label_alias = dimension["label_alias"]
+        if entries and label_alias in entries[0]:
+            return choice_labels, {
+                entry[key]: entry[label_alias]
+                for entry in entries
+                if entry[label_alias] is not None
+            }
+        return choice_labels, self._load_related_labels(
+            field, [entry.get(key) for entry in entries], using
+        )
+
+    def _load_related_labels(
+        self, field: models.Field, values: List[Any], using: str
+    ) -> Dict[Any, str]:
+        """Load the ``str()`` labels of the related rows of relation buckets at once."""
+        keys = {value for value in values if value is not None}
+        if not keys:
+            return {}
+        related_model = field.remote_field.model
+        try:
+            related_objects = related_model._default_manager.using(using).in_bulk(
+                keys, field_name=field.remote_field.field_name
+            )
+        except Exception:
+            return {}
+        return {key: str(obj) for key, obj in related_objects.items()}
+
     def generate_grouping_query(
         self, model: Type[models.Model], manager_name: str = "objects"
     ) -> graphene.Field:
         """
-        Generate a lightweight grouping query (counts per value) using the same filter inputs as list queries.
+        Generate a grouping query using the same filter inputs as list queries.
 
-        Returns buckets keyed by the grouped value with a display label and count.
+        Buckets are grouped by one or more dimensions (``group_by`` and/or
+        ``dimensions``, with optional date truncation) and carry a count plus
+        the requested aggregate ``metrics``, all computed by one
+        ``values().annotate()`` query. ``rollup`` appends a total bucket.
         """
         model_name = model.__name__.lower()
         graphql_meta = get_model_graphql_meta(model)
@@ -925,13 +1418,11 @@ class QueryGenerator:
 
         @optimize_query()
         def resolver(root: Any, info: graphene.ResolveInfo, **kwargs):
-            group_by: Optional[str] = kwargs.get("group_by")
-            if not group_by:
-                return []
-
-            field = self._resolve_group_by_field(model, group_by)
-            if field is None:
+            graphql_meta.ensure_operation_access("list", info=info)
+            dimensions = self._parse_grouping_dimensions(model, kwargs)
+            if not dimensions:
                 return []
+            metrics = self._parse_grouping_metrics(model, kwargs.get("metrics"))
 
             limit = kwargs.get("limit") or max_buckets
             try:
@@ -942,7 +1433,6 @@ class QueryGenerator:
 
             manager = getattr(model, manager_name)
             queryset = manager.all()
-            graphql_meta.ensure_operation_access("list", info=info)
 
             # Apply query optimization first
             queryset = self.optimizer.optimize_queryset(queryset, info, model)
@@ -962,6 +1452,9 @@ class QueryGenerator:
                 not in [
                     "filters",
                     "group_by",
+                    "dimensions",
+                    "metrics",
+                    "rollup",
                     "order_by",
                     "limit",
                     "include",
@@ -974,51 +1467,90 @@ class QueryGenerator:
                 else:
                     return []
 
-            value_path = group_by
-            queryset = queryset.values(value_path).annotate(total=Count("id"))
+            filtered_queryset = queryset
+            queryset = self._build_grouping_queryset(queryset, dimensions, metrics)
 
+            group_keys = [dimension["key"] for dimension in dimensions]
+            metric_keys = {name: key for name, key, _ in metrics}
             order_by = kwargs.get("order_by") or "group"
             if order_by == "count":
                 queryset = queryset.order_by("-total")
             elif order_by == "-count":
                 queryset = queryset.order_by("total")
             elif order_by == "-group":
-                queryset = queryset.order_by(f"-{value_path}")
+                queryset = queryset.order_by(*[f"-{key}" for key in group_keys])
+            elif order_by.lstrip("-") in metric_keys:
+                direction = "-" if order_by.startswith("-") else ""
+                queryset = queryset.order_by(
+                    f"{direction}{metric_keys[order_by.lstrip('-')]}"
+                )
             else:
-                queryset = queryset.order_by(value_path)
+                queryset = queryset.order_by(*group_keys)
 
-            queryset = queryset[:limit]
+            entries = list(queryset[:limit])
+            labels = [
+                self._grouping_labels(dimension, entries, queryset.db)
+                for dimension in dimensions
+            ]
 
             buckets = []
-            for entry in queryset:
-                raw_value = entry.get(value_path)
-                label_value = raw_value
-                if getattr(field, "choices", None):
-                    label_value = dict(field.flatchoices).get(raw_value, raw_value)
-                if raw_value is None:
-                    label_value = "Non renseigné"
-                elif isinstance(
-                    field, (ForeignKey, OneToOneField)
-                ) and raw_value is not None:
-                    try:
-                        related_model = field.remote_field.model
-                        related_obj = (
-                            related_model._default_manager.using(queryset.db)
-                            .filter(pk=raw_value)
-                            .first()
+            for entry in entries:
+                keys = []
+                for dimension, (choice_labels, related_labels) in zip(
+                    dimensions, labels
+                ):
+                    raw_value = entry.get(dimension["key"])
+                    label_value = raw_value
+                    if choice_labels is not None:
+                        label_value = choice_labels.get(raw_value, raw_value)
+                    if raw_value is None:
+                        label_value = "Non renseigné"
+                    elif raw_value in related_labels:
+                        label_value = related_labels[raw_value]
+                    keys.append(
+                        GroupingKeyType(
+                            path=dimension["path"],
+                            key="__EMPTY__" if raw_value is None else str(raw_value),
+                            label=str(label_value)
+                            if label_value is not None
+                            else "Non renseigné",
                         )
-                        if related_obj:
-                            label_value = str(related_obj)
-                    except Exception:
-                        label_value = label_value
+                    )
 
                 buckets.append(
                     GroupingBucketType(
-                        key="__EMPTY__" if raw_value is None else str(raw_value),
-                        label=str(label_value)
-                        if label_value is not None
-                        else "Non renseigné",
+                        key=GROUPING_KEY_SEPARATOR.join(k.key for k in keys),
+                        label=" / ".join(k.label for k in keys),
                         count=int(entry.get("total", 0) or 0),
+                        keys=keys,
+                        metrics=[
+                            GroupingMetricValueType(
+                                name=name, value=_grouping_metric_value(entry[key])
+                            )
+                            for name, key, _ in metrics
+                        ],
+                        is_total=False,
+                    )
+                )
+
+            if kwargs.get("rollup"):
+                totals = filtered_queryset.aggregate(
+                    total=Count("pk"),
+                    **{key: expression for _, key, expression in metrics},
+                )
+                buckets.append(
+                    GroupingBucketType(
+                        key="__TOTAL__",
+                        label="Total",
+                        count=int(totals.get("total") or 0),
+                        keys=[],
+                        metrics=[
+                            GroupingMetricValueType(
+                                name=name, value=_grouping_metric_value(totals[key])
+                            )
+                            for name, key, _ in metrics
+                        ],
+                        is_total=True,
                     )
                 )
 
@@ -1027,13 +1559,31 @@ class QueryGenerator:
         arguments = {
             "group_by": graphene.Argument(
                 graphene.String,
-                required=True,
+                required=False,
                 description="Nom du champ pour le regroupement (chemin Django avec __ autorisé)",
             ),
+            "dimensions": graphene.Argument(
+                graphene.List(graphene.NonNull(GroupingDimensionInput)),
+                required=False,
+                description="Dimensions supplémentaires du regroupement (après group_by)",
+            ),
+            "metrics": graphene.Argument(
+                graphene.List(graphene.NonNull(GroupingMetricInput)),
+                required=False,
+                description="Agrégats calculés pour chaque groupe",
+            ),
+            "rollup": graphene.Argument(
+                graphene.Boolean,
+                required=False,
+                description="Ajoute un groupe Total calculé sur l'ensemble filtré",
+            ),
             "order_by": graphene.Argument(
                 graphene.String,
                 required=False,
-                description="Ordre de tri: group, -group, count, -count (défaut: group)",
+                description=(
+                    "Ordre de tri: group, -group, count, -count (défaut: group) "
+                    "ou nom d'une métrique (préfixe - pour l'ordre décroissant)"
+                ),
             ),
             "limit": graphene.Argument(
                 graphene.Int,
@@ -29,6 +29,7 @@ if DJANGO_FILTER_INSTALLED:
 from datetime import date
 
 from ..conf import get_mutation_generator_settings, get_type_generator_settings
+from ..core.dataloaders import get_relation_loader
 from ..core.meta import get_model_graphql_meta
 from ..core.performance import get_query_optimizer
 from ..core.scalars import Binary as BinaryScalar
@@ -615,6 +616,13 @@ class TypeGenerator:
                             return related_obj
                         # For ForeignKey and ManyToMany, return queryset with optional filtering
                         else:
+                            if not filters:
+                                loader = get_relation_loader(
+                                    info, "list", model, field_name
+                                )
+                                if loader is not None:
+                                    return loader.load(self)
+
                             queryset = related_obj.all()
 
                             # Apply filters if provided
@@ -637,6 +645,9 @@ class TypeGenerator:
                 # Add count resolver for ManyToMany relation
                 def make_count_resolver(field_name):
                     def count_resolver(self, info):
+                        loader = get_relation_loader(info, "count", model, field_name)
+                        if loader is not None:
+                            return loader.load(self)
                         related_obj = getattr(self, field_name)
                         return related_obj.count()
 
@@ -704,6 +715,9 @@ class TypeGenerator:
                 def resolver(self, info, filters=None):
                     # For OneToOne reverse relationships, handle DoesNotExist exceptions
                     if is_one_to_one:
+                        loader = get_relation_loader(info, "one", model, accessor_name)
+                        if loader is not None:
+                            return loader.load(self)
                         try:
                             related_obj = getattr(self, accessor_name)
                             return related_obj
@@ -711,6 +725,13 @@ class TypeGenerator:
                             return None
                     # For other relationships, return queryset with optional filtering
                     else:
+                        if not filters:
+                            loader = get_relation_loader(
+                                info, "list", model, accessor_name
+                            )
+                            if loader is not None:
+                                return loader.load(self)
+
                         related_obj = getattr(self, accessor_name)
                         queryset = related_obj.all()
 
@@ -738,6 +759,11 @@ class TypeGenerator:
                         return 1 if related_obj else 0
                     else:
                         # For ManyToOne reverse relations, count the related objects
+                        loader = get_relation_loader(
+                            info, "count", model, accessor_name
+                        )
+                        if loader is not None:
+                            return loader.load(self)
                         related_obj = getattr(self, accessor_name)
                         return related_obj.count()
 
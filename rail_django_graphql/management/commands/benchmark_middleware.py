@@ -0,0 +1,101 @@
+"""
+Commande de gestion Django pour mesurer le surcoût de la pile de middlewares.
+
+Cette commande exécute une requête synthétique (lignes × champs scalaires)
+sans middleware, avec la pile appliquée à chaque champ (comportement
+historique) puis avec la pile compilée par portée, et affiche le surcoût
+moyen par champ résolu.
+"""
+
+import time
+from types import SimpleNamespace
+
+import graphene
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand
+
+from ...core.middleware import compile_middleware_stack, get_middleware_stack
+
+
+def build_benchmark_schema(field_count: int, row_count: int) -> graphene.Schema:
+    """Construit un schéma retournant `row_count` lignes de `field_count` champs."""
+    attrs = {f"field_{index}": graphene.String() for index in range(field_count)}
+    Row = type("BenchmarkRow", (graphene.ObjectType,), attrs)
+    values = {name: name for name in attrs}
+
+    class Query(graphene.ObjectType):
+        rows = graphene.List(Row)
+
+        def resolve_rows(root, info):
+            return [values] * row_count
+
+    return graphene.Schema(query=Query)
+
+
+class Command(BaseCommand):
+    """
+    Commande Django pour mesurer le surcoût par champ des middlewares.
+
+    Usage:
+        python manage.py benchmark_middleware
+        python manage.py benchmark_middleware --rows 500 --fields 20
+    """
+
+    help = "Mesure le surcoût par champ de la pile de middlewares GraphQL"
+
+    def add_arguments(self, parser):
+        """Ajoute les arguments de la commande."""
+        parser.add_argument(
+            "--rows", type=int, default=500, help="Nombre de lignes (défaut: 500)"
+        )
+        parser.add_argument(
+            "--fields", type=int, default=20, help="Champs par ligne (défaut: 20)"
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=5, help="Nombre d'exécutions (défaut: 5)"
+        )
+        parser.add_argument(
+            "--schema", type=str, default=None, help="Schéma dont la pile est mesurée"
+        )
+
+    def handle(self, *args, **options):
+        """Exécute la commande."""
+        schema = build_benchmark_schema(options["fields"], options["rows"])
+        selection = " ".join(f"field{index}" for index in range(options["fields"]))
+        query = f"{{ rows {{ {selection} }} }}"
+        field_count = options["rows"] * (options["fields"] + 1) + 1
+
+        stack = get_middleware_stack(options["schema"])
+        modes = [
+            ("aucun middleware", []),
+            ("pile par champ", [compile_middleware_stack(stack, use_scopes=False)]),
+            ("pile compilée", [compile_middleware_stack(stack)]),
+        ]
+
+        timings = {}
+        for label, middleware in modes:
+            timings[label] = self._measure(
+                schema, query, middleware, options["repeat"]
+            )
+
+        baseline = timings["aucun middleware"]
+        self.stdout.write(f"Champs résolus par exécution: {field_count}")
+        for label, duration in timings.items():
+            overhead_us = (duration - baseline) / field_count * 1_000_000
+            self.stdout.write(
+                f"{label:<18} {duration * 1000:8.2f} ms  "
+                f"surcoût/champ: {overhead_us:6.2f} µs"
+            )
+
+    def _measure(self, schema, query, middleware, repeat: int) -> float:
+        """Retourne la meilleure durée d'exécution (en secondes)."""
+        best = None
+        for _ in range(max(repeat, 1)):
+            context = SimpleNamespace(user=AnonymousUser(), META={})
+            start = time.perf_counter()
+            result = schema.execute(query, context_value=context, middleware=middleware)
+            duration = time.perf_counter() - start
+            if result.errors:
+                raise RuntimeError(result.errors[0])
+            best = duration if best is None else min(best, duration)
+        return best
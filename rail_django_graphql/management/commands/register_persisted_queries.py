@@ -0,0 +1,164 @@
+"""
+Commande de gestion Django pour enregistrer les opérations persistées d'un build.
+
+Les opérations enregistrées alimentent la liste autorisée utilisée lorsque
+``persisted_query_settings.allow_list_only`` est actif. Sources acceptées:
+
+- manifeste JSON Apollo (``{"operations": [{"id", "name", "body"}]}``)
+- objet JSON ``{"<sha256>": "<requête>"}``
+- fichiers ``.graphql`` / ``.gql`` (le texte est haché tel quel) ou
+  répertoires les contenant
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Iterable, List
+
+from django.core.management.base import BaseCommand, CommandError
+from graphql import GraphQLError, parse
+
+from ...extensions.persisted_queries import (
+    MemoryPersistedQueryStore,
+    PersistedQueryEntry,
+    PersistedQuerySettings,
+    get_persisted_query_store,
+    hash_query,
+    register_operations,
+)
+
+GRAPHQL_SUFFIXES = (".graphql", ".gql")
+
+
+class Command(BaseCommand):
+    """
+    Commande Django pour enregistrer des opérations dans la liste autorisée.
+
+    Usage:
+        python manage.py register_persisted_queries persisted-query-manifest.json
+        python manage.py register_persisted_queries src/graphql/ --store database
+    """
+
+    help = "Enregistre les opérations persistées d'un build (liste autorisée)"
+
+    def add_arguments(self, parser):
+        """Ajoute les arguments de la commande."""
+        parser.add_argument(
+            "paths", nargs="+", help="Manifestes JSON, fichiers .graphql ou répertoires"
+        )
+        parser.add_argument(
+            "--schema", type=str, default=None, help="Schéma dont la configuration est utilisée"
+        )
+        parser.add_argument(
+            "--store",
+            choices=["cache", "database"],
+            default=None,
+            help="Store cible (défaut: persisted_query_settings.store)",
+        )
+        parser.add_argument(
+            "--clear",
+            action="store_true",
+            help="Supprime les requêtes existantes avant l'enregistrement (database)",
+        )
+        parser.add_argument(
+            "--dry-run", action="store_true", help="Vérifie les opérations sans les enregistrer"
+        )
+
+    def handle(self, *args, **options):
+        """Exécute la commande."""
+        settings = PersistedQuerySettings.from_schema(options["schema"])
+        if options["store"]:
+            settings.store = options["store"]
+        if options["clear"] and settings.store == "cache":
+            raise CommandError(
+                "--clear n'est pas disponible avec le store cache: "
+                "un cache Django ne peut pas énumérer ses entrées"
+            )
+
+        operations = []
+        for path in options["paths"]:
+            operations.extend(self._load_path(Path(path)))
+        if not operations:
+            raise CommandError("Aucune opération trouvée")
+
+        if options["dry_run"]:
+            self.stdout.write(f"{len(operations)} opération(s) valide(s)")
+            return
+
+        store = get_persisted_query_store(settings)
+        if isinstance(store, MemoryPersistedQueryStore):
+            raise CommandError(
+                "Le store mémoire n'est pas partagé avec le serveur: "
+                "utilisez --store cache ou --store database"
+            )
+
+        if options["clear"]:
+            store.clear()
+
+        count = register_operations(operations, store)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{count} opération(s) enregistrée(s) dans le store '{settings.store}'"
+            )
+        )
+
+    def _load_path(self, path: Path) -> List[PersistedQueryEntry]:
+        """Charge les opérations d'un fichier ou d'un répertoire."""
+        if path.is_dir():
+            operations = []
+            for child in sorted(path.rglob("*")):
+                if child.suffix in GRAPHQL_SUFFIXES:
+                    operations.extend(self._load_path(child))
+            return operations
+        if not path.is_file():
+            raise CommandError(f"Fichier introuvable: {path}")
+
+        text = path.read_text(encoding="utf-8")
+        if path.suffix in GRAPHQL_SUFFIXES:
+            return [self._build_entry(path, text, "", None)]
+
+        try:
+            manifest = json.loads(text)
+        except ValueError as e:
+            raise CommandError(f"{path}: JSON invalide ({e})")
+        return [
+            self._build_entry(path, body, name, query_hash)
+            for body, name, query_hash in self._iter_manifest(path, manifest)
+        ]
+
+    def _iter_manifest(self, path: Path, manifest: Any) -> Iterable[tuple]:
+        """Parcourt un manifeste Apollo ou un objet empreinte -> requête."""
+        if isinstance(manifest, dict) and isinstance(manifest.get("operations"), list):
+            for operation in manifest["operations"]:
+                if not isinstance(operation, dict):
+                    raise CommandError(f"{path}: opération invalide {operation!r}")
+                yield (
+                    operation.get("body") or operation.get("query"),
+                    operation.get("name") or operation.get("operationName") or "",
+                    operation.get("id") or operation.get("sha256Hash"),
+                )
+        elif isinstance(manifest, dict):
+            for query_hash, body in manifest.items():
+                yield body, "", query_hash
+        else:
+            raise CommandError(f"{path}: format de manifeste non reconnu")
+
+    def _build_entry(self, path: Path, body: Any, name: str, query_hash: Any):
+        """Vérifie l'empreinte et la syntaxe d'une opération."""
+        if not isinstance(body, str) or not body.strip():
+            raise CommandError(f"{path}: opération sans texte de requête")
+        if query_hash and str(query_hash).lower() != hash_query(body):
+            raise CommandError(
+                f"{path}: l'empreinte {query_hash} ne correspond pas à la requête"
+            )
+        try:
+            document = parse(body)
+        except GraphQLError as e:
+            raise CommandError(f"{path}: requête invalide ({e.message})")
+        if not name:
+            names = [
+                definition.name.value
+                for definition in document.definitions
+                if getattr(definition, "operation", None) and definition.name
+            ]
+            name = names[0] if len(names) == 1 else ""
+        return PersistedQueryEntry(body, name, True)
@@ -146,6 +146,7 @@ class GraphQLPerformanceMiddleware(MiddlewareMixin):
             cache_misses=cache_misses,
             memory_usage_mb=memory_usage_mb,
             error_message=error_message,
+            query_cost=getattr(request, "query_cost", None),
         )
 
         # Logger les requêtes lentes si activé
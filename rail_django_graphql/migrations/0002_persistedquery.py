@@ -0,0 +1,47 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("rail_django_graphql", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PersistedQuery",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                (
+                    "sha256_hash",
+                    models.CharField(max_length=64, unique=True, verbose_name="Empreinte SHA-256"),
+                ),
+                ("query", models.TextField(verbose_name="Requete")),
+                (
+                    "operation_name",
+                    models.CharField(blank=True, max_length=255, verbose_name="Operation"),
+                ),
+                (
+                    "registered",
+                    models.BooleanField(
+                        default=False,
+                        help_text="Operation enregistree par register_persisted_queries (liste autorisee).",
+                        verbose_name="Enregistree",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True, verbose_name="Creation")),
+            ],
+            options={
+                "verbose_name": "Requete persistee",
+                "verbose_name_plural": "Requetes persistees",
+                "ordering": ["-created_at"],
+            },
+        ),
+    ]
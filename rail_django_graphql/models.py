@@ -2,9 +2,12 @@
 Model registry for rail_django_graphql extensions.
 
 This module imports reporting models so Django auto-discovery registers them and
-the GraphQL auto schema can expose CRUD and method-based mutations.
+the GraphQL auto schema can expose CRUD and method-based mutations. The
+persisted query table is internal storage and is not exposed.
 """
 
+from rail_django_graphql.extensions.persisted_queries import PersistedQuery
+
 from rail_django_graphql.extensions.reporting import (
     ReportingDataset,
     ReportingExportJob,
@@ -19,4 +22,5 @@ __all__ = [
     "ReportingReport",
     "ReportingReportBlock",
     "ReportingExportJob",
+    "PersistedQuery",
 ]
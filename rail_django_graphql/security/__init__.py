@@ -21,11 +21,14 @@ from .audit_logging import (
 from .field_permissions import (
     FieldAccessLevel,
     FieldContext,
+    FieldMaskPlan,
     FieldPermissionManager,
     FieldPermissionRule,
     FieldVisibility,
+    apply_mask_plan,
     field_permission_manager,
     field_permission_required,
+    get_mask_plan,
     mask_sensitive_fields,
 )
 from .graphql_security import (
@@ -46,6 +49,7 @@ from .input_validation import (
     ValidationSeverity,
     validate_input,
 )
+from .permission_cache import RequestPermissionCache, get_permission_cache
 from .rbac import (
     PermissionContext,
     PermissionScope,
@@ -80,10 +84,17 @@ __all__ = [
     'FieldVisibility',
     'FieldPermissionRule',
     'FieldContext',
+    'FieldMaskPlan',
     'FieldPermissionManager',
     'field_permission_manager',
     'field_permission_required',
     'mask_sensitive_fields',
+    'get_mask_plan',
+    'apply_mask_plan',
+
+    # Request Permission Cache
+    'RequestPermissionCache',
+    'get_permission_cache',
 
     # GraphQL Security
     'SecurityThreatLevel',
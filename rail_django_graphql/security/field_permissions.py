@@ -9,7 +9,7 @@ Ce module fournit :
 """
 
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from functools import wraps
 from typing import (
@@ -17,6 +17,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    FrozenSet,
     List,
     Optional,
     Set,
@@ -32,6 +33,8 @@ from graphql import GraphQLError
 
 if TYPE_CHECKING:
     from django.contrib.auth.models import AbstractUser
+
+    from .permission_cache import RequestPermissionCache
 logger = logging.getLogger(__name__)
 
 
@@ -79,6 +82,49 @@ class FieldContext:
     operation_type: str = "read"  # read, write, create, update, delete
     request_context: Dict[str, Any] = None
     model_class: Optional[Type[models.Model]] = None
+    permission_cache: Optional["RequestPermissionCache"] = None
+
+
+@dataclass
+class FieldMaskPlan:
+    """
+    Plan de masquage précompilé pour un modèle et un utilisateur.
+
+    Les colonnes sont désignées par leur attname (``author_id`` pour une clé
+    étrangère) afin d'être appliquées sur ``instance.__dict__`` sans passer
+    par les descripteurs.
+    """
+
+    hidden: List[Tuple[str, str]] = field(default_factory=list)
+    masked: List[Tuple[str, str, Any]] = field(default_factory=list)
+    redacted: List[Tuple[str, str]] = field(default_factory=list)
+    dynamic: List[Tuple[str, str]] = field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        """True si le plan ne modifie aucune instance."""
+        return not (self.hidden or self.masked or self.redacted or self.dynamic)
+
+
+@dataclass(frozen=True)
+class CompiledFieldRules:
+    """
+    Règles candidates précompilées pour un couple (modèle, champ).
+
+    Les règles sont triées par priorité (clé la plus précise d'abord, puis
+    ordre d'enregistrement) et déjà filtrées sur le modèle et le champ.
+    """
+
+    key: Tuple[str, str]
+    field_rules: Tuple[FieldPermissionRule, ...]
+    global_rules: Tuple[FieldPermissionRule, ...]
+    has_dynamic_rules: bool
+    has_permission_rules: bool
+
+    @property
+    def is_static(self) -> bool:
+        """True si la décision ne dépend que des rôles de l'utilisateur."""
+        return not (self.has_dynamic_rules or self.has_permission_rules)
 
 
 class FieldPermissionManager:
@@ -91,6 +137,10 @@ class FieldPermissionManager:
         self._field_rules: Dict[str, List[FieldPermissionRule]] = {}
         self._global_rules: List[FieldPermissionRule] = []
         self._graphql_configs: Set[str] = set()
+        self._rule_index: Dict[Tuple[str, str], CompiledFieldRules] = {}
+        self._static_decisions: Dict[
+            Tuple[Tuple[str, str], str, FrozenSet[str]], Optional[FieldPermissionRule]
+        ] = {}
         self._sensitive_fields = {
             "password",
             "token",
@@ -168,6 +218,7 @@ class FieldPermissionManager:
             self._field_rules[key] = []
 
         self._field_rules[key].append(rule)
+        self._invalidate_rule_index()
         logger.info(f"Règle de permission enregistrée pour {key}")
 
     def register_global_rule(self, rule: FieldPermissionRule):
@@ -178,6 +229,7 @@ class FieldPermissionManager:
             rule: Règle globale à enregistrer
         """
         self._global_rules.append(rule)
+        self._invalidate_rule_index()
         logger.info(f"Règle globale enregistrée pour {rule.field_name}")
 
     def register_graphql_field_config(
@@ -229,6 +281,12 @@ class FieldPermissionManager:
             )
 
         self._graphql_configs.add(model_label)
+        self._invalidate_rule_index()
+
+    def _invalidate_rule_index(self) -> None:
+        """Vide l'index compilé après une modification des règles."""
+        self._rule_index = {}
+        self._static_decisions = {}
 
     def _get_model_lookup_tokens(
         self, instance: Optional[models.Model], model_class: Optional[Type[models.Model]]
@@ -257,10 +315,158 @@ class FieldPermissionManager:
 
         return seen_tokens
 
+    def _get_search_keys(self, lookup_tokens: List[str], field_name: str) -> List[str]:
+        """Retourne les clés de règles à examiner, de la plus précise à la plus large."""
+
+        search_keys: List[str] = []
+        seen: Set[str] = set()
+        for token in lookup_tokens:
+            for suffix in (field_name, "*"):
+                key = f"{token}.{suffix}"
+                if key not in seen:
+                    search_keys.append(key)
+                    seen.add(key)
+        return search_keys
+
+    def _get_compiled_rules(self, context: FieldContext) -> CompiledFieldRules:
+        """
+        Retourne les règles compilées pour le modèle et le champ du contexte.
+
+        L'index est construit paresseusement et reconstruit uniquement après
+        un appel à ``register_*``.
+        """
+        target_class = (
+            context.instance.__class__
+            if context.instance is not None
+            else context.model_class
+        )
+        model_label = target_class._meta.label_lower if target_class else "*"
+        index_key = (model_label, context.field_name)
+
+        compiled = self._rule_index.get(index_key)
+        if compiled is None:
+            compiled = self._compile_rules(index_key, target_class)
+            self._rule_index[index_key] = compiled
+        return compiled
+
+    def _compile_rules(
+        self, index_key: Tuple[str, str], target_class: Optional[Type[models.Model]]
+    ) -> CompiledFieldRules:
+        """Compile les règles candidates pour un couple (modèle, champ)."""
+
+        field_name = index_key[1]
+        lookup_tokens = self._get_model_lookup_tokens(None, target_class)
+
+        field_rules = tuple(
+            rule
+            for key in self._get_search_keys(lookup_tokens, field_name)
+            for rule in self._field_rules.get(key, ())
+            if self._rule_matches_target(rule, lookup_tokens, field_name)
+        )
+        global_rules = tuple(
+            rule
+            for rule in self._global_rules
+            if self._rule_matches_target(rule, lookup_tokens, field_name)
+        )
+        candidates = field_rules + global_rules
+        return CompiledFieldRules(
+            key=index_key,
+            field_rules=field_rules,
+            global_rules=global_rules,
+            has_dynamic_rules=any(rule.condition for rule in candidates),
+            has_permission_rules=any(rule.permissions for rule in candidates),
+        )
+
+    def _get_permission_cache(
+        self, context: FieldContext
+    ) -> Optional["RequestPermissionCache"]:
+        """Retourne le cache de permissions de la requête pour ce contexte."""
+
+        cache = context.permission_cache
+        if cache is None:
+            from .permission_cache import get_permission_cache
+
+            cache = get_permission_cache(user=context.user)
+        if cache is None or not cache.matches(context.user):
+            return None
+        return cache
+
+    def _get_decision_key(
+        self, context: FieldContext, compiled: CompiledFieldRules
+    ) -> Optional[Tuple[str, str, str]]:
+        """
+        Retourne la clé (modèle, champ, opération) d'une décision mémorisable.
+
+        Une décision n'est mémorisable que si aucune règle candidate n'a de
+        condition personnalisée (qui peut dépendre de l'instance).
+        """
+        if compiled.has_dynamic_rules:
+            return None
+        return (*compiled.key, context.operation_type)
+
+    def _get_user_roles(self, context: FieldContext) -> List[str]:
+        """Retourne les rôles de l'utilisateur en passant par le cache de requête."""
+
+        from .rbac import role_manager
+
+        return role_manager.get_user_roles(
+            context.user, self._get_permission_cache(context)
+        )
+
+    def _has_perm(self, context: FieldContext, permission: str) -> bool:
+        """Vérifie une permission Django en passant par le cache de requête."""
+
+        cache = self._get_permission_cache(context)
+        if cache is not None:
+            return cache.has_perm(permission)
+        return context.user.has_perm(permission)
+
+    def _match_rules(
+        self,
+        compiled: CompiledFieldRules,
+        rules_attr: str,
+        context: FieldContext,
+    ) -> Optional[FieldPermissionRule]:
+        """
+        Retourne la première règle applicable parmi ``field_rules`` ou ``global_rules``.
+
+        Pour des règles statiques (rôles uniquement), la décision est mise en
+        cache par ensemble de rôles.
+        """
+        rules = getattr(compiled, rules_attr)
+        if not rules:
+            return None
+
+        if not compiled.is_static:
+            for rule in rules:
+                if self._rule_grants(rule, context):
+                    return rule
+            return None
+
+        user_roles = (
+            frozenset(self._get_user_roles(context))
+            if any(rule.roles for rule in rules)
+            else frozenset()
+        )
+        decision_key = (compiled.key, rules_attr, user_roles)
+        if decision_key not in self._static_decisions:
+            self._static_decisions[decision_key] = next(
+                (
+                    rule
+                    for rule in rules
+                    if not rule.roles or user_roles.intersection(rule.roles)
+                ),
+                None,
+            )
+        return self._static_decisions[decision_key]
+
     def get_field_access_level(self, context: FieldContext) -> FieldAccessLevel:
         """
         Détermine le niveau d'accès pour un champ.
 
+        Les décisions indépendantes de l'instance sont mémorisées dans le cache
+        de permissions de la requête.
+
         Args:
             context: Contexte d'accès au champ
 
@@ -274,31 +480,30 @@ class FieldPermissionManager:
         if context.user.is_superuser:
             return FieldAccessLevel.ADMIN
 
-        # Vérifier les règles spécifiques au champ
-        field_name = context.field_name
-        lookup_tokens = self._get_model_lookup_tokens(
-            context.instance, context.model_class
+        compiled = self._get_compiled_rules(context)
+        cache = self._get_permission_cache(context)
+        decision_key = (
+            self._get_decision_key(context, compiled) if cache is not None else None
         )
+        if decision_key is not None:
+            return cache.memoize(
+                "field_access",
+                decision_key,
+                lambda: self._compute_field_access_level(context, compiled),
+            )
+        return self._compute_field_access_level(context, compiled)
 
-        search_keys: List[str] = []
-        seen: Set[str] = set()
-        for token in lookup_tokens:
-            for suffix in (field_name, "*"):
-                key = f"{token}.{suffix}"
-                if key not in seen:
-                    search_keys.append(key)
-                    seen.add(key)
-
-        for key in search_keys:
-            if key in self._field_rules:
-                for rule in self._field_rules[key]:
-                    if self._rule_applies(rule, context):
-                        return rule.access_level
+    def _compute_field_access_level(
+        self, context: FieldContext, compiled: CompiledFieldRules
+    ) -> FieldAccessLevel:
+        """Calcule le niveau d'accès à partir des règles et des permissions."""
 
-        # Vérifier les règles globales
-        for rule in self._global_rules:
-            if self._rule_applies(rule, context):
-                return rule.access_level
+        # Vérifier les règles spécifiques au champ, puis les règles globales
+        rule = self._match_rules(compiled, "field_rules", context) or self._match_rules(
+            compiled, "global_rules", context
+        )
+        if rule is not None:
+            return rule.access_level
 
         # Accès par défaut basé sur les permissions Django
         target_model = context.model_class
@@ -311,11 +516,11 @@ class FieldPermissionManager:
 
             if context.operation_type in ["create", "update", "delete"]:
                 perm_name = f"{app_label}.change_{model_name_lower}"
-                if context.user.has_perm(perm_name):
+                if self._has_perm(context, perm_name):
                     return FieldAccessLevel.WRITE
 
             perm_name = f"{app_label}.view_{model_name_lower}"
-            if context.user.has_perm(perm_name):
+            if self._has_perm(context, perm_name):
                 return FieldAccessLevel.READ
 
         # Fallback: permettre la lecture si aucune règle spécifique n'existe
@@ -338,33 +543,80 @@ class FieldPermissionManager:
         if access_level == FieldAccessLevel.NONE:
             return FieldVisibility.HIDDEN, None
 
-        # Vérifier les règles spécifiques de visibilité
-        field_name = context.field_name
-        lookup_tokens = self._get_model_lookup_tokens(
-            context.instance, context.model_class
+        compiled = self._get_compiled_rules(context)
+        cache = self._get_permission_cache(context)
+        decision_key = (
+            self._get_decision_key(context, compiled) if cache is not None else None
         )
+        if decision_key is not None:
+            return cache.memoize(
+                "field_visibility",
+                decision_key,
+                lambda: self._compute_field_visibility(context, compiled),
+            )
+        return self._compute_field_visibility(context, compiled)
 
-        search_keys: List[str] = []
-        seen: Set[str] = set()
-        for token in lookup_tokens:
-            for suffix in (field_name, "*"):
-                key = f"{token}.{suffix}"
-                if key not in seen:
-                    search_keys.append(key)
-                    seen.add(key)
+    def _compute_field_visibility(
+        self, context: FieldContext, compiled: CompiledFieldRules
+    ) -> Tuple[FieldVisibility, Any]:
+        """Calcule la visibilité à partir des règles et des champs sensibles."""
 
-        for key in search_keys:
-            if key in self._field_rules:
-                for rule in self._field_rules[key]:
-                    if self._rule_applies(rule, context):
-                        return rule.visibility, rule.mask_value
+        # Vérifier les règles spécifiques de visibilité
+        rule = self._match_rules(compiled, "field_rules", context)
+        if rule is not None:
+            return rule.visibility, rule.mask_value
 
         # Vérifier si c'est un champ sensible
-        if self._is_sensitive_field(field_name):
+        if self._is_sensitive_field(context.field_name):
             return FieldVisibility.MASKED, "***HIDDEN***"
 
         return FieldVisibility.VISIBLE, None
 
+    def compile_mask_plan(
+        self,
+        user: "AbstractUser",
+        model_class: Type[models.Model],
+        permission_cache: Optional["RequestPermissionCache"] = None,
+    ) -> FieldMaskPlan:
+        """
+        Compile le plan de masquage des champs concrets d'un modèle.
+
+        Les champs dont une règle candidate a une condition personnalisée
+        dépendent de l'instance : ils sont placés dans ``dynamic`` et évalués
+        ligne par ligne.
+
+        Args:
+            user: Utilisateur
+            model_class: Classe du modèle
+            permission_cache: Cache de permissions de la requête (optionnel)
+
+        Returns:
+            Plan de masquage
+        """
+        plan = FieldMaskPlan()
+        for model_field in model_class._meta.concrete_fields:
+            name = model_field.name
+            attname = getattr(model_field, "attname", name)
+            context = FieldContext(
+                user=user,
+                field_name=name,
+                operation_type="read",
+                model_class=model_class,
+                permission_cache=permission_cache,
+            )
+            if self._get_compiled_rules(context).has_dynamic_rules:
+                plan.dynamic.append((name, attname))
+                continue
+
+            visibility, mask_value = self.get_field_visibility(context)
+            if visibility == FieldVisibility.HIDDEN:
+                plan.hidden.append((name, attname))
+            elif visibility == FieldVisibility.MASKED:
+                plan.masked.append((name, attname, mask_value))
+            elif visibility == FieldVisibility.REDACTED:
+                plan.redacted.append((name, attname))
+        return plan
+
     def _rule_applies(self, rule: FieldPermissionRule, context: FieldContext) -> bool:
         """
         Vérifie si une règle s'applique au contexte donné.
@@ -376,12 +628,30 @@ class FieldPermissionManager:
         Returns:
             True si la règle s'applique
         """
+        lookup_tokens = self._get_model_lookup_tokens(
+            context.instance, context.model_class
+        )
+        return self._rule_matches_target(
+            rule, lookup_tokens, context.field_name
+        ) and self._rule_grants(rule, context)
+
+    def _rule_matches_target(
+        self, rule: FieldPermissionRule, lookup_tokens: List[str], field_name: str
+    ) -> bool:
+        """
+        Vérifie la partie statique d'une règle : modèle et nom du champ.
+
+        Args:
+            rule: Règle à vérifier
+            lookup_tokens: Identifiants du modèle ciblé
+            field_name: Nom du champ
+
+        Returns:
+            True si la règle cible ce modèle et ce champ
+        """
         # Vérifier le nom du modèle
         if rule.model_name not in ("*", None):
-            identifiers = self._get_model_lookup_tokens(
-                context.instance, context.model_class
-            )
-            if rule.model_name not in identifiers:
+            if rule.model_name not in lookup_tokens:
                 return False
 
         # Vérifier le nom du champ (support des wildcards)
@@ -389,22 +659,33 @@ class FieldPermissionManager:
             if "*" in rule.field_name:
                 # Support des wildcards simples
                 pattern = rule.field_name.replace("*", "")
-                if pattern not in context.field_name:
+                if pattern not in field_name:
                     return False
-            elif rule.field_name != context.field_name:
+            elif rule.field_name != field_name:
                 return False
 
+        return True
+
+    def _rule_grants(self, rule: FieldPermissionRule, context: FieldContext) -> bool:
+        """
+        Vérifie la partie dépendante de l'utilisateur d'une règle.
+
+        Args:
+            rule: Règle à vérifier
+            context: Contexte d'accès
+
+        Returns:
+            True si les rôles, permissions et condition de la règle sont satisfaits
+        """
         # Vérifier les rôles
         if rule.roles:
-            from .rbac import role_manager
-
-            user_roles = role_manager.get_user_roles(context.user)
+            user_roles = self._get_user_roles(context)
             if not any(role in user_roles for role in rule.roles):
                 return False
 
         # Vérifier les permissions
         if rule.permissions:
-            if not any(context.user.has_perm(perm) for perm in rule.permissions):
+            if not any(self._has_perm(context, perm) for perm in rule.permissions):
                 return False
 
         # Vérifier la condition personnalisée
@@ -576,12 +857,15 @@ def field_permission_required(
             if not user or not user.is_authenticated:
                 raise GraphQLError("Authentification requise")
 
+            from .permission_cache import get_permission_cache
+
             context = FieldContext(
                 user=user,
                 instance=instance,
                 field_name=field_name,
                 operation_type="read",
                 model_class=model_class,
+                permission_cache=get_permission_cache(info.context, user),
             )
 
             user_access_level = field_permission_manager.get_field_access_level(context)
@@ -607,11 +891,19 @@ def field_permission_required(
     return decorator
 
 
+def _redact_value(value: Any) -> Any:
+    """Censure partiellement une valeur (garde les premiers et derniers caractères)."""
+    if isinstance(value, str) and len(value) > 4:
+        return value[:2] + "*" * (len(value) - 4) + value[-2:]
+    return "****"
+
+
 def mask_sensitive_fields(
     data: Dict[str, Any],
     user: "AbstractUser",
     model_class: type,
     instance: models.Model = None,
+    permission_cache: Optional["RequestPermissionCache"] = None,
 ) -> Dict[str, Any]:
     """
     Masque les champs sensibles dans un dictionnaire de données.
@@ -621,6 +913,7 @@ def mask_sensitive_fields(
         user: Utilisateur
         model_class: Classe du modèle
         instance: Instance du modèle
+        permission_cache: Cache de permissions de la requête (optionnel)
 
     Returns:
         Données avec champs masqués
@@ -637,6 +930,7 @@ def mask_sensitive_fields(
             field_name=field_name,
             operation_type="read",
             model_class=model_class,
+            permission_cache=permission_cache,
         )
 
         visibility, mask_value = field_permission_manager.get_field_visibility(context)
@@ -646,14 +940,99 @@ def mask_sensitive_fields(
         elif visibility == FieldVisibility.MASKED:
             result[field_name] = mask_value
         elif visibility == FieldVisibility.REDACTED and value:
-            # Censurer partiellement (garder les premiers et derniers caractères)
-            if isinstance(value, str) and len(value) > 4:
-                result[field_name] = value[:2] + "*" * (len(value) - 4) + value[-2:]
-            else:
-                result[field_name] = "****"
+            result[field_name] = _redact_value(value)
 
     return result
 
 
+def get_mask_plan(
+    user: "AbstractUser",
+    model_class: Type[models.Model],
+    permission_cache: Optional["RequestPermissionCache"] = None,
+) -> FieldMaskPlan:
+    """
+    Retourne le plan de masquage d'un modèle, compilé une fois par requête.
+
+    Args:
+        user: Utilisateur
+        model_class: Classe du modèle
+        permission_cache: Cache de permissions de la requête (optionnel)
+
+    Returns:
+        Plan de masquage
+    """
+    if permission_cache is None:
+        return field_permission_manager.compile_mask_plan(user, model_class)
+    return permission_cache.memoize(
+        "mask_plan",
+        model_class._meta.label_lower,
+        lambda: field_permission_manager.compile_mask_plan(
+            user, model_class, permission_cache
+        ),
+    )
+
+
+def apply_mask_plan(
+    plan: FieldMaskPlan,
+    instance: models.Model,
+    user: "AbstractUser",
+    permission_cache: Optional["RequestPermissionCache"] = None,
+) -> models.Model:
+    """
+    Applique un plan de masquage à une instance.
+
+    Seules les colonnes chargées (présentes dans ``instance.__dict__``) sont
+    modifiées ; les colonnes différées et les descripteurs de relations ne
+    sont jamais lus.
+
+    Args:
+        plan: Plan de masquage compilé
+        instance: Instance à masquer
+        user: Utilisateur
+        permission_cache: Cache de permissions de la requête (optionnel)
+
+    Returns:
+        Instance masquée
+    """
+    values = instance.__dict__
+    fields_cache = instance._state.fields_cache
+
+    def _replace(name: str, attname: str, value: Any) -> None:
+        if attname in values:
+            values[attname] = value
+            # Une relation déjà chargée ne doit pas réexposer la valeur
+            fields_cache.pop(name, None)
+
+    for name, attname in plan.hidden:
+        _replace(name, attname, None)
+    for name, attname, mask_value in plan.masked:
+        _replace(name, attname, mask_value)
+    for name, attname in plan.redacted:
+        if values.get(attname):
+            _replace(name, attname, _redact_value(values[attname]))
+
+    for name, attname in plan.dynamic:
+        if attname not in values:
+            continue
+        visibility, mask_value = field_permission_manager.get_field_visibility(
+            FieldContext(
+                user=user,
+                instance=instance,
+                field_name=name,
+                operation_type="read",
+                model_class=instance.__class__,
+                permission_cache=permission_cache,
+            )
+        )
+        if visibility == FieldVisibility.HIDDEN:
+            _replace(name, attname, None)
+        elif visibility == FieldVisibility.MASKED:
+            _replace(name, attname, mask_value)
+        elif visibility == FieldVisibility.REDACTED and values[attname]:
+            _replace(name, attname, _redact_value(values[attname]))
+
+    return instance
+
+
 # Instance globale du gestionnaire de permissions de champs
 field_permission_manager = FieldPermissionManager()
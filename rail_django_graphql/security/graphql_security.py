@@ -11,6 +11,7 @@ Ce module fournit :
 
 import logging
 import time
+import warnings
 from dataclasses import dataclass
 from enum import Enum
 from functools import wraps
@@ -20,12 +21,9 @@ from django.conf import settings
 from django.contrib.auth import get_user_model
 from graphql import (
     DocumentNode,
-    FieldNode,
-    FragmentDefinitionNode,
     GraphQLError,
     GraphQLResolveInfo,
     GraphQLSchema,
-    InlineFragmentNode,
     OperationDefinitionNode,
     ValidationRule,
     validate,
@@ -73,20 +71,23 @@ class SecurityConfig:
     enable_depth_limiting: bool = True
     enable_field_suggestions: bool = False
     rate_limit_per_minute: int = 60
-    complexity_multipliers: Dict[str, float] = None
+    # Obsolète : la complexité provient de l'analyseur de coût partagé
+    complexity_multipliers: Optional[Dict[str, float]] = None
 
     def __post_init__(self):
         """Initialise les valeurs par défaut."""
         if self.introspection_roles is None:
             self.introspection_roles = ['admin', 'developer']
 
-        if self.complexity_multipliers is None:
-            self.complexity_multipliers = {
-                'connection': 2.0,  # Les connexions sont plus coûteuses
-                'mutation': 3.0,    # Les mutations sont plus coûteuses
-                'nested_object': 1.5,  # Les objets imbriqués
-                'list_field': 2.0,  # Les champs de liste
-            }
+        if self.complexity_multipliers is not None:
+            warnings.warn(
+                "SecurityConfig.complexity_multipliers is ignored: query complexity "
+                "is computed by the shared query cost analyzer. Declare costs with "
+                "GraphQLMeta.Cost (type_cost, fields) and size lists with "
+                "PerformanceSettings.default_list_size instead.",
+                DeprecationWarning,
+                stacklevel=3,
+            )
 
 
 class GraphQLSecurityAnalyzer:
@@ -102,21 +103,6 @@ class GraphQLSecurityAnalyzer:
             config: Configuration de sécurité
         """
         self.config = config or SecurityConfig()
-        self._field_costs = {}
-        self._type_costs = {}
-
-        # Coûts par défaut pour certains types de champs
-        self._default_field_costs = {
-            'id': 1,
-            'createdAt': 1,
-            'updatedAt': 1,
-            'name': 1,
-            'title': 1,
-            'description': 2,
-            'content': 3,
-            'email': 2,
-            'phone': 2,
-        }
 
     def analyze_query(self, document: DocumentNode, schema: GraphQLSchema,
                       user=None, variables: Dict = None) -> QueryAnalysisResult:
@@ -148,23 +134,20 @@ class GraphQLSecurityAnalyzer:
             blocked_reasons=[]
         )
 
-        # Analyser chaque opération
-        for definition in document.definitions:
-            if isinstance(definition, OperationDefinitionNode):
-                result.operation_count += 1
-
-                # Analyser le type d'opération
-                if definition.operation.value == 'mutation':
-                    result.has_mutations = True
-
-                # Analyser la sélection
-                self._analyze_selection_set(
-                    definition.selection_set,
-                    schema,
-                    result,
-                    depth=1,
-                    parent_type=schema.query_type if definition.operation.value == 'query' else schema.mutation_type
-                )
+        # Coût, profondeur et nombre de champs : analyseur de coût partagé
+        from ..core.query_cost import get_query_cost_analyzer
+
+        cost = get_query_cost_analyzer().analyze(schema, document, None, variables)
+        result.complexity = cost.complexity
+        result.depth = cost.depth
+        result.field_count = cost.field_count
+        result.has_introspection = cost.has_introspection
+        result.operation_count = cost.operation_count
+        result.has_mutations = any(
+            isinstance(definition, OperationDefinitionNode)
+            and definition.operation.value == 'mutation'
+            for definition in document.definitions
+        )
 
         # Calculer le temps d'exécution estimé
         result.execution_time_estimate = time.time() - start_time
@@ -177,136 +160,6 @@ class GraphQLSecurityAnalyzer:
 
         return result
 
-    def _analyze_selection_set(self, selection_set, schema: GraphQLSchema,
-                               result: QueryAnalysisResult, depth: int,
-                               parent_type=None):
-        """
-        Analyse un ensemble de sélections GraphQL.
-
-        Args:
-            selection_set: Ensemble de sélections à analyser
-            schema: Schéma GraphQL
-            result: Résultat de l'analyse à mettre à jour
-            depth: Profondeur actuelle
-            parent_type: Type parent
-        """
-        if not selection_set or not selection_set.selections:
-            return
-
-        # Mettre à jour la profondeur maximale
-        result.depth = max(result.depth, depth)
-
-        for selection in selection_set.selections:
-            if isinstance(selection, FieldNode):
-                result.field_count += 1
-
-                # Vérifier l'introspection
-                if selection.name.value in ['__schema', '__type', '__typename']:
-                    result.has_introspection = True
-
-                # Calculer la complexité du champ
-                field_complexity = self._calculate_field_complexity(
-                    selection, parent_type, depth
-                )
-                result.complexity += field_complexity
-
-                # Analyser les sous-sélections
-                if selection.selection_set:
-                    field_type = self._get_field_type(selection, parent_type, schema)
-                    self._analyze_selection_set(
-                        selection.selection_set,
-                        schema,
-                        result,
-                        depth + 1,
-                        field_type
-                    )
-
-            elif isinstance(selection, InlineFragmentNode):
-                self._analyze_selection_set(
-                    selection.selection_set,
-                    schema,
-                    result,
-                    depth,
-                    parent_type
-                )
-
-            elif isinstance(selection, FragmentDefinitionNode):
-                self._analyze_selection_set(
-                    selection.selection_set,
-                    schema,
-                    result,
-                    depth,
-                    parent_type
-                )
-
-    def _calculate_field_complexity(self, field: FieldNode, parent_type, depth: int) -> int:
-        """
-        Calcule la complexité d'un champ.
-
-        Args:
-            field: Nœud de champ GraphQL
-            parent_type: Type parent
-            depth: Profondeur du champ
-
-        Returns:
-            Complexité calculée du champ
-        """
-        base_complexity = 1
-        field_name = field.name.value
-
-        # Coût de base du champ
-        if field_name in self._default_field_costs:
-            base_complexity = self._default_field_costs[field_name]
-
-        # Multiplicateurs basés sur le type de champ
-        multiplier = 1.0
-
-        # Champs de connexion (pagination)
-        if 'connection' in field_name.lower() or 'edges' in field_name.lower():
-            multiplier *= self.config.complexity_multipliers.get('connection', 2.0)
-
-        # Champs de liste
-        if field.arguments:
-            for arg in field.arguments:
-                if arg.name.value in ['first', 'last', 'limit']:
-                    # Augmenter la complexité basée sur la taille de la liste
-                    try:
-                        limit_value = int(arg.value.value)
-                        multiplier *= min(limit_value / 10, 10)  # Cap à 10x
-                    except (ValueError, AttributeError):
-                        multiplier *= 2.0
-
-        # Pénalité de profondeur
-        depth_penalty = 1 + (depth * 0.1)
-
-        # Champs imbriqués
-        if field.selection_set:
-            multiplier *= self.config.complexity_multipliers.get('nested_object', 1.5)
-
-        return int(base_complexity * multiplier * depth_penalty)
-
-    def _get_field_type(self, field: FieldNode, parent_type, schema: GraphQLSchema):
-        """
-        Récupère le type d'un champ.
-
-        Args:
-            field: Nœud de champ
-            parent_type: Type parent
-            schema: Schéma GraphQL
-
-        Returns:
-            Type du champ
-        """
-        if not parent_type or not hasattr(parent_type, 'fields'):
-            return None
-
-        field_name = field.name.value
-        if field_name in parent_type.fields:
-            field_def = parent_type.fields[field_name]
-            return field_def.type
-
-        return None
-
     def _calculate_threat_level(self, result: QueryAnalysisResult) -> SecurityThreatLevel:
         """
         Calcule le niveau de menace d'une requête.
@@ -468,14 +321,26 @@ def create_security_middleware(config: SecurityConfig = None):
     Returns:
         Fonction middleware
     """
+    from ..core.query_cost import build_operation_document
+    from ..extensions.rate_limiting import (
+        RateLimitRule,
+        get_client_identifier,
+        get_rate_limit_engine,
+        is_new_operation,
+        rate_limit_error,
+    )
+
+    config = config or SecurityConfig()
     analyzer = GraphQLSecurityAnalyzer(config)
-    # In-memory rate limit state: {user_id: (count, window_start_ts)}
-    rate_limit_state: Dict[int, List[float]] = {}
+    rate_limit_rules = (RateLimitRule("security", config.rate_limit_per_minute, 60),)
 
     def security_middleware(next_middleware, root, info: GraphQLResolveInfo, **args):
         """
         Middleware de sécurité pour GraphQL.
 
+        Les contrôles ne s'exécutent qu'une fois par opération, sur son
+        premier champ racine ; les champs imbriqués passent directement.
+
         Args:
             next_middleware: Middleware suivant
             root: Objet racine
@@ -485,44 +350,35 @@ def create_security_middleware(config: SecurityConfig = None):
         Returns:
             Résultat du middleware suivant
         """
-        # Rate limiting without Django cache (in-memory per-process)
+        if not is_new_operation(info, "security"):
+            return next_middleware(root, info, **args)
+
+        # Limitation de débit partagée (compteurs atomiques du moteur commun)
         user = getattr(info.context, 'user', None)
         if user and user.is_authenticated:
-            now = time.time()
-            # state: [count, window_start_ts]
-            state = rate_limit_state.get(user.id, [0.0, now])
-            count = int(state[0])
-            window_start = float(state[1])
-
-            # Reset window if older than 60s
-            if now - window_start >= 60.0:
-                count = 0
-                window_start = now
-
-            if count >= config.rate_limit_per_minute:
-                raise GraphQLError("Limite de taux dépassée")
-
-            # Increment and store
-            rate_limit_state[user.id] = [float(count + 1), window_start]
-
-        # Analyser la requête si c'est le champ racine
-        if info.path.key == info.operation.selection_set.selections[0].name.value:
-            try:
-                result = analyzer.analyze_query(
-                    info.operation,
-                    info.schema,
-                    user,
-                    info.variable_values
-                )
+            result = get_rate_limit_engine().check(
+                get_client_identifier(info.context), rate_limit_rules
+            )
+            if not result.allowed:
+                raise rate_limit_error(result, "Limite de taux dépassée")
 
-                if result.blocked_reasons:
-                    raise GraphQLError(f"Requête bloquée: {'; '.join(result.blocked_reasons)}")
+        # Analyser la requête
+        try:
+            result = analyzer.analyze_query(
+                build_operation_document(info),
+                info.schema,
+                user,
+                info.variable_values
+            )
+
+            if result.blocked_reasons:
+                raise GraphQLError(f"Requête bloquée: {'; '.join(result.blocked_reasons)}")
 
-                # Ajouter les métriques au contexte
-                info.context.security_analysis = result
+            # Ajouter les métriques au contexte
+            info.context.security_analysis = result
 
-            except Exception as e:
-                logger.error(f"Erreur d'analyse de sécurité: {e}")
+        except Exception as e:
+            logger.error(f"Erreur d'analyse de sécurité: {e}")
 
         return next_middleware(root, info, **args)
 
@@ -558,8 +414,11 @@ def require_introspection_permission(func):
         # Vérifier les permissions d'introspection
         config = getattr(info.context, 'security_config', SecurityConfig())
         if not config.enable_introspection:
+            from .permission_cache import get_permission_cache
             from .rbac import role_manager
-            user_roles = role_manager.get_user_roles(user)
+            user_roles = role_manager.get_user_roles(
+                user, get_permission_cache(info.context, user)
+            )
             if not any(role in config.introspection_roles for role in user_roles):
                 raise GraphQLError("Permission d'introspection requise")
 
@@ -0,0 +1,215 @@
+"""
+Cache des permissions à portée de requête pour Django GraphQL.
+
+Ce module fournit :
+- Un cache attaché au contexte GraphQL (``info.context``)
+- La mémorisation des rôles, des permissions effectives et de ``has_perm``
+- La mémorisation de la hiérarchie des rôles résolue
+- La mémorisation des décisions d'accès ``(modèle, champ, opération)``
+- Une version globale des permissions, incrémentée lorsque les appartenances
+  aux groupes, les permissions des groupes ou les définitions de rôles changent
+
+Le cache vit le temps d'une requête : il est créé paresseusement au premier
+contrôle d'accès et disparaît avec le contexte. Il est également référencé
+par l'objet utilisateur de la requête afin que le code qui ne reçoit que
+l'utilisateur (métadonnées, décorateurs) en profite.
+"""
+
+import logging
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, Optional
+
+from django.core.cache import cache as django_cache
+from django.db.models.signals import m2m_changed, post_delete
+from django.dispatch import receiver
+
+if TYPE_CHECKING:
+    from django.contrib.auth.models import AbstractUser
+
+logger = logging.getLogger(__name__)
+
+CONTEXT_ATTRIBUTE = "_rail_permission_cache"
+USER_ATTRIBUTE = "_rail_permission_cache"
+PERMISSION_VERSION_KEY = "rail_django_graphql:permissions:version"
+
+# Modèles dont les modifications changent les permissions effectives
+_PERMISSION_MODEL_LABELS = {"auth.group", "auth.permission"}
+
+
+class RequestPermissionCache:
+    """
+    Mémorise les résultats de permissions d'un utilisateur pour une requête.
+    """
+
+    def __init__(self, user: "AbstractUser"):
+        """
+        Initialise le cache pour un utilisateur.
+
+        Args:
+            user: Utilisateur de la requête
+        """
+        self.user = user
+        self._store: Dict[str, Dict[Hashable, Any]] = {}
+
+    def matches(self, user: Any) -> bool:
+        """
+        Vérifie que le cache appartient bien à l'utilisateur donné.
+
+        Args:
+            user: Utilisateur à comparer
+
+        Returns:
+            True si le cache peut être utilisé pour cet utilisateur
+        """
+        if user is None:
+            return False
+        if user is self.user:
+            return True
+        user_pk = getattr(user, "pk", None)
+        return user_pk is not None and user_pk == getattr(self.user, "pk", None)
+
+    def memoize(
+        self, namespace: str, key: Hashable, loader: Callable[[], Any]
+    ) -> Any:
+        """
+        Retourne la valeur mémorisée ou la calcule une seule fois.
+
+        Args:
+            namespace: Catégorie de la valeur (rôles, permissions, ...)
+            key: Clé dans la catégorie
+            loader: Fonction calculant la valeur en cas d'absence
+
+        Returns:
+            Valeur mémorisée
+        """
+        bucket = self._store.setdefault(namespace, {})
+        if key not in bucket:
+            bucket[key] = loader()
+        return bucket[key]
+
+    def has_perm(self, permission: str) -> bool:
+        """
+        Version mémorisée de ``user.has_perm``.
+
+        Args:
+            permission: Permission Django (``app_label.codename``)
+
+        Returns:
+            True si l'utilisateur possède la permission
+        """
+        return self.memoize(
+            "has_perm", permission, lambda: bool(self.user.has_perm(permission))
+        )
+
+    def clear(self) -> None:
+        """Vide le cache (après un changement de rôles en cours de requête)."""
+        self._store.clear()
+
+
+def get_permission_cache(
+    context: Any = None, user: Any = None
+) -> Optional[RequestPermissionCache]:
+    """
+    Récupère (ou crée) le cache de permissions de la requête.
+
+    Le cache est attaché au contexte GraphQL. Sans contexte, seul un cache
+    déjà créé pour cette requête et référencé par l'utilisateur est retourné.
+
+    Args:
+        context: Contexte GraphQL (``info.context``)
+        user: Utilisateur (par défaut ``context.user``)
+
+    Returns:
+        Cache de la requête ou None si aucun n'est disponible
+    """
+    if user is None and context is not None:
+        user = getattr(context, "user", None)
+    if user is None:
+        return None
+
+    if context is None:
+        cache = getattr(user, USER_ATTRIBUTE, None)
+        return cache if cache is not None and cache.matches(user) else None
+
+    cache = getattr(context, CONTEXT_ATTRIBUTE, None)
+    if cache is not None and cache.matches(user):
+        return cache
+
+    cache = RequestPermissionCache(user)
+    try:
+        setattr(context, CONTEXT_ATTRIBUTE, cache)
+    except (AttributeError, TypeError):
+        logger.debug("Contexte non modifiable, cache de permissions non attaché")
+        return cache
+
+    if getattr(user, "is_authenticated", False):
+        try:
+            setattr(user, USER_ATTRIBUTE, cache)
+        except (AttributeError, TypeError):
+            pass
+    return cache
+
+
+def get_permission_version() -> int:
+    """
+    Retourne la version globale des permissions.
+
+    Returns:
+        Version courante (partagée entre processus via le cache Django)
+    """
+    version = django_cache.get(PERMISSION_VERSION_KEY)
+    if version is None:
+        django_cache.add(PERMISSION_VERSION_KEY, 1, None)
+        version = django_cache.get(PERMISSION_VERSION_KEY, 1)
+    return version
+
+
+def bump_permission_version() -> int:
+    """
+    Incrémente la version globale des permissions.
+
+    Les caches dérivés des permissions (matrice des modèles, ...) incluent
+    cette version dans leur clé et deviennent ainsi obsolètes.
+
+    Returns:
+        Nouvelle version
+    """
+    get_permission_version()
+    try:
+        return django_cache.incr(PERMISSION_VERSION_KEY)
+    except ValueError:
+        django_cache.set(PERMISSION_VERSION_KEY, 1, None)
+        return 1
+
+
+def is_permission_relation(sender: Any) -> bool:
+    """Vérifie si une table de liaison porte des groupes ou des permissions."""
+    meta = getattr(sender, "_meta", None)
+    if meta is None:
+        return False
+    related_labels = {
+        field.related_model._meta.label_lower
+        for field in meta.get_fields()
+        if hasattr(getattr(field, "related_model", None), "_meta")
+    }
+    return bool(related_labels & _PERMISSION_MODEL_LABELS)
+
+
+@receiver(m2m_changed)
+def invalidate_permissions_on_m2m_change(sender, action, **kwargs):
+    """
+    Incrémente la version des permissions lors d'un changement de groupes.
+
+    Couvre ``user.groups``, ``user.user_permissions`` et ``group.permissions``.
+    """
+    if action in ("post_add", "post_remove", "post_clear") and is_permission_relation(
+        sender
+    ):
+        bump_permission_version()
+
+
+@receiver(post_delete)
+def invalidate_permissions_on_delete(sender, **kwargs):
+    """Incrémente la version des permissions lors de la suppression d'un groupe."""
+    meta = getattr(sender, "_meta", None)
+    if meta is not None and meta.label_lower in _PERMISSION_MODEL_LABELS:
+        bump_permission_version()
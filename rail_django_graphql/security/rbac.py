@@ -20,6 +20,8 @@ from graphql import GraphQLError
 if TYPE_CHECKING:
     from django.contrib.auth.models import AbstractUser, Group
 
+    from .permission_cache import RequestPermissionCache
+
 
 def _get_group_model():
     """Lazy import to avoid AppRegistryNotReady during Django setup."""
@@ -151,6 +153,10 @@ class RoleManager:
         if role_definition.parent_roles:
             self._role_hierarchy[role_definition.name] = role_definition.parent_roles
 
+        from .permission_cache import bump_permission_version
+
+        bump_permission_version()
+
         logger.info(f"Rôle '{role_definition.name}' enregistré")
 
     def register_default_model_roles(self, model_class: Type[models.Model]):
@@ -221,18 +227,61 @@ class RoleManager:
 
         return self._roles_cache.get(role_name)
 
-    def get_user_roles(self, user: "AbstractUser") -> List[str]:
+    def get_user_roles(self, user: "AbstractUser",
+                       cache: "RequestPermissionCache" = None) -> List[str]:
         """
         Récupère les rôles d'un utilisateur.
 
         Args:
             user: Utilisateur
+            cache: Cache de permissions de la requête (optionnel)
 
         Returns:
             Liste des noms de rôles
         """
-        # Retrieve roles directly from Django groups
-        roles = list(user.groups.values_list('name', flat=True))
+        cache = self._resolve_cache(user, cache)
+        if cache is not None:
+            return list(
+                cache.memoize("roles", None, lambda: self._load_user_roles(user))
+            )
+        return self._load_user_roles(user)
+
+    def _resolve_cache(self, user: "AbstractUser",
+                       cache: "RequestPermissionCache" = None
+                       ) -> Optional["RequestPermissionCache"]:
+        """
+        Retourne le cache de requête utilisable pour cet utilisateur.
+
+        Args:
+            user: Utilisateur
+            cache: Cache fourni explicitement
+
+        Returns:
+            Cache de la requête ou None
+        """
+        if cache is not None:
+            return cache if cache.matches(user) else None
+
+        from .permission_cache import get_permission_cache
+
+        return get_permission_cache(user=user)
+
+    def _load_user_roles(self, user: "AbstractUser") -> List[str]:
+        """
+        Charge les rôles d'un utilisateur depuis la base de données.
+
+        Args:
+            user: Utilisateur
+
+        Returns:
+            Liste des noms de rôles
+        """
+        # Retrieve roles directly from Django groups (prefetched when available)
+        prefetched = getattr(user, '_prefetched_objects_cache', {}).get('groups')
+        if prefetched is not None:
+            roles = [group.name for group in prefetched]
+        else:
+            roles = list(user.groups.values_list('name', flat=True))
 
         # Add system roles if applicable
         if user.is_superuser:
@@ -243,19 +292,44 @@ class RoleManager:
         return roles
 
     def get_effective_permissions(self, user: "AbstractUser",
-                                  context: PermissionContext = None) -> Set[str]:
+                                  context: PermissionContext = None,
+                                  cache: "RequestPermissionCache" = None) -> Set[str]:
         """
         Récupère les permissions effectives d'un utilisateur.
 
         Args:
             user: Utilisateur
             context: Contexte de la permission
+            cache: Cache de permissions de la requête (optionnel)
+
+        Returns:
+            Ensemble des permissions effectives
+        """
+        cache = self._resolve_cache(user, cache)
+        if cache is not None:
+            return set(
+                cache.memoize(
+                    "effective_permissions",
+                    None,
+                    lambda: frozenset(self._load_effective_permissions(user, cache)),
+                )
+            )
+        return self._load_effective_permissions(user)
+
+    def _load_effective_permissions(self, user: "AbstractUser",
+                                    cache: "RequestPermissionCache" = None) -> Set[str]:
+        """
+        Calcule les permissions effectives (rôles, héritage et Django).
+
+        Args:
+            user: Utilisateur
+            cache: Cache de permissions de la requête (optionnel)
 
         Returns:
             Ensemble des permissions effectives
         """
         permissions = set()
-        user_roles = self.get_user_roles(user)
+        user_roles = self.get_user_roles(user, cache)
 
         for role_name in user_roles:
             role_def = self.get_role_definition(role_name)
@@ -263,7 +337,7 @@ class RoleManager:
                 permissions.update(role_def.permissions)
 
                 # Add parent role permissions
-                parent_permissions = self._get_inherited_permissions(role_name)
+                parent_permissions = self._get_inherited_permissions(role_name, cache)
                 permissions.update(parent_permissions)
 
         # Native Django permissions
@@ -272,16 +346,27 @@ class RoleManager:
 
         return permissions
 
-    def _get_inherited_permissions(self, role_name: str) -> Set[str]:
+    def _get_inherited_permissions(self, role_name: str,
+                                   cache: "RequestPermissionCache" = None) -> Set[str]:
         """
         Récupère les permissions héritées des rôles parents.
 
         Args:
             role_name: Nom du rôle
+            cache: Cache de permissions de la requête (optionnel)
 
         Returns:
             Ensemble des permissions héritées
         """
+        if cache is not None:
+            return set(
+                cache.memoize(
+                    "inherited_permissions",
+                    role_name,
+                    lambda: frozenset(self._get_inherited_permissions(role_name)),
+                )
+            )
+
         permissions = set()
 
         if role_name in self._role_hierarchy:
@@ -295,7 +380,8 @@ class RoleManager:
         return permissions
 
     def has_permission(self, user: "AbstractUser", permission: str,
-                       context: PermissionContext = None) -> bool:
+                       context: PermissionContext = None,
+                       cache: "RequestPermissionCache" = None) -> bool:
         """
         Vérifie si un utilisateur a une permission spécifique.
 
@@ -303,6 +389,7 @@ class RoleManager:
             user: Utilisateur
             permission: Permission à vérifier
             context: Contexte de la permission
+            cache: Cache de permissions de la requête (optionnel)
 
         Returns:
             True si l'utilisateur a la permission
@@ -314,7 +401,7 @@ class RoleManager:
         if user.is_superuser:
             return True
 
-        effective_permissions = self.get_effective_permissions(user, context)
+        effective_permissions = self.get_effective_permissions(user, context, cache)
 
         # Vérifier la permission exacte
         if permission in effective_permissions:
@@ -447,8 +534,7 @@ class RoleManager:
         # Créer le groupe Django si nécessaire
         group, created = group_model.objects.get_or_create(name=role_name)
         user.groups.add(group)
-
-        # Cache removed: no invalidation needed
+        self._invalidate_user_cache(user)
 
         logger.info(f"Rôle '{role_name}' assigné à l'utilisateur {user.username}")
 
@@ -465,13 +551,23 @@ class RoleManager:
         try:
             group = group_model.objects.get(name=role_name)
             user.groups.remove(group)
-
-            # Cache removed: no invalidation needed
+            self._invalidate_user_cache(user)
 
             logger.info(f"Rôle '{role_name}' retiré de l'utilisateur {user.username}")
         except group_model.DoesNotExist:
             logger.warning(f"Groupe '{role_name}' non trouvé")
 
+    def _invalidate_user_cache(self, user: "AbstractUser"):
+        """
+        Vide le cache de requête de l'utilisateur après un changement de rôles.
+
+        Args:
+            user: Utilisateur
+        """
+        cache = self._resolve_cache(user)
+        if cache is not None:
+            cache.clear()
+
 
 def require_role(required_roles: Union[str, List[str]]):
     """
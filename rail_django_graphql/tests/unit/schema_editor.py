@@ -0,0 +1,37 @@
+"""
+Classe de base des tests unitaires utilisant des modèles de test.
+
+Les modèles déclarés dans les modules de test (app_label "tests") n'ont pas
+de migration : leurs tables sont créées avec le schema_editor avant la
+transaction de la classe de test et supprimées après sa fermeture.
+"""
+
+from typing import Sequence, Type
+
+from django.db import connection, models
+from django.test import TestCase
+
+
+class SchemaEditorTestCase(TestCase):
+    """
+    TestCase créant les tables des modèles de TEST_MODELS.
+
+    Les tables sont créées dans l'ordre de TEST_MODELS (modèles référencés
+    en premier) et supprimées dans l'ordre inverse.
+    """
+
+    TEST_MODELS: Sequence[Type[models.Model]] = ()
+
+    @classmethod
+    def setUpClass(cls):
+        with connection.schema_editor() as editor:
+            for model in cls.TEST_MODELS:
+                editor.create_model(model)
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        with connection.schema_editor() as editor:
+            for model in reversed(cls.TEST_MODELS):
+                editor.delete_model(model)
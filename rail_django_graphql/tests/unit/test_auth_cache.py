@@ -0,0 +1,78 @@
+"""
+Tests unitaires pour le cache partagé d'authentification JWT.
+
+Ce module vérifie que les tokens vérifiés sont mémorisés jusqu'à leur
+expiration, que l'utilisateur est chargé une seule fois avec ses groupes et
+ses permissions, que chaque requête reçoit sa propre copie et que les
+modifications de l'utilisateur ou de ses groupes invalident le cache.
+"""
+
+from unittest import mock
+
+from django.contrib.auth.models import Group, User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from rail_django_graphql.extensions import auth_cache
+from rail_django_graphql.extensions.auth import JWTManager, get_user_from_token
+from rail_django_graphql.security.rbac import role_manager
+
+
+class TestAuthCache(TestCase):
+    """Tests pour le cache des claims JWT et des utilisateurs."""
+
+    def setUp(self):
+        auth_cache.clear_auth_caches()
+        self.addCleanup(auth_cache.clear_auth_caches)
+        self.user = User.objects.create_user(username="agent")
+        self.user.groups.add(Group.objects.create(name="exploitation"))
+        self.token = JWTManager.generate_token(self.user)["token"]
+
+    def test_token_is_decoded_once(self):
+        """Test la vérification unique d'un token valide."""
+        with mock.patch.object(
+            JWTManager, "verify_token", wraps=JWTManager.verify_token
+        ) as verify:
+            for _ in range(3):
+                claims = auth_cache.get_token_claims(self.token)
+        self.assertEqual(verify.call_count, 1)
+        self.assertEqual(claims["user_id"], self.user.pk)
+        self.assertIsNone(auth_cache.get_token_claims("invalide"))
+
+    def test_expired_entries_are_not_served(self):
+        """Test qu'une entrée n'est plus servie après l'expiration du token."""
+        claims = auth_cache.get_token_claims(self.token)
+        with mock.patch.object(auth_cache.time, "time", return_value=claims["exp"]):
+            with mock.patch.object(
+                JWTManager, "verify_token", return_value=None
+            ) as verify:
+                self.assertIsNone(auth_cache.get_token_claims(self.token))
+        self.assertEqual(verify.call_count, 1)
+
+    def test_user_is_loaded_once_with_groups(self):
+        """Test le chargement unique de l'utilisateur, de ses groupes et permissions."""
+        get_user_from_token(self.token)
+        with CaptureQueriesContext(connection) as ctx:
+            first = get_user_from_token(self.token)
+            second = auth_cache.authenticate_token(self.token)
+            roles = role_manager.get_user_roles(first)
+            first.has_perm("auth.view_group")
+        self.assertEqual(len(ctx.captured_queries), 0)
+        self.assertEqual(roles, ["exploitation"])
+        self.assertIsNot(first, second)
+        self.assertEqual(first.pk, second.pk)
+
+    def test_changes_invalidate_cached_user(self):
+        """Test l'invalidation par post_save et par changement de groupes."""
+        auth_cache.authenticate_token(self.token)
+
+        self.user.groups.add(Group.objects.create(name="maintenance"))
+        user = auth_cache.authenticate_token(self.token)
+        self.assertEqual(
+            sorted(role_manager.get_user_roles(user)), ["exploitation", "maintenance"]
+        )
+
+        self.user.is_active = False
+        self.user.save()
+        self.assertIsNone(auth_cache.authenticate_token(self.token))
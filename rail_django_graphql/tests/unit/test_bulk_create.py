@@ -0,0 +1,232 @@
+"""
+Tests unitaires pour la création en masse.
+
+Ce module vérifie que la mutation de création en masse valide toutes les
+lignes avant d'écrire, rapporte les erreurs par index, insère les lignes par
+lots avec bulk_create, affecte les relations many-to-many en une seconde
+passe groupée, prend en charge le mode ignore_conflicts et les backends qui
+ne renvoient pas les clés primaires d'une insertion groupée.
+"""
+
+from types import SimpleNamespace
+from unittest import mock
+
+from django.db import connection, models
+from django.test.utils import CaptureQueriesContext
+
+from rail_django_graphql.core.settings import MutationGeneratorSettings
+from rail_django_graphql.generators.bulk_operations import BulkOperationHandler
+from rail_django_graphql.generators.mutations import MutationGenerator
+from rail_django_graphql.generators.types import TypeGenerator
+from rail_django_graphql.tests.unit.schema_editor import SchemaEditorTestCase
+
+
+class BulkTestTag(models.Model):
+    """Étiquette affectée aux produits."""
+
+    nom = models.CharField(max_length=50)
+
+    class Meta:
+        app_label = "tests"
+
+
+class BulkTestCategory(models.Model):
+    """Catégorie référencée par clé étrangère."""
+
+    nom = models.CharField(max_length=50)
+
+    class Meta:
+        app_label = "tests"
+
+
+class BulkTestProduct(models.Model):
+    """Produit créé en masse."""
+
+    reference = models.CharField(max_length=20, unique=True)
+    prix = models.IntegerField()
+    categorie = models.ForeignKey(BulkTestCategory, on_delete=models.CASCADE)
+    tags = models.ManyToManyField(BulkTestTag, blank=True)
+
+    class Meta:
+        app_label = "tests"
+
+
+def make_info():
+    """Construit un objet info minimal pour une mutation."""
+    return SimpleNamespace(context=SimpleNamespace(user=None))
+
+
+class TestBulkCreate(SchemaEditorTestCase):
+    """Tests pour la validation et l'insertion groupées des créations en masse."""
+
+    TEST_MODELS = [BulkTestTag, BulkTestCategory, BulkTestProduct]
+
+    def setUp(self):
+        self.category = BulkTestCategory.objects.create(nom="Outils")
+        self.tags = [BulkTestTag.objects.create(nom=f"t{i}") for i in range(3)]
+        self.handler = BulkOperationHandler(batch_size=2)
+
+    def rows(self, count, **overrides):
+        """Construit des lignes valides de produits."""
+        return [
+            {
+                "reference": f"REF-{index}",
+                "prix": index,
+                "categorie": self.category.pk,
+                **overrides,
+            }
+            for index in range(count)
+        ]
+
+    def test_rows_are_inserted_in_batches(self):
+        """Test l'insertion par lots avec un nombre de requêtes borné."""
+        with CaptureQueriesContext(connection) as ctx:
+            created, errors = self.handler.bulk_create(BulkTestProduct, self.rows(5))
+
+        self.assertEqual(errors, {})
+        self.assertEqual(len(created), 5)
+        self.assertEqual(BulkTestProduct.objects.count(), 5)
+        inserts = [q for q in ctx.captured_queries if q["sql"].startswith("INSERT")]
+        self.assertEqual(len(inserts), 3)
+        # Clés étrangères (1 requête), unicité (3 lots de 2 valeurs), 3 INSERT
+        self.assertEqual(len(ctx.captured_queries), 7)
+
+    def test_errors_are_reported_per_index(self):
+        """Test les erreurs par ligne sans aucune écriture partielle."""
+        rows = self.rows(4)
+        rows[1]["prix"] = "abc"
+        rows[2]["categorie"] = 9999
+        rows[3]["reference"] = "REF-0"
+
+        created, errors = self.handler.bulk_create(BulkTestProduct, rows)
+
+        self.assertEqual(created, [])
+        self.assertEqual(sorted(errors), [1, 2, 3])
+        self.assertIn("prix", errors[1].message_dict)
+        self.assertIn("categorie", errors[2].message_dict)
+        self.assertIn("reference", errors[3].message_dict)
+        self.assertEqual(BulkTestProduct.objects.count(), 0)
+
+    def test_existing_unique_value_is_rejected(self):
+        """Test le rejet d'une valeur unique déjà présente en base."""
+        BulkTestProduct.objects.create(
+            reference="REF-1", prix=1, categorie=self.category
+        )
+        _, errors = self.handler.bulk_create(BulkTestProduct, self.rows(3))
+        self.assertEqual(list(errors), [1])
+
+    def test_many_to_many_second_pass(self):
+        """Test l'affectation des many-to-many par une insertion groupée."""
+        rows = self.rows(3)
+        rows[0]["tags"] = [self.tags[0].pk, self.tags[1].pk, self.tags[0].pk]
+        rows[2]["tags"] = [self.tags[2].pk]
+
+        with CaptureQueriesContext(connection) as ctx:
+            created, errors = self.handler.bulk_create(BulkTestProduct, rows)
+
+        self.assertEqual(errors, {})
+        through = BulkTestProduct.tags.through._meta.db_table
+        through_inserts = [
+            q
+            for q in ctx.captured_queries
+            if q["sql"].startswith("INSERT") and through in q["sql"]
+        ]
+        self.assertEqual(len(through_inserts), 2)
+        self.assertEqual(
+            sorted(tag.nom for tag in created[0].tags.all()), ["t0", "t1"]
+        )
+        self.assertEqual([tag.nom for tag in created[2].tags.all()], ["t2"])
+
+        rows = self.rows(1, reference="REF-X", tags=[9999])
+        _, errors = self.handler.bulk_create(BulkTestProduct, rows)
+        self.assertIn("tags", errors[0].message_dict)
+
+    def test_ignore_conflicts(self):
+        """Test le mode ignore_conflicts sur une valeur unique existante."""
+        BulkTestProduct.objects.create(
+            reference="REF-0", prix=0, categorie=self.category
+        )
+        _, errors = self.handler.bulk_create(
+            BulkTestProduct, self.rows(3), ignore_conflicts=True
+        )
+        self.assertEqual(errors, {})
+        self.assertEqual(BulkTestProduct.objects.count(), 3)
+
+    def test_backend_without_returned_primary_keys(self):
+        """Test les clés primaires sur un backend de type MySQL."""
+        BulkTestProduct.objects.create(
+            reference="REF-0", prix=0, categorie=self.category
+        )
+        table = BulkTestProduct._meta.db_table
+        without_returning = mock.patch.object(
+            type(connection.features),
+            "can_return_rows_from_bulk_insert",
+            new_callable=mock.PropertyMock,
+            return_value=False,
+        )
+
+        # Sans mode de conflit: enregistrement ligne par ligne
+        rows = self.rows(2, tags=[self.tags[1].pk])
+        for index, row in enumerate(rows):
+            row["reference"] = f"NEW-{index}"
+        with without_returning, CaptureQueriesContext(connection) as ctx:
+            created, errors = self.handler.bulk_create(BulkTestProduct, rows)
+        self.assertEqual(errors, {})
+        inserts = [
+            q
+            for q in ctx.captured_queries
+            if q["sql"].startswith("INSERT") and f'"{table}"' in q["sql"]
+        ]
+        self.assertEqual(len(inserts), 2)
+        expected = dict(BulkTestProduct.objects.values_list("reference", "pk"))
+        self.assertEqual(
+            [product.pk for product in created], [expected["NEW-0"], expected["NEW-1"]]
+        )
+        self.assertEqual([tag.nom for tag in created[1].tags.all()], ["t1"])
+
+        # update_conflicts: une insertion groupée puis clés relues par "reference"
+        rows = self.rows(2, tags=[self.tags[0].pk])
+        with without_returning, CaptureQueriesContext(connection) as ctx:
+            created, errors = self.handler.bulk_create(
+                BulkTestProduct,
+                rows,
+                update_conflicts=True,
+                update_fields=["prix"],
+                unique_fields=["reference"],
+            )
+        self.assertEqual(errors, {})
+        read_back = [
+            q
+            for q in ctx.captured_queries
+            if q["sql"].startswith("SELECT")
+            and f'"{table}"' in q["sql"]
+            and '"reference"' in q["sql"]
+        ]
+        self.assertEqual(len(read_back), 1)
+        expected = dict(BulkTestProduct.objects.values_list("reference", "pk"))
+        self.assertEqual(
+            [product.pk for product in created], [expected["REF-0"], expected["REF-1"]]
+        )
+        self.assertEqual([tag.nom for tag in created[1].tags.all()], ["t0"])
+
+    def test_mutation_reports_indexed_errors(self):
+        """Test la mutation GraphQL et le chemin des erreurs par ligne."""
+        generator = MutationGenerator(
+            TypeGenerator(), MutationGeneratorSettings(bulk_batch_size=2)
+        )
+        mutation = generator.generate_bulk_create_mutation(BulkTestProduct)
+
+        result = mutation.mutate(None, make_info(), inputs=self.rows(3))
+        self.assertTrue(result.ok, result.errors)
+        self.assertEqual(len(result.objects), 3)
+
+        rows = self.rows(2, prix="abc")
+        rows[0]["reference"] = "NEW-0"
+        rows[1]["reference"] = "NEW-1"
+        result = mutation.mutate(None, make_info(), inputs=rows)
+        self.assertFalse(result.ok)
+        self.assertEqual(
+            sorted(error.field for error in result.errors),
+            ["inputs.0.prix", "inputs.1.prix"],
+        )
+        self.assertEqual(BulkTestProduct.objects.count(), 3)
@@ -0,0 +1,150 @@
+"""
+Tests unitaires pour la suppression en masse.
+
+Ce module vérifie que la mutation de suppression en masse contrôle et
+supprime les cibles par lots de clés primaires, que le mode
+returnObjects=false ne lit que les clés primaires et retourne les compteurs
+par modèle du collecteur, et qu'aucune ligne n'est supprimée si un identifiant
+est introuvable.
+"""
+
+from types import SimpleNamespace
+
+from django.db import connection, models
+from django.test.utils import CaptureQueriesContext
+
+from rail_django_graphql.core.meta import GraphQLMeta
+from rail_django_graphql.core.settings import MutationGeneratorSettings
+from rail_django_graphql.generators.mutations import MutationGenerator
+from rail_django_graphql.generators.types import TypeGenerator
+from rail_django_graphql.tests.unit.schema_editor import SchemaEditorTestCase
+
+
+def not_locked(instance=None, **kwargs):
+    """Condition de garde: les dossiers verrouillés ne sont pas supprimables."""
+    return instance is None or not instance.verrouille
+
+
+class BulkDeleteTestFolder(models.Model):
+    """Dossier supprimé en masse."""
+
+    nom = models.CharField(max_length=50)
+    verrouille = models.BooleanField(default=False)
+
+    class Meta:
+        app_label = "tests"
+
+
+class BulkDeleteTestDocument(models.Model):
+    """Document supprimé en cascade avec son dossier."""
+
+    dossier = models.ForeignKey(BulkDeleteTestFolder, on_delete=models.CASCADE)
+
+    class Meta:
+        app_label = "tests"
+
+
+class GuardedDeleteTestFolder(models.Model):
+    """Dossier dont la suppression dépend d'une condition."""
+
+    verrouille = models.BooleanField(default=False)
+
+    class Meta:
+        app_label = "tests"
+
+    class GraphQLMeta(GraphQLMeta):
+        access = {
+            "operations": {
+                "bulk_delete": {"condition": not_locked, "require_authentication": False}
+            }
+        }
+
+
+def make_info():
+    """Construit un objet info minimal pour une mutation."""
+    return SimpleNamespace(context=SimpleNamespace(user=None))
+
+
+class TestBulkDelete(SchemaEditorTestCase):
+    """Tests pour la suppression par lots et le mode sans retour d'objets."""
+
+    TEST_MODELS = [
+        BulkDeleteTestFolder,
+        BulkDeleteTestDocument,
+        GuardedDeleteTestFolder,
+    ]
+
+    def setUp(self):
+        self.folders = [
+            BulkDeleteTestFolder.objects.create(nom=f"d{i}") for i in range(5)
+        ]
+        for folder in self.folders:
+            BulkDeleteTestDocument.objects.create(dossier=folder)
+            BulkDeleteTestDocument.objects.create(dossier=folder)
+        generator = MutationGenerator(
+            TypeGenerator(), MutationGeneratorSettings(bulk_batch_size=2)
+        )
+        self.generator = generator
+        self.mutation = generator.generate_bulk_delete_mutation(BulkDeleteTestFolder)
+
+    def ids(self):
+        return [str(folder.pk) for folder in self.folders]
+
+    def test_counts_without_returning_objects(self):
+        """Test le mode returnObjects=false et les compteurs par modèle."""
+        with CaptureQueriesContext(connection) as ctx:
+            result = self.mutation.mutate(
+                None, make_info(), ids=self.ids(), return_objects=False
+            )
+
+        self.assertTrue(result.ok, result.errors)
+        self.assertIsNone(result.objects)
+        self.assertEqual(result.deleted_count, 15)
+        self.assertEqual(
+            [(count.model, count.count) for count in result.deleted_counts],
+            [("tests.BulkDeleteTestDocument", 10), ("tests.BulkDeleteTestFolder", 5)],
+        )
+        self.assertFalse(BulkDeleteTestDocument.objects.exists())
+        # Le contrôle des identifiants ne lit que les clés primaires, par lots
+        sql = [query["sql"] for query in ctx.captured_queries]
+        first_delete = next(i for i, q in enumerate(sql) if q.startswith("DELETE"))
+        checks = [q for q in sql[:first_delete] if q.startswith("SELECT")]
+        self.assertEqual(len(checks), 5)
+        self.assertTrue(all('"nom"' not in q for q in checks[:3]))
+        self.assertEqual(len([q for q in sql if q.startswith("DELETE")]), 6)
+
+    def test_objects_are_returned_by_default(self):
+        """Test le retour des objets supprimés par défaut."""
+        result = self.mutation.mutate(None, make_info(), ids=self.ids()[:3])
+        self.assertTrue(result.ok, result.errors)
+        self.assertEqual(
+            sorted(folder.nom for folder in result.objects), ["d0", "d1", "d2"]
+        )
+        self.assertEqual(BulkDeleteTestFolder.objects.count(), 2)
+
+    def test_missing_id_deletes_nothing(self):
+        """Test qu'un identifiant introuvable annule toute la suppression."""
+        result = self.mutation.mutate(
+            None, make_info(), ids=[*self.ids(), "9999", "abc"], return_objects=False
+        )
+        self.assertFalse(result.ok)
+        self.assertIn("9999", result.errors[0].message)
+        self.assertIn("abc", result.errors[0].message)
+        self.assertEqual(BulkDeleteTestFolder.objects.count(), 5)
+
+    def test_guard_condition_is_checked_per_chunk(self):
+        """Test la condition de garde évaluée sur chaque lot d'instances."""
+        folders = [GuardedDeleteTestFolder.objects.create() for _ in range(3)]
+        folders.append(GuardedDeleteTestFolder.objects.create(verrouille=True))
+        mutation = self.generator.generate_bulk_delete_mutation(
+            GuardedDeleteTestFolder
+        )
+        ids = [str(folder.pk) for folder in folders]
+
+        result = mutation.mutate(None, make_info(), ids=ids, return_objects=False)
+        self.assertFalse(result.ok)
+        self.assertEqual(GuardedDeleteTestFolder.objects.count(), 4)
+
+        result = mutation.mutate(None, make_info(), ids=ids[:3], return_objects=False)
+        self.assertTrue(result.ok, result.errors)
+        self.assertEqual(result.deleted_count, 3)
@@ -0,0 +1,181 @@
+"""
+Tests unitaires pour la mise à jour en masse.
+
+Ce module vérifie que la mutation de mise à jour en masse charge les cibles
+en une seule requête, valide les changements en mémoire avec des erreurs par
+index, écrit les lignes avec bulk_update sur l'union des champs modifiés et
+n'évalue les rôles de l'utilisateur qu'une seule fois.
+"""
+
+from datetime import timedelta
+from types import SimpleNamespace
+
+from django.contrib.auth.models import Group, User
+from django.db import connection, models
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from rail_django_graphql.core.meta import GraphQLMeta
+from rail_django_graphql.core.settings import MutationGeneratorSettings
+from rail_django_graphql.generators.bulk_operations import BulkOperationHandler
+from rail_django_graphql.generators.mutations import MutationGenerator
+from rail_django_graphql.generators.types import TypeGenerator
+from rail_django_graphql.tests.unit.schema_editor import SchemaEditorTestCase
+
+
+def not_archived(user=None, instance=None, **kwargs):
+    """Condition de garde: les articles archivés ne sont pas modifiables."""
+    return instance is None or not instance.archive
+
+
+class BulkUpdateTestTag(models.Model):
+    """Étiquette affectée aux articles."""
+
+    nom = models.CharField(max_length=50)
+
+    class Meta:
+        app_label = "tests"
+
+
+class BulkUpdateTestItem(models.Model):
+    """Article mis à jour en masse."""
+
+    code = models.CharField(max_length=20, unique=True)
+    quantite = models.IntegerField()
+    archive = models.BooleanField(default=False)
+    tags = models.ManyToManyField(BulkUpdateTestTag, blank=True)
+    modifie_le = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        app_label = "tests"
+
+    class GraphQLMeta(GraphQLMeta):
+        access = {
+            "operations": {
+                "bulk_update": {
+                    "roles": ["magasinier"],
+                    "condition": not_archived,
+                    "match": "all",
+                }
+            }
+        }
+
+
+class TestBulkUpdate(SchemaEditorTestCase):
+    """Tests pour le chargement, la validation et l'écriture groupés."""
+
+    TEST_MODELS = [BulkUpdateTestTag, BulkUpdateTestItem]
+
+    def setUp(self):
+        self.items = [
+            BulkUpdateTestItem.objects.create(code=f"A{i}", quantite=i)
+            for i in range(5)
+        ]
+        self.tags = [BulkUpdateTestTag.objects.create(nom=f"t{i}") for i in range(2)]
+        self.handler = BulkOperationHandler(batch_size=2)
+
+    def test_single_fetch_and_batched_writes(self):
+        """Test un seul chargement et des UPDATE groupés par lots."""
+        updates = [(item.pk, {"quantite": item.quantite + 10}) for item in self.items]
+        updates[0][1]["code"] = "B0"
+
+        with CaptureQueriesContext(connection) as ctx:
+            updated, errors = self.handler.bulk_update(BulkUpdateTestItem, updates)
+
+        self.assertEqual(errors, {})
+        self.assertEqual([item.quantite for item in updated], [10, 11, 12, 13, 14])
+        selects = [q for q in ctx.captured_queries if q["sql"].startswith("SELECT")]
+        updates_sql = [q for q in ctx.captured_queries if q["sql"].startswith("UPDATE")]
+        # Chargement des cibles et contrôle d'unicité de "code"
+        self.assertEqual(len(selects), 2)
+        self.assertEqual(len(updates_sql), 3)
+        self.assertIn('"code"', updates_sql[0]["sql"])
+        self.assertEqual(
+            BulkUpdateTestItem.objects.get(pk=self.items[0].pk).code, "B0"
+        )
+
+    def test_errors_are_reported_per_index(self):
+        """Test les erreurs par ligne sans aucune écriture partielle."""
+        updates = [
+            (self.items[0].pk, {"quantite": 100}),
+            (9999, {"quantite": 1}),
+            (self.items[2].pk, {"quantite": "abc"}),
+            (self.items[3].pk, {"code": "A4"}),
+            (self.items[0].pk, {"quantite": 5}),
+        ]
+        updated, errors = self.handler.bulk_update(BulkUpdateTestItem, updates)
+
+        self.assertEqual(updated, [])
+        self.assertEqual(list(errors), [1, 2, 3, 4])
+        self.assertIn("id", errors[1].message_dict)
+        self.assertIn("quantite", errors[2].message_dict)
+        self.assertIn("code", errors[3].message_dict)
+        self.assertIn("id", errors[4].message_dict)
+        self.assertEqual(BulkUpdateTestItem.objects.get(pk=self.items[0].pk).quantite, 0)
+
+    def test_unique_value_can_be_kept(self):
+        """Test qu'une ligne peut conserver sa propre valeur unique."""
+        _, errors = self.handler.bulk_update(
+            BulkUpdateTestItem, [(self.items[1].pk, {"code": "A1", "quantite": 7})]
+        )
+        self.assertEqual(errors, {})
+
+    def test_auto_now_fields_are_refreshed(self):
+        """Test la mise à jour des champs auto_now comme avec save()."""
+        ancienne = timezone.now() - timedelta(days=1)
+        BulkUpdateTestItem.objects.update(modifie_le=ancienne)
+        _, errors = self.handler.bulk_update(
+            BulkUpdateTestItem, [(self.items[0].pk, {"quantite": 42})]
+        )
+        self.assertEqual(errors, {})
+        self.assertGreater(
+            BulkUpdateTestItem.objects.get(pk=self.items[0].pk).modifie_le, ancienne
+        )
+        self.assertEqual(
+            BulkUpdateTestItem.objects.get(pk=self.items[1].pk).modifie_le, ancienne
+        )
+
+    def test_many_to_many_values_replace_relations(self):
+        """Test le remplacement des relations many-to-many."""
+        item = self.items[0]
+        item.tags.add(self.tags[0])
+        _, errors = self.handler.bulk_update(
+            BulkUpdateTestItem,
+            [(item.pk, {"tags": [self.tags[1].pk]}), (self.items[1].pk, {"tags": []})],
+        )
+        self.assertEqual(errors, {})
+        self.assertEqual([tag.nom for tag in item.tags.all()], ["t1"])
+
+    def test_mutation_checks_roles_once(self):
+        """Test la mutation et l'évaluation unique des rôles de l'utilisateur."""
+        user = User.objects.create_user(username="magasinier")
+        user.groups.add(Group.objects.create(name="magasinier"))
+        info = SimpleNamespace(context=SimpleNamespace(user=user))
+        generator = MutationGenerator(
+            TypeGenerator(), MutationGeneratorSettings(bulk_batch_size=2)
+        )
+        mutation = generator.generate_bulk_update_mutation(BulkUpdateTestItem)
+        inputs = [
+            {"id": str(item.pk), "data": {"quantite": 50}} for item in self.items
+        ]
+
+        with CaptureQueriesContext(connection) as ctx:
+            result = mutation.mutate(None, info, inputs=inputs)
+        self.assertTrue(result.ok, result.errors)
+        group_queries = [
+            q for q in ctx.captured_queries if "auth_group" in q["sql"]
+        ]
+        self.assertEqual(len(group_queries), 1)
+
+        # La condition de garde est évaluée pour chaque cible
+        BulkUpdateTestItem.objects.filter(pk=self.items[4].pk).update(archive=True)
+        for payload in inputs:
+            payload["data"] = {"quantite": 60}
+        result = mutation.mutate(None, info, inputs=inputs)
+        self.assertFalse(result.ok)
+        self.assertIn("not permitted", result.errors[0].message)
+        self.assertEqual(BulkUpdateTestItem.objects.filter(quantite=50).count(), 5)
+
+        inputs = [{"id": str(self.items[0].pk), "data": {"quantite": "abc"}}]
+        result = mutation.mutate(None, info, inputs=inputs)
+        self.assertEqual([error.field for error in result.errors], ["inputs.0.quantite"])
@@ -0,0 +1,206 @@
+"""
+Tests unitaires pour les DataLoaders de relations par requête.
+
+Ce module vérifie que les résolveurs de relations générés (listes, compteurs,
+relations inverses un-à-un) sont regroupés en une requête SQL par niveau.
+"""
+
+from types import SimpleNamespace
+
+from django.db import connection, models
+from django.test.utils import CaptureQueriesContext
+
+from rail_django_graphql.core.dataloaders import (
+    DataLoaderRegistry,
+    describe_relation,
+    get_dataloader_registry,
+    register_dataloader_batch,
+)
+from rail_django_graphql.generators.types import TypeGenerator
+from rail_django_graphql.tests.unit.schema_editor import SchemaEditorTestCase
+
+
+class LoaderTestAuthor(models.Model):
+    """Auteur pour les tests de DataLoader."""
+
+    nom = models.CharField(max_length=100)
+
+    class Meta:
+        app_label = "tests"
+
+
+class LoaderTestTag(models.Model):
+    """Étiquette pour les tests de DataLoader."""
+
+    libelle = models.CharField(max_length=50)
+
+    class Meta:
+        app_label = "tests"
+
+
+class LoaderTestBook(models.Model):
+    """Livre pour les tests de DataLoader."""
+
+    titre = models.CharField(max_length=100)
+    auteur = models.ForeignKey(
+        LoaderTestAuthor, on_delete=models.CASCADE, related_name="livres"
+    )
+    etiquettes = models.ManyToManyField(LoaderTestTag, related_name="livres")
+
+    class Meta:
+        app_label = "tests"
+        ordering = ["id"]
+
+
+class LoaderTestProfile(models.Model):
+    """Profil un-à-un pour les tests de DataLoader."""
+
+    auteur = models.OneToOneField(
+        LoaderTestAuthor, on_delete=models.CASCADE, related_name="profil"
+    )
+    bio = models.CharField(max_length=100)
+
+    class Meta:
+        app_label = "tests"
+
+
+def make_info(context=None):
+    """Construit un objet info minimal pour une opération de lecture."""
+    return SimpleNamespace(
+        context=context if context is not None else SimpleNamespace(),
+        operation=None,
+    )
+
+
+class TestRelationDataLoaders(SchemaEditorTestCase):
+    """Tests pour le regroupement des relations par requête."""
+
+    TEST_MODELS = [
+        LoaderTestAuthor,
+        LoaderTestTag,
+        LoaderTestBook,
+        LoaderTestProfile,
+    ]
+
+    def setUp(self):
+        self.tags = [LoaderTestTag.objects.create(libelle=f"t{i}") for i in range(3)]
+        self.authors = []
+        for i in range(5):
+            author = LoaderTestAuthor.objects.create(nom=f"auteur {i}")
+            for j in range(i):
+                book = LoaderTestBook.objects.create(titre=f"livre {i}-{j}", auteur=author)
+                book.etiquettes.set(self.tags[: j + 1])
+            if i % 2 == 0:
+                LoaderTestProfile.objects.create(auteur=author, bio=f"bio {i}")
+            self.authors.append(author)
+
+    def test_describe_relation(self):
+        """Test la description des relations inverses et ManyToMany."""
+        reverse_fk = describe_relation(LoaderTestAuthor, "livres")
+        self.assertEqual(reverse_fk.related_model, LoaderTestBook)
+        self.assertEqual(reverse_fk.lookup, "auteur")
+
+        m2m = describe_relation(LoaderTestBook, "etiquettes")
+        self.assertEqual(m2m.related_model, LoaderTestTag)
+        self.assertEqual(m2m.lookup, "livres")
+
+        self.assertIsNone(describe_relation(LoaderTestAuthor, "inconnu"))
+
+    def test_counts_are_batched(self):
+        """Test qu'un compteur sur N parents ne coûte qu'une requête."""
+        registry = DataLoaderRegistry(batch_size=100)
+        authors = list(LoaderTestAuthor.objects.order_by("id"))
+        registry.register_batch(authors)
+        loader = registry.get_loader("count", LoaderTestAuthor, "livres")
+
+        with CaptureQueriesContext(connection) as ctx:
+            counts = [loader.load(author) for author in authors]
+
+        self.assertEqual(counts, [0, 1, 2, 3, 4])
+        self.assertEqual(len(ctx.captured_queries), 1)
+
+    def test_batch_size_chunks_queries(self):
+        """Test le découpage des clés selon dataloader_batch_size."""
+        registry = DataLoaderRegistry(batch_size=2)
+        authors = list(LoaderTestAuthor.objects.order_by("id"))
+        registry.register_batch(authors)
+        loader = registry.get_loader("list", LoaderTestAuthor, "livres")
+
+        with CaptureQueriesContext(connection) as ctx:
+            titles = [[b.titre for b in loader.load(author)] for author in authors]
+
+        self.assertEqual(len(ctx.captured_queries), 3)
+        self.assertEqual(titles[2], ["livre 2-0", "livre 2-1"])
+
+    def test_nested_levels_share_one_query(self):
+        """Test que les enfants chargés forment le lot du niveau suivant."""
+        registry = DataLoaderRegistry()
+        authors = list(LoaderTestAuthor.objects.order_by("id"))
+        registry.register_batch(authors)
+        books_loader = registry.get_loader("list", LoaderTestAuthor, "livres")
+        tags_loader = registry.get_loader("list", LoaderTestBook, "etiquettes")
+
+        with CaptureQueriesContext(connection) as ctx:
+            books = [book for author in authors for book in books_loader.load(author)]
+            tag_counts = [len(tags_loader.load(book)) for book in books]
+
+        self.assertEqual(len(ctx.captured_queries), 2)
+        expected = [
+            len(book.etiquettes.all())
+            for book in LoaderTestBook.objects.order_by("id")
+        ]
+        self.assertEqual(sorted(tag_counts), sorted(expected))
+
+    def test_prefetched_children_form_next_batch(self):
+        """Test la réutilisation des relations préchargées et de leurs enfants."""
+        registry = DataLoaderRegistry()
+        authors = list(
+            LoaderTestAuthor.objects.order_by("id").prefetch_related("livres")
+        )
+        registry.register_batch(authors)
+        books_loader = registry.get_loader("list", LoaderTestAuthor, "livres")
+        tags_loader = registry.get_loader("count", LoaderTestBook, "etiquettes")
+
+        with CaptureQueriesContext(connection) as ctx:
+            books = [book for author in authors for book in books_loader.load(author)]
+            counts = [tags_loader.load(book) for book in books]
+
+        self.assertEqual(len(books), 10)
+        self.assertEqual(sum(counts), LoaderTestBook.etiquettes.through.objects.count())
+        self.assertEqual(len(ctx.captured_queries), 1)
+
+    def test_reverse_one_to_one(self):
+        """Test le chargement groupé des relations inverses un-à-un."""
+        registry = DataLoaderRegistry()
+        authors = list(LoaderTestAuthor.objects.order_by("id"))
+        registry.register_batch(authors)
+        loader = registry.get_loader("one", LoaderTestAuthor, "profil")
+
+        with CaptureQueriesContext(connection) as ctx:
+            bios = [getattr(loader.load(a), "bio", None) for a in authors]
+
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.assertEqual(bios, ["bio 0", None, "bio 2", None, "bio 4"])
+
+    def test_generated_resolvers_use_context_registry(self):
+        """Test que les résolveurs générés utilisent le registre du contexte."""
+        type_generator = TypeGenerator()
+        author_type = type_generator.generate_object_type(LoaderTestAuthor)
+        info = make_info()
+        authors = list(LoaderTestAuthor.objects.order_by("id"))
+        register_dataloader_batch(info, authors)
+
+        with CaptureQueriesContext(connection) as ctx:
+            counts = [author_type.resolve_livres_count(a, info) for a in authors]
+
+        self.assertEqual(counts, [0, 1, 2, 3, 4])
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.assertIs(get_dataloader_registry(info), get_dataloader_registry(info))
+
+    def test_mutations_do_not_use_loaders(self):
+        """Test que les mutations contournent le cache des DataLoaders."""
+        info = SimpleNamespace(
+            context=SimpleNamespace(),
+            operation=SimpleNamespace(operation=SimpleNamespace(value="mutation")),
+        )
+        self.assertIsNone(get_dataloader_registry(info))
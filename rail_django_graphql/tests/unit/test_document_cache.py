@@ -0,0 +1,161 @@
+"""
+Tests unitaires pour le cache des documents GraphQL analysés et validés.
+
+Ce module vérifie la réutilisation des documents et de leurs erreurs de
+validation, l'invalidation au changement de version du schéma, le taux de
+réussite rapporté et l'intégration dans la vue multi-schémas, où la
+validation n'est plus exécutée pour les documents déjà vus.
+"""
+
+import json
+from unittest import mock
+
+import graphene
+from django.test import RequestFactory, TestCase
+from graphql import GraphQLError
+
+from rail_django_graphql.core import document_cache, query_cost
+from rail_django_graphql.core.document_cache import DocumentCache
+from rail_django_graphql.core.performance import PerformanceSettings
+from rail_django_graphql.core.query_cost import QueryCostAnalyzer
+from rail_django_graphql.views.graphql_views import MultiSchemaGraphQLView
+
+
+class Item(graphene.ObjectType):
+    """Élément de liste."""
+
+    id = graphene.Int()
+
+
+class Query(graphene.ObjectType):
+    """Requête racine minimale."""
+
+    hello = graphene.String(name=graphene.String(default_value="monde"))
+    items = graphene.List(Item, limit=graphene.Int())
+
+    def resolve_hello(root, info, name):
+        return f"bonjour {name}"
+
+    def resolve_items(root, info, limit=3):
+        return [Item(id=index) for index in range(limit)]
+
+
+SCHEMA = graphene.Schema(query=Query)
+
+
+class TestDocumentCache(TestCase):
+    """Tests pour le cache LRU par schéma et version."""
+
+    def setUp(self):
+        self.schema = SCHEMA.graphql_schema
+        self.cache = DocumentCache(max_size=2)
+
+    def get(self, query, version=1, schema_name="default"):
+        """Récupère un document depuis le cache de test."""
+        return self.cache.get_document(schema_name, version, self.schema, query)
+
+    def test_hot_documents_skip_parse_and_validation(self):
+        """Test la réutilisation du document et le taux de réussite."""
+        with mock.patch.object(
+            document_cache, "validate", wraps=document_cache.validate
+        ) as validate:
+            first = self.get("{ hello }")
+            again = self.get("{ hello }")
+        self.assertIs(first, again)
+        self.assertTrue(first.is_valid)
+        self.assertEqual(validate.call_count, 1)
+        self.assertEqual(self.cache.stats()["hit_ratio"], 0.5)
+
+    def test_validation_errors_are_cached(self):
+        """Test la mise en cache des erreurs de validation."""
+        first = self.get("{ unknown }")
+        self.assertFalse(first.is_valid)
+        self.assertIs(self.get("{ unknown }"), first)
+
+    def test_syntax_errors_are_not_cached(self):
+        """Test la propagation des erreurs de syntaxe sans mise en cache."""
+        with self.assertRaises(GraphQLError):
+            self.get("{ hello")
+        self.assertEqual(self.cache.stats()["size"], 0)
+
+    def test_new_schema_version_invalidates_entries(self):
+        """Test l'invalidation des entrées à la nouvelle version du schéma."""
+        self.get("{ hello }", version=1)
+        self.get("{ hello }", version=1, schema_name="admin")
+        self.get("{ hello }", version=2)
+
+        stats = self.cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (0, 3))
+        self.assertEqual((stats["size"], stats["invalidations"]), (2, 1))
+        self.get("{ hello }", version=2)
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_lru_eviction(self):
+        """Test l'éviction de l'entrée la moins récemment utilisée."""
+        self.get("{ hello }")
+        self.get("{ items { id } }")
+        self.get("{ hello }")
+        self.get('{ hello(name: "x") }')
+        self.get("{ hello }")
+        self.assertEqual((self.cache.hits, self.cache.misses), (2, 3))
+        self.get("{ items { id } }")
+        self.assertEqual(self.cache.misses, 4)
+
+
+class TestViewDocumentCache(TestCase):
+    """Tests pour l'utilisation du cache dans la vue multi-schémas."""
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.cache = DocumentCache(max_size=10)
+        self.analyzer = QueryCostAnalyzer(
+            PerformanceSettings(enable_query_cost_analysis=True, max_query_complexity=20)
+        )
+        patchers = [
+            mock.patch.object(document_cache, "_document_cache", self.cache),
+            mock.patch.object(query_cost, "_query_cost_analyzer", self.analyzer),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def execute(self, query, variables=None):
+        """Exécute une requête via la vue avec un schéma fourni directement."""
+        view = MultiSchemaGraphQLView(schema=SCHEMA)
+        request = self.factory.post(
+            "/graphql/",
+            json.dumps({"query": query}),
+            content_type="application/json",
+        )
+        result = view.execute_graphql_request(
+            request, {}, query, variables or {}, None
+        )
+        return request, result
+
+    def test_validation_runs_once_per_document(self):
+        """Test une seule validation pour des exécutions répétées."""
+        query = "query ($n: Int) { items(limit: $n) { id } }"
+        with mock.patch.object(
+            document_cache, "validate", wraps=document_cache.validate
+        ) as validate:
+            results = [self.execute(query, {"n": n}) for n in (2, 3)]
+        self.assertEqual(validate.call_count, 1)
+        self.assertEqual([len(result.data["items"]) for _, result in results], [2, 3])
+        self.assertEqual(results[1][0].query_cost.complexity, 3 * 2)
+        self.assertEqual(self.cache.stats()["hit_ratio"], 0.5)
+
+    def test_cost_limit_applies_to_cached_documents(self):
+        """Test la limite de coût appliquée selon les variables de chaque requête."""
+        query = "query ($n: Int) { items(limit: $n) { id } }"
+        self.assertIsNone(self.execute(query, {"n": 5})[1].errors)
+        _, result = self.execute(query, {"n": 15})
+        self.assertIn("complexity 30", result.errors[0].message)
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_cached_validation_errors_are_returned(self):
+        """Test le renvoi des erreurs de validation mises en cache."""
+        for _ in range(2):
+            _, result = self.execute("{ unknown }")
+            self.assertIsNone(result.data)
+            self.assertIn("unknown", result.errors[0].message)
+        self.assertEqual(self.cache.hits, 1)
@@ -0,0 +1,141 @@
+"""
+Tests unitaires pour les plans de masquage des champs.
+
+Ce module vérifie que le plan de masquage est compilé une fois par modèle et
+par requête, qu'il s'applique sans lire les descripteurs de clés étrangères,
+qu'une liste sans champ masqué est retournée telle quelle et que seules les
+règles dépendantes de l'instance sont évaluées ligne par ligne.
+"""
+
+from types import SimpleNamespace
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.db import connection, models
+from django.test.utils import CaptureQueriesContext
+
+from rail_django_graphql.generators.queries import QueryGenerator
+from rail_django_graphql.generators.types import TypeGenerator
+from rail_django_graphql.security.field_permissions import (
+    FieldAccessLevel,
+    FieldPermissionManager,
+    FieldPermissionRule,
+    FieldVisibility,
+)
+from rail_django_graphql.tests.unit.schema_editor import SchemaEditorTestCase
+
+
+class MaskTestAgency(models.Model):
+    """Agence référencée par les dossiers."""
+
+    nom = models.CharField(max_length=50)
+
+    class Meta:
+        app_label = "tests"
+
+
+class MaskTestFile(models.Model):
+    """Dossier dont certains champs sont masqués."""
+
+    titre = models.CharField(max_length=50)
+    commentaire = models.CharField(max_length=50, blank=True)
+    agence = models.ForeignKey(MaskTestAgency, on_delete=models.CASCADE)
+
+    class Meta:
+        app_label = "tests"
+
+
+class MaskTestPlain(models.Model):
+    """Modèle sans aucune règle de masquage."""
+
+    libelle = models.CharField(max_length=50)
+    agence = models.ForeignKey(MaskTestAgency, on_delete=models.CASCADE)
+
+    class Meta:
+        app_label = "tests"
+
+
+class TestFieldMasks(SchemaEditorTestCase):
+    """Tests pour la compilation et l'application des plans de masquage."""
+
+    TEST_MODELS = [MaskTestAgency, MaskTestFile, MaskTestPlain]
+
+    def setUp(self):
+        self.manager = FieldPermissionManager()
+        self.manager.register_field_rule(
+            FieldPermissionRule(
+                field_name="agence",
+                model_name="tests.masktestfile",
+                access_level=FieldAccessLevel.NONE,
+                visibility=FieldVisibility.HIDDEN,
+            )
+        )
+        self.manager.register_field_rule(
+            FieldPermissionRule(
+                field_name="commentaire",
+                model_name="tests.masktestfile",
+                access_level=FieldAccessLevel.READ,
+                visibility=FieldVisibility.MASKED,
+                mask_value="***",
+                condition=lambda context: context.instance.titre == "secret",
+            )
+        )
+        patcher = mock.patch(
+            "rail_django_graphql.security.field_permissions.field_permission_manager",
+            self.manager,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.user = User.objects.create_user(username="lecteur")
+        self.info = SimpleNamespace(context=SimpleNamespace(user=self.user))
+        self.generator = QueryGenerator(TypeGenerator())
+        self.agency = MaskTestAgency.objects.create(nom="Alger")
+
+    def test_plan_is_compiled_once_per_request(self):
+        """Test la compilation unique du plan et les champs dynamiques."""
+        for titre in ("public", "secret"):
+            MaskTestFile.objects.create(
+                titre=titre, commentaire="note", agence=self.agency
+            )
+        items = list(MaskTestFile.objects.order_by("pk"))
+
+        with mock.patch.object(
+            self.manager, "compile_mask_plan", wraps=self.manager.compile_mask_plan
+        ) as compile_plan:
+            with CaptureQueriesContext(connection) as ctx:
+                self.generator._apply_field_masks(items, self.info, MaskTestFile)
+                items = self.generator._apply_field_masks(
+                    items, self.info, MaskTestFile
+                )
+        self.assertEqual(compile_plan.call_count, 1)
+        # Les clés étrangères sont masquées sans charger l'agence ; seules les
+        # permissions Django de l'utilisateur sont lues (2 requêtes)
+        self.assertEqual(len(ctx.captured_queries), 2)
+        self.assertFalse(
+            any("masktestagency" in q["sql"] for q in ctx.captured_queries)
+        )
+        self.assertEqual([item.agence_id for item in items], [None, None])
+        self.assertEqual(
+            [item.commentaire for item in items], ["note", "***"]
+        )
+
+    def test_empty_plan_skips_rows(self):
+        """Test qu'aucune ligne n'est examinée lorsque rien n'est masqué."""
+        MaskTestPlain.objects.bulk_create(
+            [MaskTestPlain(libelle=f"l{i}", agence=self.agency) for i in range(1000)]
+        )
+        items = list(MaskTestPlain.objects.all())
+
+        with mock.patch.object(
+            self.manager, "get_field_visibility", wraps=self.manager.get_field_visibility
+        ) as visibility:
+            with CaptureQueriesContext(connection) as ctx:
+                result = self.generator._apply_field_masks(
+                    items, self.info, MaskTestPlain
+                )
+        self.assertIs(result, items)
+        # Permissions Django lues une fois, aucune requête par ligne
+        self.assertEqual(len(ctx.captured_queries), 2)
+        # Une évaluation par champ concret, aucune par ligne
+        self.assertEqual(visibility.call_count, 3)
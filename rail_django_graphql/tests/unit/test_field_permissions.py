@@ -0,0 +1,138 @@
+"""
+Tests unitaires pour l'index compilé des règles de permissions de champs.
+
+Ce module vérifie que les règles candidates sont compilées une fois par
+couple (modèle, champ) dans l'ordre de priorité, que l'index est reconstruit
+lors d'un enregistrement de règle, que les décisions statiques sont mises en
+cache par ensemble de rôles et que les règles conditionnelles restent
+évaluées à chaque appel.
+"""
+
+from unittest import mock
+
+from django.contrib.auth.models import Group, User
+from django.db import models
+from django.test import TestCase
+
+from rail_django_graphql.security.field_permissions import (
+    FieldAccessLevel,
+    FieldContext,
+    FieldPermissionManager,
+    FieldPermissionRule,
+    FieldVisibility,
+)
+
+
+class RuleIndexTestContract(models.Model):
+    """Contrat dont les champs sont protégés par des règles."""
+
+    montant = models.IntegerField(default=0)
+    clause = models.CharField(max_length=50, blank=True)
+
+    class Meta:
+        app_label = "tests"
+        managed = False
+
+
+def make_rule(field_name, model_name="tests.ruleindextestcontract", **kwargs):
+    """Construit une règle de champ avec des valeurs par défaut."""
+    kwargs.setdefault("access_level", FieldAccessLevel.READ)
+    kwargs.setdefault("visibility", FieldVisibility.VISIBLE)
+    return FieldPermissionRule(
+        field_name=field_name, model_name=model_name, **kwargs
+    )
+
+
+class TestFieldRuleIndex(TestCase):
+    """Tests pour la compilation et l'invalidation de l'index des règles."""
+
+    def setUp(self):
+        self.manager = FieldPermissionManager()
+        self.user = User.objects.create_user(username="juriste")
+        self.user.groups.add(Group.objects.create(name="juriste"))
+
+    def context(self, field_name, user=None, **kwargs):
+        """Construit un contexte d'accès au champ du contrat."""
+        return FieldContext(
+            user=user or self.user,
+            field_name=field_name,
+            model_class=RuleIndexTestContract,
+            **kwargs,
+        )
+
+    def test_rules_are_compiled_by_priority(self):
+        """Test l'ordre de priorité: règle du modèle avant la règle générique."""
+        generic = make_rule("montant", model_name="*", access_level=FieldAccessLevel.NONE)
+        specific = make_rule("montant", roles=["juriste"])
+        self.manager.register_field_rule(generic)
+        self.manager.register_field_rule(specific)
+
+        compiled = self.manager._get_compiled_rules(self.context("montant"))
+        self.assertEqual(compiled.field_rules, (specific, generic))
+        self.assertTrue(compiled.is_static)
+        self.assertEqual(
+            self.manager.get_field_access_level(self.context("montant")),
+            FieldAccessLevel.READ,
+        )
+        self.assertIs(
+            self.manager._get_compiled_rules(self.context("montant")), compiled
+        )
+
+    def test_index_is_rebuilt_on_register(self):
+        """Test la reconstruction de l'index après l'ajout d'une règle."""
+        self.assertEqual(
+            self.manager.get_field_access_level(self.context("clause")),
+            FieldAccessLevel.READ,
+        )
+        self.manager.register_global_rule(
+            make_rule("clause", model_name="*", access_level=FieldAccessLevel.NONE)
+        )
+        self.assertEqual(
+            self.manager.get_field_access_level(self.context("clause")),
+            FieldAccessLevel.NONE,
+        )
+
+    def test_static_decisions_are_cached_per_role_set(self):
+        """Test le cache des décisions statiques par ensemble de rôles."""
+        self.manager.register_field_rule(
+            make_rule(
+                "montant",
+                visibility=FieldVisibility.MASKED,
+                mask_value="***",
+                roles=["juriste"],
+            )
+        )
+        other = User.objects.create_user(username="stagiaire")
+        with mock.patch.object(
+            self.manager, "_rule_grants", wraps=self.manager._rule_grants
+        ) as grants:
+            for _ in range(3):
+                self.assertEqual(
+                    self.manager.get_field_visibility(self.context("montant")),
+                    (FieldVisibility.MASKED, "***"),
+                )
+                self.assertEqual(
+                    self.manager.get_field_visibility(self.context("montant", other)),
+                    (FieldVisibility.VISIBLE, None),
+                )
+        self.assertEqual(grants.call_count, 0)
+        # Une décision par ensemble de rôles ({juriste} et aucun rôle)
+        self.assertEqual(len(self.manager._static_decisions), 2)
+
+    def test_dynamic_rules_are_evaluated_per_call(self):
+        """Test l'évaluation des règles conditionnelles à chaque appel."""
+        self.manager.register_field_rule(
+            make_rule(
+                "clause",
+                access_level=FieldAccessLevel.NONE,
+                condition=lambda context: context.request_context["secret"],
+            )
+        )
+        levels = [
+            self.manager.get_field_access_level(
+                self.context("clause", request_context={"secret": secret})
+            )
+            for secret in (True, False)
+        ]
+        self.assertEqual(levels, [FieldAccessLevel.NONE, FieldAccessLevel.READ])
+        self.assertFalse(self.manager._static_decisions)
@@ -0,0 +1,125 @@
+"""
+Tests unitaires pour la compilation des filtres complexes.
+
+Ce module vérifie que les arbres de filtres AND/OR/NOT sont compilés une
+seule fois par forme, que l'entrée n'est jamais modifiée, que les branches
+imbriquées sont appliquées et que les lookups invalides sont rejetés.
+"""
+
+import copy
+
+from django.db import models
+
+from rail_django_graphql.generators.filter_compiler import (
+    FilterCompiler,
+    filter_shape,
+)
+from rail_django_graphql.generators.filters import AdvancedFilterGenerator
+from rail_django_graphql.tests.unit.schema_editor import SchemaEditorTestCase
+
+
+class CompilerTestAuthor(models.Model):
+    """Auteur pour les tests du compilateur de filtres."""
+
+    nom = models.CharField(max_length=50)
+
+    class Meta:
+        app_label = "tests"
+
+
+class CompilerTestBook(models.Model):
+    """Livre pour les tests du compilateur de filtres."""
+
+    titre = models.CharField(max_length=50)
+    pages = models.IntegerField()
+    auteur = models.ForeignKey(CompilerTestAuthor, on_delete=models.CASCADE)
+
+    class Meta:
+        app_label = "tests"
+
+
+class TestFilterCompiler(SchemaEditorTestCase):
+    """Tests pour le cache des arbres de filtres compilés."""
+
+    TEST_MODELS = [CompilerTestAuthor, CompilerTestBook]
+
+    def setUp(self):
+        hugo = CompilerTestAuthor.objects.create(nom="Hugo")
+        zola = CompilerTestAuthor.objects.create(nom="Zola")
+        for titre, pages, auteur in [
+            ("Les Misérables", 1500, hugo),
+            ("Notre-Dame", 900, hugo),
+            ("Germinal", 600, zola),
+            ("Nana", 450, zola),
+        ]:
+            CompilerTestBook.objects.create(titre=titre, pages=pages, auteur=auteur)
+        self.generator = AdvancedFilterGenerator()
+
+    def titles(self, filters):
+        """Applique les filtres et retourne les titres triés."""
+        queryset = self.generator.apply_complex_filters(
+            CompilerTestBook.objects.all(), filters
+        )
+        return sorted(book.titre for book in queryset)
+
+    def test_input_is_not_mutated(self):
+        """Test que le même dictionnaire peut être réutilisé."""
+        filters = {
+            "OR": [{"pages__gte": 1000}, {"auteur__nom": "Zola"}],
+            "NOT": {"titre__icontains": "nana"},
+        }
+        snapshot = copy.deepcopy(filters)
+        first = self.titles(filters)
+        self.assertEqual(filters, snapshot)
+        self.assertEqual(self.titles(filters), first)
+        self.assertEqual(first, ["Germinal", "Les Misérables"])
+
+    def test_shape_is_compiled_once(self):
+        """Test la réutilisation de la forme compilée avec d'autres valeurs."""
+        compiler = self.generator.filter_compiler
+        compiler.clear()
+        self.assertEqual(
+            self.titles({"pages__lt": 700, "auteur__nom": "Zola"}), ["Germinal", "Nana"]
+        )
+        self.assertEqual(self.titles({"auteur__nom": "Hugo", "pages__lt": 1000}), ["Notre-Dame"])
+        self.assertEqual((compiler.misses, compiler.hits), (1, 1))
+
+        self.assertEqual(
+            filter_shape({"a": 1, "b": None, "AND": [{"c": 2}]}),
+            filter_shape({"a": 3, "AND": [{"c": 4}]}),
+        )
+
+    def test_nested_branches_are_applied(self):
+        """Test les branches AND/OR imbriquées dans une branche."""
+        filters = {
+            "AND": [
+                {"OR": [{"titre__startswith": "G"}, {"titre__startswith": "N"}]},
+                {"pages__gt": 500},
+            ]
+        }
+        self.assertEqual(self.titles(filters), ["Germinal", "Notre-Dame"])
+
+    def test_values_are_coerced(self):
+        """Test la conversion des valeurs selon le type du champ."""
+        author = CompilerTestAuthor.objects.get(nom="Hugo")
+        filters = {"pages__in": [900.0, 450.0], "auteur__in": [str(author.pk)]}
+        compiled = FilterCompiler().compile(CompilerTestBook, filters)
+        lookups = dict(lookup.bind(filters[lookup.key]) for lookup in compiled.lookups)
+        self.assertEqual(lookups["pages__in"], [900, 450])
+        self.assertEqual(lookups["auteur__in"], [author.pk])
+        self.assertEqual(self.titles(filters), ["Notre-Dame"])
+
+    def test_invalid_lookup_is_rejected(self):
+        """Test le rejet d'un lookup inconnu pour le champ."""
+        with self.assertRaises(ValueError):
+            self.titles({"pages__icontainz": "1"})
+
+    def test_lru_evicts_oldest_shape(self):
+        """Test la taille maximale du cache LRU."""
+        compiler = FilterCompiler(maxsize=2)
+        for key in ("titre", "pages", "titre", "auteur"):
+            compiler.compile(CompilerTestBook, {key: 1})
+        self.assertEqual(compiler.misses, 3)
+        compiler.compile(CompilerTestBook, {"titre": "x"})
+        compiler.compile(CompilerTestBook, {"pages": 2})
+        self.assertEqual((compiler.hits, compiler.misses), (2, 4))
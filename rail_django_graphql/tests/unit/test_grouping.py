@@ -0,0 +1,246 @@
+"""
+Tests unitaires pour les requêtes de regroupement.
+
+Ce module vérifie que les libellés des groupes portant sur une relation sont
+obtenus sans requête par groupe (jointure, sous-requête ou in_bulk unique),
+que les libellés de choix proviennent d'une table précalculée et que les
+regroupements multi-dimensions et multi-métriques tiennent en une requête.
+"""
+
+import datetime
+from types import SimpleNamespace
+from unittest import mock
+
+from django.db import connection, models
+from django.db.models import Value
+from django.db.models.functions import Concat
+from django.test.utils import CaptureQueriesContext
+from graphql import GraphQLError
+
+from rail_django_graphql.core.meta import GraphQLMeta
+from rail_django_graphql.generators.queries import QueryGenerator
+from rail_django_graphql.generators.types import TypeGenerator
+from rail_django_graphql.tests.unit.schema_editor import SchemaEditorTestCase
+
+
+class GroupingTestCategory(models.Model):
+    """Catégorie étiquetée par str()."""
+
+    nom = models.CharField(max_length=50)
+
+    class Meta:
+        app_label = "tests"
+
+    def __str__(self) -> str:
+        return f"Catégorie {self.nom}"
+
+
+class GroupingTestBrand(models.Model):
+    """Marque étiquetée par un chemin de champ."""
+
+    nom = models.CharField(max_length=50)
+
+    class Meta:
+        app_label = "tests"
+
+    class GraphQLMeta(GraphQLMeta):
+        label_expression = "nom"
+
+
+class GroupingTestSupplier(models.Model):
+    """Fournisseur étiquetée par une expression SQL."""
+
+    code = models.CharField(max_length=10)
+    ville = models.CharField(max_length=50)
+
+    class Meta:
+        app_label = "tests"
+
+    class GraphQLMeta(GraphQLMeta):
+        label_expression = Concat("code", Value(" - "), "ville")
+
+
+class GroupingTestArticle(models.Model):
+    """Article regroupé par relation ou par choix."""
+
+    statut = models.CharField(
+        max_length=10, choices=[("brouillon", "Brouillon"), ("publie", "Publié")]
+    )
+    categorie = models.ForeignKey(
+        GroupingTestCategory, null=True, on_delete=models.CASCADE
+    )
+    marque = models.ForeignKey(GroupingTestBrand, on_delete=models.CASCADE)
+    fournisseur = models.ForeignKey(GroupingTestSupplier, on_delete=models.CASCADE)
+    quantite = models.IntegerField(default=0)
+    prix = models.DecimalField(max_digits=8, decimal_places=2, default=0)
+    publie_le = models.DateField(default=datetime.date(2024, 1, 1))
+
+    class Meta:
+        app_label = "tests"
+
+
+def make_info():
+    """Construit un objet info minimal pour une requête de regroupement."""
+    return SimpleNamespace(
+        field_nodes=[],
+        fragments={},
+        field_name="articles_group",
+        context=SimpleNamespace(user=None),
+        operation=None,
+    )
+
+
+class TestGroupingQuery(SchemaEditorTestCase):
+    """Tests pour les libellés, dimensions et métriques des regroupements."""
+
+    TEST_MODELS = [
+        GroupingTestCategory,
+        GroupingTestBrand,
+        GroupingTestSupplier,
+        GroupingTestArticle,
+    ]
+
+    def setUp(self):
+        categories = [GroupingTestCategory.objects.create(nom=f"c{i}") for i in range(4)]
+        brands = [GroupingTestBrand.objects.create(nom=f"m{i}") for i in range(3)]
+        suppliers = [
+            GroupingTestSupplier.objects.create(code=f"F{i}", ville="Lyon")
+            for i in range(2)
+        ]
+        for index in range(12):
+            GroupingTestArticle.objects.create(
+                statut="publie" if index % 3 else "brouillon",
+                categorie=categories[index % 4] if index % 5 else None,
+                marque=brands[index % 3],
+                fournisseur=suppliers[index % 2],
+                quantite=index,
+                prix=index * 1.5,
+                publie_le=datetime.date(2024, 1 + index % 3, 1 + index),
+            )
+        generator = QueryGenerator(TypeGenerator())
+        self.generator = generator
+        self.resolver = generator.generate_grouping_query(GroupingTestArticle).resolver
+
+    def group(self, group_by=None, **kwargs):
+        """Exécute le regroupement et retourne les groupes et les requêtes SQL."""
+        with CaptureQueriesContext(connection) as ctx:
+            buckets = self.resolver(None, make_info(), group_by=group_by, **kwargs)
+        return buckets, ctx.captured_queries
+
+    def test_str_labels_use_single_in_bulk(self):
+        """Test le chargement des libellés str() en une seule requête."""
+        buckets, queries = self.group("categorie")
+        self.assertEqual(len(queries), 2)
+        self.assertEqual(
+            sorted(bucket.label for bucket in buckets),
+            ["Catégorie c0", "Catégorie c1", "Catégorie c2", "Catégorie c3", "Non renseigné"],
+        )
+        self.assertEqual(sum(bucket.count for bucket in buckets), 12)
+
+    def test_field_path_label_uses_join(self):
+        """Test le libellé calculé par jointure dans la requête de regroupement."""
+        buckets, queries = self.group("marque")
+        self.assertEqual(len(queries), 1)
+        self.assertIn("JOIN", queries[0]["sql"])
+        self.assertEqual([bucket.label for bucket in buckets], ["m0", "m1", "m2"])
+        self.assertEqual([bucket.count for bucket in buckets], [4, 4, 4])
+
+    def test_expression_label_uses_subquery(self):
+        """Test le libellé calculé par une expression dans la même requête."""
+        buckets, queries = self.group("fournisseur")
+        self.assertEqual(len(queries), 1)
+        self.assertEqual(
+            [bucket.label for bucket in buckets], ["F0 - Lyon", "F1 - Lyon"]
+        )
+
+    def test_choice_labels_are_precomputed(self):
+        """Test les libellés de choix issus d'une table calculée une fois."""
+        buckets, queries = self.group("statut")
+        self.assertEqual(len(queries), 1)
+        self.assertEqual(
+            [(bucket.key, bucket.label, bucket.count) for bucket in buckets],
+            [("brouillon", "Brouillon", 4), ("publie", "Publié", 8)],
+        )
+        field = GroupingTestArticle._meta.get_field("statut")
+        self.assertIs(
+            self.generator._get_choice_labels(field),
+            self.generator._get_choice_labels(field),
+        )
+
+    def test_dimensions_and_metrics_in_one_query(self):
+        """Test plusieurs dimensions et métriques calculées en une requête."""
+        buckets, queries = self.group(
+            "statut",
+            dimensions=[{"path": "fournisseur"}],
+            metrics=[
+                {"name": "quantite", "aggregate": "sum", "path": "quantite"},
+                {"name": "prixMoyen", "aggregate": "avg", "path": "prix"},
+                {"name": "maxQuantite", "aggregate": "max", "path": "quantite"},
+                {"name": "marques", "aggregate": "count_distinct", "path": "marque"},
+            ],
+        )
+        self.assertEqual(len(queries), 1)
+        self.assertEqual(len(buckets), 4)
+        first = buckets[0]
+        self.assertEqual([k.label for k in first.keys], ["Brouillon", "F0 - Lyon"])
+        self.assertEqual(first.key, f"brouillon|{first.keys[1].key}")
+        self.assertEqual(first.label, "Brouillon / F0 - Lyon")
+        # Articles 0 et 6: brouillon chez F0
+        metrics = {m.name: m.value for m in first.metrics}
+        self.assertEqual(first.count, 2)
+        self.assertEqual(metrics["quantite"], 6)
+        self.assertEqual(metrics["prixMoyen"], 4.5)
+        self.assertEqual(metrics["maxQuantite"], 6)
+        self.assertEqual(metrics["marques"], 1)
+
+    def test_date_truncation_and_rollup(self):
+        """Test la troncature de date et le groupe Total."""
+        buckets, _ = self.group(
+            dimensions=[{"path": "publie_le", "trunc": "month"}],
+            metrics=[{"name": "quantite", "aggregate": "sum", "path": "quantite"}],
+            rollup=True,
+        )
+        self.assertEqual(
+            [(b.key, b.count) for b in buckets],
+            [("2024-01-01", 4), ("2024-02-01", 4), ("2024-03-01", 4), ("__TOTAL__", 12)],
+        )
+        self.assertTrue(buckets[-1].is_total)
+        self.assertEqual(buckets[-1].metrics[0].value, sum(range(12)))
+
+    def test_order_by_metric_and_limit(self):
+        """Test le tri par métrique et la limite de groupes."""
+        buckets, _ = self.group(
+            "marque",
+            metrics=[{"name": "quantite", "aggregate": "sum", "path": "quantite"}],
+            order_by="-quantite",
+            limit=2,
+        )
+        self.assertEqual([b.label for b in buckets], ["m2", "m1"])
+        self.assertEqual([b.metrics[0].value for b in buckets], [26, 22])
+
+    def test_invalid_metric_is_rejected(self):
+        """Test le rejet d'une métrique numérique sur un champ texte."""
+        with self.assertRaises(GraphQLError):
+            self.group(
+                "marque", metrics=[{"name": "x", "aggregate": "sum", "path": "statut"}]
+            )
+        with self.assertRaises(GraphQLError):
+            self.group(dimensions=[{"path": "statut", "trunc": "month"}])
+
+    def test_reserved_metric_name_is_rejected(self):
+        """Test le rejet des noms de métrique réservés au tri."""
+        for name in ("count", "group"):
+            with self.assertRaises(GraphQLError):
+                self.group(
+                    "marque", metrics=[{"name": name, "aggregate": "count"}]
+                )
+
+    def test_access_is_checked_before_validation(self):
+        """Test le contrôle d'accès avant l'analyse des dimensions."""
+        with mock.patch.object(
+            GraphQLMeta,
+            "ensure_operation_access",
+            side_effect=GraphQLError("Accès refusé"),
+        ):
+            with self.assertRaisesMessage(GraphQLError, "Accès refusé"):
+                self.group(dimensions=[{"path": "statut", "trunc": "month"}])
@@ -0,0 +1,140 @@
+"""
+Tests unitaires pour la compilation de la pile de middlewares.
+
+Ce module vérifie que les middlewares de portée opération s'exécutent une
+seule fois par document (y compris leurs erreurs, rejouées pour chaque champ
+racine), que les champs scalaires triviaux contournent la chaîne et que les
+middlewares désactivés sont retirés à la compilation.
+"""
+
+from types import SimpleNamespace
+
+import graphene
+from django.contrib.auth.models import AnonymousUser
+from django.test import TestCase
+
+from rail_django_graphql.core.middleware import (
+    BaseMiddleware,
+    MiddlewareScope,
+    compile_middleware_stack,
+    get_compiled_middleware,
+)
+
+
+class CountingMiddleware(BaseMiddleware):
+    """Middleware enregistrant les champs qu'il traverse."""
+
+    def __init__(self, scope, enabled=True, error=None):
+        super().__init__()
+        self.scope = scope
+        self.enabled = enabled
+        self.error = error
+        self.calls = []
+
+    def is_enabled(self):
+        return self.enabled
+
+    def resolve(self, next_resolver, root, info, **kwargs):
+        self.calls.append(info.field_name)
+        if self.error:
+            raise self.error
+        return next_resolver(root, info, **kwargs)
+
+
+class Owner(graphene.ObjectType):
+    """Objet imbriqué avec un résolveur personnalisé."""
+
+    name = graphene.String()
+    label = graphene.String()
+
+    def resolve_label(root, info):
+        return root.name.upper()
+
+
+class Row(graphene.ObjectType):
+    """Ligne contenant des scalaires et un objet imbriqué."""
+
+    code = graphene.String()
+    amount = graphene.Int()
+    owner = graphene.Field(Owner)
+
+
+class Query(graphene.ObjectType):
+    """Requête racine avec deux champs."""
+
+    rows = graphene.List(Row)
+    total = graphene.Int()
+
+    def resolve_rows(root, info):
+        return [
+            Row(code=str(index), amount=index, owner=Owner(name="exploitant"))
+            for index in range(10)
+        ]
+
+    def resolve_total(root, info):
+        return 10
+
+
+QUERY = "{ rows { code amount owner { name label } } total }"
+
+
+class TestCompiledMiddleware(TestCase):
+    """Tests pour l'exécution des middlewares selon leur portée."""
+
+    def setUp(self):
+        self.schema = graphene.Schema(query=Query)
+
+    def execute(self, *middlewares, use_scopes=True):
+        """Exécute la requête de test avec la pile compilée."""
+        compiled = compile_middleware_stack(list(middlewares), use_scopes=use_scopes)
+        context = SimpleNamespace(user=AnonymousUser(), META={})
+        return self.schema.execute(QUERY, context_value=context, middleware=[compiled])
+
+    def test_middlewares_run_at_their_scope(self):
+        """Test les appels par portée: opération, champ racine et champ."""
+        operation = CountingMiddleware(MiddlewareScope.OPERATION)
+        root = CountingMiddleware(MiddlewareScope.ROOT)
+        field = CountingMiddleware(MiddlewareScope.FIELD)
+
+        result = self.execute(operation, root, field)
+
+        self.assertIsNone(result.errors)
+        self.assertEqual(operation.calls, ["rows"])
+        self.assertEqual(root.calls, ["rows", "total"])
+        # Scalaires par défaut (code, amount, name) contournés; label a un résolveur
+        self.assertEqual(sorted(set(field.calls)), ["label", "owner", "rows", "total"])
+        self.assertEqual(len(field.calls), 22)
+
+    def test_unscoped_stack_runs_on_every_field(self):
+        """Test le comportement historique: chaque middleware sur chaque champ."""
+        operation = CountingMiddleware(MiddlewareScope.OPERATION)
+        self.execute(operation, use_scopes=False)
+        self.assertEqual(len(operation.calls), 2 + 10 * 5)
+
+    def test_operation_error_is_replayed_for_each_root_field(self):
+        """Test la mémorisation de l'erreur d'opération sur le contexte."""
+        operation = CountingMiddleware(
+            MiddlewareScope.OPERATION, error=PermissionError("refusé")
+        )
+        result = self.execute(operation)
+        self.assertEqual(operation.calls, ["rows"])
+        self.assertEqual([error.path for error in result.errors], [["rows"], ["total"]])
+
+    def test_disabled_middlewares_are_dropped(self):
+        """Test le retrait des middlewares désactivés à la compilation."""
+        disabled = CountingMiddleware(MiddlewareScope.FIELD, enabled=False)
+        compiled = compile_middleware_stack([disabled])
+        self.assertEqual((compiled.operation, compiled.root, compiled.field), ((), (), ()))
+        self.assertIsNone(self.execute(disabled).errors)
+        self.assertEqual(disabled.calls, [])
+
+    def test_default_stack_compiles(self):
+        """Test la compilation de la pile par défaut."""
+        compiled = get_compiled_middleware()
+        self.assertTrue(compiled.operation)
+        result = self.schema.execute(
+            QUERY,
+            context_value=SimpleNamespace(user=AnonymousUser(), META={}),
+            middleware=[compiled],
+        )
+        self.assertIsNone(result.errors)
@@ -0,0 +1,98 @@
+"""
+Tests unitaires pour la matrice des permissions par modèle de MeQuery.
+
+Ce module vérifie que la matrice est calculée en une passe à partir des
+permissions effectives de l'utilisateur, qu'elle est identique aux contrôles
+d'opération unitaires, qu'elle est mise en cache par utilisateur, invalidée
+par un changement d'appartenance aux groupes et filtrable par application.
+"""
+
+from unittest import mock
+
+from django.contrib.auth.models import Group, Permission, User
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from rail_django_graphql.extensions import auth
+from rail_django_graphql.extensions.permissions import (
+    DjangoPermissionChecker,
+    OperationType,
+    PermissionManager,
+)
+
+OPERATION_CODENAMES = {
+    OperationType.CREATE: "add",
+    OperationType.READ: "view",
+    OperationType.UPDATE: "change",
+    OperationType.DELETE: "delete",
+    OperationType.LIST: "view",
+}
+
+
+class TestModelPermissionMatrix(TestCase):
+    """Tests pour le calcul et le cache de la matrice des permissions."""
+
+    def setUp(self):
+        cache.clear()
+        self.permission_manager = PermissionManager()
+        for model in (Group, Permission):
+            for operation, codename in OPERATION_CODENAMES.items():
+                self.permission_manager.register_operation_permission(
+                    model._meta.label_lower,
+                    operation,
+                    DjangoPermissionChecker(codename, model),
+                )
+        patcher = mock.patch.object(
+            auth, "permission_manager", self.permission_manager
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.user = User.objects.create_user(username="gestionnaire")
+        self.user.user_permissions.add(Permission.objects.get(codename="view_group"))
+        self.user = User.objects.get(pk=self.user.pk)
+
+    def matrix(self, user=None, app_labels=None):
+        """Retourne la matrice indexée par modèle."""
+        rows = auth._build_model_permission_snapshot(user or self.user, app_labels)
+        return {row.model_name: row for row in rows}
+
+    def test_matrix_matches_operation_checks(self):
+        """Test l'équivalence avec check_operation_permission pour chaque modèle."""
+        matrix = self.matrix()
+        for model_label, row in matrix.items():
+            for attribute, operation in auth._MODEL_PERMISSION_OPERATIONS:
+                expected = self.permission_manager.check_operation_permission(
+                    self.user, model_label, operation
+                ).allowed
+                self.assertEqual(getattr(row, attribute), expected, model_label)
+        self.assertTrue(matrix["auth.group"].can_read)
+        self.assertFalse(matrix["auth.group"].can_create)
+        self.assertFalse(matrix["auth.permission"].can_list)
+
+    def test_matrix_is_cached_per_user(self):
+        """Test le cache de la matrice: aucune requête au second appel."""
+        self.matrix()
+        user = User.objects.get(pk=self.user.pk)
+        with CaptureQueriesContext(connection) as ctx:
+            self.matrix(user)
+        self.assertEqual(len(ctx.captured_queries), 0)
+
+    def test_group_membership_invalidates_matrix(self):
+        """Test l'invalidation après un ajout à un groupe."""
+        self.assertFalse(self.matrix()["auth.group"].can_create)
+
+        group = Group.objects.create(name="administrateurs")
+        group.permissions.add(Permission.objects.get(codename="add_group"))
+        self.user.groups.add(group)
+
+        user = User.objects.get(pk=self.user.pk)
+        self.assertTrue(self.matrix(user)["auth.group"].can_create)
+
+    def test_matrix_filtered_by_app(self):
+        """Test le filtrage de la matrice par application."""
+        matrix = self.matrix(app_labels=["auth"])
+        self.assertTrue(matrix)
+        self.assertTrue(all(label.startswith("auth.") for label in matrix))
@@ -0,0 +1,259 @@
+"""
+Tests unitaires pour les opérations imbriquées groupées.
+
+Ce module vérifie que les mises à jour et créations imbriquées chargent les
+lignes référencées une seule fois par modèle, comparent les enfants existants
+en une requête et les écrivent avec bulk_create, bulk_update et une seule
+suppression, avec un nombre de requêtes indépendant du nombre d'enfants. Il
+vérifie aussi la suppression en cascade planifiée (simulation, SET_NULL
+groupé, PROTECT).
+"""
+
+from django.db import connection, models
+from django.test.utils import CaptureQueriesContext
+
+from rail_django_graphql.core.settings import MutationGeneratorSettings
+from rail_django_graphql.generators.nested_operations import NestedOperationHandler
+from rail_django_graphql.tests.unit.schema_editor import SchemaEditorTestCase
+
+
+class NestedTestProduct(models.Model):
+    """Produit référencé par les lignes de commande."""
+
+    nom = models.CharField(max_length=50)
+
+    class Meta:
+        app_label = "tests"
+
+
+class NestedTestOrder(models.Model):
+    """Commande mise à jour avec ses lignes."""
+
+    reference = models.CharField(max_length=20)
+
+    class Meta:
+        app_label = "tests"
+
+
+class NestedTestLine(models.Model):
+    """Ligne de commande (relation inverse "lines")."""
+
+    commande = models.ForeignKey(
+        NestedTestOrder, on_delete=models.CASCADE, related_name="lines"
+    )
+    produit = models.ForeignKey(NestedTestProduct, on_delete=models.PROTECT)
+    quantite = models.IntegerField(default=1)
+    modifie_le = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        app_label = "tests"
+
+
+class TestNestedOperations(SchemaEditorTestCase):
+    """Tests pour l'écriture groupée des enfants d'une relation inverse."""
+
+    TEST_MODELS = [NestedTestProduct, NestedTestOrder, NestedTestLine]
+
+    def setUp(self):
+        self.products = [
+            NestedTestProduct.objects.create(nom=f"p{i}") for i in range(4)
+        ]
+        self.handler = NestedOperationHandler(
+            MutationGeneratorSettings(bulk_batch_size=50)
+        )
+
+    def make_order(self, line_count):
+        """Crée une commande avec des lignes existantes."""
+        order = NestedTestOrder.objects.create(reference="C1")
+        for index in range(line_count):
+            NestedTestLine.objects.create(
+                commande=order, produit=self.products[index % 4], quantite=index
+            )
+        return order
+
+    def update_lines(self, line_count):
+        """Met à jour la moitié des lignes, en supprime un quart et en ajoute."""
+        order = self.make_order(line_count)
+        lines = list(order.lines.order_by("pk"))
+        kept = lines[: line_count // 2]
+        payload = {
+            "reference": "C1-bis",
+            "lines": [
+                {"id": str(line.pk), "quantite": 100, "produit": str(self.products[3].pk)}
+                for line in kept
+            ]
+            + [
+                {"produit": str(self.products[index % 4].pk), "quantite": 7}
+                for index in range(line_count // 4)
+            ],
+        }
+        with CaptureQueriesContext(connection) as ctx:
+            self.handler.handle_nested_update(NestedTestOrder, payload, order)
+        return order, kept, len(ctx.captured_queries)
+
+    def test_query_count_does_not_grow_with_children(self):
+        """Test un nombre de requêtes constant quel que soit le nombre d'enfants."""
+        _, _, small = self.update_lines(8)
+        _, _, large = self.update_lines(40)
+        self.assertEqual(small, large)
+        self.assertLessEqual(large, 8)
+
+    def test_children_are_diffed(self):
+        """Test la mise à jour, la création et la suppression des enfants."""
+        order, kept, _ = self.update_lines(8)
+        order.refresh_from_db()
+        self.assertEqual(order.reference, "C1-bis")
+
+        lines = list(order.lines.order_by("pk"))
+        self.assertEqual(len(lines), 4 + 2)
+        self.assertEqual([line.pk for line in lines[:4]], [line.pk for line in kept])
+        self.assertTrue(all(line.quantite == 100 for line in lines[:4]))
+        self.assertTrue(all(line.produit_id == self.products[3].pk for line in lines[:4]))
+        self.assertTrue(all(line.quantite == 7 for line in lines[4:]))
+        self.assertGreater(lines[0].modifie_le, kept[0].modifie_le)
+
+    def test_missing_reference_is_reported(self):
+        """Test l'erreur de validation pour un produit inexistant."""
+        from django.core.exceptions import ValidationError
+
+        order = self.make_order(2)
+        payload = {"lines": [{"produit": "9999", "quantite": 1}]}
+        with self.assertRaises(ValidationError) as raised:
+            self.handler.handle_nested_update(NestedTestOrder, payload, order)
+        self.assertIn("produit", raised.exception.message_dict)
+
+    def test_nested_create_batches_children(self):
+        """Test la création d'une commande avec ses lignes en insertions groupées."""
+        payload = {
+            "reference": "C2",
+            "lines": [
+                {"produit": str(self.products[index % 4].pk), "quantite": index}
+                for index in range(20)
+            ],
+        }
+        with CaptureQueriesContext(connection) as ctx:
+            order = self.handler.handle_nested_create(NestedTestOrder, payload)
+        self.assertEqual(order.lines.count(), 20)
+        inserts = [q for q in ctx.captured_queries if q["sql"].startswith("INSERT")]
+        self.assertEqual(len(inserts), 2)
+
+
+class CascadeTestAuthor(models.Model):
+    """Auteur supprimé en cascade."""
+
+    nom = models.CharField(max_length=50)
+
+    class Meta:
+        app_label = "tests"
+
+
+class CascadeTestBook(models.Model):
+    """Livre d'un auteur."""
+
+    auteur = models.ForeignKey(CascadeTestAuthor, on_delete=models.CASCADE)
+
+    class Meta:
+        app_label = "tests"
+
+
+class CascadeTestChapter(models.Model):
+    """Chapitre d'un livre."""
+
+    livre = models.ForeignKey(CascadeTestBook, on_delete=models.CASCADE)
+
+    class Meta:
+        app_label = "tests"
+
+
+class CascadeTestReview(models.Model):
+    """Critique détachée (SET_NULL) ou protégée (PROTECT) selon les règles."""
+
+    livre = models.ForeignKey(CascadeTestBook, null=True, on_delete=models.SET_NULL)
+
+    class Meta:
+        app_label = "tests"
+
+
+class TestCascadeDelete(SchemaEditorTestCase):
+    """Tests pour la suppression en cascade planifiée et groupée."""
+
+    TEST_MODELS = [
+        CascadeTestAuthor,
+        CascadeTestBook,
+        CascadeTestChapter,
+        CascadeTestReview,
+    ]
+
+    def setUp(self):
+        self.author = CascadeTestAuthor.objects.create(nom="Hugo")
+        for _ in range(3):
+            book = CascadeTestBook.objects.create(auteur=self.author)
+            for _ in range(4):
+                CascadeTestChapter.objects.create(livre=book)
+            CascadeTestReview.objects.create(livre=book)
+        self.handler = NestedOperationHandler(MutationGeneratorSettings())
+        self.rules = {"cascadetestreview": "SET_NULL"}
+
+    def test_dry_run_counts_without_deleting(self):
+        """Test le mode simulation et les compteurs par modèle."""
+        with CaptureQueriesContext(connection) as ctx:
+            plan = self.handler.plan_cascade_delete(self.author, self.rules)
+        self.assertEqual(
+            plan.counts,
+            {
+                "tests.CascadeTestAuthor": 1,
+                "tests.CascadeTestBook": 3,
+                "tests.CascadeTestChapter": 12,
+            },
+        )
+        self.assertEqual(plan.update_counts, {"tests.CascadeTestReview.livre": 3})
+        # Une requête par relation inverse et par niveau
+        self.assertEqual(len(ctx.captured_queries), 3)
+
+        counts = self.handler.handle_cascade_delete(
+            self.author, self.rules, dry_run=True
+        )
+        self.assertEqual(
+            counts,
+            {
+                "tests.CascadeTestAuthor": 1,
+                "tests.CascadeTestBook": 3,
+                "tests.CascadeTestChapter": 12,
+            },
+        )
+        self.assertEqual(CascadeTestChapter.objects.count(), 12)
+        self.assertTrue(CascadeTestAuthor.objects.filter(pk=self.author.pk).exists())
+
+    def test_cascade_applies_rules_set_based(self):
+        """Test la suppression par niveaux et la mise à NULL groupée."""
+        described = self.handler.handle_cascade_delete(self.author, self.rules)
+
+        self.assertEqual(described[-1], f"cascadetestauthor(id={self.author.pk})")
+        self.assertFalse(CascadeTestBook.objects.exists())
+        self.assertFalse(CascadeTestChapter.objects.exists())
+        self.assertEqual(
+            list(CascadeTestReview.objects.values_list("livre", flat=True)),
+            [None, None, None],
+        )
+
+    def test_unapplicable_rules_are_rejected(self):
+        """Test le rejet des règles SET_NULL/SET_DEFAULT inapplicables."""
+        from django.core.exceptions import ValidationError
+
+        # Clé étrangère non nullable et sans valeur par défaut
+        for action in ("SET_NULL", "SET_DEFAULT"):
+            with self.assertRaises(ValidationError):
+                self.handler.plan_cascade_delete(
+                    self.author, {"cascadetestchapter": action}
+                )
+        self.assertEqual(CascadeTestChapter.objects.count(), 12)
+
+    def test_protect_rule_blocks_delete(self):
+        """Test la règle PROTECT sur des lignes liées existantes."""
+        from django.core.exceptions import ValidationError
+
+        with self.assertRaises(ValidationError):
+            self.handler.handle_cascade_delete(
+                self.author, {"cascadetestreview": "PROTECT"}
+            )
+        self.assertEqual(CascadeTestBook.objects.count(), 3)
@@ -0,0 +1,307 @@
+"""
+Tests unitaires pour le planificateur select_related/prefetch_related.
+
+Ce module vérifie que l'analyseur parcourt l'arbre de sélection complet
+(fragments nommés et en ligne), convertit les noms camelCase en noms Django
+et produit des chaînes select_related et Prefetch imbriquées, ainsi que
+les listes de colonnes only() déduites de la sélection.
+"""
+
+from types import SimpleNamespace
+
+from django.db import connection, models
+from django.db.models import Prefetch
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from graphql import FragmentDefinitionNode, OperationDefinitionNode, parse
+
+from rail_django_graphql.core.meta import GraphQLMeta
+from rail_django_graphql.core.performance import QueryOptimizer
+from rail_django_graphql.extensions.optimization import (
+    QueryAnalyzer,
+    QueryOptimizationConfig,
+)
+from rail_django_graphql.tests.unit.schema_editor import SchemaEditorTestCase
+
+
+class PlanTestCountry(models.Model):
+    """Pays pour les tests du planificateur."""
+
+    nom = models.CharField(max_length=50)
+
+    class Meta:
+        app_label = "tests"
+
+
+class PlanTestCompany(models.Model):
+    """Société pour les tests du planificateur."""
+
+    nom = models.CharField(max_length=50)
+    country = models.ForeignKey(PlanTestCountry, on_delete=models.CASCADE)
+
+    class Meta:
+        app_label = "tests"
+
+
+class PlanTestAuthor(models.Model):
+    """Auteur pour les tests du planificateur."""
+
+    nom = models.CharField(max_length=50)
+    company = models.ForeignKey(
+        PlanTestCompany, null=True, on_delete=models.SET_NULL
+    )
+
+    class Meta:
+        app_label = "tests"
+
+
+class PlanTestPost(models.Model):
+    """Article pour les tests du planificateur."""
+
+    titre = models.CharField(max_length=50)
+    created_by = models.ForeignKey(
+        PlanTestAuthor, on_delete=models.CASCADE, related_name="posts"
+    )
+    reviewers = models.ManyToManyField(PlanTestAuthor, related_name="reviewed_posts")
+
+    class Meta:
+        app_label = "tests"
+
+
+class PlanTestArticle(models.Model):
+    """Article large pour les tests d'élagage des colonnes."""
+
+    STATUTS = [("brouillon", "Brouillon"), ("publie", "Publié")]
+
+    titre = models.CharField(max_length=50)
+    sous_titre = models.CharField(max_length=50, blank=True)
+    statut = models.CharField(max_length=20, choices=STATUTS, default="brouillon")
+    contenu = models.TextField(blank=True)
+    donnees = models.JSONField(default=dict)
+    auteur = models.ForeignKey(PlanTestAuthor, on_delete=models.CASCADE)
+
+    class Meta:
+        app_label = "tests"
+
+    class GraphQLMeta(GraphQLMeta):
+        properties = {"titre_complet": ["titre", "sous_titre"]}
+
+    @property
+    def titre_complet(self) -> str:
+        return f"{self.titre} - {self.sous_titre}"
+
+    @property
+    def resume(self) -> str:
+        return self.contenu[:10]
+
+
+class PlanTestSecret(models.Model):
+    """Modèle protégé par une condition de garde."""
+
+    nom = models.CharField(max_length=50)
+    code = models.CharField(max_length=50)
+
+    class Meta:
+        app_label = "tests"
+
+    class GraphQLMeta(GraphQLMeta):
+        access = GraphQLMeta.AccessControl(
+            fields=[
+                GraphQLMeta.FieldGuard(
+                    field="code",
+                    access="none",
+                    condition=lambda user, instance: True,
+                )
+            ]
+        )
+
+
+def build_info(query: str) -> SimpleNamespace:
+    """Construit un objet info minimal à partir d'un document GraphQL."""
+    document = parse(query)
+    operation = next(
+        d for d in document.definitions if isinstance(d, OperationDefinitionNode)
+    )
+    fragments = {
+        d.name.value: d
+        for d in document.definitions
+        if isinstance(d, FragmentDefinitionNode)
+    }
+    return SimpleNamespace(
+        field_nodes=[operation.selection_set.selections[0]], fragments=fragments
+    )
+
+
+def prefetch_paths(prefetches):
+    """Retourne les chemins des objets Prefetch."""
+    return [p.prefetch_to if isinstance(p, Prefetch) else p for p in prefetches]
+
+
+class TestSelectionTreePlanner(TestCase):
+    """Tests pour l'analyse récursive de l'arbre de sélection."""
+
+    def setUp(self):
+        self.analyzer = QueryAnalyzer(QueryOptimizationConfig())
+
+    def test_nested_select_related_with_camel_case(self):
+        """Test les chemins select_related imbriqués depuis des noms camelCase."""
+        info = build_info(
+            "{ posts { titre createdBy { nom company { country { nom } } } } }"
+        )
+        result = self.analyzer.analyze_query(info, PlanTestPost)
+
+        self.assertIn("created_by", result.requested_fields)
+        self.assertEqual(
+            result.select_related_fields,
+            ["created_by", "created_by__company", "created_by__company__country"],
+        )
+        self.assertEqual(result.prefetch_related_fields, [])
+
+    def test_fragments_are_expanded_at_every_level(self):
+        """Test l'expansion des fragments nommés et en ligne imbriqués."""
+        info = build_info(
+            """
+            query {
+              posts {
+                ...PostFields
+                ... on PlanTestPostType { reviewers { ...AuthorFields } }
+              }
+            }
+            fragment PostFields on PlanTestPostType { createdBy { ...AuthorFields } }
+            fragment AuthorFields on PlanTestAuthorType {
+              nom
+              company { country { nom } }
+            }
+            """
+        )
+        result = self.analyzer.analyze_query(info, PlanTestPost)
+
+        self.assertEqual(
+            result.select_related_fields,
+            ["created_by", "created_by__company", "created_by__company__country"],
+        )
+        self.assertEqual(prefetch_paths(result.prefetch_related_fields), ["reviewers"])
+        nested_qs = result.prefetch_related_fields[0].queryset
+        self.assertEqual(
+            nested_qs.query.select_related, {"company": {"country": {}}}
+        )
+
+    def test_reverse_relations_carry_nested_plans(self):
+        """Test les Prefetch des relations inverses avec leurs plans imbriqués."""
+        info = build_info(
+            "{ authors { posts { titre reviewers { company { nom } } } } }"
+        )
+        result = self.analyzer.analyze_query(info, PlanTestAuthor)
+
+        self.assertEqual(prefetch_paths(result.prefetch_related_fields), ["posts"])
+        posts_qs = result.prefetch_related_fields[0].queryset
+        nested = posts_qs._prefetch_related_lookups
+        self.assertEqual(prefetch_paths(nested), ["reviewers"])
+        self.assertEqual(nested[0].queryset.query.select_related, {"company": {}})
+
+    def test_paginated_items_are_unwrapped(self):
+        """Test la prise en compte des champs sous items pour les requêtes paginées."""
+        info = build_info(
+            "{ posts { items { createdBy { nom } } pageInfo { totalCount } } }"
+        )
+        result = self.analyzer.analyze_query(info, PlanTestPost)
+
+        self.assertEqual(result.select_related_fields, ["created_by"])
+
+    def test_prefetch_depth_is_limited(self):
+        """Test la limite de profondeur du planificateur."""
+        analyzer = QueryAnalyzer(QueryOptimizationConfig(max_prefetch_depth=1))
+        info = build_info("{ posts { createdBy { company { country { nom } } } } }")
+        result = analyzer.analyze_query(info, PlanTestPost)
+
+        self.assertEqual(result.select_related_fields, ["created_by"])
+
+
+class TestOnlyFieldsPlanner(TestCase):
+    """Tests pour le calcul des colonnes only() depuis la sélection."""
+
+    def setUp(self):
+        self.analyzer = QueryAnalyzer(QueryOptimizationConfig())
+
+    def plan(self, query, model, joined=None, extra_fields=()):
+        info = build_info(query)
+        tree = self.analyzer._unwrap_connection(
+            model, self.analyzer.build_selection_tree(info)
+        )
+        return self.analyzer.plan_only_fields(
+            model, tree, joined=joined, extra_fields=extra_fields
+        )
+
+    def test_selected_columns_keep_pk_and_foreign_keys(self):
+        """Test la conservation de la clé primaire et des clés étrangères."""
+        only = self.plan("{ articles { titre auteur { id } } }", PlanTestArticle)
+        self.assertEqual(sorted(only), ["auteur", "id", "titre"])
+
+    def test_joined_relations_are_pruned(self):
+        """Test l'élagage des modèles joints via select_related."""
+        only = self.plan(
+            "{ articles { items { titre auteur { nom } } } }",
+            PlanTestArticle,
+            joined={"auteur": {}},
+        )
+        self.assertEqual(
+            sorted(only), ["auteur", "auteur__id", "auteur__nom", "id", "titre"]
+        )
+
+    def test_declared_property_requirements(self):
+        """Test les colonnes déclarées pour une propriété."""
+        only = self.plan("{ articles { titreComplet statutDesc } }", PlanTestArticle)
+        self.assertEqual(sorted(only), ["id", "sous_titre", "statut", "titre"])
+
+    def test_undeclared_property_disables_pruning(self):
+        """Test qu'une propriété non déclarée charge toutes les colonnes."""
+        self.assertIsNone(self.plan("{ articles { titre resume } }", PlanTestArticle))
+
+    def test_ordering_fields_are_kept(self):
+        """Test la conservation des champs de tri et des propriétés triées."""
+        only = self.plan(
+            "{ articles { titre } }",
+            PlanTestArticle,
+            extra_fields=["contenu", "titre_complet", "auteur__nom", "total_annot"],
+        )
+        self.assertEqual(sorted(only), ["contenu", "id", "sous_titre", "titre"])
+
+    def test_guard_conditions_disable_pruning(self):
+        """Test que les conditions de garde chargent toutes les colonnes."""
+        self.assertIsNone(self.plan("{ secrets { nom } }", PlanTestSecret))
+
+
+class TestOnlyFieldsQueries(SchemaEditorTestCase):
+    """Tests pour l'application de only() aux requêtes SQL."""
+
+    TEST_MODELS = [PlanTestCountry, PlanTestCompany, PlanTestAuthor, PlanTestArticle]
+
+    def setUp(self):
+        auteur = PlanTestAuthor.objects.create(nom="auteur")
+        for i in range(3):
+            PlanTestArticle.objects.create(
+                titre=f"titre {i}", contenu="x" * 1000, auteur=auteur
+            )
+        self.optimizer = QueryOptimizer()
+
+    def test_only_columns_are_selected(self):
+        """Test que les colonnes non demandées ne sont pas chargées."""
+        info = build_info("{ articles { titre auteur { nom } } }")
+        queryset = self.optimizer.apply_only_fields(
+            PlanTestArticle.objects.select_related("auteur"), info
+        )
+
+        with CaptureQueriesContext(connection) as ctx:
+            rows = [(a.titre, a.auteur.nom) for a in queryset]
+
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(len(ctx.captured_queries), 1)
+        sql = ctx.captured_queries[0]["sql"]
+        self.assertNotIn("contenu", sql)
+        self.assertNotIn("donnees", sql)
+
+    def test_explicit_only_is_preserved(self):
+        """Test que les appels only() explicites ne sont pas modifiés."""
+        info = build_info("{ articles { titre } }")
+        queryset = PlanTestArticle.objects.only("contenu")
+        self.assertIs(self.optimizer.apply_only_fields(queryset, info), queryset)
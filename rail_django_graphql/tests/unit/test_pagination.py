@@ -0,0 +1,239 @@
+"""
+Tests unitaires pour la pagination par curseur (keyset) et le comptage.
+
+Ce module vérifie le parcours complet des pages via les curseurs opaques,
+la gestion des valeurs NULL dans le tri, l'absence de COUNT lorsque
+totalCount n'est pas sélectionné et les stratégies de comptage.
+"""
+
+from types import SimpleNamespace
+
+from django.core.cache import cache
+from django.db import connection, models
+from django.test.utils import CaptureQueriesContext
+from graphql import GraphQLError, parse
+
+from rail_django_graphql.core.meta import GraphQLMeta
+from rail_django_graphql.generators.pagination import (
+    KeysetOrdering,
+    count_queryset,
+    paginate_keyset,
+)
+from rail_django_graphql.generators.queries import QueryGenerator
+from rail_django_graphql.generators.types import TypeGenerator
+from rail_django_graphql.tests.unit.schema_editor import SchemaEditorTestCase
+
+
+class KeysetTestItem(models.Model):
+    """Élément pour les tests de pagination par curseur."""
+
+    nom = models.CharField(max_length=50)
+    score = models.IntegerField(null=True)
+
+    class Meta:
+        app_label = "tests"
+
+    class GraphQLMeta(GraphQLMeta):
+        pagination = GraphQLMeta.Pagination(mode="keyset")
+
+    @property
+    def libelle(self) -> str:
+        return self.nom.upper()
+
+
+class CountTestItem(models.Model):
+    """Élément pour les tests des stratégies de comptage."""
+
+    nom = models.CharField(max_length=50)
+
+    class Meta:
+        app_label = "tests"
+
+    class GraphQLMeta(GraphQLMeta):
+        pagination = {"count_strategy": "selected"}
+
+
+def build_info(query: str) -> SimpleNamespace:
+    """Construit un objet info minimal à partir d'un document GraphQL."""
+    operation = parse(query).definitions[0]
+    return SimpleNamespace(
+        field_nodes=[operation.selection_set.selections[0]],
+        fragments={},
+        field_name="items",
+        context=SimpleNamespace(user=None),
+        operation=None,
+    )
+
+
+class TestKeysetPagination(SchemaEditorTestCase):
+    """Tests pour la pagination keyset des requêtes paginées."""
+
+    TEST_MODELS = [KeysetTestItem]
+
+    def setUp(self):
+        scores = [5, None, 3, 5, None, 1, 3, 5, 2, None, 4]
+        for index, score in enumerate(scores):
+            KeysetTestItem.objects.create(nom=f"item {index % 4}", score=score)
+
+    def collect_pages(self, order_by, per_page=3):
+        """Parcourt toutes les pages et retourne les clés primaires lues."""
+        seen, cursor = [], None
+        while True:
+            items, has_next, cursor = paginate_keyset(
+                KeysetTestItem.objects.all(),
+                KeysetTestItem,
+                order_by,
+                per_page,
+                after=cursor,
+            )
+            seen.extend(item.pk for item in items)
+            if not has_next:
+                return seen
+
+    def test_pages_follow_ordering_with_nulls_last(self):
+        """Test le parcours complet sans doublon avec des valeurs NULL."""
+        for order_by in (["-score", "nom"], ["score"], ["nom", "-score"]):
+            ordering = KeysetOrdering(KeysetTestItem, order_by)
+            expected = list(
+                KeysetTestItem.objects.order_by(
+                    *ordering.order_by_expressions()
+                ).values_list("pk", flat=True)
+            )
+            self.assertEqual(self.collect_pages(order_by), expected)
+
+    def test_primary_key_tie_breaker_is_added(self):
+        """Test l'ajout de la clé primaire comme critère de départage."""
+        ordering = KeysetOrdering(KeysetTestItem, ["-score"])
+        self.assertEqual(ordering.specs, ["-score", "id"])
+        self.assertEqual(ordering.nullable, [True, False])
+
+    def test_cursor_must_match_ordering(self):
+        """Test le rejet d'un curseur construit pour un autre tri."""
+        _, _, cursor = paginate_keyset(
+            KeysetTestItem.objects.all(), KeysetTestItem, ["nom"], 2
+        )
+        with self.assertRaises(ValueError):
+            paginate_keyset(
+                KeysetTestItem.objects.all(),
+                KeysetTestItem,
+                ["-nom"],
+                2,
+                after=cursor,
+            )
+        with self.assertRaises(ValueError):
+            KeysetOrdering(KeysetTestItem, ["nom"]).decode_cursor("pas-un-curseur")
+
+    def test_resolver_skips_count_unless_selected(self):
+        """Test que COUNT n'est exécuté que si totalCount est sélectionné."""
+        generator = QueryGenerator(TypeGenerator())
+        resolver = generator.generate_paginated_query(KeysetTestItem).resolver
+
+        info = build_info("{ items { items { nom } pageInfo { hasNextPage endCursor } } }")
+        with CaptureQueriesContext(connection) as ctx:
+            result = resolver(None, info, page=1, per_page=4, order_by=["nom"])
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.assertIsNone(result.page_info.total_count)
+        self.assertTrue(result.page_info.has_next_page)
+
+        info = build_info("{ items { pageInfo { totalCount } } }")
+        with CaptureQueriesContext(connection) as ctx:
+            next_page = resolver(
+                None,
+                info,
+                page=1,
+                per_page=4,
+                order_by=["nom"],
+                after=result.page_info.end_cursor,
+            )
+        self.assertEqual(len(ctx.captured_queries), 2)
+        self.assertEqual(next_page.page_info.total_count, 11)
+        self.assertTrue(next_page.page_info.has_previous_page)
+        self.assertFalse(
+            {item.pk for item in result.items} & {item.pk for item in next_page.items}
+        )
+
+    def test_property_ordering_refuses_cursor(self):
+        """Test le repli sur la pagination par page pour un tri par propriété."""
+        generator = QueryGenerator(TypeGenerator())
+        resolver = generator.generate_paginated_query(KeysetTestItem).resolver
+        info = build_info("{ items { items { nom } pageInfo { totalCount } } }")
+
+        result = resolver(None, info, page=1, per_page=4, order_by=["libelle"])
+        self.assertEqual(result.page_info.total_count, 11)
+        self.assertIsNone(result.page_info.end_cursor)
+
+        with self.assertRaisesMessage(GraphQLError, "libelle"):
+            resolver(
+                None, info, page=1, per_page=4, order_by=["libelle"], after="abc"
+            )
+        # Curseur invalide: erreur GraphQL et non ValueError
+        with self.assertRaises(GraphQLError):
+            resolver(None, info, page=1, per_page=4, order_by=["nom"], after="abc")
+
+
+class TestCountStrategies(SchemaEditorTestCase):
+    """Tests pour les stratégies de calcul de totalCount."""
+
+    TEST_MODELS = [CountTestItem]
+
+    def setUp(self):
+        cache.clear()
+        for index in range(7):
+            CountTestItem.objects.create(nom=f"item {index}")
+        generator = QueryGenerator(TypeGenerator())
+        self.resolver = generator.generate_paginated_query(CountTestItem).resolver
+
+    def test_count_skipped_when_not_selected(self):
+        """Test la pagination sans COUNT lorsque totalCount n'est pas demandé."""
+        info = build_info("{ items { items { nom } pageInfo { hasNextPage } } }")
+        with CaptureQueriesContext(connection) as ctx:
+            result = self.resolver(None, info, page=2, per_page=3, order_by=["id"])
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.assertIsNone(result.page_info.total_count)
+        self.assertIsNone(result.page_info.page_count)
+        self.assertTrue(result.page_info.has_next_page)
+        self.assertEqual(len(result.items), 3)
+
+        last = self.resolver(None, info, page=3, per_page=3, order_by=["id"])
+        self.assertFalse(last.page_info.has_next_page)
+        self.assertEqual(len(last.items), 1)
+
+        beyond = self.resolver(None, info, page=9, per_page=3, order_by=["id"])
+        self.assertEqual(beyond.items, [])
+        self.assertEqual(beyond.page_info.current_page, 9)
+
+    def test_count_computed_when_selected(self):
+        """Test le comptage et le bornage de page lorsque totalCount est demandé."""
+        info = build_info("{ items { pageInfo { totalCount pageCount } } }")
+        result = self.resolver(None, info, page=9, per_page=3, order_by=["id"])
+        self.assertEqual(result.page_info.total_count, 7)
+        self.assertEqual(result.page_info.page_count, 3)
+        self.assertEqual(result.page_info.current_page, 3)
+        self.assertFalse(result.page_info.has_next_page)
+
+    def test_cached_count_is_keyed_by_filters(self):
+        """Test le cache des comptes par ensemble de filtres."""
+        queryset = CountTestItem.objects.all()
+        self.assertEqual(count_queryset(queryset, "cached"), (7, True))
+        CountTestItem.objects.create(nom="nouveau")
+
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertEqual(count_queryset(queryset.order_by("-id"), "cached"), (7, True))
+        self.assertEqual(len(ctx.captured_queries), 0)
+
+        filtered = CountTestItem.objects.filter(nom="nouveau")
+        self.assertEqual(count_queryset(filtered, "cached"), (1, True))
+
+    def test_estimate_falls_back_to_exact_count(self):
+        """Test le repli sur un comptage exact hors PostgreSQL."""
+        self.assertEqual(
+            count_queryset(CountTestItem.objects.all(), "estimate", estimate_threshold=1),
+            (7, True),
+        )
+
+    def test_unknown_strategy_is_rejected(self):
+        """Test la validation de la stratégie de comptage."""
+        meta = GraphQLMeta(CountTestItem)
+        meta._meta_config = type("Meta", (), {"pagination": {"count_strategy": "x"}})
+        with self.assertRaises(ValueError):
+            meta._build_pagination_config()
@@ -0,0 +1,178 @@
+"""
+Tests unitaires pour le cache des permissions à portée de requête.
+
+Ce module vérifie que les rôles, les permissions effectives, les appels à
+has_perm et les décisions d'accès aux champs sont calculés une seule fois par
+requête, que le cache est attaché au contexte GraphQL et qu'un changement de
+rôle le vide.
+"""
+
+from types import SimpleNamespace
+
+from django.contrib.auth.models import Group, Permission, User
+from django.db import connection, models
+from django.test.utils import CaptureQueriesContext
+
+from rail_django_graphql.core.meta import GraphQLMeta
+from rail_django_graphql.security.field_permissions import (
+    FieldAccessLevel,
+    FieldContext,
+    FieldPermissionManager,
+    FieldPermissionRule,
+    FieldVisibility,
+)
+from rail_django_graphql.security.permission_cache import get_permission_cache
+from rail_django_graphql.security.rbac import RoleDefinition, RoleManager, RoleType
+from rail_django_graphql.tests.unit.schema_editor import SchemaEditorTestCase
+
+
+class PermissionCacheTestInvoice(models.Model):
+    """Facture protégée par rôle."""
+
+    montant = models.IntegerField(default=0)
+    note = models.CharField(max_length=50, blank=True)
+
+    class Meta:
+        app_label = "tests"
+
+    class GraphQLMeta(GraphQLMeta):
+        access = {"operations": {"update": {"roles": ["comptable"]}}}
+
+
+def group_queries(ctx):
+    """Retourne les requêtes qui lisent les groupes de l'utilisateur."""
+    return [q for q in ctx.captured_queries if "auth_group" in q["sql"]]
+
+
+class TestPermissionCache(SchemaEditorTestCase):
+    """Tests pour la mémorisation des permissions pendant une requête."""
+
+    TEST_MODELS = [PermissionCacheTestInvoice]
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="comptable")
+        self.user.groups.add(Group.objects.create(name="comptable"))
+        self.context = SimpleNamespace(user=self.user)
+        self.info = SimpleNamespace(context=self.context)
+
+    def test_cache_is_attached_to_context(self):
+        """Test l'attachement du cache au contexte et son renouvellement."""
+        cache = get_permission_cache(self.context)
+        self.assertIs(get_permission_cache(self.context), cache)
+        self.assertIs(get_permission_cache(user=self.user), cache)
+
+        other = User.objects.create_user(username="autre")
+        self.context.user = other
+        self.assertIsNot(get_permission_cache(self.context), cache)
+        self.assertIsNone(get_permission_cache(None, None))
+
+    def test_operation_guard_reads_groups_once(self):
+        """Test une seule lecture des groupes pour plusieurs contrôles."""
+        graphql_meta = PermissionCacheTestInvoice.GraphQLMeta(
+            PermissionCacheTestInvoice
+        )
+        with CaptureQueriesContext(connection) as ctx:
+            for _ in range(5):
+                graphql_meta.ensure_operation_access("update", info=self.info)
+        self.assertEqual(len(group_queries(ctx)), 1)
+
+    def test_effective_permissions_and_hierarchy_are_memoized(self):
+        """Test la mémorisation des permissions effectives et de l'héritage."""
+        manager = RoleManager()
+        manager.register_role(
+            RoleDefinition(
+                name="comptable",
+                description="Comptable",
+                role_type=RoleType.BUSINESS,
+                permissions=["facture.update"],
+                parent_roles=["viewer"],
+            )
+        )
+        cache = get_permission_cache(self.context)
+
+        with CaptureQueriesContext(connection) as ctx:
+            for _ in range(3):
+                permissions = manager.get_effective_permissions(self.user, cache=cache)
+                self.assertTrue(manager.has_permission(self.user, "facture.update"))
+        self.assertIn("task.read_assigned", permissions)
+        self.assertEqual(len(group_queries(ctx)), 2)
+
+        # Un changement de rôle vide le cache de la requête
+        manager.remove_role_from_user(self.user, "comptable")
+        self.assertNotIn(
+            "facture.update", manager.get_effective_permissions(self.user, cache=cache)
+        )
+
+    def test_field_decisions_are_memoized(self):
+        """Test la mémorisation des décisions (modèle, champ, opération)."""
+        permission = Permission.objects.filter(codename="view_user").first()
+        self.user.user_permissions.add(permission)
+        user = User.objects.get(pk=self.user.pk)
+        manager = FieldPermissionManager()
+        manager.register_field_rule(
+            FieldPermissionRule(
+                field_name="montant",
+                model_name="tests.permissioncachetestinvoice",
+                access_level=FieldAccessLevel.READ,
+                visibility=FieldVisibility.MASKED,
+                mask_value="***",
+                roles=["comptable"],
+            )
+        )
+        cache = get_permission_cache(SimpleNamespace(user=user))
+        calls = []
+        original_has_perm = user.has_perm
+        user.has_perm = lambda perm, obj=None: calls.append(perm) or original_has_perm(
+            perm, obj
+        )
+
+        with CaptureQueriesContext(connection) as ctx:
+            for _ in range(10):
+                for field_name in ("montant", "note"):
+                    context = FieldContext(
+                        user=user,
+                        field_name=field_name,
+                        model_class=PermissionCacheTestInvoice,
+                        permission_cache=cache,
+                    )
+                    manager.get_field_visibility(context)
+        # Rôles (1 requête) et permissions de groupe du premier has_perm (1)
+        self.assertEqual(len(group_queries(ctx)), 2)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(
+            manager.get_field_visibility(
+                FieldContext(
+                    user=user,
+                    field_name="montant",
+                    model_class=PermissionCacheTestInvoice,
+                    permission_cache=cache,
+                )
+            ),
+            (FieldVisibility.MASKED, "***"),
+        )
+
+    def test_conditional_rules_are_not_memoized(self):
+        """Test qu'une règle conditionnelle est évaluée pour chaque instance."""
+        manager = FieldPermissionManager()
+        manager.register_field_rule(
+            FieldPermissionRule(
+                field_name="note",
+                model_name="tests.permissioncachetestinvoice",
+                access_level=FieldAccessLevel.NONE,
+                visibility=FieldVisibility.HIDDEN,
+                condition=lambda context: context.instance.montant > 100,
+            )
+        )
+        cache = get_permission_cache(self.context)
+        levels = [
+            manager.get_field_access_level(
+                FieldContext(
+                    user=self.user,
+                    instance=PermissionCacheTestInvoice(montant=montant),
+                    field_name="note",
+                    permission_cache=cache,
+                )
+            )
+            for montant in (10, 500)
+        ]
+        self.assertEqual(levels, [FieldAccessLevel.READ, FieldAccessLevel.NONE])
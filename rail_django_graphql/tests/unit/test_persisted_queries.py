@@ -0,0 +1,214 @@
+"""
+Tests unitaires pour les requêtes persistées (APQ).
+
+Ce module vérifie le protocole ``extensions.persistedQuery.sha256Hash`` dans
+la vue multi-schémas (empreinte inconnue, enregistrement après validation,
+empreinte incorrecte), les stores mémoire, cache et base de données, ainsi
+que le mode liste autorisée alimenté par la commande
+``register_persisted_queries``.
+"""
+
+import json
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+import graphene
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import RequestFactory, TestCase
+
+from rail_django_graphql.extensions import persisted_queries
+from rail_django_graphql.extensions.persisted_queries import (
+    CachePersistedQueryStore,
+    DatabasePersistedQueryStore,
+    PersistedQuery,
+    PersistedQueryEntry,
+    PersistedQuerySettings,
+    hash_query,
+)
+from rail_django_graphql.views.graphql_views import MultiSchemaGraphQLView
+
+
+class Query(graphene.ObjectType):
+    """Requête racine minimale."""
+
+    hello = graphene.String()
+
+    def resolve_hello(root, info):
+        return "bonjour"
+
+
+SCHEMA = graphene.Schema(query=Query)
+QUERY = "query Hello { hello }"
+
+
+class TestPersistedQueryView(TestCase):
+    """Tests pour le protocole APQ dans la vue multi-schémas."""
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        patchers = [
+            mock.patch.object(persisted_queries, "_stores", {}),
+            mock.patch.object(
+                PersistedQuerySettings,
+                "from_schema",
+                return_value=PersistedQuerySettings(),
+            ),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def execute(self, query=None, query_hash=None, get=False):
+        """Exécute une requête, éventuellement réduite à son empreinte."""
+        data = {}
+        if query_hash:
+            data["extensions"] = {
+                "persistedQuery": {"version": 1, "sha256Hash": query_hash}
+            }
+        if get:
+            params = {"extensions": json.dumps(data.get("extensions", {}))}
+            request = self.factory.get("/graphql/", params)
+        else:
+            request = self.factory.post(
+                "/graphql/", json.dumps(data), content_type="application/json"
+            )
+        view = MultiSchemaGraphQLView(schema=SCHEMA)
+        return view.execute_graphql_request(request, data, query, {}, None)
+
+    def error_code(self, result):
+        """Retourne le code d'erreur APQ du résultat."""
+        return result.errors[0].extensions["code"]
+
+    def test_unknown_hash_then_registration(self):
+        """Test le cycle APQ: empreinte inconnue, envoi complet, empreinte seule."""
+        query_hash = hash_query(QUERY)
+        self.assertEqual(
+            self.error_code(self.execute(query_hash=query_hash)),
+            "PERSISTED_QUERY_NOT_FOUND",
+        )
+        self.assertEqual(self.execute(QUERY, query_hash).data, {"hello": "bonjour"})
+        result = self.execute(query_hash=query_hash, get=True)
+        self.assertIsNone(result.errors)
+        self.assertEqual(result.data, {"hello": "bonjour"})
+
+    def test_invalid_queries_are_not_stored(self):
+        """Test le refus d'enregistrer une requête invalide ou mal hachée."""
+        invalid = "{ unknown }"
+        self.assertTrue(self.execute(invalid, hash_query(invalid)).errors)
+        self.assertEqual(
+            self.error_code(self.execute(query_hash=hash_query(invalid))),
+            "PERSISTED_QUERY_NOT_FOUND",
+        )
+        self.assertEqual(
+            self.error_code(self.execute(QUERY, "0" * 64)),
+            "PERSISTED_QUERY_HASH_MISMATCH",
+        )
+
+    def test_disabled_persisted_queries(self):
+        """Test la réponse lorsque les requêtes persistées sont désactivées."""
+        PersistedQuerySettings.from_schema.return_value = PersistedQuerySettings(
+            enabled=False
+        )
+        result = self.execute(query_hash=hash_query(QUERY))
+        self.assertEqual(self.error_code(result), "PERSISTED_QUERY_NOT_SUPPORTED")
+        # Les requêtes complètes sans extension restent acceptées
+        self.assertIsNone(self.execute(QUERY).errors)
+
+
+class TestPersistedQueryAllowList(TestCase):
+    """Tests pour la liste autorisée alimentée par la commande de gestion."""
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.settings = PersistedQuerySettings(store="database", allow_list_only=True)
+        patchers = [
+            mock.patch.object(persisted_queries, "_stores", {}),
+            mock.patch.object(
+                PersistedQuerySettings, "from_schema", return_value=self.settings
+            ),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def execute(self, query=None, query_hash=None):
+        """Exécute une requête via la vue."""
+        data = {}
+        if query_hash:
+            data["extensions"] = {"persistedQuery": {"sha256Hash": query_hash}}
+        request = self.factory.post(
+            "/graphql/", json.dumps(data), content_type="application/json"
+        )
+        view = MultiSchemaGraphQLView(schema=SCHEMA)
+        return view.execute_graphql_request(request, data, query, {}, None)
+
+    def register(self, manifest):
+        """Enregistre un manifeste Apollo via la commande de gestion."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "manifest.json"
+            path.write_text(json.dumps(manifest), encoding="utf-8")
+            call_command("register_persisted_queries", str(path), stdout=mock.Mock())
+
+    def test_only_registered_operations_run(self):
+        """Test l'exécution des seules opérations enregistrées."""
+        self.register(
+            {
+                "format": "apollo-persisted-query-manifest",
+                "version": 1,
+                "operations": [{"id": hash_query(QUERY), "name": "Hello", "body": QUERY}],
+            }
+        )
+        row = PersistedQuery.objects.get()
+        self.assertEqual((row.operation_name, row.registered), ("Hello", True))
+
+        self.assertEqual(self.execute(query_hash=hash_query(QUERY)).data, {"hello": "bonjour"})
+        self.assertIsNone(self.execute(QUERY).errors)
+
+        other = "{ hello }"
+        for result in (self.execute(other), self.execute(other, hash_query(other))):
+            self.assertEqual(
+                result.errors[0].extensions["code"], "PERSISTED_QUERY_NOT_ALLOWED"
+            )
+        self.assertEqual(PersistedQuery.objects.count(), 1)
+
+    def test_command_rejects_mismatching_hash(self):
+        """Test le refus d'un manifeste dont l'empreinte est incorrecte."""
+        with self.assertRaises(CommandError):
+            self.register({"0" * 64: QUERY})
+        self.assertFalse(PersistedQuery.objects.exists())
+
+    def test_command_rejects_clear_with_cache_store(self):
+        """Test le refus de --clear avec le store cache avant toute lecture."""
+        with self.assertRaisesMessage(CommandError, "--clear"):
+            call_command(
+                "register_persisted_queries",
+                "manifeste-absent.json",
+                "--store",
+                "cache",
+                "--clear",
+                stdout=mock.Mock(),
+            )
+
+
+class TestPersistedQueryStores(TestCase):
+    """Tests pour les stores cache et base de données."""
+
+    def test_cache_store_round_trip(self):
+        """Test l'aller-retour d'une entrée dans le cache Django."""
+        cache.clear()
+        store = CachePersistedQueryStore()
+        store.set("abc", PersistedQueryEntry(QUERY, "Hello"))
+        self.assertEqual(store.get("abc"), PersistedQueryEntry(QUERY, "Hello"))
+        self.assertIsNone(store.get("missing"))
+
+    def test_database_store_keeps_registration(self):
+        """Test la conservation du statut enregistré et la lecture en mémoire."""
+        store = DatabasePersistedQueryStore()
+        store.set("abc", PersistedQueryEntry(QUERY, "Hello", registered=True))
+        store.set("abc", PersistedQueryEntry(QUERY))
+        self.assertTrue(store.get("abc").registered)
+        with self.assertNumQueries(0):
+            self.assertEqual(store.get("abc").operation_name, "Hello")
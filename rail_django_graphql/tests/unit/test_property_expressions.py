@@ -0,0 +1,132 @@
+"""
+Tests unitaires pour les expressions SQL déclarées sur les propriétés.
+
+Ce module vérifie que les filtres et les tris portant sur une propriété
+munie d'une expression (GraphQLMeta.properties) sont exécutés par la base
+de données au lieu d'évaluer la propriété ligne par ligne en Python.
+"""
+
+from types import SimpleNamespace
+
+from django.db import connection, models
+from django.db.models import Value
+from django.db.models.functions import Concat, Upper
+from django.test.utils import CaptureQueriesContext
+from graphql import parse
+
+from rail_django_graphql.core.meta import GraphQLMeta, get_model_graphql_meta
+from rail_django_graphql.generators.filters import AdvancedFilterGenerator
+from rail_django_graphql.generators.pagination import paginate_keyset
+from rail_django_graphql.generators.queries import QueryGenerator
+from rail_django_graphql.generators.types import TypeGenerator
+from rail_django_graphql.tests.unit.schema_editor import SchemaEditorTestCase
+
+
+class ExpressionTestPerson(models.Model):
+    """Personne dont le nom complet est exprimé en SQL."""
+
+    prenom = models.CharField(max_length=50)
+    nom = models.CharField(max_length=50)
+
+    class Meta:
+        app_label = "tests"
+
+    class GraphQLMeta(GraphQLMeta):
+        properties = {
+            "nom_complet": GraphQLMeta.Property(
+                requires=["prenom", "nom"],
+                expression=Concat("prenom", Value(" "), "nom"),
+            ),
+            "nom_majuscule": {"expression": lambda: Upper("nom")},
+        }
+
+    @property
+    def nom_complet(self) -> str:
+        return f"{self.prenom} {self.nom}"
+
+    @property
+    def nom_majuscule(self) -> str:
+        return self.nom.upper()
+
+
+def build_info(query: str) -> SimpleNamespace:
+    """Construit un objet info minimal à partir d'un document GraphQL."""
+    operation = parse(query).definitions[0]
+    return SimpleNamespace(
+        field_nodes=[operation.selection_set.selections[0]],
+        fragments={},
+        field_name="persons",
+        context=SimpleNamespace(user=None),
+        operation=None,
+    )
+
+
+class TestPropertyExpressions(SchemaEditorTestCase):
+    """Tests pour l'exécution SQL des filtres et tris sur propriétés."""
+
+    TEST_MODELS = [ExpressionTestPerson]
+
+    def setUp(self):
+        for prenom, nom in [("Ali", "Zed"), ("Bea", "Yon"), ("Cal", "Xu"), ("Ali", "Abe")]:
+            ExpressionTestPerson.objects.create(prenom=prenom, nom=nom)
+        self.filter_generator = AdvancedFilterGenerator()
+
+    def test_filter_method_runs_in_sql(self):
+        """Test que le filtre de propriété est compilé en une seule requête."""
+        filter_method = self.filter_generator._create_property_filter_method(
+            "nom_complet", "icontains"
+        )
+        queryset = filter_method(ExpressionTestPerson.objects.all(), "nom_complet", "ali ")
+
+        with CaptureQueriesContext(connection) as ctx:
+            noms = sorted(person.nom for person in queryset)
+
+        self.assertEqual(noms, ["Abe", "Zed"])
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.assertIn("LIKE", ctx.captured_queries[0]["sql"].upper())
+
+    def test_complex_filters_alias_properties(self):
+        """Test les filtres complexes imbriqués sur une propriété."""
+        queryset = self.filter_generator.apply_complex_filters(
+            ExpressionTestPerson.objects.all(),
+            {"OR": [{"nom_complet__startswith": "Bea"}, {"nom_majuscule": "XU"}]},
+        )
+        self.assertEqual(sorted(p.prenom for p in queryset), ["Bea", "Cal"])
+
+    def test_ordering_runs_in_sql(self):
+        """Test le tri par propriété exécuté par la base de données."""
+        generator = QueryGenerator(TypeGenerator())
+        db_specs, prop_specs = generator._split_order_specs(
+            ExpressionTestPerson, ["-nom_complet"]
+        )
+        self.assertEqual((db_specs, prop_specs), (["-nom_complet"], []))
+
+        resolver = generator.generate_paginated_query(ExpressionTestPerson).resolver
+        info = build_info("{ persons { items { nomComplet } } }")
+        with CaptureQueriesContext(connection) as ctx:
+            result = resolver(None, info, page=1, per_page=2, order_by=["nom_complet"])
+
+        self.assertEqual(
+            [person.nom_complet for person in result.items], ["Ali Abe", "Ali Zed"]
+        )
+        self.assertIn("ORDER BY", ctx.captured_queries[-1]["sql"])
+        self.assertIn("LIMIT 2", ctx.captured_queries[-1]["sql"])
+
+    def test_keyset_pagination_on_property(self):
+        """Test la pagination par curseur sur une propriété déclarée."""
+        meta = get_model_graphql_meta(ExpressionTestPerson)
+        queryset = meta.apply_property_expressions(
+            ExpressionTestPerson.objects.all(), ["nom_complet"]
+        )
+        items, has_next, cursor = paginate_keyset(
+            queryset, ExpressionTestPerson, ["nom_complet"], 2
+        )
+        rest, has_more, _ = paginate_keyset(
+            queryset, ExpressionTestPerson, ["nom_complet"], 2, after=cursor
+        )
+        self.assertTrue(has_next)
+        self.assertFalse(has_more)
+        self.assertEqual(
+            [p.nom_complet for p in items + rest],
+            ["Ali Abe", "Ali Zed", "Bea Yon", "Cal Xu"],
+        )
@@ -0,0 +1,150 @@
+"""
+Tests unitaires pour l'évaluation bornée des propriétés en Python.
+
+Ce module vérifie que les filtres et tris sur des propriétés sans expression
+SQL parcourent les lignes par lots en ne chargeant que les colonnes
+déclarées, conservent seulement les k premières lignes triées et échouent
+avec une erreur GraphQL explicite au-delà du plafond de lignes du modèle.
+"""
+
+from types import SimpleNamespace
+
+from django.db import connection, models
+from django.test.utils import CaptureQueriesContext
+from graphql import GraphQLError, parse
+
+from rail_django_graphql.core.meta import GraphQLMeta
+from rail_django_graphql.generators.filters import AdvancedFilterGenerator
+from rail_django_graphql.generators.queries import QueryGenerator
+from rail_django_graphql.generators.types import TypeGenerator
+from rail_django_graphql.tests.unit.schema_editor import SchemaEditorTestCase
+
+
+class FallbackTestProduct(models.Model):
+    """Produit dont les propriétés sont évaluées en Python."""
+
+    nom = models.CharField(max_length=50)
+    prix = models.IntegerField()
+    quantite = models.IntegerField()
+    notice = models.TextField(default="")
+
+    class Meta:
+        app_label = "tests"
+
+    class GraphQLMeta(GraphQLMeta):
+        properties = {"valeur": ["prix", "quantite"]}
+
+    @property
+    def valeur(self) -> int:
+        return self.prix * self.quantite
+
+    @property
+    def initiale(self) -> str:
+        return self.nom[:1]
+
+
+class CappedTestProduct(models.Model):
+    """Produit dont le parcours Python est plafonné."""
+
+    prix = models.IntegerField()
+
+    class Meta:
+        app_label = "tests"
+
+    class GraphQLMeta(GraphQLMeta):
+        property_scan_limit = 3
+
+    @property
+    def double(self) -> int:
+        return self.prix * 2
+
+
+def build_info(query: str) -> SimpleNamespace:
+    """Construit un objet info minimal à partir d'un document GraphQL."""
+    operation = parse(query).definitions[0]
+    return SimpleNamespace(
+        field_nodes=[operation.selection_set.selections[0]],
+        fragments={},
+        field_name="products",
+        context=SimpleNamespace(user=None),
+        operation=None,
+    )
+
+
+class TestPropertyFallback(SchemaEditorTestCase):
+    """Tests pour le repli Python borné des filtres et tris sur propriétés."""
+
+    TEST_MODELS = [FallbackTestProduct, CappedTestProduct]
+
+    def setUp(self):
+        rows = [("b", 4, 5), ("a", 3, 1), ("d", 2, 9), ("c", 7, 2), ("e", 1, 3)]
+        for nom, prix, quantite in rows:
+            FallbackTestProduct.objects.create(nom=nom, prix=prix, quantite=quantite)
+        for prix in range(5):
+            CappedTestProduct.objects.create(prix=prix)
+        self.generator = QueryGenerator(TypeGenerator())
+
+    def test_filter_loads_declared_columns_only(self):
+        """Test que le filtre ne charge que les colonnes déclarées."""
+        filter_method = AdvancedFilterGenerator()._create_property_filter_method(
+            "valeur", "gte"
+        )
+        with CaptureQueriesContext(connection) as ctx:
+            queryset = filter_method(FallbackTestProduct.objects.all(), "valeur", 14)
+        noms = sorted(product.nom for product in queryset)
+
+        self.assertEqual(noms, ["b", "c", "d"])
+        scan_sql = ctx.captured_queries[0]["sql"]
+        self.assertIn('"prix"', scan_sql)
+        self.assertNotIn('"notice"', scan_sql)
+
+    def test_scan_limit_raises_graphql_error(self):
+        """Test l'erreur GraphQL au-delà du plafond de lignes du modèle."""
+        filter_method = AdvancedFilterGenerator()._create_property_filter_method(
+            "double", "gte"
+        )
+        with self.assertRaises(GraphQLError) as raised:
+            filter_method(CappedTestProduct.objects.all(), "double", 0)
+        self.assertIn("GraphQLMeta.properties", str(raised.exception))
+
+        resolver = self.generator.generate_list_query(CappedTestProduct).kwargs[
+            "resolver"
+        ]
+        with self.assertRaises(GraphQLError):
+            resolver(None, build_info("{ products { prix } }"), order_by=["double"])
+
+    def test_top_k_matches_full_sort(self):
+        """Test que le tri borné donne les mêmes lignes que le tri complet."""
+        specs = ["-valeur", "initiale"]
+        products = list(FallbackTestProduct.objects.all())
+        full = self.generator._apply_property_ordering(products, specs)
+        top = self.generator._apply_property_ordering(iter(products), specs, limit=2)
+
+        self.assertEqual([p.nom for p in full], ["b", "d", "c", "a", "e"])
+        self.assertEqual(top, full[:2])
+
+        resolver = self.generator.generate_list_query(FallbackTestProduct).kwargs[
+            "resolver"
+        ]
+        items = resolver(
+            None,
+            build_info("{ products { nom } }"),
+            order_by=["-valeur"],
+            offset=1,
+            limit=2,
+        )
+        self.assertEqual([p.nom for p in items], ["d", "c"])
+
+    def test_paginated_total_count_from_scan(self):
+        """Test le total exact et la page demandée avec un tri par propriété."""
+        resolver = self.generator.generate_paginated_query(FallbackTestProduct).resolver
+        info = build_info("{ products { items { nom } pageInfo { totalCount } } }")
+
+        result = resolver(None, info, page=2, per_page=2, order_by=["valeur"])
+        self.assertEqual(result.page_info.total_count, 5)
+        self.assertEqual(result.page_info.page_count, 3)
+        self.assertEqual([p.nom for p in result.items], ["c", "d"])
+
+        last = resolver(None, info, page=9, per_page=2, order_by=["valeur"])
+        self.assertEqual(last.page_info.current_page, 3)
+        self.assertEqual([p.nom for p in last.items], ["b"])
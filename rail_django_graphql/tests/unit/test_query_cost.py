@@ -0,0 +1,206 @@
+"""
+Tests unitaires pour l'analyseur de coût des requêtes GraphQL.
+
+Ce module vérifie les multiplicateurs de listes (limit, per_page, variables),
+l'expansion des fragments, les coûts déclarés dans GraphQLMeta, le cache LRU
+indexé par document et variables de taille, ainsi que la règle de validation
+et l'exposition du coût sur le contexte.
+"""
+
+from types import SimpleNamespace
+from unittest import mock
+
+import graphene
+from django.db import models
+from django.test import TestCase
+from graphene_django import DjangoObjectType
+from graphql import parse, validate
+
+from rail_django_graphql.core import query_cost
+from rail_django_graphql.core.meta import GraphQLMeta
+from rail_django_graphql.core.performance import PerformanceSettings
+from rail_django_graphql.core.query_cost import (
+    QueryCostAnalyzer,
+    create_query_cost_rule,
+    get_query_cost,
+    validate_query_cost,
+)
+
+
+class CostTestDocument(models.Model):
+    """Document dont le corps est coûteux à charger."""
+
+    title = models.CharField(max_length=100)
+    body = models.TextField()
+
+    class Meta:
+        app_label = "tests"
+        managed = False
+
+    class GraphqlMeta(GraphQLMeta):
+        cost = GraphQLMeta.Cost(type_cost=3, fields={"body": 5})
+
+
+class CostTestDocumentType(DjangoObjectType):
+    """Type GraphQL du document."""
+
+    class Meta:
+        model = CostTestDocument
+        fields = ("id", "title", "body")
+
+
+class Item(graphene.ObjectType):
+    """Élément de liste."""
+
+    id = graphene.Int()
+    name = graphene.String()
+
+
+class Page(graphene.ObjectType):
+    """Page d'éléments."""
+
+    total = graphene.Int()
+    items = graphene.List(Item)
+
+
+class Query(graphene.ObjectType):
+    """Requête racine: listes, page et coût courant."""
+
+    items = graphene.List(Item, limit=graphene.Int())
+    page = graphene.Field(Page, per_page=graphene.Int())
+    documents = graphene.List(CostTestDocumentType, limit=graphene.Int())
+    cost = graphene.Int()
+
+    def resolve_cost(root, info):
+        return get_query_cost(info).complexity
+
+
+class TestQueryCostAnalyzer(TestCase):
+    """Tests pour le calcul et le cache du coût des requêtes."""
+
+    def setUp(self):
+        self.schema = graphene.Schema(query=Query).graphql_schema
+        self.analyzer = QueryCostAnalyzer(PerformanceSettings(default_list_size=10))
+
+    def analyze(self, query, variables=None):
+        """Analyse une requête sur le schéma de test."""
+        return self.analyzer.analyze(self.schema, parse(query), None, variables)
+
+    def test_list_multipliers(self):
+        """Test les multiplicateurs de listes: limit, défaut et per_page."""
+        limited = self.analyze("{ items(limit: 5) { id name } }")
+        self.assertEqual((limited.complexity, limited.depth, limited.field_count), (15, 2, 3))
+        self.assertEqual(self.analyze("{ items { id name } }").complexity, 30)
+        # per_page s'applique à la liste imbriquée sous l'objet paginé
+        self.assertEqual(
+            self.analyze("{ page(perPage: 20) { total items { id } } }").complexity, 42
+        )
+
+    def test_fragments_are_expanded(self):
+        """Test l'expansion des fragments nommés et en ligne."""
+        query = """
+            query { items(limit: 2) { ...ItemFields ... on Item { name } } }
+            fragment ItemFields on Item { id name }
+        """
+        self.assertEqual(self.analyze(query).complexity, 2 * (1 + 3))
+
+    def test_graphql_meta_costs(self):
+        """Test les coûts de type et de champ déclarés dans GraphQLMeta."""
+        cost = self.analyze("{ documents(limit: 2) { title body } }")
+        self.assertEqual(cost.complexity, 2 * (3 + 1 + 5))
+
+    def test_cache_keyed_by_size_variables(self):
+        """Test le cache par document et valeurs des variables de taille."""
+        query = "query ($n: Int, $other: String) { items(limit: $n) { id } }"
+        first = self.analyze(query, {"n": 5, "other": "a"})
+        # Normalisation: espaces différents, même document
+        again = self.analyze(
+            "query($n:Int,$other:String){items(limit:$n){id}}", {"n": 5, "other": "b"}
+        )
+        larger = self.analyze(query, {"n": 50})
+        self.assertEqual((first.complexity, again.complexity, larger.complexity), (10, 10, 100))
+        self.assertEqual((self.analyzer.hits, self.analyzer.misses), (1, 2))
+
+    def test_cache_keyed_by_schema_name_and_version(self):
+        """Test l'invalidation du cache lorsque le schéma change de version."""
+        document = parse("{ items { id } }")
+        for version in (1, 1, 2):
+            self.analyzer.analyze(self.schema, document, schema_name="s", schema_version=version)
+        self.assertEqual((self.analyzer.hits, self.analyzer.misses), (1, 2))
+        self.assertEqual(len(self.analyzer._entries), 1)
+
+        # Sans nom, le schéma lui-même sert de clé
+        other = graphene.Schema(query=Query).graphql_schema
+        self.analyzer.analyze(self.schema, document)
+        self.analyzer.analyze(other, document)
+        self.assertEqual(self.analyzer.misses, 4)
+
+    def test_size_variable_default_value(self):
+        """Test la valeur par défaut d'une variable de taille absente."""
+        query = "query ($n: Int = 1000) { items(limit: $n) { id } }"
+        defaulted = self.analyze(query)
+        explicit = self.analyze(query, {"n": 3})
+        # null explicite: pas de valeur par défaut, taille de liste par défaut
+        null = self.analyze(query, {"n": None})
+        self.assertEqual(
+            (defaulted.complexity, explicit.complexity, null.complexity), (2000, 6, 20)
+        )
+        self.assertEqual(self.analyze(query).complexity, 2000)
+        self.assertEqual((self.analyzer.hits, self.analyzer.misses), (1, 3))
+
+    def test_validation_rule_reports_and_enforces(self):
+        """Test la règle de validation: coût transmis puis limite appliquée."""
+        costs = []
+        rule = create_query_cost_rule({"n": 3}, on_cost=costs.append)
+        document = parse("query ($n: Int) { items(limit: $n) { id } }")
+        with mock.patch.object(query_cost, "_query_cost_analyzer", self.analyzer):
+            self.assertEqual(validate(self.schema, document, [rule]), [])
+            self.assertEqual(costs[0].complexity, 6)
+
+            strict = QueryCostAnalyzer(
+                PerformanceSettings(enable_query_cost_analysis=True, max_query_complexity=5)
+            )
+            with mock.patch.object(query_cost, "_query_cost_analyzer", strict):
+                errors = validate(self.schema, document, [rule])
+        self.assertEqual(len(errors), 1)
+        self.assertIn("complexity 6", errors[0].message)
+
+    def test_depth_is_limited_without_cost_analysis(self):
+        """Test la limite de profondeur appliquée même sans analyse de coût."""
+        cost = query_cost.QueryCost(complexity=5000, depth=4, field_count=4)
+        settings = PerformanceSettings(
+            enable_query_cost_analysis=False, max_query_depth=3, max_query_complexity=10
+        )
+        errors = validate_query_cost(cost, settings)
+        self.assertEqual(len(errors), 1)
+        self.assertIn("depth 4", errors[0])
+
+        rule = create_query_cost_rule()
+        document = parse("{ page { items { id } } }")
+        with mock.patch.object(
+            query_cost, "_query_cost_analyzer", QueryCostAnalyzer(settings)
+        ):
+            self.assertEqual(validate(self.schema, document, [rule]), [])
+            deep = QueryCostAnalyzer(PerformanceSettings(max_query_depth=2))
+            with mock.patch.object(query_cost, "_query_cost_analyzer", deep):
+                errors = validate(self.schema, document, [rule])
+        self.assertIn("depth 3", errors[0].message)
+
+    def test_security_complexity_multipliers_are_deprecated(self):
+        """Test l'avertissement pour l'option obsolète complexity_multipliers."""
+        from rail_django_graphql.security.graphql_security import SecurityConfig
+
+        with self.assertWarns(DeprecationWarning):
+            SecurityConfig(complexity_multipliers={"connection": 2.0})
+        self.assertIsNone(SecurityConfig().complexity_multipliers)
+
+    def test_cost_is_exposed_on_context(self):
+        """Test l'exposition du coût sur le contexte pendant l'exécution."""
+        context = SimpleNamespace()
+        with mock.patch.object(query_cost, "_query_cost_analyzer", self.analyzer):
+            result = graphene.Schema(query=Query).execute(
+                "{ cost items(limit: 4) { id } }", context_value=context
+            )
+        self.assertIsNone(result.errors)
+        self.assertEqual(result.data["cost"], 1 + 4 * 2)
+        self.assertEqual(context.query_cost.complexity, 9)
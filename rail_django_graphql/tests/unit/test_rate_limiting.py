@@ -0,0 +1,202 @@
+"""
+Tests unitaires pour le moteur de limitation de débit.
+
+Ce module vérifie les fenêtres fixes à compteurs atomiques sur chaque
+backend (mémoire locale, cache Django, serveur compatible Redis), les limites
+fondées sur le coût de l'opération et le comptage unique par opération
+GraphQL, quel que soit le nombre de champs résolus.
+"""
+
+from types import SimpleNamespace
+from unittest import mock
+
+import graphene
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.test import TestCase
+
+from rail_django_graphql.extensions import rate_limiting
+from rail_django_graphql.extensions.rate_limiting import (
+    DjangoCacheBackend,
+    LocalMemoryBackend,
+    RateLimitEngine,
+    RateLimitRule,
+    RedisBackend,
+)
+
+
+class LocalRedis:
+    """Substitut local d'un client Redis (transactions MULTI/EXEC)."""
+
+    def __init__(self):
+        self.values = {}
+        self.expirations = {}
+        self.transactions = []
+
+    def pipeline(self, transaction=True):
+        return LocalRedisPipeline(self, transaction)
+
+
+class LocalRedisPipeline:
+    """Pipeline local: les commandes ne s'appliquent qu'à execute()."""
+
+    def __init__(self, client, transaction):
+        self.client = client
+        self.transaction = transaction
+        self.commands = []
+
+    def incrby(self, key, amount):
+        self.commands.append(("incrby", key, amount, {}))
+
+    def expire(self, key, seconds, nx=False):
+        self.commands.append(("expire", key, seconds, {"nx": nx}))
+
+    def execute(self):
+        self.client.transactions.append(
+            (self.transaction, [command[0] for command in self.commands])
+        )
+        results = []
+        for name, key, value, options in self.commands:
+            if name == "incrby":
+                self.client.values[key] = self.client.values.get(key, 0) + value
+                results.append(self.client.values[key])
+            elif options["nx"] and key in self.client.expirations:
+                results.append(False)
+            else:
+                self.client.expirations[key] = value
+                results.append(True)
+        self.commands = []
+        return results
+
+
+class Item(graphene.ObjectType):
+    """Élément de liste avec plusieurs champs scalaires."""
+
+    id = graphene.Int()
+    label = graphene.String()
+
+
+class Query(graphene.ObjectType):
+    """Requête racine retournant une liste d'éléments."""
+
+    items = graphene.List(Item)
+    total = graphene.Int()
+
+    def resolve_items(root, info):
+        return [Item(id=index, label=str(index)) for index in range(50)]
+
+    def resolve_total(root, info):
+        return 50
+
+
+class TestRateLimitEngine(TestCase):
+    """Tests pour les fenêtres fixes du moteur et ses backends."""
+
+    def test_fixed_window_blocks_then_resets(self):
+        """Test le blocage au-delà de la limite puis la réouverture de la fenêtre."""
+        engine = RateLimitEngine(LocalMemoryBackend())
+        rules = [RateLimitRule("minute", 2, 60)]
+        with mock.patch.object(rate_limiting.time, "time", return_value=1200.0):
+            allowed = [engine.check("user:1", rules).allowed for _ in range(3)]
+            denied = engine.check("user:1", rules)
+            other = engine.check("user:2", rules)
+        self.assertEqual(allowed, [True, True, False])
+        self.assertEqual(denied.rule.name, "minute")
+        self.assertEqual(denied.retry_after, 60)
+        self.assertTrue(other.allowed)
+
+        with mock.patch.object(rate_limiting.time, "time", return_value=1260.0):
+            self.assertTrue(engine.check("user:1", rules).allowed)
+
+    def test_django_cache_backend_and_cost_rule(self):
+        """Test les compteurs du cache Django et une règle fondée sur le coût."""
+        cache.clear()
+        engine = RateLimitEngine(DjangoCacheBackend())
+        rules = [
+            RateLimitRule("requests", 10, 60),
+            RateLimitRule("cost", 100, 60, use_cost=True),
+        ]
+        self.assertTrue(engine.check("ip:10.0.0.1", rules, cost=60).allowed)
+        result = engine.check("ip:10.0.0.1", rules, cost=60)
+        self.assertFalse(result.allowed)
+        self.assertEqual((result.rule.name, result.count), ("cost", 120))
+
+    def test_redis_backend_sets_ttl_atomically(self):
+        """Test l'incrément et l'expiration dans une même transaction."""
+        client = LocalRedis()
+        engine = RateLimitEngine(RedisBackend(client))
+        rules = [RateLimitRule("minute", 5, 60)]
+        for _ in range(3):
+            engine.check("user:1", rules)
+        self.assertEqual(list(client.values.values()), [3])
+        self.assertEqual(list(client.expirations.values()), [60])
+        # Un seul aller-retour MULTI/EXEC par incrément, jamais d'INCRBY seul
+        self.assertEqual(client.transactions, [(True, ["incrby", "expire"])] * 3)
+
+        # Une erreur avant execute() n'applique aucune commande
+        with mock.patch.object(
+            LocalRedisPipeline, "execute", side_effect=ConnectionError
+        ):
+            with self.assertRaises(ConnectionError):
+                RedisBackend(client).increment("user:2", 1, 60)
+        self.assertNotIn("user:2", client.values)
+
+
+class TestRateLimitMiddleware(TestCase):
+    """Tests pour le comptage unique par opération GraphQL."""
+
+    def setUp(self):
+        self.backend = LocalMemoryBackend()
+        self.schema = graphene.Schema(query=Query)
+        settings = {
+            "enable": True,
+            "window_seconds": 60,
+            "max_requests": 2,
+            "max_cost": 0,
+            "scope": "per_user",
+            "backend": "memory",
+            "location": "",
+        }
+        patchers = [
+            mock.patch.object(
+                rate_limiting, "_get_rate_limit_settings", return_value=settings
+            ),
+            mock.patch.object(
+                rate_limiting,
+                "get_rate_limit_engine",
+                return_value=RateLimitEngine(self.backend),
+            ),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def execute(self):
+        """Exécute une opération avec deux champs racine et une liste."""
+        context = SimpleNamespace(
+            user=AnonymousUser(), META={"REMOTE_ADDR": "192.0.2.1"}
+        )
+        return self.schema.execute(
+            "{ items { id label } total }",
+            context_value=context,
+            middleware=[rate_limiting.rate_limit_middleware],
+        )
+
+    def test_operation_is_counted_once(self):
+        """Test un seul incrément par opération malgré ses nombreux champs."""
+        with mock.patch.object(
+            self.backend, "increment", wraps=self.backend.increment
+        ) as increment:
+            result = self.execute()
+        self.assertIsNone(result.errors)
+        self.assertEqual(len(result.data["items"]), 50)
+        self.assertEqual(increment.call_count, 1)
+
+    def test_limit_is_enforced_per_operation(self):
+        """Test le refus de la troisième opération avec retry_after."""
+        self.assertIsNone(self.execute().errors)
+        self.assertIsNone(self.execute().errors)
+        result = self.execute()
+        self.assertTrue(result.errors)
+        self.assertEqual(result.errors[0].extensions["code"], "RATE_LIMITED")
+        self.assertIsNone(result.data["items"])
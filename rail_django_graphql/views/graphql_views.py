@@ -7,14 +7,30 @@ import logging
 from typing import Any, Dict, Optional
 
 from django.conf import settings
-from django.http import Http404, HttpRequest, HttpResponse, JsonResponse
+from django.db import connection, transaction
+from django.http import (
+    Http404,
+    HttpRequest,
+    HttpResponse,
+    HttpResponseNotAllowed,
+    JsonResponse,
+)
 from django.utils.decorators import method_decorator
 from django.views.decorators.csrf import csrf_exempt
 from django.views.generic import View
 
 try:
-    from graphene_django.views import GraphQLView
-    from graphql import GraphQLError
+    from graphene_django.constants import MUTATION_ERRORS_FLAG
+    from graphene_django.settings import graphene_settings
+    from graphene_django.views import GraphQLView, HttpError
+    from graphql import (
+        ExecutionResult,
+        GraphQLError,
+        OperationType,
+        execute,
+        get_operation_ast,
+        validate_schema,
+    )
 except ImportError:
     raise ImportError(
         "graphene-django is required for GraphQL views. "
@@ -40,6 +56,146 @@ class MultiSchemaGraphQLView(GraphQLView):
         """Initialize the multi-schema view."""
         super().__init__(**kwargs)
         self._schema_cache = {}
+        self._schema_name = None
+        self._schema_version = None
+        self._base_validation_rules = self.validation_rules
+
+    def execute_graphql_request(
+        self, request, data, query, variables, operation_name, show_graphiql=False
+    ):
+        """
+        Execute a GraphQL request, reusing cached parsed and validated documents.
+
+        Parsing and validation results come from the process-wide document
+        cache, keyed by schema name and version, so hot documents skip both.
+        The cost (``QueryCost``) is then computed for the request variables and
+        stored on the request, which is also the GraphQL context, as
+        ``query_cost``.
+
+        Hash-only requests (``extensions.persistedQuery.sha256Hash``) are
+        resolved from the persisted query store; see
+        ``extensions.persisted_queries``.
+        """
+        from ..core.document_cache import get_document_cache
+        from ..core.query_cost import get_query_cost_analyzer, validate_query_cost
+        from ..extensions.persisted_queries import (
+            PersistedQueryError,
+            PersistedQuerySettings,
+            get_request_extensions,
+            resolve_persisted_query,
+            store_persisted_query,
+        )
+
+        request.query_cost = None
+        persisted_settings = PersistedQuerySettings.from_schema(self._schema_name)
+        try:
+            lookup = resolve_persisted_query(
+                query, get_request_extensions(request, data), persisted_settings
+            )
+        except PersistedQueryError as e:
+            return ExecutionResult(data=None, errors=[e])
+        query = lookup.query
+
+        if not query:
+            return super().execute_graphql_request(
+                request, data, query, variables, operation_name, show_graphiql
+            )
+
+        schema = self.schema.graphql_schema
+
+        schema_validation_errors = validate_schema(schema)
+        if schema_validation_errors:
+            return ExecutionResult(data=None, errors=schema_validation_errors)
+
+        try:
+            cached = get_document_cache().get_document(
+                self._schema_name if self._schema_name is not None else id(schema),
+                self._schema_version if self._schema_version is not None else id(schema),
+                schema,
+                query,
+                self._base_validation_rules,
+                graphene_settings.MAX_VALIDATION_ERRORS,
+                lookup.query_hash,
+            )
+        except Exception as e:
+            return ExecutionResult(errors=[e])
+
+        document = cached.document
+        operation_ast = get_operation_ast(document, operation_name)
+
+        if (
+            request.method.lower() == "get"
+            and operation_ast is not None
+            and operation_ast.operation != OperationType.QUERY
+        ):
+            if show_graphiql:
+                return None
+
+            raise HttpError(
+                HttpResponseNotAllowed(
+                    ["POST"],
+                    "Can only perform a {} operation from a POST request.".format(
+                        operation_ast.operation.value
+                    ),
+                )
+            )
+
+        if cached.errors:
+            return ExecutionResult(data=None, errors=list(cached.errors))
+
+        # Queries sent with their hash are only stored once known to be valid
+        store_persisted_query(lookup, persisted_settings, operation_name)
+
+        # The cost depends on the variables: computed outside the cached validation
+        analyzer = get_query_cost_analyzer()
+        try:
+            request.query_cost = analyzer.analyze(
+                schema,
+                document,
+                operation_name,
+                variables,
+                cached.query_hash,
+                self._schema_name,
+                self._schema_version,
+            )
+        except Exception as e:
+            logger.warning(f"Query cost analysis failed: {e}")
+        else:
+            cost_errors = validate_query_cost(request.query_cost, analyzer.settings)
+            if cost_errors:
+                return ExecutionResult(
+                    data=None,
+                    errors=[GraphQLError(message, document) for message in cost_errors],
+                )
+
+        try:
+            execute_options = {
+                "root_value": self.get_root_value(request),
+                "context_value": self.get_context(request),
+                "variable_values": variables,
+                "operation_name": operation_name,
+                "middleware": self.get_middleware(request),
+            }
+            if self.execution_context_class:
+                execute_options["execution_context_class"] = self.execution_context_class
+
+            if (
+                operation_ast is not None
+                and operation_ast.operation == OperationType.MUTATION
+                and (
+                    graphene_settings.ATOMIC_MUTATIONS is True
+                    or connection.settings_dict.get("ATOMIC_MUTATIONS", False) is True
+                )
+            ):
+                with transaction.atomic():
+                    result = execute(schema, document, **execute_options)
+                    if getattr(request, MUTATION_ERRORS_FLAG, False) is True:
+                        transaction.set_rollback(True)
+                return result
+
+            return execute(schema, document, **execute_options)
+        except Exception as e:
+            return ExecutionResult(errors=[e])
 
     def dispatch(self, request: HttpRequest, *args, **kwargs):
         """
@@ -99,25 +255,15 @@ class MultiSchemaGraphQLView(GraphQLView):
                 parts = auth_header.split(" ", 1)
                 token = parts[1] if len(parts) == 2 else None
                 if token:
-                    # Validate JWT token using JWTManager
-                    from ..extensions.auth import JWTManager
-
-                    payload = JWTManager.verify_token(token)
-
-                    if payload:
-                        # Get user from payload, support standard 'sub' claim fallback
-                        user_id = payload.get("user_id") or payload.get("sub")
-                        if user_id:
-                            from django.contrib.auth import get_user_model
-
-                            User = get_user_model()
-
-                            user = User.objects.filter(id=user_id, is_active=True).first()
-                            if user:
-                                # Inject authenticated user into context
-                                context.user = user
-                                # Also set on request for compatibility
-                                request.user = user
+                    # Verified claims and active users are cached per process
+                    from ..extensions.auth_cache import authenticate_token
+
+                    user = authenticate_token(token)
+                    if user:
+                        # Inject authenticated user into context
+                        context.user = user
+                        # Also set on request for compatibility
+                        request.user = user
             except Exception as e:
                 # Log the error for debugging but don't expose details
                 logger.warning(f"JWT authentication failed: {str(e)}")
@@ -126,6 +272,8 @@ class MultiSchemaGraphQLView(GraphQLView):
         schema_match = getattr(request, "resolver_match", None)
         schema_name = getattr(schema_match, "kwargs", {}).get("schema_name", "default")
         context.schema_name = schema_name
+        # Cost computed by the validation rule (the context may not be the request)
+        context.query_cost = getattr(request, "query_cost", None)
 
         return context
 
@@ -169,6 +317,8 @@ class MultiSchemaGraphQLView(GraphQLView):
                 builder = schema_registry.get_schema_builder(schema_name)
                 # Always get current schema (SchemaBuilder handles rebuilds on changes)
                 schema_instance = builder.get_schema()
+                self._schema_name = schema_name
+                self._schema_version = builder.get_schema_version()
                 logger.debug(
                     f"DEBUG mode: bypassing schema cache for '{schema_name}' (version {builder.get_schema_version()})"
                 )
@@ -184,6 +334,8 @@ class MultiSchemaGraphQLView(GraphQLView):
 
             builder = schema_registry.get_schema_builder(schema_name)
             current_version = getattr(builder, "get_schema_version", lambda: 0)()
+            self._schema_name = schema_name
+            self._schema_version = current_version
 
             # If cached and version matches, return cached instance
             cached_entry = self._schema_cache.get(schema_name)
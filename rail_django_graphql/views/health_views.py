@@ -244,6 +244,11 @@ def health_metrics_endpoint(request):
         health_checker = HealthChecker()
         metrics = health_checker.get_system_metrics()
 
+        from ..core.document_cache import get_document_cache
+
+        # Taux de réussite du cache des documents analysés et validés
+        metrics["document_cache"] = get_document_cache().stats()
+
         return JsonResponse(
             {
                 "metrics": metrics,